@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from filter_extraction_evaluation.cli import main
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+"""Utilities for evaluating the rule-based filter extraction against synthetic queries."""
+
+from filter_extraction_evaluation.cli import main
+
+__all__ = ["main"]
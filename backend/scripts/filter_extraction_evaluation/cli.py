@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from filter_extraction_evaluation.evaluation import FILTER_NAMES
+from filter_extraction_evaluation.evaluation import FilterEvaluation
+from filter_extraction_evaluation.evaluation import evaluate_queries
+from filter_extraction_evaluation.evaluation import load_queries
+from filter_extraction_evaluation.evaluation import load_reference_filters
+from filter_extraction_evaluation.paths import DEFAULT_QUERIES_DIRECTORY
+from filter_extraction_evaluation.paths import DEFAULT_REFERENCE_RESULTS_DIRECTORY
+from recommender.common.configuration import Configuration
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse CLI arguments for the rule-based filter extraction evaluation."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Evaluate the rule-based recommendation_v2 filter extraction on synthetic queries: "
+            "how often it is confident enough to skip the LLM, and how often it then agrees with a reference LLM run."
+        ),
+    )
+    parser.add_argument(
+        "--queries-directory",
+        type=Path,
+        default=DEFAULT_QUERIES_DIRECTORY,
+        help="Directory with synthetic query JSON files.",
+    )
+    parser.add_argument(
+        "--reference-results-directory",
+        type=Path,
+        default=DEFAULT_REFERENCE_RESULTS_DIRECTORY,
+        help="Directory with JSONL results of an LLM run whose extracted filters serve as the reference.",
+    )
+    parser.add_argument(
+        "--min-confidence",
+        type=float,
+        default=None,
+        help="Confidence needed to skip the LLM. Defaults to RULE_BASED_FILTER_EXTRACTION_MIN_CONFIDENCE from backend/.env.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Optional JSON file for the full report including every disagreement.",
+    )
+    parser.add_argument(
+        "--show-disagreements",
+        action="store_true",
+        help="Print every confident rule-based result that differs from the reference.",
+    )
+    return parser.parse_args()
+
+
+def validate_args(args: argparse.Namespace) -> None:
+    """Validate CLI arguments before starting the evaluation."""
+    if not args.queries_directory.is_dir():
+        raise FileNotFoundError(f"Queries directory not found: {args.queries_directory}")
+    if args.min_confidence is not None and not 0.0 <= args.min_confidence <= 1.0:
+        raise ValueError("--min-confidence must be between 0 and 1")
+
+
+def _format_rate(value: float | None) -> str:
+    return "n/a" if value is None else f"{value:6.1%}"
+
+
+def _serialize_evaluation(evaluation: FilterEvaluation) -> dict[str, object]:
+    return {
+        "total": evaluation.total,
+        "hits": evaluation.hits,
+        "hit_rate": evaluation.hit_rate,
+        "compared_hits": evaluation.compared_hits,
+        "agreement_rate": evaluation.agreement_rate,
+        "disagreements": evaluation.disagreements,
+    }
+
+
+def main() -> None:
+    """Evaluate rule-based filter extraction for every synthetic query file."""
+    args = parse_args()
+    validate_args(args)
+    min_confidence = (
+        args.min_confidence
+        if args.min_confidence is not None
+        else Configuration().rule_based_filter_extraction_min_confidence
+    )
+
+    report: dict[str, dict[str, dict[str, object]]] = {}
+    totals = {filter_name: FilterEvaluation() for filter_name in FILTER_NAMES}
+    print(f"Using min_confidence={min_confidence:.2f}, reference={args.reference_results_directory}")
+    print(f"{'query file':<60} {'filter':<14} {'hit rate':>9} {'agreement':>10}")
+    for queries_path in sorted(args.queries_directory.glob("*.json")):
+        evaluations = evaluate_queries(
+            load_queries(queries_path),
+            load_reference_filters(args.reference_results_directory / f"{queries_path.stem}.jsonl"),
+            min_confidence=min_confidence,
+        )
+        report[queries_path.stem] = {}
+        for filter_name, evaluation in evaluations.items():
+            report[queries_path.stem][filter_name] = _serialize_evaluation(evaluation)
+            total = totals[filter_name]
+            total.total += evaluation.total
+            total.hits += evaluation.hits
+            total.compared_hits += evaluation.compared_hits
+            total.agreeing_hits += evaluation.agreeing_hits
+            total.disagreements.extend(evaluation.disagreements)
+            print(
+                f"{queries_path.stem:<60} {filter_name:<14} "
+                f"{_format_rate(evaluation.hit_rate):>9} {_format_rate(evaluation.agreement_rate):>10}"
+            )
+
+    for filter_name, total in totals.items():
+        print(
+            f"{'TOTAL':<60} {filter_name:<14} "
+            f"{_format_rate(total.hit_rate):>9} {_format_rate(total.agreement_rate):>10}"
+        )
+        if args.show_disagreements:
+            for disagreement in total.disagreements:
+                print(f"  {json.dumps(disagreement, ensure_ascii=False)}")
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"Wrote report to {args.output}")
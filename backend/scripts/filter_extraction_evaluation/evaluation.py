@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+
+from filter_extraction_evaluation.paths import ensure_src_path
+
+ensure_src_path()
+
+from recommender.graphs.recommendation_v2.agents.filter_extraction.budget.models import (
+    RecommendationV2BudgetFilterExtractionInput,
+)
+from recommender.graphs.recommendation_v2.agents.filter_extraction.parent_region.models import (
+    RecommendationV2ParentRegionFilterExtractionInput,
+)
+from recommender.graphs.recommendation_v2.agents.filter_extraction.rule_based.extractor import (
+    RuleBasedExtraction,
+    extract_budget_filter,
+    extract_parent_region_filter,
+    extract_season_filter,
+)
+from recommender.graphs.recommendation_v2.agents.filter_extraction.season.models import (
+    RecommendationV2SeasonFilterExtractionInput,
+)
+
+FILTER_NAMES = ("parent_region", "season", "budget")
+
+
+@dataclass(slots=True)
+class FilterEvaluation:
+    """Hit-rate and agreement counters of one filter over a set of queries."""
+
+    total: int = 0
+    hits: int = 0
+    compared_hits: int = 0
+    agreeing_hits: int = 0
+    disagreements: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.total if self.total else 0.0
+
+    @property
+    def agreement_rate(self) -> float | None:
+        return self.agreeing_hits / self.compared_hits if self.compared_hits else None
+
+
+def load_queries(path: Path) -> list[tuple[str, str]]:
+    """Load `(query_id, user_request)` pairs from a synthetic query file."""
+
+    with path.open(encoding="utf-8") as queries_file:
+        entries = json.load(queries_file)
+
+    return [(query_id, user_request) for entry in entries for query_id, user_request in entry.items()]
+
+
+def load_reference_filters(path: Path) -> dict[str, dict[str, Any]]:
+    """Load the filters an LLM run extracted for each query, keyed by query_id."""
+
+    if not path.exists():
+        return {}
+
+    references: dict[str, dict[str, Any]] = {}
+    with path.open(encoding="utf-8") as results_file:
+        for line in results_file:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            references[row["query_id"]] = {
+                "parent_region": _normalize_parent_regions(row.get("extracted_parent_region_filters")),
+                "season": _normalize_seasonality(row.get("extracted_seasonality_filter")),
+                "budget": _normalize_budget(row.get("extracted_budget_filter")),
+            }
+
+    return references
+
+
+def _normalize_parent_regions(value: list[dict[str, Any]] | None) -> list[tuple[str, str]] | None:
+    if value is None:
+        return None
+    return sorted((entry.get("region_name") or entry["name"], entry["type"]) for entry in value)
+
+
+def _normalize_seasonality(value: dict[str, Any] | None) -> dict[str, Any] | None:
+    if value is None:
+        return None
+    return {"season": value.get("season"), "months": list(value.get("months") or [])}
+
+
+def _normalize_budget(value: dict[str, Any] | None) -> dict[str, Any] | None:
+    if value is None:
+        return None
+    return {"cost_term": value.get("cost_term")}
+
+
+def _rule_based_extractions(user_request: str) -> dict[str, tuple[RuleBasedExtraction[Any], Any]]:
+    parent_region = extract_parent_region_filter(
+        RecommendationV2ParentRegionFilterExtractionInput(current_user_request=user_request)
+    )
+    season = extract_season_filter(
+        RecommendationV2SeasonFilterExtractionInput(current_user_request=user_request)
+    )
+    budget = extract_budget_filter(
+        RecommendationV2BudgetFilterExtractionInput(current_user_request=user_request)
+    )
+
+    return {
+        "parent_region": (
+            parent_region,
+            sorted((entry.name, entry.type) for entry in parent_region.result.parent_regions or []),
+        ),
+        "season": (
+            season,
+            {"season": season.result.season, "months": list(season.result.months)},
+        ),
+        "budget": (
+            budget,
+            {
+                "cost_term": (
+                    budget.result.cost_term.model_dump(exclude_none=True)
+                    if budget.result.cost_term is not None
+                    else None
+                )
+            },
+        ),
+    }
+
+
+def evaluate_queries(
+    queries: list[tuple[str, str]],
+    references: dict[str, dict[str, Any]],
+    *,
+    min_confidence: float,
+    on_query: Callable[[str, str, dict[str, tuple[RuleBasedExtraction[Any], Any]]], None] | None = None,
+) -> dict[str, FilterEvaluation]:
+    """Run the rule-based extractors over queries and compare confident results with the references."""
+
+    evaluations = {filter_name: FilterEvaluation() for filter_name in FILTER_NAMES}
+    for query_id, user_request in queries:
+        extractions = _rule_based_extractions(user_request)
+        if on_query is not None:
+            on_query(query_id, user_request, extractions)
+
+        reference = references.get(query_id, {})
+        for filter_name, (extraction, normalized_result) in extractions.items():
+            evaluation = evaluations[filter_name]
+            evaluation.total += 1
+            if extraction.confidence < min_confidence:
+                continue
+
+            evaluation.hits += 1
+            expected = reference.get(filter_name)
+            if expected is None:
+                continue
+
+            evaluation.compared_hits += 1
+            if normalized_result == expected:
+                evaluation.agreeing_hits += 1
+            else:
+                evaluation.disagreements.append(
+                    {
+                        "query_id": query_id,
+                        "user_request": user_request,
+                        "reason": extraction.reason,
+                        "rule_based": normalized_result,
+                        "reference": expected,
+                    }
+                )
+
+    return evaluations
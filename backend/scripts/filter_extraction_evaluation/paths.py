@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+SRC_PATH = BACKEND_ROOT / "src"
+SYNTHETIC_EVALUATION_DIRECTORY = BACKEND_ROOT.parent / "evaluation" / "synthetic"
+
+DEFAULT_QUERIES_DIRECTORY = SYNTHETIC_EVALUATION_DIRECTORY / "queries"
+DEFAULT_REFERENCE_RESULTS_DIRECTORY = SYNTHETIC_EVALUATION_DIRECTORY / "results" / "v2_gpt"
+
+
+def ensure_src_path() -> None:
+    """Ensure backend src modules are importable when the script runs directly."""
+    if str(SRC_PATH) not in sys.path:
+        sys.path.insert(0, str(SRC_PATH))
@@ -43,6 +43,18 @@ def parse_args() -> argparse.Namespace:
         default=200,
         help="Batch size for store upsert operations.",
     )
+    parser.add_argument(
+        "--embedding-batch-size",
+        type=int,
+        default=None,
+        help="Optional number of descriptions per embedding request. Defaults to EMBEDDINGS_BATCH_SIZE from backend/.env.",
+    )
+    parser.add_argument(
+        "--embedding-concurrency",
+        type=int,
+        default=None,
+        help="Optional number of embedding requests in flight. Defaults to EMBEDDINGS_MAX_CONCURRENCY from backend/.env.",
+    )
     parser.add_argument(
         "--embeddings-provider",
         type=str,
@@ -80,6 +92,10 @@ def validate_args(args: argparse.Namespace) -> None:
     """Validate CLI arguments before starting the load."""
     if args.batch_size <= 0:
         raise ValueError("--batch-size must be greater than zero")
+    if args.embedding_batch_size is not None and args.embedding_batch_size <= 0:
+        raise ValueError("--embedding-batch-size must be greater than zero")
+    if args.embedding_concurrency is not None and args.embedding_concurrency <= 0:
+        raise ValueError("--embedding-concurrency must be greater than zero")
     if not args.csv_path.exists():
         raise FileNotFoundError(f"Travel destination CSV file not found: {args.csv_path}")
     if args.embeddings_model_name is not None and not args.embeddings_model_name.strip():
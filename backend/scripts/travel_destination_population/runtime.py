@@ -54,4 +54,10 @@ def build_embedding_configuration(args: argparse.Namespace) -> TextEmbeddingMode
         model_name=args.embeddings_model_name if args.embeddings_model_name is not None else runtime_configuration.model_name,
         base_url=base_url,
         api_key=args.embeddings_api_key if args.embeddings_api_key is not None else runtime_configuration.api_key,
+        batch_size=args.embedding_batch_size if args.embedding_batch_size is not None else runtime_configuration.batch_size,
+        max_concurrency=(
+            args.embedding_concurrency
+            if args.embedding_concurrency is not None
+            else runtime_configuration.max_concurrency
+        ),
     )
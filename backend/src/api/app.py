@@ -12,9 +12,11 @@ from api.contracts.session_service import SessionServiceProtocol
 from api.core.configuration import ApiConfiguration
 from api.core.cors import build_cors_middleware_options
 from api.core.handlers import register_exception_handlers
+from api.services.admission_controller import ChatAdmissionController
 from api.lifecycle import create_lifespan
 from api.routers import destinations
 from api.routers import health
+from api.routers import metrics
 from api.routers import recommendations_v2
 from api.routers import sessions
 from api.routers import survey
@@ -42,10 +44,18 @@ def create_app(
     app.state.recommendation_service = recommendation_service
     app.state.recommendation_v2_service = recommendation_v2_service
     app.state.session_service = session_service
+    app.state.chat_admission_controller = ChatAdmissionController(
+        max_concurrent_runs=configuration.chat_max_concurrent_runs,
+        max_queued_runs=configuration.chat_max_queued_runs,
+        max_runs_per_user=configuration.chat_max_runs_per_user,
+        max_queue_wait_s=configuration.chat_max_queue_wait_s,
+        retry_after_s=configuration.chat_retry_after_s,
+    )
     app.state.is_ready = False
 
     app.include_router(destinations.router)
     app.include_router(health.router)
+    app.include_router(metrics.router)
     app.include_router(recommendations_v2.router)
 
     app.include_router(sessions.router)
@@ -40,6 +40,17 @@ class ApiConfiguration(BaseSettings):
     port: int = 8000
     cors_allow_origins: Annotated[list[str], NoDecode] = Field(default_factory=list)
     cors_allow_origin_regex: str | None = None
+    disconnect_poll_interval_s: float = Field(default=1.0, gt=0.0)
+    chat_max_concurrent_runs: int = Field(default=8, ge=1)
+    chat_max_queued_runs: int = Field(default=32, ge=0)
+    chat_max_runs_per_user: int = Field(default=2, ge=1)
+    chat_max_queue_wait_s: float = Field(default=60.0, gt=0.0)
+    chat_retry_after_s: int = Field(default=5, ge=1)
+    chat_resume_grace_period_s: float = Field(default=0.0, ge=0.0)
+    chat_replay_max_events: int = Field(default=2000, ge=1)
+    chat_replay_max_runs: int = Field(default=256, ge=1)
+    chat_replay_ttl_s: float = Field(default=600.0, gt=0.0)
+    chat_replay_persistence_enabled: bool = False
 
     @field_validator("cors_allow_origins", mode="before")
     @classmethod
@@ -11,12 +11,14 @@ class ApiError(Exception):
         message: str,
         status_code: int,
         details: dict[str, Any] | None,
+        headers: dict[str, str] | None = None,
     ) -> None:
         super().__init__(message)
         self.code = code
         self.message = message
         self.status_code = status_code
         self.details = details
+        self.headers = headers
 
 
 class DependencyNotConfiguredError(ApiError):
@@ -47,3 +49,55 @@ class ServiceNotReadyError(ApiError):
             status_code=503,
             details=None,
         )
+
+
+class TooManyChatRunsError(ApiError):
+    def __init__(self, *, user_id: str, max_runs_per_user: int, retry_after_s: int) -> None:
+        super().__init__(
+            code="too_many_chat_runs",
+            message="Too many recommendation chats are running or queued for this user.",
+            status_code=429,
+            details={"user_id": user_id, "max_runs_per_user": max_runs_per_user},
+            headers={"Retry-After": str(retry_after_s)},
+        )
+
+
+class ChatCapacityExhaustedError(ApiError):
+    def __init__(self, *, max_queued_runs: int, retry_after_s: int) -> None:
+        super().__init__(
+            code="chat_capacity_exhausted",
+            message="The recommendation chat queue is full.",
+            status_code=503,
+            details={"max_queued_runs": max_queued_runs},
+            headers={"Retry-After": str(retry_after_s)},
+        )
+
+
+class InvalidLastEventIdError(ApiError):
+    def __init__(self, *, last_event_id: str | None) -> None:
+        super().__init__(
+            code="invalid_last_event_id",
+            message="Last-Event-ID must be an event id of a recommendation chat stream.",
+            status_code=400,
+            details={"last_event_id": last_event_id},
+        )
+
+
+class RecommendationRunNotFoundError(ApiError):
+    def __init__(self, *, run_id: str) -> None:
+        super().__init__(
+            code="recommendation_run_not_found",
+            message="Recommendation chat run was not found or has expired.",
+            status_code=404,
+            details={"run_id": run_id},
+        )
+
+
+class RecommendationRunEventsExpiredError(ApiError):
+    def __init__(self, *, run_id: str, last_event_id: int, oldest_event_id: int) -> None:
+        super().__init__(
+            code="recommendation_run_events_expired",
+            message="Events after Last-Event-ID are no longer available for this recommendation chat run.",
+            status_code=410,
+            details={"run_id": run_id, "last_event_id": last_event_id, "oldest_event_id": oldest_event_id},
+        )
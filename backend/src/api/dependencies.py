@@ -10,6 +10,7 @@ from api.contracts.recommendation_service import RecommendationServiceProtocol
 from api.contracts.session_service import SessionServiceProtocol
 from api.core.configuration import ApiConfiguration
 from api.core.exceptions import DependencyNotConfiguredError
+from api.services.admission_controller import ChatAdmissionController
 
 
 def get_api_configuration(request: Request) -> ApiConfiguration:
@@ -33,6 +34,13 @@ def get_recommendation_v2_service(request: Request) -> Any:
     return service
 
 
+def get_chat_admission_controller(request: Request) -> ChatAdmissionController:
+    controller = getattr(request.app.state, "chat_admission_controller", None)
+    if controller is None:
+        raise DependencyNotConfiguredError(dependency_name="chat_admission_controller")
+    return controller
+
+
 def get_session_service(request: Request) -> SessionServiceProtocol:
     service = getattr(request.app.state, "session_service", None)
     if service is None:
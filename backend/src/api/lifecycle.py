@@ -27,6 +27,12 @@ def create_lifespan() -> Callable[[FastAPI], AbstractAsyncContextManager[None]]:
         app.state.is_ready = True
         yield
         app.state.is_ready = False
+        recommendation_v2_service = getattr(app.state, "recommendation_v2_service", None)
+        if recommendation_v2_service is not None and hasattr(recommendation_v2_service, "aclose"):
+            await recommendation_v2_service.aclose()
+        storage = getattr(app.state, "storage", None)
+        if storage is not None and hasattr(storage, "aclose"):
+            await storage.aclose()
         logger.info("API server shutdown completed")
 
     return lifespan
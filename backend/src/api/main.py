@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from api.app import create_app
 from api.core.configuration import load_api_configuration
+from api.services.recommendation_run_registry import RecommendationRunRegistry
 from api.services.recommendation_v2_service import RecommendationV2Service
 from api.services.session_service import SessionService
+from embeddings.cached_text_embedding_model import CachedTextEmbeddingModel
 from embeddings.loader import load_text_embedding_model
 from recommender.graphs.recommendation_v2 import build_recommendation_v2_graph
 from storage.configuration import load_storage_configuration
@@ -29,15 +31,30 @@ embedding_model = load_text_embedding_model()
 logger.info("Initializing storage")
 storage_configuration = load_storage_configuration()
 storage = Storage(storage_configuration, embedding_model=embedding_model)
+if isinstance(embedding_model, CachedTextEmbeddingModel):
+    embedding_model.attach_persistent_cache(storage.embedding_cache)
 
 logger.info("Compiling recommendation_v2 graph")
 recommendation_v2_graph = build_recommendation_v2_graph(
     travel_destination_store=storage.travel_destinations,
     recommendation_session_store=storage.chat,
+    async_travel_destination_store=storage.async_travel_destinations,
+    async_recommendation_session_store=storage.async_chat,
+    llm_response_cache_backend=storage.llm_response_cache,
+    region_research_cache_backend=storage.region_research_cache,
 )
 
+recommendation_run_registry = RecommendationRunRegistry(
+    max_runs=configuration.chat_replay_max_runs,
+    max_events_per_run=configuration.chat_replay_max_events,
+    ttl_s=configuration.chat_replay_ttl_s,
+    backend=storage.recommendation_run_events if configuration.chat_replay_persistence_enabled else None,
+)
 recommendation_v2_service = RecommendationV2Service(
     recommendation_graph=recommendation_v2_graph,
+    disconnect_poll_interval_s=configuration.disconnect_poll_interval_s,
+    run_registry=recommendation_run_registry,
+    resume_grace_period_s=configuration.chat_resume_grace_period_s,
 )
 session_service = SessionService(
     chat_store=storage.chat,
@@ -1,5 +1,6 @@
 from api.routers import destinations
 from api.routers import health
+from api.routers import metrics
 from api.routers import recommendations_v2
 from api.routers import sessions
 from api.routers import survey
@@ -7,6 +8,7 @@ from api.routers import survey
 __all__ = [
     "destinations",
     "health",
+    "metrics",
     "recommendations_v2",
     "sessions",
     "survey",
@@ -18,7 +18,7 @@ def list_destinations(
     storage: Storage = Depends(get_storage),
 ) -> DestinationListResponseDto:
     logger.info("List all destinations request")
-    records = storage.travel_destinations.all()
+    records = storage.travel_destinations.list_summaries()
     destinations = [DestinationItemDto.from_record(r) for r in records]
     logger.info("List all destinations response: total=%d", len(destinations))
     return DestinationListResponseDto(
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from utils.metrics import MetricsRegistry
+
+router = APIRouter(prefix="/metrics")
+
+
+@router.get("", response_class=PlainTextResponse)
+async def get_metrics() -> str:
+    """Expose the process metrics registry, one `name{labels} value` sample per line."""
+    return "".join(f"{name} {value}\n" for name, value in MetricsRegistry().snapshot().items())
@@ -4,20 +4,34 @@ from typing import Any
 
 from fastapi import APIRouter
 from fastapi import Depends
+from fastapi import Header
+from fastapi import Query
+from fastapi import Request
 from fastapi.responses import StreamingResponse
 
+from api.dependencies import get_chat_admission_controller
 from api.dependencies import get_recommendation_v2_service
 from api.schemas.recommendation import RecommendationRequestDto
+from api.services.admission_controller import ChatAdmissionController
+from api.services.admission_controller import stream_admitted
 from utils.logger import LoggerManager
 
 router = APIRouter(prefix="/api/v2/recommendations")
 logger = LoggerManager.get_logger(__name__)
 
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
 
 @router.post("/chat")
 async def chat_stream(
     payload: RecommendationRequestDto,
+    request: Request,
     service: Any = Depends(get_recommendation_v2_service),
+    admission_controller: ChatAdmissionController = Depends(get_chat_admission_controller),
 ):
     logger.info(
         "Recommendation v2 chat streaming request: user_id=%s, session_id=%s",
@@ -25,12 +39,51 @@ async def chat_stream(
         payload.session.session_id,
     )
 
+    await service.cancel_detached_runs(
+        user_id=payload.session.user_id,
+        session_id=payload.session.session_id,
+    )
+    ticket = admission_controller.admit(payload.session.user_id)
+
     return StreamingResponse(
-        service.chat_stream(payload),
+        stream_admitted(
+            ticket,
+            lambda: service.chat_stream(
+                payload,
+                is_disconnected=request.is_disconnected,
+                on_run_finished=ticket.hand_over(),
+            ),
+        ),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
+        headers=_SSE_HEADERS,
+    )
+
+
+@router.get("/chat/resume")
+async def resume_chat_stream(
+    request: Request,
+    user_id: str = Query(..., min_length=1),
+    session_id: str = Query(..., min_length=1),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    last_event_id_query: str | None = Query(default=None, alias="last_event_id"),
+    service: Any = Depends(get_recommendation_v2_service),
+):
+    """Replay the events of a chat run after `Last-Event-ID`, then continue it live.
+
+    Browsers' `EventSource` sends the header on reconnect; other clients may pass the
+    `last_event_id` query parameter instead.
+    """
+    logger.info(
+        "Recommendation v2 chat resume request: user_id=%s, session_id=%s, last_event_id=%s",
+        user_id,
+        session_id,
+        last_event_id or last_event_id_query,
+    )
+
+    stream = await service.resume_stream(
+        user_id=user_id,
+        session_id=session_id,
+        last_event_id=last_event_id or last_event_id_query,
+        is_disconnected=request.is_disconnected,
     )
+    return StreamingResponse(stream, media_type="text/event-stream", headers=_SSE_HEADERS)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from pydantic import BaseModel
 from pydantic import Field
 
-from storage.models.travel_destination import TravelDestinationRecord
+from storage.stores.projection_models import TravelDestinationSummary
 
 
 class DestinationItemDto(BaseModel):
@@ -14,7 +14,7 @@ class DestinationItemDto(BaseModel):
     description: str = Field(..., description="Destination description text")
 
     @classmethod
-    def from_record(cls, record: TravelDestinationRecord) -> DestinationItemDto:
+    def from_record(cls, record: TravelDestinationSummary) -> DestinationItemDto:
         return cls(
             id=record.id,
             parent_region=record.parent_region,
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncGenerator
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+
+from api.core.exceptions import ChatCapacityExhaustedError
+from api.core.exceptions import TooManyChatRunsError
+from api.utils.sse import format_sse
+from utils.logger import LoggerManager
+from utils.metrics import MetricsRegistry
+
+logger = LoggerManager.get_logger(__name__)
+metrics = MetricsRegistry()
+
+
+class AdmissionQueueTimeoutError(Exception):
+    """Raised when a queued chat run is not admitted within the configured wait."""
+
+
+class AdmissionTicket:
+    """One chat run's place in the admission controller, either queued or admitted."""
+
+    def __init__(self, controller: ChatAdmissionController, user_id: str) -> None:
+        self._controller = controller
+        self.user_id = user_id
+        self.admitted = False
+        self.released = False
+        self.handed_over = False
+        self.enqueued_at = time.perf_counter()
+        self._changed = asyncio.Event()
+
+    @property
+    def position(self) -> int:
+        """1-based position in the wait queue, or 0 once admitted."""
+        return self._controller.position_of(self)
+
+    async def wait(self) -> AsyncIterator[int]:
+        """Yield the queue position whenever it changes until the run is admitted."""
+        deadline = asyncio.get_running_loop().time() + self._controller.max_queue_wait_s
+        last_position: int | None = None
+        while True:
+            self._changed.clear()
+            if self.admitted:
+                return
+
+            position = self.position
+            if position != last_position:
+                last_position = position
+                yield position
+                continue
+
+            remaining_s = deadline - asyncio.get_running_loop().time()
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=max(0.0, remaining_s))
+            except TimeoutError:
+                raise AdmissionQueueTimeoutError(
+                    f"Chat run was not admitted within {self._controller.max_queue_wait_s:.0f}s"
+                ) from None
+
+    def release(self) -> None:
+        """Give back the run slot or queue place; safe to call more than once."""
+        self._controller.release(self)
+
+    def hand_over(self) -> Callable[[], None]:
+        """Leave releasing the run slot to the run itself, which may outlive its stream."""
+        self.handed_over = True
+        return self.release
+
+    def notify(self) -> None:
+        self._changed.set()
+
+
+class ChatAdmissionController:
+    """Global concurrency limit with a bounded FIFO wait queue and a per-user cap for chat runs.
+
+    `admit` rejects synchronously, so saturation is answered with 429/503 before streaming
+    starts: 429 when the user already has `max_runs_per_user` runs running or queued, 503 when
+    the wait queue is full. All state is owned by the event loop, so no locking is needed.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrent_runs: int,
+        max_queued_runs: int,
+        max_runs_per_user: int,
+        max_queue_wait_s: float,
+        retry_after_s: int,
+    ) -> None:
+        if max_concurrent_runs < 1:
+            raise ValueError("max_concurrent_runs must be at least 1")
+        if max_queued_runs < 0:
+            raise ValueError("max_queued_runs must not be negative")
+        if max_runs_per_user < 1:
+            raise ValueError("max_runs_per_user must be at least 1")
+        if max_queue_wait_s <= 0:
+            raise ValueError("max_queue_wait_s must be greater than zero")
+
+        self.max_concurrent_runs = max_concurrent_runs
+        self.max_queued_runs = max_queued_runs
+        self.max_runs_per_user = max_runs_per_user
+        self.max_queue_wait_s = max_queue_wait_s
+        self.retry_after_s = retry_after_s
+        self.active_runs = 0
+        self._queue: deque[AdmissionTicket] = deque()
+        self._runs_by_user: dict[str, int] = {}
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def admit(self, user_id: str) -> AdmissionTicket:
+        """Admit or queue a run for `user_id`, raising an API error when saturated."""
+        if self._runs_by_user.get(user_id, 0) >= self.max_runs_per_user:
+            metrics.increment("recommendation_v2_admission_total", outcome="rejected_user_limit")
+            raise TooManyChatRunsError(
+                user_id=user_id,
+                max_runs_per_user=self.max_runs_per_user,
+                retry_after_s=self.retry_after_s,
+            )
+
+        ticket = AdmissionTicket(self, user_id)
+        if self.active_runs < self.max_concurrent_runs and not self._queue:
+            self._start(ticket)
+            metrics.increment("recommendation_v2_admission_total", outcome="admitted")
+        elif len(self._queue) < self.max_queued_runs:
+            self._queue.append(ticket)
+            metrics.increment("recommendation_v2_admission_total", outcome="queued")
+        else:
+            metrics.increment("recommendation_v2_admission_total", outcome="rejected_queue_full")
+            raise ChatCapacityExhaustedError(
+                max_queued_runs=self.max_queued_runs,
+                retry_after_s=self.retry_after_s,
+            )
+
+        self._runs_by_user[user_id] = self._runs_by_user.get(user_id, 0) + 1
+        self._record_gauges()
+        return ticket
+
+    def position_of(self, ticket: AdmissionTicket) -> int:
+        if ticket.admitted:
+            return 0
+        return self._queue.index(ticket) + 1
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        if ticket.released:
+            return
+
+        ticket.released = True
+        remaining_runs = self._runs_by_user.get(ticket.user_id, 1) - 1
+        if remaining_runs > 0:
+            self._runs_by_user[ticket.user_id] = remaining_runs
+        else:
+            self._runs_by_user.pop(ticket.user_id, None)
+
+        if ticket.admitted:
+            self.active_runs -= 1
+        else:
+            self._queue.remove(ticket)
+
+        self._admit_queued()
+        self._record_gauges()
+
+    def _start(self, ticket: AdmissionTicket) -> None:
+        ticket.admitted = True
+        self.active_runs += 1
+        metrics.observe("recommendation_v2_admission_wait_seconds", time.perf_counter() - ticket.enqueued_at)
+
+    def _admit_queued(self) -> None:
+        while self._queue and self.active_runs < self.max_concurrent_runs:
+            ticket = self._queue.popleft()
+            self._start(ticket)
+            ticket.notify()
+
+        for queued_ticket in self._queue:
+            queued_ticket.notify()
+
+    def _record_gauges(self) -> None:
+        metrics.set_gauge("recommendation_v2_admission_queue_depth", len(self._queue))
+        metrics.set_gauge("recommendation_v2_admission_active_runs", self.active_runs)
+
+
+async def stream_admitted(
+    ticket: AdmissionTicket,
+    open_stream: Callable[[], AsyncIterator[str]],
+) -> AsyncGenerator[str, None]:
+    """Emit `queued` events until `ticket` is admitted, then relay the run's stream.
+
+    The ticket is released when the stream ends or is closed, e.g. after a client disconnect,
+    unless `open_stream` handed it over to the run with `AdmissionTicket.hand_over`.
+    """
+    timed_out = False
+    try:
+        try:
+            async for position in ticket.wait():
+                yield format_sse("queued", {"position": position})
+        except AdmissionQueueTimeoutError as error:
+            timed_out = True
+            metrics.increment("recommendation_v2_admission_total", outcome="queue_timeout")
+            logger.warning("Recommendation v2 chat run left the queue: %s", error)
+            yield format_sse(
+                "error",
+                {"message": "The service is busy, please try again shortly."},
+            )
+            return
+
+        async for message in open_stream():
+            yield message
+    finally:
+        if not ticket.admitted and not timed_out:
+            metrics.increment("recommendation_v2_admission_total", outcome="abandoned")
+        if not ticket.handed_over:
+            ticket.release()
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Protocol
+from uuid import uuid4
+
+from api.utils.sse import format_sse
+from utils.logger import LoggerManager
+from utils.metrics import MetricsRegistry
+
+logger = LoggerManager.get_logger(__name__)
+metrics = MetricsRegistry()
+
+_PERSIST_BATCH_SIZE = 32
+
+
+class RecommendationRunEventBackendProtocol(Protocol):
+    """Contract for a persistent store of streamed run events."""
+
+    def append_many(
+        self,
+        run_id: str,
+        user_id: str,
+        session_id: str,
+        events: list[dict[str, Any]],
+        ttl_s: float,
+    ) -> None:
+        """Store `{"event_id", "event", "data"}` events of one run for `ttl_s` seconds."""
+        ...
+
+    def list_after(
+        self,
+        run_id: str,
+        user_id: str,
+        session_id: str,
+        after_event_id: int,
+    ) -> list[dict[str, Any]]:
+        """Return the stored events of one session's run after `after_event_id`, in order."""
+        ...
+
+
+def format_event_id(run_id: str, event_id: int) -> str:
+    return f"{run_id}:{event_id}"
+
+
+def parse_event_id(value: str) -> tuple[str, int]:
+    """Split a `<run_id>:<event_id>` SSE event id, raising ValueError when it is malformed."""
+    run_id, separator, event_id = value.strip().rpartition(":")
+    if not separator or not run_id or not event_id.isdigit():
+        raise ValueError(f"Malformed recommendation run event id: {value!r}")
+    return run_id, int(event_id)
+
+
+@dataclass(frozen=True, slots=True)
+class RunEvent:
+    """One streamed event of a run; `event_id` increases by one per event, starting at 1."""
+
+    event_id: int
+    event: str
+    data: dict[str, Any]
+
+    def to_sse(self, run_id: str) -> str:
+        return format_sse(self.event, self.data, event_id=format_event_id(run_id, self.event_id))
+
+
+class RecommendationRun:
+    """A graph run with a bounded buffer of its latest events, followed by one or more streams.
+
+    Followers wait on `changed()`, which is replaced after every append, so each change wakes
+    every follower exactly once. All state is owned by the event loop.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        user_id: str,
+        session_id: str,
+        *,
+        max_events: int,
+        persisted: bool = False,
+    ) -> None:
+        self.run_id = run_id
+        self.user_id = user_id
+        self.session_id = session_id
+        self.started_at = time.perf_counter()
+        self.finished_at: float | None = None
+        self.task: asyncio.Task[None] | None = None
+        self.subscribers = 0
+        self.cancel_handle: asyncio.TimerHandle | None = None
+        self.last_event_name = "none"
+        self.last_event_id = 0
+        self._events: deque[RunEvent] = deque(maxlen=max_events)
+        self._unpersisted: list[RunEvent] | None = [] if persisted else None
+        self._changed = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.finished_at is not None
+
+    @property
+    def oldest_event_id(self) -> int:
+        """Id of the oldest event still buffered, or the next event id when none is."""
+        return self._events[0].event_id if self._events else self.last_event_id + 1
+
+    def changed(self) -> asyncio.Event:
+        return self._changed
+
+    def append(self, event: str, data: dict[str, Any]) -> RunEvent:
+        self.last_event_id += 1
+        run_event = RunEvent(event_id=self.last_event_id, event=event, data=data)
+        self._events.append(run_event)
+        if self._unpersisted is not None:
+            self._unpersisted.append(run_event)
+        self.last_event_name = event
+        self._notify()
+        return run_event
+
+    def finish(self) -> None:
+        if self.finished_at is None:
+            self.finished_at = time.monotonic()
+            self._notify()
+
+    def events_after(self, event_id: int) -> list[RunEvent]:
+        return [run_event for run_event in self._events if run_event.event_id > event_id]
+
+    def has_gap_after(self, event_id: int) -> bool:
+        """Whether events directly after `event_id` were already dropped from the buffer."""
+        return event_id + 1 < self.oldest_event_id
+
+    def take_unpersisted(self) -> list[RunEvent]:
+        """Return and forget the events not yet written; they are kept apart from the bounded buffer."""
+        unpersisted = self._unpersisted or []
+        if self._unpersisted is not None:
+            self._unpersisted = []
+        return unpersisted
+
+    @property
+    def unpersisted_count(self) -> int:
+        return len(self._unpersisted or ())
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+
+class RecommendationRunRegistry:
+    """Replay buffer of recent recommendation chat runs, so a dropped stream can resume.
+
+    Runs stay in memory until `ttl_s` after they finish; beyond `max_runs`, the oldest finished
+    runs are dropped first. With a `backend`, events are also written in batches, so finished
+    runs and events dropped from the in-memory buffer can still be replayed. Backend failures
+    are logged and never break a run.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_runs: int = 256,
+        max_events_per_run: int = 2000,
+        ttl_s: float = 600.0,
+        backend: RecommendationRunEventBackendProtocol | None = None,
+    ) -> None:
+        if max_runs < 1:
+            raise ValueError("max_runs must be at least 1")
+        if max_events_per_run < 1:
+            raise ValueError("max_events_per_run must be at least 1")
+        if ttl_s <= 0:
+            raise ValueError("ttl_s must be greater than zero")
+
+        self.max_runs = max_runs
+        self.max_events_per_run = max_events_per_run
+        self.ttl_s = ttl_s
+        self.backend = backend
+        self._runs: OrderedDict[str, RecommendationRun] = OrderedDict()
+
+    def create(self, user_id: str, session_id: str) -> RecommendationRun:
+        self._evict()
+        run = RecommendationRun(
+            str(uuid4()),
+            user_id,
+            session_id,
+            max_events=self.max_events_per_run,
+            persisted=self.backend is not None,
+        )
+        self._runs[run.run_id] = run
+        metrics.set_gauge("recommendation_v2_replay_buffer_runs", len(self._runs))
+        return run
+
+    def get(self, run_id: str, *, user_id: str, session_id: str) -> RecommendationRun | None:
+        """Return the buffered run if it belongs to the given session."""
+        self._evict()
+        run = self._runs.get(run_id)
+        if run is None or run.user_id != user_id or run.session_id != session_id:
+            return None
+        return run
+
+    def running(self, *, user_id: str, session_id: str) -> list[RecommendationRun]:
+        """Return the session's runs that have not finished yet."""
+        return [
+            run
+            for run in self._runs.values()
+            if run.user_id == user_id and run.session_id == session_id and not run.finished
+        ]
+
+    async def persist(self, run: RecommendationRun, *, flush: bool = False) -> None:
+        """Write the run's new events to the backend once a batch is full, or now with `flush`."""
+        if self.backend is None or run.unpersisted_count == 0:
+            return
+        if not flush and run.unpersisted_count < _PERSIST_BATCH_SIZE:
+            return
+
+        events = [
+            {
+                "event_id": run_event.event_id,
+                "event": run_event.event,
+                "data": json.loads(json.dumps(run_event.data, default=str)),
+            }
+            for run_event in run.take_unpersisted()
+        ]
+        try:
+            await asyncio.to_thread(
+                self.backend.append_many,
+                run.run_id,
+                run.user_id,
+                run.session_id,
+                events,
+                self.ttl_s,
+            )
+        except Exception as error:
+            metrics.increment("recommendation_v2_replay_persist_failures_total")
+            logger.warning("Persisting events of recommendation run %s failed: %s", run.run_id, error)
+
+    async def load_persisted(
+        self,
+        run_id: str,
+        *,
+        user_id: str,
+        session_id: str,
+        after_event_id: int,
+    ) -> list[RunEvent]:
+        if self.backend is None:
+            return []
+
+        try:
+            rows = await asyncio.to_thread(self.backend.list_after, run_id, user_id, session_id, after_event_id)
+        except Exception as error:
+            logger.warning("Loading events of recommendation run %s failed: %s", run_id, error)
+            return []
+        return [RunEvent(event_id=row["event_id"], event=row["event"], data=row["data"]) for row in rows]
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        expired_run_ids = [
+            run_id
+            for run_id, run in self._runs.items()
+            if run.finished_at is not None and now - run.finished_at >= self.ttl_s
+        ]
+        for run_id in expired_run_ids:
+            del self._runs[run_id]
+
+        if len(self._runs) >= self.max_runs:
+            finished_run_ids = [run_id for run_id, run in self._runs.items() if run.finished]
+            for run_id in finished_run_ids[: len(self._runs) - self.max_runs + 1]:
+                del self._runs[run_id]
+
+        metrics.set_gauge("recommendation_v2_replay_buffer_runs", len(self._runs))
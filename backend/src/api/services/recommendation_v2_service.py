@@ -1,14 +1,32 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import time
 from collections.abc import AsyncGenerator
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
 from typing import Any
 
+from api.core.exceptions import InvalidLastEventIdError
+from api.core.exceptions import RecommendationRunEventsExpiredError
+from api.core.exceptions import RecommendationRunNotFoundError
 from api.schemas.recommendation import RecommendationRequestDto
-from api.utils.sse import format_sse
+from api.services.recommendation_run_registry import RecommendationRun
+from api.services.recommendation_run_registry import RecommendationRunRegistry
+from api.services.recommendation_run_registry import RunEvent
+from api.services.recommendation_run_registry import parse_event_id
+from recommender.graphs.recommendation_v2.nodes.recommendation_research_node import cancel_deferred_research
+from recommender.graphs.recommendation_v2.nodes.recommendation_research_node import deferred_research_bound_to_run
 from recommender.models.session.session import Session
 from utils.logger import LoggerManager
+from utils.metrics import MetricsRegistry
 
 logger = LoggerManager.get_logger(__name__)
+metrics = MetricsRegistry()
+
+DisconnectCheck = Callable[[], Awaitable[bool]]
 
 
 class RecommendationV2Service:
@@ -16,65 +34,308 @@ class RecommendationV2Service:
         self,
         *,
         recommendation_graph: Any,
+        disconnect_poll_interval_s: float = 1.0,
+        run_registry: RecommendationRunRegistry | None = None,
+        resume_grace_period_s: float = 0.0,
     ) -> None:
+        if disconnect_poll_interval_s <= 0:
+            raise ValueError("disconnect_poll_interval_s must be greater than zero")
+        if resume_grace_period_s < 0:
+            raise ValueError("resume_grace_period_s must not be negative")
+
         self._recommendation_graph = recommendation_graph
+        self._disconnect_poll_interval_s = disconnect_poll_interval_s
+        self._run_registry = run_registry or RecommendationRunRegistry()
+        self._resume_grace_period_s = resume_grace_period_s
         logger.info("Recommendation v2 service initialized")
 
+    async def aclose(self) -> None:
+        """Stop the research that turns left to complete in the background."""
+        await cancel_deferred_research()
+
+    async def _execute_run(
+        self,
+        run: RecommendationRun,
+        session: Session,
+        request: RecommendationRequestDto,
+        on_run_finished: Callable[[], None] | None,
+    ) -> None:
+        try:
+            try:
+                with deferred_research_bound_to_run():
+                    async for event_payload in self._recommendation_graph.astream(
+                        {
+                            "session": session,
+                            "user_request": request.message,
+                            "included_regions_ids": request.included_regions_ids,
+                            "excluded_regions_ids": request.excluded_regions_ids,
+                        },
+                        stream_mode="custom",
+                    ):
+                        if not isinstance(event_payload, dict):
+                            logger.warning(
+                                "Ignoring malformed recommendation_v2 stream payload: %r",
+                                event_payload,
+                            )
+                            continue
+
+                        event_name = event_payload.get("event")
+                        event_data = event_payload.get("data", {})
+                        if not isinstance(event_name, str):
+                            logger.warning(
+                                "Ignoring recommendation_v2 stream payload without event name: %r",
+                                event_payload,
+                            )
+                            continue
+
+                        run.append(event_name, event_data)
+                        await self._run_registry.persist(run)
+
+                metrics.increment("recommendation_v2_runs_total", outcome="completed")
+                logger.info(
+                    "Recommendation v2 streaming completed: user_id=%s, session_id=%s",
+                    session.user_id,
+                    session.session_id,
+                )
+
+            except Exception:
+                metrics.increment("recommendation_v2_runs_total", outcome="failed")
+                logger.exception(
+                    "Recommendation v2 streaming failed: user_id=%s, session_id=%s",
+                    session.user_id,
+                    session.session_id,
+                )
+                run.append(
+                    "error",
+                    {"message": "An internal error occurred while generating recommendations."},
+                )
+
+        finally:
+            if run.cancel_handle is not None:
+                run.cancel_handle.cancel()
+                run.cancel_handle = None
+            try:
+                if on_run_finished is not None:
+                    on_run_finished()
+                # Flush before finishing, so a stream that saw the run end can resume from the backend.
+                await self._run_registry.persist(run, flush=True)
+            finally:
+                run.finish()
+
     async def chat_stream(
         self,
         request: RecommendationRequestDto,
+        *,
+        is_disconnected: DisconnectCheck | None = None,
+        on_run_finished: Callable[[], None] | None = None,
     ) -> AsyncGenerator[str, None]:
-        session = Session(
-            user_id=request.session.user_id,
-            session_id=request.session.session_id,
-        )
+        """Stream the graph run as SSE messages with `<run_id>:<seq>` event ids.
+
+        The run executes in its own task and its events are kept in the run registry, so a
+        client that loses the stream can continue it with `resume_stream`. While no event is
+        ready, `is_disconnected` is polled every `disconnect_poll_interval_s`. Once the client is
+        gone, or the response stream is closed, the run is cancelled after
+        `resume_grace_period_s` unless a resumed stream attaches first. `on_run_finished` is
+        called when the run task ends, however it ends.
+        """
+        try:
+            session = Session(
+                user_id=request.session.user_id,
+                session_id=request.session.session_id,
+            )
+            run = self._run_registry.create(request.session.user_id, request.session.session_id)
+            run.task = asyncio.create_task(self._execute_run(run, session, request, on_run_finished))
+        except BaseException:
+            if on_run_finished is not None:
+                on_run_finished()
+            raise
+
         logger.info(
-            "Recommendation v2 streaming: user_id=%s, session_id=%s",
+            "Recommendation v2 streaming: user_id=%s, session_id=%s, run_id=%s",
             session.user_id,
             session.session_id,
+            run.run_id,
         )
+        # Close the follower right away, so the run is detached as soon as the stream closes.
+        async with contextlib.aclosing(self._follow(run, 0, is_disconnected)) as messages:
+            async for message in messages:
+                yield message
+
+    async def cancel_detached_runs(self, *, user_id: str, session_id: str) -> None:
+        """Cancel the session's runs that no stream follows and wait for them to end.
 
+        Clients that lose a stream may send the message again instead of resuming; ending the
+        abandoned run first gives its admission slot back before the new run is admitted.
+        """
+        detached_runs = [
+            run
+            for run in self._run_registry.running(user_id=user_id, session_id=session_id)
+            if run.subscribers == 0
+        ]
+        for run in detached_runs:
+            logger.info("Cancelling detached recommendation v2 run %s for a new message", run.run_id)
+            self._cancel_run(run)
+        await asyncio.gather(
+            *(run.task for run in detached_runs if run.task is not None),
+            return_exceptions=True,
+        )
+
+    async def resume_stream(
+        self,
+        *,
+        user_id: str,
+        session_id: str,
+        last_event_id: str | None,
+        is_disconnected: DisconnectCheck | None = None,
+    ) -> AsyncIterator[str]:
+        """Return the events of a run after `last_event_id`, followed live while it still runs.
+
+        Everything is validated before streaming starts, so a run that is unknown, owned by
+        another session, or whose missed events are no longer buffered is answered with an
+        `ApiError` instead of a broken stream. Persisted events fill gaps in the in-memory
+        buffer and replay runs this process no longer holds.
+        """
         try:
-            async for event_payload in self._recommendation_graph.astream(
-                {
-                    "session": session,
-                    "user_request": request.message,
-                    "included_regions_ids": request.included_regions_ids,
-                    "excluded_regions_ids": request.excluded_regions_ids,
-                },
-                stream_mode="custom",
-            ):
-                if not isinstance(event_payload, dict):
-                    logger.warning(
-                        "Ignoring malformed recommendation_v2 stream payload: %r",
-                        event_payload,
-                    )
-                    continue
+            run_id, after_event_id = parse_event_id(last_event_id or "")
+        except ValueError:
+            raise InvalidLastEventIdError(last_event_id=last_event_id) from None
 
-                event_name = event_payload.get("event")
-                event_data = event_payload.get("data", {})
-                if not isinstance(event_name, str):
+        run = self._run_registry.get(run_id, user_id=user_id, session_id=session_id)
+        if run is None:
+            persisted_events = await self._run_registry.load_persisted(
+                run_id,
+                user_id=user_id,
+                session_id=session_id,
+                after_event_id=after_event_id,
+            )
+            if not persisted_events:
+                raise RecommendationRunNotFoundError(run_id=run_id)
+            metrics.increment("recommendation_v2_resumed_runs_total", source="persisted")
+            return _replay(run_id, persisted_events)
+
+        missed_events: list[RunEvent] = []
+        if run.has_gap_after(after_event_id):
+            oldest_event_id = run.oldest_event_id
+            missed_events = [
+                run_event
+                for run_event in await self._run_registry.load_persisted(
+                    run_id,
+                    user_id=user_id,
+                    session_id=session_id,
+                    after_event_id=after_event_id,
+                )
+                if run_event.event_id < oldest_event_id
+            ]
+            if len(missed_events) != oldest_event_id - after_event_id - 1:
+                raise RecommendationRunEventsExpiredError(
+                    run_id=run_id,
+                    last_event_id=after_event_id,
+                    oldest_event_id=oldest_event_id,
+                )
+
+        metrics.increment("recommendation_v2_resumed_runs_total", source="memory")
+        logger.info(
+            "Resuming recommendation v2 run %s after event %d: user_id=%s, session_id=%s",
+            run_id,
+            after_event_id,
+            user_id,
+            session_id,
+        )
+        return self._follow(run, after_event_id, is_disconnected, replayed_events=missed_events)
+
+    async def _follow(
+        self,
+        run: RecommendationRun,
+        after_event_id: int,
+        is_disconnected: DisconnectCheck | None,
+        *,
+        replayed_events: list[RunEvent] | None = None,
+    ) -> AsyncGenerator[str, None]:
+        self._attach(run)
+        try:
+            for run_event in replayed_events or ():
+                yield run_event.to_sse(run.run_id)
+                after_event_id = run_event.event_id
+
+            while True:
+                changed = run.changed()
+                if run.has_gap_after(after_event_id):
+                    metrics.increment("recommendation_v2_replay_events_dropped_total")
                     logger.warning(
-                        "Ignoring recommendation_v2 stream payload without event name: %r",
-                        event_payload,
+                        "Recommendation v2 stream fell behind run %s; skipping events %d-%d",
+                        run.run_id,
+                        after_event_id + 1,
+                        run.oldest_event_id - 1,
                     )
-                    continue
+                for run_event in run.events_after(after_event_id):
+                    yield run_event.to_sse(run.run_id)
+                    after_event_id = run_event.event_id
 
-                yield format_sse(event_name, event_data)
+                if run.finished and after_event_id >= run.last_event_id:
+                    return
 
-            logger.info(
-                "Recommendation v2 streaming completed: user_id=%s, session_id=%s",
-                session.user_id,
-                session.session_id,
-            )
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=self._disconnect_poll_interval_s)
+                except TimeoutError:
+                    if is_disconnected is not None and await is_disconnected():
+                        logger.info(
+                            "Recommendation v2 client disconnected: user_id=%s, session_id=%s, run_id=%s",
+                            run.user_id,
+                            run.session_id,
+                            run.run_id,
+                        )
+                        return
+        finally:
+            self._detach(run)
 
-        except Exception:
-            logger.exception(
-                "Recommendation v2 streaming failed: user_id=%s, session_id=%s",
-                request.session.user_id,
-                request.session.session_id,
-            )
-            yield format_sse(
-                "error",
-                {"message": "An internal error occurred while generating recommendations."},
-            )
+    def _attach(self, run: RecommendationRun) -> None:
+        run.subscribers += 1
+        if run.cancel_handle is not None:
+            run.cancel_handle.cancel()
+            run.cancel_handle = None
+
+    def _detach(self, run: RecommendationRun) -> None:
+        run.subscribers -= 1
+        if run.subscribers > 0 or run.finished:
+            return
+        if self._resume_grace_period_s <= 0:
+            self._cancel_run(run)
+            return
+
+        logger.info(
+            "Recommendation v2 run %s has no client; cancelling it unless resumed within %.1fs",
+            run.run_id,
+            self._resume_grace_period_s,
+        )
+        run.cancel_handle = asyncio.get_running_loop().call_later(
+            self._resume_grace_period_s,
+            self._cancel_abandoned_run,
+            run,
+        )
+
+    def _cancel_abandoned_run(self, run: RecommendationRun) -> None:
+        run.cancel_handle = None
+        if run.subscribers == 0:
+            self._cancel_run(run)
+
+    def _cancel_run(self, run: RecommendationRun) -> None:
+        if run.task is None or run.task.done():
+            return
+
+        run.task.cancel()
+        elapsed_s = time.perf_counter() - run.started_at
+        metrics.increment("recommendation_v2_runs_total", outcome="cancelled")
+        metrics.increment("recommendation_v2_cancelled_runs_total", last_event=run.last_event_name)
+        metrics.observe("recommendation_v2_cancelled_run_seconds", elapsed_s)
+        logger.info(
+            "Cancelled recommendation v2 run after %.2fs (last event: %s): user_id=%s, session_id=%s",
+            elapsed_s,
+            run.last_event_name,
+            run.user_id,
+            run.session_id,
+        )
+
+
+async def _replay(run_id: str, run_events: list[RunEvent]) -> AsyncGenerator[str, None]:
+    for run_event in run_events:
+        yield run_event.to_sse(run_id)
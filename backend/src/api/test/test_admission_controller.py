@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from collections.abc import AsyncIterator
+
+from api.core.exceptions import ChatCapacityExhaustedError
+from api.core.exceptions import TooManyChatRunsError
+from api.services.admission_controller import ChatAdmissionController
+from api.services.admission_controller import stream_admitted
+from api.utils.sse import format_sse
+from utils.metrics import MetricsRegistry
+
+
+def create_controller(
+    *,
+    max_concurrent_runs: int = 1,
+    max_queued_runs: int = 2,
+    max_runs_per_user: int = 1,
+    max_queue_wait_s: float = 5.0,
+) -> ChatAdmissionController:
+    return ChatAdmissionController(
+        max_concurrent_runs=max_concurrent_runs,
+        max_queued_runs=max_queued_runs,
+        max_runs_per_user=max_runs_per_user,
+        max_queue_wait_s=max_queue_wait_s,
+        retry_after_s=5,
+    )
+
+
+async def run_stream() -> AsyncIterator[str]:
+    yield format_sse("done", {})
+
+
+class TestChatAdmissionController(unittest.TestCase):
+    def setUp(self) -> None:
+        MetricsRegistry().reset()
+
+    def test_queues_beyond_the_concurrency_limit_and_rejects_when_queue_is_full(self) -> None:
+        controller = create_controller(max_queued_runs=1)
+
+        running = controller.admit("user-1")
+        queued = controller.admit("user-2")
+
+        self.assertEqual(running.position, 0)
+        self.assertEqual(queued.position, 1)
+        self.assertEqual(MetricsRegistry().gauge("recommendation_v2_admission_queue_depth"), 1.0)
+        with self.assertRaises(ChatCapacityExhaustedError):
+            controller.admit("user-3")
+
+    def test_per_user_cap_counts_running_and_queued_runs(self) -> None:
+        controller = create_controller(max_runs_per_user=2)
+
+        controller.admit("user-1")
+        queued = controller.admit("user-1")
+
+        with self.assertRaises(TooManyChatRunsError):
+            controller.admit("user-1")
+        queued.release()
+        controller.admit("user-1")
+
+    def test_queued_stream_reports_positions_then_runs_once_admitted(self) -> None:
+        controller = create_controller(max_queued_runs=2)
+
+        async def scenario() -> list[str]:
+            running = controller.admit("user-1")
+            next_in_line = controller.admit("user-2")
+            queued = controller.admit("user-3")
+            messages: list[str] = []
+
+            async def consume() -> None:
+                async for message in stream_admitted(queued, run_stream):
+                    messages.append(message)
+
+            consumer = asyncio.create_task(consume())
+            await asyncio.sleep(0.01)
+            running.release()
+            await asyncio.sleep(0.01)
+            next_in_line.release()
+            await asyncio.wait_for(consumer, timeout=1)
+            return messages
+
+        messages = asyncio.run(scenario())
+
+        self.assertEqual(
+            messages,
+            [
+                format_sse("queued", {"position": 2}),
+                format_sse("queued", {"position": 1}),
+                format_sse("done", {}),
+            ],
+        )
+        self.assertEqual(controller.active_runs, 0)
+        self.assertEqual(controller.queue_depth, 0)
+        self.assertEqual(MetricsRegistry().histogram("recommendation_v2_admission_wait_seconds").count, 3)
+
+    def test_queue_wait_timeout_ends_the_stream_with_an_error(self) -> None:
+        controller = create_controller(max_queue_wait_s=0.05)
+
+        async def scenario() -> list[str]:
+            controller.admit("user-1")
+            queued = controller.admit("user-2")
+            return [message async for message in stream_admitted(queued, run_stream)]
+
+        messages = asyncio.run(scenario())
+
+        self.assertEqual(messages[0], format_sse("queued", {"position": 1}))
+        self.assertIn("event: error", messages[-1])
+        self.assertEqual(controller.queue_depth, 0)
+        self.assertEqual(
+            MetricsRegistry().counter("recommendation_v2_admission_total", outcome="queue_timeout"),
+            1.0,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from collections.abc import AsyncIterator
+from typing import Any
+from uuid import uuid4
+
+from api.core.exceptions import RecommendationRunEventsExpiredError
+from api.schemas.recommendation import RecommendationRequestDto
+from api.services.recommendation_run_registry import RecommendationRunRegistry
+from api.services.recommendation_v2_service import RecommendationV2Service
+from utils.metrics import MetricsRegistry
+
+
+class FakeGraph:
+    def __init__(self, *, hang_after_first_event: bool) -> None:
+        self.hang_after_first_event = hang_after_first_event
+        self.cancelled = False
+        self.release = asyncio.Event()
+
+    async def astream(self, _inputs: dict[str, Any], *, stream_mode: str) -> AsyncIterator[dict[str, Any]]:
+        _ = stream_mode
+        yield {"event": "initializing", "data": {}}
+        if self.hang_after_first_event:
+            try:
+                await asyncio.wait_for(self.release.wait(), timeout=3600)
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+        yield {"event": "done", "data": {}}
+
+
+def build_request() -> RecommendationRequestDto:
+    return RecommendationRequestDto.model_validate(
+        {
+            "session": {"user_id": str(uuid4()), "session_id": str(uuid4())},
+            "message": "A beach trip in July",
+        }
+    )
+
+
+async def collect(stream: AsyncIterator[str]) -> list[str]:
+    return [message async for message in stream]
+
+
+class TestRecommendationV2ServiceCancellation(unittest.TestCase):
+    def setUp(self) -> None:
+        MetricsRegistry().reset()
+
+    def test_streams_every_event_when_client_stays_connected(self) -> None:
+        graph = FakeGraph(hang_after_first_event=False)
+        service = RecommendationV2Service(recommendation_graph=graph, disconnect_poll_interval_s=0.01)
+
+        async def is_disconnected() -> bool:
+            return False
+
+        messages = asyncio.run(collect(service.chat_stream(build_request(), is_disconnected=is_disconnected)))
+
+        self.assertEqual(len(messages), 2)
+        self.assertEqual(MetricsRegistry().counter("recommendation_v2_runs_total", outcome="completed"), 1.0)
+
+    def test_disconnected_client_cancels_the_graph_run(self) -> None:
+        graph = FakeGraph(hang_after_first_event=True)
+        service = RecommendationV2Service(recommendation_graph=graph, disconnect_poll_interval_s=0.01)
+
+        async def is_disconnected() -> bool:
+            return True
+
+        async def run() -> list[str]:
+            messages = await collect(service.chat_stream(build_request(), is_disconnected=is_disconnected))
+            await asyncio.sleep(0)
+            return messages
+
+        messages = asyncio.run(run())
+
+        self.assertEqual(len(messages), 1)
+        self.assertTrue(graph.cancelled)
+        metrics = MetricsRegistry()
+        self.assertEqual(metrics.counter("recommendation_v2_runs_total", outcome="cancelled"), 1.0)
+        self.assertEqual(
+            metrics.counter("recommendation_v2_cancelled_runs_total", last_event="initializing"),
+            1.0,
+        )
+
+    def test_closing_the_stream_cancels_the_graph_run(self) -> None:
+        graph = FakeGraph(hang_after_first_event=True)
+        service = RecommendationV2Service(recommendation_graph=graph, disconnect_poll_interval_s=0.01)
+
+        async def run() -> None:
+            stream = service.chat_stream(build_request())
+            await anext(stream)
+            await stream.aclose()
+            await asyncio.sleep(0)
+
+        asyncio.run(run())
+
+        self.assertTrue(graph.cancelled)
+        self.assertEqual(MetricsRegistry().counter("recommendation_v2_runs_total", outcome="cancelled"), 1.0)
+
+
+class FakeRunEventBackend:
+    def __init__(self) -> None:
+        self.events: dict[str, list[dict[str, Any]]] = {}
+
+    def append_many(
+        self,
+        run_id: str,
+        user_id: str,
+        session_id: str,
+        events: list[dict[str, Any]],
+        ttl_s: float,
+    ) -> None:
+        _ = (user_id, session_id, ttl_s)
+        self.events.setdefault(run_id, []).extend(events)
+
+    def list_after(self, run_id: str, user_id: str, session_id: str, after_event_id: int) -> list[dict[str, Any]]:
+        _ = (user_id, session_id)
+        return [event for event in self.events.get(run_id, []) if event["event_id"] > after_event_id]
+
+
+def event_id_of(message: str) -> str:
+    return message.split("\n", 1)[0].removeprefix("id: ")
+
+
+class TestRecommendationV2ServiceResume(unittest.TestCase):
+    def setUp(self) -> None:
+        MetricsRegistry().reset()
+
+    def test_resumed_stream_reattaches_to_the_running_graph_within_the_grace_period(self) -> None:
+        graph = FakeGraph(hang_after_first_event=True)
+        service = RecommendationV2Service(
+            recommendation_graph=graph,
+            disconnect_poll_interval_s=0.01,
+            resume_grace_period_s=5.0,
+        )
+        request = build_request()
+
+        async def run() -> tuple[str, list[str]]:
+            stream = service.chat_stream(request)
+            first_message = await anext(stream)
+            await stream.aclose()
+            await asyncio.sleep(0)
+
+            resumed = await service.resume_stream(
+                user_id=request.session.user_id,
+                session_id=request.session.session_id,
+                last_event_id=event_id_of(first_message),
+            )
+            graph.release.set()
+            return first_message, await collect(resumed)
+
+        first_message, resumed_messages = asyncio.run(run())
+
+        self.assertFalse(graph.cancelled)
+        self.assertTrue(first_message.endswith(":1\nevent: initializing\ndata: {}\n\n"))
+        self.assertEqual(len(resumed_messages), 1)
+        self.assertIn(":2\nevent: done", resumed_messages[0])
+        self.assertEqual(MetricsRegistry().counter("recommendation_v2_runs_total", outcome="completed"), 1.0)
+
+    def test_new_message_cancels_the_sessions_detached_run_and_frees_its_slot(self) -> None:
+        graph = FakeGraph(hang_after_first_event=True)
+        service = RecommendationV2Service(
+            recommendation_graph=graph,
+            disconnect_poll_interval_s=0.01,
+            resume_grace_period_s=5.0,
+        )
+        request = build_request()
+        released: list[str] = []
+
+        async def run() -> None:
+            stream = service.chat_stream(request, on_run_finished=lambda: released.append("run"))
+            await anext(stream)
+            await stream.aclose()
+
+            await service.cancel_detached_runs(
+                user_id=request.session.user_id,
+                session_id=request.session.session_id,
+            )
+
+        asyncio.run(run())
+
+        self.assertTrue(graph.cancelled)
+        self.assertEqual(released, ["run"])
+        self.assertEqual(MetricsRegistry().counter("recommendation_v2_runs_total", outcome="cancelled"), 1.0)
+
+    def test_finished_run_is_replayed_from_the_last_event_id(self) -> None:
+        service = RecommendationV2Service(recommendation_graph=FakeGraph(hang_after_first_event=False))
+        request = build_request()
+
+        async def run() -> tuple[list[str], list[str]]:
+            messages = await collect(service.chat_stream(request))
+            resumed = await service.resume_stream(
+                user_id=request.session.user_id,
+                session_id=request.session.session_id,
+                last_event_id=event_id_of(messages[0]),
+            )
+            return messages, await collect(resumed)
+
+        messages, resumed_messages = asyncio.run(run())
+
+        self.assertEqual(resumed_messages, messages[1:])
+
+    def test_evicted_events_are_filled_from_the_backend_or_reported_as_expired(self) -> None:
+        request = build_request()
+
+        async def resume_from_the_start(backend: FakeRunEventBackend | None) -> list[str]:
+            registry = RecommendationRunRegistry(max_events_per_run=1, backend=backend)
+            service = RecommendationV2Service(
+                recommendation_graph=FakeGraph(hang_after_first_event=False),
+                run_registry=registry,
+            )
+            messages = await collect(service.chat_stream(request))
+            run_id, _, _ = event_id_of(messages[0]).rpartition(":")
+            resumed = await service.resume_stream(
+                user_id=request.session.user_id,
+                session_id=request.session.session_id,
+                last_event_id=f"{run_id}:0",
+            )
+            return await collect(resumed)
+
+        replayed_messages = asyncio.run(resume_from_the_start(FakeRunEventBackend()))
+
+        self.assertEqual(len(replayed_messages), 2)
+        with self.assertRaises(RecommendationRunEventsExpiredError):
+            asyncio.run(resume_from_the_start(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import unittest
 from collections.abc import AsyncGenerator
+from collections.abc import Callable
 
 from fastapi.testclient import TestClient
 
@@ -17,15 +18,32 @@ from api.schemas.session import SessionCreateResponseDto
 from api.schemas.session import SessionDeleteResponseDto
 from api.schemas.session import SessionRefDto
 from api.schemas.session import SessionStateResponseDto
+from api.services.admission_controller import ChatAdmissionController
+from api.services.recommendation_v2_service import RecommendationV2Service
 from api.utils.sse import MESSAGE_DELIMITER, format_sse
 from storage.health import StorageHealthReport
 
 
 class FakeRecommendationService:
+    async def cancel_detached_runs(self, *, user_id: str, session_id: str) -> None:
+        _ = (user_id, session_id)
+
     async def chat_stream(
         self,
         request: RecommendationRequestDto,
+        *,
+        is_disconnected: object = None,
+        on_run_finished: Callable[[], None] | None = None,
     ) -> AsyncGenerator[str, None]:
+        _ = is_disconnected
+        try:
+            async for message in self._messages(request):
+                yield message
+        finally:
+            if on_run_finished is not None:
+                on_run_finished()
+
+    async def _messages(self, request: RecommendationRequestDto) -> AsyncGenerator[str, None]:
         yield format_sse("init", {})
         yield format_sse(
             "recommendation",
@@ -167,5 +185,79 @@ class TestRecommendationEndpoints(unittest.TestCase):
         body = response.json()
         self.assertEqual(body["code"], "validation_error")
 
+    def test_chat_endpoint_rejects_user_over_the_per_user_cap(self) -> None:
+        payload = {
+            "session": {"user_id": "user-1", "session_id": "session-1"},
+            "message": "Recommend a calm trip",
+        }
+
+        with create_test_client() as client:
+            controller = _create_admission_controller(max_concurrent_runs=4, max_queued_runs=4)
+            controller.admit("user-1")
+            client.app.state.chat_admission_controller = controller
+            response = client.post("/api/v2/recommendations/chat", json=payload)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.json()["code"], "too_many_chat_runs")
+        self.assertEqual(response.headers["retry-after"], "7")
+
+    def test_chat_endpoint_returns_503_when_the_queue_is_full(self) -> None:
+        payload = {
+            "session": {"user_id": "user-1", "session_id": "session-1"},
+            "message": "Recommend a calm trip",
+        }
+
+        with create_test_client() as client:
+            controller = _create_admission_controller(max_concurrent_runs=1, max_queued_runs=0)
+            controller.admit("user-2")
+            client.app.state.chat_admission_controller = controller
+            response = client.post("/api/v2/recommendations/chat", json=payload)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["code"], "chat_capacity_exhausted")
+
+    def test_chat_run_releases_its_admission_slot_when_it_finishes(self) -> None:
+        payload = {
+            "session": {"user_id": "user-1", "session_id": "session-1"},
+            "message": "Recommend a calm trip",
+        }
+
+        with create_test_client() as client:
+            response = client.post("/api/v2/recommendations/chat", json=payload)
+            controller = client.app.state.chat_admission_controller
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(controller.active_runs, 0)
+
+    def test_resume_endpoint_rejects_unknown_runs_and_malformed_event_ids(self) -> None:
+        params = {"user_id": "user-1", "session_id": "session-1"}
+
+        with create_test_client() as client:
+            client.app.state.recommendation_v2_service = RecommendationV2Service(recommendation_graph=None)
+            malformed_response = client.get(
+                "/api/v2/recommendations/chat/resume",
+                params=params,
+                headers={"Last-Event-ID": "not-an-event-id"},
+            )
+            unknown_response = client.get(
+                "/api/v2/recommendations/chat/resume",
+                params={**params, "last_event_id": "run-1:3"},
+            )
+
+        self.assertEqual(malformed_response.status_code, 400)
+        self.assertEqual(malformed_response.json()["code"], "invalid_last_event_id")
+        self.assertEqual(unknown_response.status_code, 404)
+        self.assertEqual(unknown_response.json()["code"], "recommendation_run_not_found")
+
+
+def _create_admission_controller(*, max_concurrent_runs: int, max_queued_runs: int) -> ChatAdmissionController:
+    return ChatAdmissionController(
+        max_concurrent_runs=max_concurrent_runs,
+        max_queued_runs=max_queued_runs,
+        max_runs_per_user=1,
+        max_queue_wait_s=1.0,
+        retry_after_s=7,
+    )
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,14 +5,16 @@ import json
 MESSAGE_DELIMITER = "\n\n"
 
 
-def format_sse(event: str, data: dict[str, object]) -> str:
+def format_sse(event: str, data: dict[str, object], event_id: str | None = None) -> str:
     """Format an SSE event string.
 
     Args:
         event: The SSE event type name.
         data: The event payload as a dictionary (serialized to JSON).
+        event_id: Optional event id, sent back by clients as `Last-Event-ID` when resuming.
 
     Returns:
         A string formatted as an SSE event frame.
     """
-    return f"event: {event}\ndata: {json.dumps(data, default=str)}{MESSAGE_DELIMITER}"
+    id_line = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{id_line}event: {event}\ndata: {json.dumps(data, default=str)}{MESSAGE_DELIMITER}"
@@ -1,3 +1,4 @@
+from embeddings.cached_text_embedding_model import CachedTextEmbeddingModel
 from embeddings.configuration import EmbeddingProvider
 from embeddings.configuration import TextEmbeddingModelConfiguration
 from embeddings.configuration import load_text_embedding_model_configuration
@@ -5,9 +6,12 @@ from embeddings.loader import create_text_embedding_model
 from embeddings.loader import load_text_embedding_model
 from embeddings.openai_text_embedding_model import OpenAITextEmbeddingModel
 from embeddings.ollama_text_embedding_model import OllamaTextEmbeddingModel
+from embeddings.protocols import EmbeddingCacheBackendProtocol
 from embeddings.protocols import TextEmbeddingModelProtocol
 
 __all__ = [
+    "CachedTextEmbeddingModel",
+    "EmbeddingCacheBackendProtocol",
     "EmbeddingProvider",
     "TextEmbeddingModelConfiguration",
     "OllamaTextEmbeddingModel",
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+EmbedBatch = Callable[[list[str]], list[list[float]]]
+AsyncEmbedBatch = Callable[[list[str]], Awaitable[list[list[float]]]]
+
+
+def normalize_document_texts(texts: Sequence[str]) -> list[str]:
+    """Return stripped document texts, rejecting empty entries."""
+    normalized_texts: list[str] = []
+    for index, text in enumerate(texts):
+        normalized = text.strip()
+        if not normalized:
+            raise ValueError(f"texts[{index}] must not be empty")
+        normalized_texts.append(normalized)
+    return normalized_texts
+
+
+def split_into_batches(texts: Sequence[str], *, batch_size: int) -> list[list[str]]:
+    """Split texts into consecutive batches of at most `batch_size` items."""
+    if batch_size <= 0:
+        raise ValueError("batch_size must be greater than zero")
+    return [list(texts[start_index : start_index + batch_size]) for start_index in range(0, len(texts), batch_size)]
+
+
+def embed_batches(
+    embed_batch: EmbedBatch,
+    texts: Sequence[str],
+    *,
+    batch_size: int,
+    max_concurrency: int,
+) -> list[list[float]]:
+    """Embed texts batch by batch with up to `max_concurrency` batches in flight, preserving input order."""
+    if max_concurrency <= 0:
+        raise ValueError("max_concurrency must be greater than zero")
+
+    batches = split_into_batches(texts, batch_size=batch_size)
+    if len(batches) <= 1 or max_concurrency == 1:
+        batch_embeddings = [embed_batch(batch) for batch in batches]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(batches))) as executor:
+            batch_embeddings = list(executor.map(embed_batch, batches))
+
+    return _flatten_batch_embeddings(batches, batch_embeddings)
+
+
+async def aembed_batches(
+    aembed_batch: AsyncEmbedBatch,
+    texts: Sequence[str],
+    *,
+    batch_size: int,
+    max_concurrency: int,
+) -> list[list[float]]:
+    """Async variant of `embed_batches` bounded by a semaphore instead of a thread pool."""
+    if max_concurrency <= 0:
+        raise ValueError("max_concurrency must be greater than zero")
+
+    batches = split_into_batches(texts, batch_size=batch_size)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def embed_with_limit(batch: list[str]) -> list[list[float]]:
+        async with semaphore:
+            return await aembed_batch(batch)
+
+    batch_embeddings = await asyncio.gather(*(embed_with_limit(batch) for batch in batches))
+    return _flatten_batch_embeddings(batches, list(batch_embeddings))
+
+
+def _flatten_batch_embeddings(
+    batches: Sequence[Sequence[str]],
+    batch_embeddings: Sequence[Sequence[Sequence[float]]],
+) -> list[list[float]]:
+    embeddings: list[list[float]] = []
+    for batch, embeddings_for_batch in zip(batches, batch_embeddings, strict=True):
+        if len(embeddings_for_batch) != len(batch):
+            raise RuntimeError(
+                "Embedding backend returned a mismatched batch: "
+                f"expected {len(batch)} vectors, got {len(embeddings_for_batch)}"
+            )
+        embeddings.extend([float(value) for value in embedding] for embedding in embeddings_for_batch)
+    return embeddings
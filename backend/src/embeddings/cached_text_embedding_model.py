@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Sequence
+
+from embeddings.protocols import EmbeddingCacheBackendProtocol
+from embeddings.protocols import TextEmbeddingModelProtocol
+from utils.logger import LoggerManager
+from utils.metrics import MetricsRegistry
+from utils.ttl_cache import TTLCache
+
+logger = LoggerManager.get_logger(__name__)
+metrics = MetricsRegistry()
+
+
+def normalize_embedding_cache_text(text: str) -> str:
+    """Return the cache identity of a query: casefolded with collapsed whitespace."""
+    return " ".join(text.casefold().split())
+
+
+def embedding_cache_text_hash(text: str) -> str:
+    """Return the sha256 hex digest of the normalized query text."""
+    return hashlib.sha256(normalize_embedding_cache_text(text).encode("utf-8")).hexdigest()
+
+
+class CachedTextEmbeddingModel(TextEmbeddingModelProtocol):
+    """Embedding model wrapper with an in-process LRU and an optional persistent cache tier.
+
+    Lookups go LRU, then the persistent backend, then the wrapped model. Persistent-cache
+    failures are logged and treated as misses so caching never breaks embedding.
+    """
+
+    def __init__(
+        self,
+        embedding_model: TextEmbeddingModelProtocol,
+        *,
+        provider: str,
+        model_name: str,
+        max_entries: int = 1024,
+        ttl_s: float = 3600.0,
+        persistent_cache: EmbeddingCacheBackendProtocol | None = None,
+    ) -> None:
+        if embedding_model is None:
+            raise ValueError("embedding_model is required")
+
+        self.embedding_model = embedding_model
+        self.provider = provider
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.persistent_cache = persistent_cache
+        self._entries: TTLCache[str, list[float]] = TTLCache(max_entries=max_entries, ttl_s=ttl_s)
+
+    def attach_persistent_cache(self, persistent_cache: EmbeddingCacheBackendProtocol | None) -> None:
+        """Attach the persistent tier once storage is available (storage itself needs the model first)."""
+        self.persistent_cache = persistent_cache
+
+    def get_dimentions(self) -> int:
+        """Return embedding vector dimension of the wrapped model."""
+        return self.embedding_model.get_dimentions()
+
+    def check_health(self) -> bool:
+        """Return whether the wrapped model is healthy; the probe bypasses the cache."""
+        return self.embedding_model.check_health()
+
+    def embed_query(self, text: str) -> list[float]:
+        """Return embedding vector for one query string, reusing cached vectors when possible."""
+        if not text.strip():
+            raise ValueError("text must not be empty")
+
+        text_hash = embedding_cache_text_hash(text)
+        embedding = self._get_from_memory(text_hash)
+        if embedding is not None:
+            metrics.increment("embedding_cache_requests_total", result="memory_hit")
+            return embedding
+
+        embedding = self._get_from_persistent_cache(text_hash)
+        if embedding is not None:
+            metrics.increment("embedding_cache_requests_total", result="persistent_hit")
+            self._put_in_memory(text_hash, embedding)
+            return list(embedding)
+
+        metrics.increment("embedding_cache_requests_total", result="miss")
+        embedding = self.embedding_model.embed_query(text)
+        self._put_in_memory(text_hash, embedding)
+        self._put_in_persistent_cache(text_hash, embedding)
+        return list(embedding)
+
+    def embed_documents(self, texts: Sequence[str]) -> list[list[float]]:
+        """Return document embeddings from the wrapped model; documents bypass the query cache."""
+        return self.embedding_model.embed_documents(texts)
+
+    async def aembed_documents(self, texts: Sequence[str]) -> list[list[float]]:
+        """Async variant of `embed_documents`."""
+        return await self.embedding_model.aembed_documents(texts)
+
+    def clear(self) -> None:
+        """Drop all in-process cache entries."""
+        self._entries.clear()
+
+    def _get_from_memory(self, text_hash: str) -> list[float] | None:
+        embedding = self._entries.get(text_hash)
+        return list(embedding) if embedding is not None else None
+
+    def _put_in_memory(self, text_hash: str, embedding: list[float]) -> None:
+        self._entries.put(text_hash, list(embedding))
+
+    def _get_from_persistent_cache(self, text_hash: str) -> list[float] | None:
+        if self.persistent_cache is None:
+            return None
+        try:
+            return self.persistent_cache.get(self.provider, self.model_name, text_hash)
+        except Exception as error:
+            logger.warning("Persistent embedding cache lookup failed: %s", error)
+            metrics.increment("embedding_cache_errors_total", operation="get")
+            return None
+
+    def _put_in_persistent_cache(self, text_hash: str, embedding: list[float]) -> None:
+        if self.persistent_cache is None:
+            return
+        try:
+            self.persistent_cache.put(self.provider, self.model_name, text_hash, embedding)
+        except Exception as error:
+            logger.warning("Persistent embedding cache write failed: %s", error)
+            metrics.increment("embedding_cache_errors_total", operation="put")
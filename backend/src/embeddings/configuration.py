@@ -35,6 +35,30 @@ class TextEmbeddingModelConfiguration(BaseSettings):
         default=None,
         description="Optional provider API key, required for OpenAI embeddings.",
     )
+    cache_enabled: bool = Field(
+        default=True,
+        description="Cache query embeddings in process and, once storage is attached, in PostgreSQL.",
+    )
+    cache_max_entries: int = Field(
+        default=1024,
+        ge=1,
+        description="Maximum number of query embeddings kept in the in-process LRU cache.",
+    )
+    cache_ttl_s: float = Field(
+        default=3600.0,
+        gt=0.0,
+        description="Seconds an in-process cached query embedding stays valid.",
+    )
+    batch_size: int = Field(
+        default=64,
+        ge=1,
+        description="Number of documents sent to the provider in one embed_documents request.",
+    )
+    max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of embed_documents batch requests in flight at once.",
+    )
 
 
 def load_text_embedding_model_configuration(
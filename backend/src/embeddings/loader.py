@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from embeddings.cached_text_embedding_model import CachedTextEmbeddingModel
 from embeddings.configuration import TextEmbeddingModelConfiguration
 from embeddings.configuration import load_text_embedding_model_configuration
 from embeddings.openai_text_embedding_model import OpenAITextEmbeddingModel
@@ -12,13 +13,25 @@ from embeddings.protocols import TextEmbeddingModelProtocol
 def create_text_embedding_model(
     configuration: TextEmbeddingModelConfiguration,
 ) -> TextEmbeddingModelProtocol:
-    """Create the configured embedding model implementation."""
+    """Create the configured embedding model implementation, wrapped in a query cache when enabled."""
+    embedding_model: TextEmbeddingModelProtocol
     if configuration.provider == "ollama":
-        return OllamaTextEmbeddingModel(configuration)
-    if configuration.provider == "openai":
-        return OpenAITextEmbeddingModel(configuration)
+        embedding_model = OllamaTextEmbeddingModel(configuration)
+    elif configuration.provider == "openai":
+        embedding_model = OpenAITextEmbeddingModel(configuration)
+    else:
+        raise ValueError(f"Unsupported embeddings provider: {configuration.provider}")
 
-    raise ValueError(f"Unsupported embeddings provider: {configuration.provider}")
+    if not configuration.cache_enabled:
+        return embedding_model
+
+    return CachedTextEmbeddingModel(
+        embedding_model,
+        provider=configuration.provider,
+        model_name=configuration.model_name.strip(),
+        max_entries=configuration.cache_max_entries,
+        ttl_s=configuration.cache_ttl_s,
+    )
 
 
 def load_text_embedding_model(
@@ -5,6 +5,9 @@ from collections.abc import Sequence
 from langchain_core.embeddings import Embeddings
 from langchain_ollama import OllamaEmbeddings
 
+from embeddings.batching import aembed_batches
+from embeddings.batching import embed_batches
+from embeddings.batching import normalize_document_texts
 from embeddings.configuration import TextEmbeddingModelConfiguration
 from embeddings.protocols import TextEmbeddingModelProtocol
 from utils.logger import LoggerManager
@@ -112,6 +115,50 @@ class OllamaTextEmbeddingModel(TextEmbeddingModelProtocol):
         logger.verbose("Generated embedding vector with dimensions=%s", len(normalized_embedding))
         return normalized_embedding
 
+    def embed_documents(self, texts: Sequence[str]) -> list[list[float]]:
+        """Return embedding vectors for documents using batched, bounded-concurrency backend calls."""
+        normalized_texts = normalize_document_texts(texts)
+        if not normalized_texts:
+            return []
+
+        logger.verbose(
+            "Generating embeddings for %s document(s) batch_size=%s max_concurrency=%s",
+            len(normalized_texts),
+            self.configuration.batch_size,
+            self.configuration.max_concurrency,
+        )
+        embeddings = embed_batches(
+            self.backend.embed_documents,
+            normalized_texts,
+            batch_size=self.configuration.batch_size,
+            max_concurrency=self.configuration.max_concurrency,
+        )
+        for embedding in embeddings:
+            self._validate_embedding_dimension(embedding)
+        return embeddings
+
+    async def aembed_documents(self, texts: Sequence[str]) -> list[list[float]]:
+        """Async variant of `embed_documents`."""
+        normalized_texts = normalize_document_texts(texts)
+        if not normalized_texts:
+            return []
+
+        logger.verbose(
+            "Generating embeddings asynchronously for %s document(s) batch_size=%s max_concurrency=%s",
+            len(normalized_texts),
+            self.configuration.batch_size,
+            self.configuration.max_concurrency,
+        )
+        embeddings = await aembed_batches(
+            self.backend.aembed_documents,
+            normalized_texts,
+            batch_size=self.configuration.batch_size,
+            max_concurrency=self.configuration.max_concurrency,
+        )
+        for embedding in embeddings:
+            self._validate_embedding_dimension(embedding)
+        return embeddings
+
     def _validate_embedding_dimension(self, embedding: Sequence[float]) -> None:
         embedding_dimension = len(embedding)
         if embedding_dimension <= 0:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Protocol
 
 
@@ -17,3 +18,23 @@ class TextEmbeddingModelProtocol(Protocol):
     def embed_query(self, text: str) -> list[float]:
         """Return a single embedding vector for one query string."""
         ...
+
+    def embed_documents(self, texts: Sequence[str]) -> list[list[float]]:
+        """Return one embedding vector per document, in input order, using batched backend calls."""
+        ...
+
+    async def aembed_documents(self, texts: Sequence[str]) -> list[list[float]]:
+        """Async variant of `embed_documents`."""
+        ...
+
+
+class EmbeddingCacheBackendProtocol(Protocol):
+    """Contract for a persistent query-embedding cache keyed by provider, model and text hash."""
+
+    def get(self, provider: str, model_name: str, text_hash: str) -> list[float] | None:
+        """Return a cached embedding vector if present."""
+        ...
+
+    def put(self, provider: str, model_name: str, text_hash: str, embedding: Sequence[float]) -> None:
+        """Store one embedding vector."""
+        ...
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from collections.abc import Sequence
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from embeddings.cached_text_embedding_model import CachedTextEmbeddingModel
+from embeddings.cached_text_embedding_model import embedding_cache_text_hash
+from utils.metrics import MetricsRegistry
+
+
+class CountingEmbeddingModel:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.healthy = True
+
+    def check_health(self) -> bool:
+        return self.healthy
+
+    def get_dimentions(self) -> int:
+        return 3
+
+    def embed_query(self, text: str) -> list[float]:
+        self.calls.append(text)
+        return [float(len(text)), 1.0, 0.0]
+
+
+class InMemoryEmbeddingCacheBackend:
+    def __init__(self) -> None:
+        self.rows: dict[tuple[str, str, str], list[float]] = {}
+
+    def get(self, provider: str, model_name: str, text_hash: str) -> list[float] | None:
+        return self.rows.get((provider, model_name, text_hash))
+
+    def put(self, provider: str, model_name: str, text_hash: str, embedding: Sequence[float]) -> None:
+        self.rows[(provider, model_name, text_hash)] = list(embedding)
+
+
+class FailingEmbeddingCacheBackend:
+    def get(self, provider: str, model_name: str, text_hash: str) -> list[float] | None:
+        raise RuntimeError("database unavailable")
+
+    def put(self, provider: str, model_name: str, text_hash: str, embedding: Sequence[float]) -> None:
+        raise RuntimeError("database unavailable")
+
+
+class TestCachedTextEmbeddingModel(unittest.TestCase):
+    def setUp(self) -> None:
+        MetricsRegistry().reset()
+        self.backend_model = CountingEmbeddingModel()
+
+    def test_repeated_normalized_queries_hit_memory_cache(self) -> None:
+        model = CachedTextEmbeddingModel(self.backend_model, provider="ollama", model_name="nomic")
+
+        first = model.embed_query("Beach destination for relaxing")
+        second = model.embed_query("  beach   destination for RELAXING ")
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.backend_model.calls, ["Beach destination for relaxing"])
+        self.assertEqual(MetricsRegistry().counter("embedding_cache_requests_total", result="miss"), 1.0)
+        self.assertEqual(MetricsRegistry().counter("embedding_cache_requests_total", result="memory_hit"), 1.0)
+
+    def test_lru_evicts_least_recently_used_entry(self) -> None:
+        model = CachedTextEmbeddingModel(self.backend_model, provider="ollama", model_name="nomic", max_entries=2)
+
+        model.embed_query("alpha")
+        model.embed_query("beta")
+        model.embed_query("alpha")
+        model.embed_query("gamma")
+        model.embed_query("alpha")
+        model.embed_query("beta")
+
+        self.assertEqual(self.backend_model.calls, ["alpha", "beta", "gamma", "beta"])
+
+    def test_health_check_bypasses_the_cache(self) -> None:
+        model = CachedTextEmbeddingModel(self.backend_model, provider="ollama", model_name="nomic")
+
+        self.assertTrue(model.check_health())
+        self.backend_model.healthy = False
+
+        self.assertFalse(model.check_health())
+        self.assertEqual(self.backend_model.calls, [])
+
+    def test_expired_entries_are_embedded_again(self) -> None:
+        model = CachedTextEmbeddingModel(self.backend_model, provider="ollama", model_name="nomic", ttl_s=10.0)
+
+        with patch("utils.ttl_cache.time.monotonic", return_value=100.0):
+            model.embed_query("alpha")
+        with patch("utils.ttl_cache.time.monotonic", return_value=111.0):
+            model.embed_query("alpha")
+
+        self.assertEqual(self.backend_model.calls, ["alpha", "alpha"])
+
+    def test_persistent_cache_is_shared_between_instances(self) -> None:
+        persistent_cache = InMemoryEmbeddingCacheBackend()
+        first_model = CachedTextEmbeddingModel(
+            self.backend_model,
+            provider="ollama",
+            model_name="nomic",
+            persistent_cache=persistent_cache,
+        )
+        second_model = CachedTextEmbeddingModel(self.backend_model, provider="ollama", model_name="nomic")
+        second_model.attach_persistent_cache(persistent_cache)
+
+        first_model.embed_query("beach destination")
+        second_model.embed_query("Beach destination")
+
+        self.assertEqual(self.backend_model.calls, ["beach destination"])
+        self.assertIn(("ollama", "nomic", embedding_cache_text_hash("beach destination")), persistent_cache.rows)
+        self.assertEqual(MetricsRegistry().counter("embedding_cache_requests_total", result="persistent_hit"), 1.0)
+
+    def test_persistent_cache_failures_fall_back_to_model(self) -> None:
+        model = CachedTextEmbeddingModel(
+            self.backend_model,
+            provider="ollama",
+            model_name="nomic",
+            persistent_cache=FailingEmbeddingCacheBackend(),
+        )
+
+        self.assertEqual(model.embed_query("alpha"), [5.0, 1.0, 0.0])
+        self.assertEqual(MetricsRegistry().counter("embedding_cache_errors_total", operation="get"), 1.0)
+        self.assertEqual(MetricsRegistry().counter("embedding_cache_errors_total", operation="put"), 1.0)
+
+    def test_rejects_blank_query(self) -> None:
+        model = CachedTextEmbeddingModel(self.backend_model, provider="ollama", model_name="nomic")
+
+        with self.assertRaises(ValueError):
+            model.embed_query("   ")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+
+from langchain_core.embeddings import Embeddings
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from embeddings.configuration import TextEmbeddingModelConfiguration
+from embeddings.ollama_text_embedding_model import OllamaTextEmbeddingModel
+
+
+class RecordingEmbeddingsBackend(Embeddings):
+    def __init__(self) -> None:
+        self.document_batches: list[list[str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def embed_query(self, text: str) -> list[float]:
+        return [float(len(text)), 0.0]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.document_batches.append(list(texts))
+        return [self.embed_query(text) for text in texts]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return self.embed_documents(texts)
+        finally:
+            self.in_flight -= 1
+
+
+class TestTextEmbeddingBatching(unittest.TestCase):
+    def setUp(self) -> None:
+        self.backend = RecordingEmbeddingsBackend()
+        self.model = OllamaTextEmbeddingModel(
+            TextEmbeddingModelConfiguration(
+                provider="ollama",
+                model_name="nomic-embed-text",
+                base_url="http://localhost:11434",
+                batch_size=2,
+                max_concurrency=2,
+            ),
+            backend=self.backend,
+        )
+
+    def test_embed_documents_splits_into_batches_and_preserves_order(self) -> None:
+        texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+        embeddings = self.model.embed_documents(texts)
+
+        self.assertEqual([embedding[0] for embedding in embeddings], [1.0, 2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(
+            sorted(self.backend.document_batches),
+            [["a", "bb"], ["ccc", "dddd"], ["eeeee"]],
+        )
+
+    def test_aembed_documents_bounds_concurrency(self) -> None:
+        texts = [f"text-{index}" for index in range(10)]
+
+        embeddings = asyncio.run(self.model.aembed_documents(texts))
+
+        self.assertEqual(len(embeddings), len(texts))
+        self.assertEqual(len(self.backend.document_batches), 5)
+        self.assertLessEqual(self.backend.max_in_flight, 2)
+
+    def test_embed_documents_rejects_empty_text(self) -> None:
+        with self.assertRaises(ValueError):
+            self.model.embed_documents(["valid", "   "])
+
+    def test_embed_documents_returns_empty_list_for_no_texts(self) -> None:
+        self.assertEqual(self.model.embed_documents([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
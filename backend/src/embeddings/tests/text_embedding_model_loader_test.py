@@ -7,6 +7,7 @@ from unittest.mock import patch
 
 sys.path.append(str(Path(__file__).resolve().parents[2]))
 
+from embeddings.cached_text_embedding_model import CachedTextEmbeddingModel
 from embeddings.configuration import TextEmbeddingModelConfiguration
 from embeddings.loader import create_text_embedding_model
 
@@ -25,7 +26,10 @@ class TestTextEmbeddingModelLoader(unittest.TestCase):
         embedding_model = create_text_embedding_model(configuration)
 
         ollama_model_class.assert_called_once_with(configuration)
-        self.assertIs(embedding_model, expected_model)
+        self.assertIsInstance(embedding_model, CachedTextEmbeddingModel)
+        self.assertIs(embedding_model.embedding_model, expected_model)
+        self.assertEqual(embedding_model.provider, "ollama")
+        self.assertEqual(embedding_model.model_name, "nomic-embed-text")
 
     @patch("embeddings.loader.OpenAITextEmbeddingModel")
     def test_create_text_embedding_model_returns_openai_model(self, openai_model_class) -> None:
@@ -40,6 +44,22 @@ class TestTextEmbeddingModelLoader(unittest.TestCase):
         embedding_model = create_text_embedding_model(configuration)
 
         openai_model_class.assert_called_once_with(configuration)
+        self.assertIsInstance(embedding_model, CachedTextEmbeddingModel)
+        self.assertIs(embedding_model.embedding_model, expected_model)
+
+    @patch("embeddings.loader.OllamaTextEmbeddingModel")
+    def test_create_text_embedding_model_skips_cache_when_disabled(self, ollama_model_class) -> None:
+        expected_model = object()
+        ollama_model_class.return_value = expected_model
+        configuration = TextEmbeddingModelConfiguration(
+            provider="ollama",
+            model_name="nomic-embed-text",
+            base_url="http://localhost:11434",
+            cache_enabled=False,
+        )
+
+        embedding_model = create_text_embedding_model(configuration)
+
         self.assertIs(embedding_model, expected_model)
 
 
@@ -3,8 +3,11 @@ from __future__ import annotations
 from enum import Enum
 from pathlib import Path
 
+from typing import Any
+
 from pydantic import (
     Field,
+    field_validator,
 )
 from pydantic_settings import BaseSettings
 from pydantic_settings import SettingsConfigDict
@@ -24,6 +27,11 @@ class LogLevel(str, Enum):
     error = "error"
 
 
+class FilterExtractionMode(str, Enum):
+    fan_out = "fan_out"
+    fused = "fused"
+
+
 class Configuration(BaseSettings):
     """Configuration settings for the recommender application."""
 
@@ -48,3 +56,51 @@ class Configuration(BaseSettings):
         5,
         description="The maximum number of recommendations to return to the user",
     )
+    filter_extraction_mode: FilterExtractionMode = Field(
+        FilterExtractionMode.fan_out,
+        description="Whether recommendation_v2 synthesizes the request and extracts filters with parallel LLM calls (fan_out) or a single combined call (fused)",
+    )
+    response_streaming_enabled: bool = Field(
+        False,
+        description="Whether recommendation_v2 streams user-facing responses as response_delta events while they are generated",
+    )
+    speculative_filter_extraction_enabled: bool = Field(
+        False,
+        description="Whether recommendation_v2 starts request synthesis and filter extraction in parallel with request routing, discarding them on out-of-scope turns",
+    )
+    research_destination_timeout_s: float = Field(
+        45.0,
+        gt=0.0,
+        description="Maximum time one destination's research may take before it is abandoned",
+    )
+    research_turn_timeout_s: float | None = Field(
+        None,
+        gt=0.0,
+        description="Maximum time the research node holds a turn open before leaving unfinished destinations behind; unset waits for every destination",
+    )
+    research_max_concurrency: int = Field(
+        16,
+        ge=1,
+        description="Maximum number of destinations researched at once across all turns",
+    )
+    research_background_completion_enabled: bool = Field(
+        False,
+        description="Whether destinations unfinished at the turn deadline keep running in the background and are saved to the session, instead of being cancelled",
+    )
+    rule_based_filter_extraction_enabled: bool = Field(
+        True,
+        description="Whether recommendation_v2 tries deterministic rules before the budget, season and parent-region extraction LLM calls",
+    )
+    rule_based_filter_extraction_min_confidence: float = Field(
+        0.8,
+        ge=0.0,
+        le=1.0,
+        description="Minimum rule-based extraction confidence needed to skip the LLM call",
+    )
+
+    @field_validator("research_turn_timeout_s", mode="before")
+    @classmethod
+    def parse_optional_research_turn_timeout(cls, value: Any) -> Any:
+        if isinstance(value, str) and not value.strip():
+            return None
+        return value
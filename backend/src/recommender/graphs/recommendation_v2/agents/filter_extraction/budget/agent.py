@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
 
 from recommender.graphs.recommendation_v2.agents.filter_extraction.budget.models import (
     RecommendationV2BudgetFilterExtractionInput,
@@ -11,6 +12,9 @@ from recommender.graphs.recommendation_v2.agents.filter_extraction.budget.models
 from recommender.graphs.recommendation_v2.agents.filter_extraction.budget.prompt import (
     prompt,
 )
+from recommender.models.llm.llm_response_cache import LLMResponseCache
+from recommender.models.llm.llm_response_cache import ainvoke_structured_output
+from recommender.models.llm.llm_response_cache import invoke_structured_output
 from utils.logger import LoggerManager
 
 logger = LoggerManager.get_logger(__name__)
@@ -19,12 +23,16 @@ logger = LoggerManager.get_logger(__name__)
 class RecommendationV2BudgetFilterExtractionAgent:
     """Agent that extracts budget filters for recommendation_v2."""
 
+    cache_agent_name = "budget_filter"
+
     def __init__(
         self,
         *,
         llm: BaseChatModel,
+        response_cache: LLMResponseCache | None = None,
     ) -> None:
         self._llm = llm
+        self._response_cache = response_cache
         self._prompt_template = prompt
         self._structured_output_llm = self._llm.with_structured_output(
             RecommendationV2BudgetFilterExtractionResult,
@@ -34,12 +42,40 @@ class RecommendationV2BudgetFilterExtractionAgent:
         self,
         inputs: RecommendationV2BudgetFilterExtractionInput,
     ) -> RecommendationV2BudgetFilterExtractionResult:
+        result = invoke_structured_output(
+            self._structured_output_llm,
+            self._build_prompt_messages(inputs),
+            output_type=RecommendationV2BudgetFilterExtractionResult,
+            agent_name=self.cache_agent_name,
+            llm=self._llm,
+            response_cache=self._response_cache,
+        )
+        logger.verbose("Budget filter-extraction structured LLM result: %s", result)
+        return result
+
+    async def ainvoke(
+        self,
+        inputs: RecommendationV2BudgetFilterExtractionInput,
+    ) -> RecommendationV2BudgetFilterExtractionResult:
+        result = await ainvoke_structured_output(
+            self._structured_output_llm,
+            self._build_prompt_messages(inputs),
+            output_type=RecommendationV2BudgetFilterExtractionResult,
+            agent_name=self.cache_agent_name,
+            llm=self._llm,
+            response_cache=self._response_cache,
+        )
+        logger.verbose("Budget filter-extraction structured LLM result: %s", result)
+        return result
+
+    def _build_prompt_messages(
+        self,
+        inputs: RecommendationV2BudgetFilterExtractionInput,
+    ) -> list[BaseMessage]:
         prompt_value = self._prompt_template.format_prompt(
             current_user_request=inputs.current_user_request,
             previous_budget_filter=RecommendationV2BudgetFilterExtractionResult(
                 cost_term=inputs.previous_cost_term,
             ).model_dump_json(indent=2, exclude_none=True),
         )
-        result = self._structured_output_llm.invoke(prompt_value.to_messages())
-        logger.verbose("Raw budget filter-extraction structured LLM result: %s", result)
-        return RecommendationV2BudgetFilterExtractionResult.model_validate(result)
+        return prompt_value.to_messages()
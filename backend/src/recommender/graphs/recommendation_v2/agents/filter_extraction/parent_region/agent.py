@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
 
 from recommender.graphs.recommendation_v2.agents.filter_extraction.parent_region.models import (
     RecommendationV2ParentRegionFilterExtractionInput,
@@ -11,6 +12,9 @@ from recommender.graphs.recommendation_v2.agents.filter_extraction.parent_region
 from recommender.graphs.recommendation_v2.agents.filter_extraction.parent_region.prompt import (
     prompt,
 )
+from recommender.models.llm.llm_response_cache import LLMResponseCache
+from recommender.models.llm.llm_response_cache import ainvoke_structured_output
+from recommender.models.llm.llm_response_cache import invoke_structured_output
 from utils.logger import LoggerManager
 
 logger = LoggerManager.get_logger(__name__)
@@ -19,12 +23,16 @@ logger = LoggerManager.get_logger(__name__)
 class RecommendationV2ParentRegionFilterExtractionAgent:
     """Agent that extracts broad parent-region (continent-level) filters for recommendation_v2."""
 
+    cache_agent_name = "parent_region_filter"
+
     def __init__(
         self,
         *,
         llm: BaseChatModel,
+        response_cache: LLMResponseCache | None = None,
     ) -> None:
         self._llm = llm
+        self._response_cache = response_cache
         self._prompt_template = prompt
         self._structured_output_llm = self._llm.with_structured_output(
             RecommendationV2ParentRegionFilterExtractionResult,
@@ -34,9 +42,37 @@ class RecommendationV2ParentRegionFilterExtractionAgent:
         self,
         inputs: RecommendationV2ParentRegionFilterExtractionInput,
     ) -> RecommendationV2ParentRegionFilterExtractionResult:
+        result = invoke_structured_output(
+            self._structured_output_llm,
+            self._build_prompt_messages(inputs),
+            output_type=RecommendationV2ParentRegionFilterExtractionResult,
+            agent_name=self.cache_agent_name,
+            llm=self._llm,
+            response_cache=self._response_cache,
+        )
+        logger.verbose("Parent-region filter-extraction structured LLM result: %s", result)
+        return result
+
+    async def ainvoke(
+        self,
+        inputs: RecommendationV2ParentRegionFilterExtractionInput,
+    ) -> RecommendationV2ParentRegionFilterExtractionResult:
+        result = await ainvoke_structured_output(
+            self._structured_output_llm,
+            self._build_prompt_messages(inputs),
+            output_type=RecommendationV2ParentRegionFilterExtractionResult,
+            agent_name=self.cache_agent_name,
+            llm=self._llm,
+            response_cache=self._response_cache,
+        )
+        logger.verbose("Parent-region filter-extraction structured LLM result: %s", result)
+        return result
+
+    def _build_prompt_messages(
+        self,
+        inputs: RecommendationV2ParentRegionFilterExtractionInput,
+    ) -> list[BaseMessage]:
         prompt_value = self._prompt_template.format_prompt(
             current_user_request=inputs.current_user_request,
         )
-        result = self._structured_output_llm.invoke(prompt_value.to_messages())
-        logger.verbose("Raw parent-region filter-extraction structured LLM result: %s", result)
-        return RecommendationV2ParentRegionFilterExtractionResult.model_validate(result)
+        return prompt_value.to_messages()
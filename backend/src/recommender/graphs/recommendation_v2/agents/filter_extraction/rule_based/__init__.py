@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from recommender.graphs.recommendation_v2.agents.filter_extraction.rule_based.extractor import (
+    RuleBasedExtraction,
+    extract_budget_filter,
+    extract_parent_region_filter,
+    extract_season_filter,
+    try_rule_based_extraction,
+)
+
+__all__ = [
+    "RuleBasedExtraction",
+    "extract_budget_filter",
+    "extract_parent_region_filter",
+    "extract_season_filter",
+    "try_rule_based_extraction",
+]
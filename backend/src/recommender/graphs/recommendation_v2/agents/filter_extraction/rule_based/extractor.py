@@ -0,0 +1,498 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Generic
+from typing import TypeVar
+
+from recommender.graphs.recommendation_v2.agents.filter_extraction.budget.models import (
+    RecommendationV2BudgetFilterExtractionInput,
+    RecommendationV2BudgetFilterExtractionResult,
+)
+from recommender.graphs.recommendation_v2.agents.filter_extraction.parent_region.models import (
+    ParentRegionEntry,
+    RecommendationV2ParentRegionFilterExtractionInput,
+    RecommendationV2ParentRegionFilterExtractionResult,
+)
+from recommender.graphs.recommendation_v2.agents.filter_extraction.season.models import (
+    RecommendationV2SeasonFilterExtractionInput,
+    RecommendationV2SeasonFilterExtractionResult,
+)
+from recommender.graphs.recommendation_v2.filter_models import (
+    ALLOWED_RECOMMENDATION_V2_PARENT_REGION_NAMES,
+    AbstractCostTerm,
+    CostTerm,
+    CostTermDuration,
+    CostTermOperator,
+    ExplicitCostTermFilter,
+    MonthCode,
+    SeasonCode,
+)
+from utils.logger import LoggerManager
+from utils.metrics import MetricsRegistry
+
+logger = LoggerManager.get_logger(__name__)
+
+InputT = TypeVar("InputT")
+ResultT = TypeVar("ResultT")
+
+# Confidence levels assigned by the rules. Anything the rules cannot fully account for is
+# reported as ambiguous so the caller falls back to the LLM extraction agent.
+CONFIDENCE_EXPLICIT = 0.95
+CONFIDENCE_NO_SIGNAL = 0.9
+CONFIDENCE_KEYWORD = 0.85
+CONFIDENCE_AMBIGUOUS = 0.3
+CONFIDENCE_NONE = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class RuleBasedExtraction(Generic[ResultT]):
+    """Filter-extraction result produced by the deterministic rules with its confidence."""
+
+    result: ResultT
+    confidence: float
+    reason: str
+
+
+_CLAUSE_BOUNDARY_PATTERN = re.compile(r"[,.;:!?()]|\bbut\b|\bwhile\b|\bwhereas\b")
+_NEGATION_PATTERN = re.compile(
+    r"\b(?:not|no|never|nor|except|excluding|exclude|avoid|avoiding|outside|other than|"
+    r"rather than|instead of|without|nowhere|don't|do not|doesn't|does not|isn't|won't|skip)\b"
+)
+_REMOVAL_PATTERN = re.compile(
+    r"\b(?:remove|removing|clear|clearing|drop|dropping|reset|ignore|forget|lift|scrap|delete)\b"
+    r"[^.?!]{0,40}?\b(?:filters?|constraints?|limits?|restrictions?|budget|price|cost|season|timing|"
+    r"months?|dates?|regions?|continents?|everything)\b"
+    r"|\b(?:no longer|anymore|any more|doesn't matter|does not matter|don't care|do not care|regardless)\b"
+    r"|\bany\s+(?:budget|price|season|time|month|timing|region|continent|where)\b"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _Mention(Generic[ResultT]):
+    value: ResultT
+    start: int
+    end: int
+
+
+def _normalize_request(user_request: str) -> str:
+    return user_request.lower().replace("’", "'").replace("–", "-").replace("—", "-")
+
+
+def _clause_before(text: str, position: int) -> str:
+    boundaries = list(_CLAUSE_BOUNDARY_PATTERN.finditer(text, 0, position))
+    return text[boundaries[-1].end() if boundaries else 0 : position]
+
+
+def _clause_after(text: str, position: int) -> str:
+    boundary = _CLAUSE_BOUNDARY_PATTERN.search(text, position)
+    return text[position : boundary.start() if boundary else len(text)]
+
+
+def _is_negated(text: str, mention: _Mention[object]) -> bool:
+    return _NEGATION_PATTERN.search(_clause_before(text, mention.start)) is not None
+
+
+def _mask(text: str, mentions: list[_Mention[object]]) -> str:
+    masked = list(text)
+    for mention in mentions:
+        masked[mention.start : mention.end] = " " * (mention.end - mention.start)
+    return "".join(masked)
+
+
+def _find_mentions(
+    text: str,
+    patterns: dict[ResultT, re.Pattern[str]],
+) -> list[_Mention[ResultT]]:
+    mentions = [
+        _Mention(value=value, start=match.start(), end=match.end())
+        for value, pattern in patterns.items()
+        for match in pattern.finditer(text)
+    ]
+    return sorted(mentions, key=lambda mention: mention.start)
+
+
+def _unique_in_order(values: list[ResultT]) -> list[ResultT]:
+    return list(dict.fromkeys(values))
+
+
+# --- season --------------------------------------------------------------------------------
+
+_MONTH_PATTERNS: dict[MonthCode, re.Pattern[str]] = {
+    month: re.compile(pattern)
+    for month, pattern in {
+        "jan": r"\bjan(?:uary)?\b",
+        "feb": r"\bfeb(?:ruary)?\b",
+        "mar": r"\bmarch\b",
+        "apr": r"\bapr(?:il)?\b",
+        "may": r"\b(?:in|during|early|late|mid|this|next|from|until|till|through|by|around|or|and|to)[\s-]+may\b",
+        "jun": r"\bjune?\b",
+        "jul": r"\bjuly?\b",
+        "aug": r"\baug(?:ust)?\b",
+        "sep": r"\bsep(?:t|tember)?\b",
+        "oct": r"\boct(?:ober)?\b",
+        "nov": r"\bnov(?:ember)?\b",
+        "dec": r"\bdec(?:ember)?\b|\bchristmas\b|\bxmas\b",
+    }.items()
+}
+_SEASON_PATTERNS: dict[SeasonCode, re.Pattern[str]] = {
+    season: re.compile(pattern)
+    for season, pattern in {
+        "winter": r"\bwinter(?:time)?\b",
+        "spring": r"\bspring(?:time)?\b(?!\s+break)",
+        "summer": r"\bsummer(?:time)?\b",
+        "autumn": r"\bautumn\b|\b(?:the|this|next|in|during|early|late|mid)[\s-]+fall\b",
+    }.items()
+}
+_MONTH_RANGE_PATTERN = re.compile(
+    r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s*(?:-|to|through|thru|till|until)\s*"
+    r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)"
+)
+_IMPLICIT_TIMING_PATTERN = re.compile(
+    r"\b(?:new year'?s?|easter|thanksgiving|halloween|holiday season|school holidays?|spring break|"
+    r"soon|asap|next (?:week|month|year)|this (?:week|month|weekend)|weekend|"
+    r"warm|warmer|warmth|warms? up|cools? down|cold|colder|chilly|freezing|hot|hotter|heat|cooler|"
+    r"snow|snowy|ski|skiing|fall|festival|festivals|oktoberfest|day of the dead|carnival|mardi gras|"
+    r"sunny|sunshine|rainy|monsoon|dry season|wet season|cherry blossoms?|northern lights|foliage|"
+    r"season|seasons|seasonal|months?|dates?|timing|shoulder)\b"
+)
+_CAPITALIZED_MAY_PATTERN = re.compile(r"\bMay\b")
+_PER_DURATION_PATTERN = re.compile(r"\b(?:per|a|an|each|every)\s+(?:day|night|week|month)\b")
+
+
+def extract_season_filter(
+    inputs: RecommendationV2SeasonFilterExtractionInput,
+) -> RuleBasedExtraction[RecommendationV2SeasonFilterExtractionResult]:
+    """Extract plainly stated season and month filters from the current turn."""
+
+    text = _normalize_request(inputs.current_user_request)
+    previous_result = RecommendationV2SeasonFilterExtractionResult(
+        season=inputs.previous_season,
+        months=inputs.previous_months,
+    )
+
+    if _REMOVAL_PATTERN.search(text):
+        return RuleBasedExtraction(previous_result, CONFIDENCE_NONE, "removal_request")
+
+    month_mentions = _find_mentions(text, _MONTH_PATTERNS)
+    season_mentions = _find_mentions(text, _SEASON_PATTERNS)
+    mentions = [*month_mentions, *season_mentions]
+    residual_text = _PER_DURATION_PATTERN.sub(" ", _mask(text, mentions))
+
+    # A capitalized "May" that is not introduced like a month is too ambiguous for the rules.
+    may_mentions = [mention for mention in month_mentions if mention.value == "may"]
+    if _IMPLICIT_TIMING_PATTERN.search(residual_text) or len(
+        _CAPITALIZED_MAY_PATTERN.findall(inputs.current_user_request)
+    ) > len(may_mentions):
+        return RuleBasedExtraction(previous_result, CONFIDENCE_AMBIGUOUS, "implicit_timing")
+
+    if not mentions:
+        return RuleBasedExtraction(previous_result, CONFIDENCE_NO_SIGNAL, "no_timing_signal")
+
+    if _MONTH_RANGE_PATTERN.search(text) or any(_is_negated(text, mention) for mention in mentions):
+        return RuleBasedExtraction(previous_result, CONFIDENCE_AMBIGUOUS, "month_range_or_negation")
+
+    seasons = _unique_in_order([mention.value for mention in season_mentions])
+    if len(seasons) > 1:
+        return RuleBasedExtraction(previous_result, CONFIDENCE_AMBIGUOUS, "multiple_seasons")
+
+    return RuleBasedExtraction(
+        RecommendationV2SeasonFilterExtractionResult(
+            season=seasons[0] if seasons else None,
+            months=_unique_in_order([mention.value for mention in month_mentions]),
+        ),
+        CONFIDENCE_EXPLICIT,
+        "explicit_timing",
+    )
+
+
+# --- budget --------------------------------------------------------------------------------
+
+_COST_LEVEL_PATTERNS: dict[AbstractCostTerm, re.Pattern[str]] = {
+    level: re.compile(pattern)
+    for level, pattern in {
+        "low": (
+            r"\b(?:cheap|cheapest|inexpensive|low[- ]cost|low[- ]budget|budget[- ]friendly|affordable|"
+            r"on a (?:tight |shoestring |small |strict |limited )?budget|shoestring|backpacker|"
+            r"frugal|economical|without (?:spending|breaking) (?:a fortune|the bank))\b"
+        ),
+        "medium": r"\b(?:mid[- ]range|mid[- ]priced|moderately priced|moderate budget|reasonably priced)\b",
+        "high": (
+            r"\b(?:luxury|luxurious|upscale|high[- ]end|five[- ]star|5[- ]star|lavish|splurge|"
+            r"money is no object|opulent)\b"
+        ),
+    }.items()
+}
+_MONEY_CUE_PATTERN = re.compile(
+    r"[$€£]|\b(?:budget|budgets|budgeting|budgeted|cost|costs|costly|price|prices|priced|pricey|"
+    r"pricy|expensive|cheap\w*|afford\w*|money|cash|spend|spending|splurge|fortune|bucks|dollars?|"
+    r"euros?|pounds?|usd|eur|gbp|bargain|deals?|premium|posh|fancy|wallet|broke|bank|savings|\d+\s?k)\b"
+)
+_HEDGED_COST_LEVEL_PATTERN = re.compile(r"\b(?:somewhat|fairly|kind of|sort of|semi|pretty|not too|not very)\s*$")
+_AMOUNT_CONTEXT_PATTERN = re.compile(
+    r"\b(?:budget|budgets|budgeting|budgeted|cost|costs|price|spend|spending|money|bucks|dollars?|"
+    r"euros?|pounds?|usd|eur|gbp)\b|[$€£]"
+)
+_AMOUNT_PATTERN = re.compile(
+    r"(?P<prefix>[$€£])?\s?(?P<number>\d{1,3}(?:,\d{3})+|\d+(?:\.\d+)?)(?P<thousands>\s?k\b)?"
+    r"\s?(?P<suffix>(?:usd|eur|euros?|dollars?|bucks|pounds?|gbp)\b|[$€£])?"
+)
+_AMOUNT_DURATION_AFTER_PATTERN = re.compile(
+    r"\s*(?:(?:usd|eur|euros?|dollars?|bucks|pounds?|gbp)\s+)?"
+    r"(?:(?:per|a|an|each|every|/)\s*(?P<unit>day|night|week|month)\b|(?P<adverb>daily|nightly|weekly|monthly)\b)"
+)
+_AMOUNT_DURATION_BEFORE_PATTERN = re.compile(r"\b(?P<adverb>daily|nightly|weekly|monthly)\b")
+_BUDGET_PHRASE_BEFORE_PATTERN = re.compile(
+    r"\b(?:budget|budgeting|budgeted|spend|spending|cost|costs|price)\s+(?:\w+\s+){0,3}$"
+)
+_MAX_OPERATOR_BEFORE_PATTERN = re.compile(
+    r"\b(?:under|below|less than|at most|up to|no more than|max|maximum|within|capped at|cap of|"
+    r"lower than|cheaper than)\s*$"
+)
+_MIN_OPERATOR_BEFORE_PATTERN = re.compile(
+    r"\b(?:at least|more than|over|above|minimum|min|starting at|starting from)\s*$"
+)
+_MAX_OPERATOR_AFTER_PATTERN = re.compile(r"\s*(?:or less|or under|max|maximum|tops|at most)\b")
+_MIN_OPERATOR_AFTER_PATTERN = re.compile(r"\s*(?:or more|plus|\+|minimum|at least)")
+_AMOUNT_RANGE_PATTERN = re.compile(
+    r"\bbetween\s+[$€£]?\s?\d[\d,.]*\s?k?\b[^.;!?]{0,20}?\band\s+[$€£]?\s?\d"
+    r"|\bfrom\s+[$€£]?\s?\d[\d,.]*\s?k?\b[^.;!?]{0,20}?\b(?:to|till|until)\s+[$€£]?\s?\d"
+    r"|\d\s?k?\s*-\s*[$€£]?\s?\d"
+)
+# Numbers large enough to be a budget that are not introduced like one, e.g. "make it 2000 instead".
+_BARE_NUMBER_PATTERN = re.compile(r"\b(?:\d{1,3}(?:,\d{3})+|\d{3,})(?:\.\d+)?\b")
+_TRIP_LENGTH_PATTERN = re.compile(
+    r"\b(?:\d+|one|two|three|four|five|six|seven|eight|nine|ten|a couple of|a few)[\s-]+"
+    r"(?:days?|nights?|weeks?|months?)\b|\bfortnight\b|\bweekend\b"
+)
+_DURATION_BY_WORD: dict[str, CostTermDuration] = {
+    "day": "day",
+    "night": "day",
+    "daily": "day",
+    "nightly": "day",
+    "week": "week",
+    "weekly": "week",
+    "month": "month",
+    "monthly": "month",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _Amount:
+    explicit: ExplicitCostTermFilter
+    start: int
+    end: int
+
+
+def _parse_amount_value(match: re.Match[str]) -> float:
+    value = float(match.group("number").replace(",", ""))
+    if match.group("thousands"):
+        value *= 1000
+    return value
+
+
+def _is_money_amount(text: str, match: re.Match[str]) -> bool:
+    if match.group("prefix") or match.group("suffix") or match.group("thousands"):
+        return True
+    if _AMOUNT_DURATION_AFTER_PATTERN.match(text[match.end() :]):
+        return True
+    return _BUDGET_PHRASE_BEFORE_PATTERN.search(_clause_before(text, match.start())) is not None
+
+
+def _resolve_operator(text: str, match: re.Match[str]) -> CostTermOperator:
+    before = text[: match.start()]
+    after = text[match.end() :]
+    if _MAX_OPERATOR_BEFORE_PATTERN.search(before) or _MAX_OPERATOR_AFTER_PATTERN.match(after):
+        return "max"
+    if _MIN_OPERATOR_BEFORE_PATTERN.search(before) or _MIN_OPERATOR_AFTER_PATTERN.match(after):
+        return "min"
+    return "around"
+
+
+def _resolve_duration(text: str, match: re.Match[str]) -> tuple[CostTermDuration | None, int]:
+    after_match = _AMOUNT_DURATION_AFTER_PATTERN.match(text[match.end() :])
+    if after_match:
+        word = after_match.group("unit") or after_match.group("adverb")
+        return _DURATION_BY_WORD[word], match.end() + after_match.end()
+
+    before_match = _AMOUNT_DURATION_BEFORE_PATTERN.search(_clause_before(text, match.start()))
+    if before_match:
+        return _DURATION_BY_WORD[before_match.group("adverb")], match.end()
+
+    return None, match.end()
+
+
+def _find_amounts(text: str) -> list[_Amount]:
+    amounts: list[_Amount] = []
+    for match in _AMOUNT_PATTERN.finditer(text):
+        if not _is_money_amount(text, match):
+            continue
+
+        duration, end = _resolve_duration(text, match)
+        amounts.append(
+            _Amount(
+                explicit=ExplicitCostTermFilter(
+                    value=_parse_amount_value(match),
+                    operator=_resolve_operator(text, match),
+                    # The system assumes a full trip lasts one week.
+                    duration=duration or "week",
+                ),
+                start=match.start(),
+                end=end,
+            )
+        )
+
+    return amounts
+
+
+def extract_budget_filter(
+    inputs: RecommendationV2BudgetFilterExtractionInput,
+) -> RuleBasedExtraction[RecommendationV2BudgetFilterExtractionResult]:
+    """Extract plainly stated budget filters from the current turn."""
+
+    text = _normalize_request(inputs.current_user_request)
+    previous_result = RecommendationV2BudgetFilterExtractionResult(
+        cost_term=inputs.previous_cost_term,
+    )
+
+    if _REMOVAL_PATTERN.search(text):
+        return RuleBasedExtraction(previous_result, CONFIDENCE_NONE, "removal_request")
+
+    amounts = _find_amounts(text)
+    level_mentions = _find_mentions(text, _COST_LEVEL_PATTERNS)
+    residual_text = _mask(
+        text,
+        [*level_mentions, *(_Mention(None, amount.start, amount.end) for amount in amounts)],
+    )
+    if amounts:
+        residual_text = _AMOUNT_CONTEXT_PATTERN.sub(" ", residual_text)
+
+    if _MONEY_CUE_PATTERN.search(residual_text):
+        return RuleBasedExtraction(previous_result, CONFIDENCE_AMBIGUOUS, "unparsed_money_cue")
+
+    # A currency or budget cue usually sits on one end of a range only, e.g. "500-900 eur".
+    bare_number = _BARE_NUMBER_PATTERN.search(_TRIP_LENGTH_PATTERN.sub(" ", residual_text))
+    if (amounts or bare_number) and _AMOUNT_RANGE_PATTERN.search(text):
+        return RuleBasedExtraction(previous_result, CONFIDENCE_AMBIGUOUS, "amount_range")
+
+    if bare_number:
+        return RuleBasedExtraction(previous_result, CONFIDENCE_AMBIGUOUS, "bare_number")
+
+    if not amounts and not level_mentions:
+        return RuleBasedExtraction(previous_result, CONFIDENCE_NO_SIGNAL, "no_budget_signal")
+
+    if any(_NEGATION_PATTERN.search(_clause_before(text, amount.start)) for amount in amounts):
+        return RuleBasedExtraction(previous_result, CONFIDENCE_AMBIGUOUS, "negated_amount")
+
+    if amounts:
+        explicit = amounts[0].explicit
+        if any(amount.explicit != explicit for amount in amounts[1:]):
+            return RuleBasedExtraction(previous_result, CONFIDENCE_AMBIGUOUS, "multiple_amounts")
+
+        if explicit.duration == "week" and _TRIP_LENGTH_PATTERN.search(text):
+            return RuleBasedExtraction(previous_result, CONFIDENCE_AMBIGUOUS, "trip_length_amount")
+
+        return RuleBasedExtraction(
+            RecommendationV2BudgetFilterExtractionResult(cost_term=CostTerm(explicit=explicit)),
+            CONFIDENCE_KEYWORD if level_mentions else CONFIDENCE_EXPLICIT,
+            "explicit_amount",
+        )
+
+    levels = _unique_in_order([mention.value for mention in level_mentions])
+    if len(levels) > 1 or any(
+        _is_negated(text, mention) or _HEDGED_COST_LEVEL_PATTERN.search(text[: mention.start])
+        for mention in level_mentions
+    ):
+        return RuleBasedExtraction(previous_result, CONFIDENCE_AMBIGUOUS, "conflicting_budget_level")
+
+    return RuleBasedExtraction(
+        RecommendationV2BudgetFilterExtractionResult(cost_term=CostTerm(inferred_level=levels[0])),
+        CONFIDENCE_KEYWORD,
+        "budget_level_keyword",
+    )
+
+
+# --- parent region -------------------------------------------------------------------------
+
+_PARENT_REGION_PATTERNS: dict[str, re.Pattern[str]] = {
+    region_name: re.compile(r"\b" + r"\s+".join(region_name.lower().split()) + r"\b")
+    for region_name in ALLOWED_RECOMMENDATION_V2_PARENT_REGION_NAMES
+}
+_AMBIGUOUS_AREA_PATTERN = re.compile(
+    r"\bamericas?\b|\bamerican\b|\busa\b|\bu\.s\.|\bunited states\b|\bthe states\b|"
+    r"\b(?:european|asian|african|australian|oceania|middle east|middle eastern|caribbean|"
+    r"scandinavia|scandinavian|nordic|mediterranean|balkans?|eurasia|arctic|antarctic|polar|"
+    r"pacific|continent|continents|overseas|abroad|worldwide|global)\b"
+)
+
+
+def extract_parent_region_filter(
+    inputs: RecommendationV2ParentRegionFilterExtractionInput,
+) -> RuleBasedExtraction[RecommendationV2ParentRegionFilterExtractionResult]:
+    """Extract explicitly named parent regions from the current turn."""
+
+    text = _normalize_request(inputs.current_user_request)
+    empty_result = RecommendationV2ParentRegionFilterExtractionResult()
+
+    if _REMOVAL_PATTERN.search(text):
+        return RuleBasedExtraction(empty_result, CONFIDENCE_NONE, "removal_request")
+
+    mentions = _find_mentions(text, _PARENT_REGION_PATTERNS)
+    if _AMBIGUOUS_AREA_PATTERN.search(_mask(text, mentions)):
+        return RuleBasedExtraction(empty_result, CONFIDENCE_AMBIGUOUS, "ambiguous_area")
+
+    if not mentions:
+        return RuleBasedExtraction(empty_result, CONFIDENCE_NO_SIGNAL, "no_region_signal")
+
+    entries: dict[str, ParentRegionEntry] = {}
+    for mention in mentions:
+        if _NEGATION_PATTERN.search(_clause_after(text, mention.end)):
+            return RuleBasedExtraction(empty_result, CONFIDENCE_AMBIGUOUS, "negation_after_region")
+
+        entry = ParentRegionEntry(
+            name=mention.value,
+            type="exclude" if _is_negated(text, mention) else "include",
+        )
+        if entries.setdefault(entry.name, entry).type != entry.type:
+            return RuleBasedExtraction(empty_result, CONFIDENCE_AMBIGUOUS, "conflicting_region_intent")
+
+    parent_regions = list(entries.values())
+    return RuleBasedExtraction(
+        RecommendationV2ParentRegionFilterExtractionResult(parent_regions=parent_regions),
+        CONFIDENCE_KEYWORD if any(entry.type == "exclude" for entry in parent_regions) else CONFIDENCE_EXPLICIT,
+        "explicit_region",
+    )
+
+
+def try_rule_based_extraction(
+    extract: Callable[[InputT], RuleBasedExtraction[ResultT]],
+    inputs: InputT,
+    *,
+    filter_name: str,
+    min_confidence: float | None,
+) -> ResultT | None:
+    """Return the rule-based result when it is confident enough, otherwise None to fall back to the LLM.
+
+    A `min_confidence` of None disables the fast path without recording a fallback.
+    """
+
+    if min_confidence is None:
+        return None
+
+    extraction = extract(inputs)
+    accepted = extraction.confidence >= min_confidence
+    MetricsRegistry().increment(
+        "rule_based_filter_extraction_total",
+        filter=filter_name,
+        result="hit" if accepted else "fallback",
+    )
+    logger.verbose(
+        "Rule-based %s filter extraction %s with confidence=%.2f (%s)",
+        filter_name,
+        "accepted" if accepted else "fell back to the LLM",
+        extraction.confidence,
+        extraction.reason,
+    )
+
+    return extraction.result if accepted else None
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import unittest
+
+from recommender.graphs.recommendation_v2.agents.filter_extraction.budget.models import (
+    RecommendationV2BudgetFilterExtractionInput,
+)
+from recommender.graphs.recommendation_v2.agents.filter_extraction.parent_region.models import (
+    RecommendationV2ParentRegionFilterExtractionInput,
+)
+from recommender.graphs.recommendation_v2.agents.filter_extraction.rule_based.extractor import (
+    extract_budget_filter,
+    extract_parent_region_filter,
+    extract_season_filter,
+    try_rule_based_extraction,
+)
+from recommender.graphs.recommendation_v2.agents.filter_extraction.season.models import (
+    RecommendationV2SeasonFilterExtractionInput,
+)
+from recommender.graphs.recommendation_v2.filter_models import CostTerm
+from recommender.graphs.recommendation_v2.filter_models import ExplicitCostTermFilter
+from utils.metrics import MetricsRegistry
+
+_MIN_CONFIDENCE = 0.8
+
+
+def _season(user_request: str, **previous: object):
+    return extract_season_filter(
+        RecommendationV2SeasonFilterExtractionInput(current_user_request=user_request, **previous)
+    )
+
+
+def _budget(user_request: str, **previous: object):
+    return extract_budget_filter(
+        RecommendationV2BudgetFilterExtractionInput(current_user_request=user_request, **previous)
+    )
+
+
+def _parent_region(user_request: str):
+    return extract_parent_region_filter(
+        RecommendationV2ParentRegionFilterExtractionInput(current_user_request=user_request)
+    )
+
+
+class TestRuleBasedSeasonFilterExtraction(unittest.TestCase):
+    def test_extracts_explicit_months_and_seasons(self) -> None:
+        months = _season("A beach week in July or maybe early August")
+        season = _season("Somewhere cozy this fall")
+
+        self.assertGreaterEqual(months.confidence, _MIN_CONFIDENCE)
+        self.assertEqual(months.result.months, ["jul", "aug"])
+        self.assertIsNone(months.result.season)
+        self.assertGreaterEqual(season.confidence, _MIN_CONFIDENCE)
+        self.assertEqual(season.result.season, "autumn")
+        self.assertEqual(season.result.months, [])
+
+    def test_keeps_previous_filter_without_timing_signal(self) -> None:
+        extraction = _season("Same vibe, but with better food", previous_season="summer")
+
+        self.assertGreaterEqual(extraction.confidence, _MIN_CONFIDENCE)
+        self.assertEqual(extraction.result.season, "summer")
+
+    def test_falls_back_for_implicit_or_ambiguous_timing(self) -> None:
+        for user_request in (
+            "Somewhere warm soon",
+            "Anywhere but not in winter",
+            "From June to August",
+            "Spring or autumn would work",
+            "May I get some ideas for Rome?",
+            "Remove the timing filter",
+        ):
+            with self.subTest(user_request=user_request):
+                self.assertLess(_season(user_request).confidence, _MIN_CONFIDENCE)
+
+    def test_modal_may_is_not_a_month(self) -> None:
+        extraction = _season("I may want to see temples")
+
+        self.assertGreaterEqual(extraction.confidence, _MIN_CONFIDENCE)
+        self.assertEqual(extraction.result.months, [])
+
+
+class TestRuleBasedBudgetFilterExtraction(unittest.TestCase):
+    def test_extracts_explicit_amounts_with_operator_and_duration(self) -> None:
+        cases = {
+            "Under 800 per week please": (800.0, "max", "week"),
+            "I'm budgeting $2,000 for the trip": (2000.0, "around", "week"),
+            "at least 300 euros a day": (300.0, "min", "day"),
+            "My budget is around 1.5k monthly": (1500.0, "around", "month"),
+        }
+        for user_request, (value, operator, duration) in cases.items():
+            with self.subTest(user_request=user_request):
+                extraction = _budget(user_request)
+                explicit = extraction.result.cost_term.explicit
+
+                self.assertGreaterEqual(extraction.confidence, _MIN_CONFIDENCE)
+                self.assertEqual((explicit.value, explicit.operator, explicit.duration), (value, operator, duration))
+
+    def test_infers_budget_level_from_keywords(self) -> None:
+        cheap = _budget("A cheap island escape")
+        luxury = _budget("A luxurious spa retreat")
+
+        self.assertEqual(cheap.result.cost_term.inferred_level, "low")
+        self.assertEqual(luxury.result.cost_term.inferred_level, "high")
+        self.assertGreaterEqual(min(cheap.confidence, luxury.confidence), _MIN_CONFIDENCE)
+
+    def test_keeps_previous_budget_without_money_signal(self) -> None:
+        extraction = _budget("Something with museums", previous_cost_term=CostTerm(inferred_level="low"))
+
+        self.assertGreaterEqual(extraction.confidence, _MIN_CONFIDENCE)
+        self.assertEqual(extraction.result.cost_term.inferred_level, "low")
+
+    def test_falls_back_for_ambiguous_money_context(self) -> None:
+        for user_request in (
+            "Not too expensive please",
+            "Somewhere that won't break the bank",
+            "Between $500 and $900",
+            "Two weeks for $3000",
+            "Something somewhat affordable",
+            "Cheaper than last time",
+            "Any budget is fine now",
+        ):
+            with self.subTest(user_request=user_request):
+                self.assertLess(_budget(user_request).confidence, _MIN_CONFIDENCE)
+
+    def test_falls_back_for_ranges_with_a_single_currency(self) -> None:
+        for user_request in (
+            "between 500 and 900 EUR",
+            "from 500 to 900 euros a week",
+            "500-900 EUR",
+            "$500 - $900 per week",
+        ):
+            with self.subTest(user_request=user_request):
+                extraction = _budget(user_request)
+
+                self.assertLess(extraction.confidence, _MIN_CONFIDENCE)
+                self.assertEqual(extraction.reason, "amount_range")
+
+    def test_falls_back_for_bare_number_edits(self) -> None:
+        previous_cost_term = CostTerm(
+            explicit=ExplicitCostTermFilter(value=1500.0, operator="around", duration="week"),
+        )
+
+        extraction = _budget("make it 2000 instead", previous_cost_term=previous_cost_term)
+
+        self.assertLess(extraction.confidence, _MIN_CONFIDENCE)
+        self.assertEqual(extraction.reason, "bare_number")
+
+    def test_trip_length_numbers_are_not_amounts(self) -> None:
+        extraction = _budget("A 10 day hiking trip for 2 people")
+
+        self.assertGreaterEqual(extraction.confidence, _MIN_CONFIDENCE)
+        self.assertIsNone(extraction.result.cost_term)
+
+
+class TestRuleBasedParentRegionFilterExtraction(unittest.TestCase):
+    def test_extracts_included_and_excluded_parent_regions(self) -> None:
+        extraction = _parent_region("I want Europe but definitely not Asia")
+
+        self.assertGreaterEqual(extraction.confidence, _MIN_CONFIDENCE)
+        self.assertEqual(
+            [(entry.name, entry.type) for entry in extraction.result.parent_regions],
+            [("Europe", "include"), ("Asia", "exclude")],
+        )
+
+    def test_returns_no_filter_without_continent(self) -> None:
+        extraction = _parent_region("I want to go to Japan")
+
+        self.assertGreaterEqual(extraction.confidence, _MIN_CONFIDENCE)
+        self.assertIsNone(extraction.result.parent_regions)
+
+    def test_falls_back_for_ambiguous_areas_and_removals(self) -> None:
+        for user_request in (
+            "A road trip across the USA",
+            "Somewhere Mediterranean",
+            "Europe is not an option",
+            "Remove the Europe region filter",
+        ):
+            with self.subTest(user_request=user_request):
+                self.assertLess(_parent_region(user_request).confidence, _MIN_CONFIDENCE)
+
+
+class TestTryRuleBasedExtraction(unittest.TestCase):
+    def setUp(self) -> None:
+        MetricsRegistry().reset()
+
+    def test_records_hits_and_fallbacks(self) -> None:
+        inputs = RecommendationV2SeasonFilterExtractionInput(current_user_request="In July")
+        vague_inputs = RecommendationV2SeasonFilterExtractionInput(current_user_request="Somewhere warm")
+
+        hit = try_rule_based_extraction(extract_season_filter, inputs, filter_name="season", min_confidence=0.8)
+        fallback = try_rule_based_extraction(
+            extract_season_filter, vague_inputs, filter_name="season", min_confidence=0.8
+        )
+        disabled = try_rule_based_extraction(
+            extract_season_filter, inputs, filter_name="season", min_confidence=None
+        )
+
+        self.assertEqual(hit.months, ["jul"])
+        self.assertIsNone(fallback)
+        self.assertIsNone(disabled)
+        self.assertEqual(
+            MetricsRegistry().counter("rule_based_filter_extraction_total", filter="season", result="hit"), 1.0
+        )
+        self.assertEqual(
+            MetricsRegistry().counter("rule_based_filter_extraction_total", filter="season", result="fallback"),
+            1.0,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
 
 from recommender.graphs.recommendation_v2.agents.filter_extraction.season.models import (
     RecommendationV2SeasonFilterExtractionInput,
@@ -11,6 +12,9 @@ from recommender.graphs.recommendation_v2.agents.filter_extraction.season.models
 from recommender.graphs.recommendation_v2.agents.filter_extraction.season.prompt import (
     prompt,
 )
+from recommender.models.llm.llm_response_cache import LLMResponseCache
+from recommender.models.llm.llm_response_cache import ainvoke_structured_output
+from recommender.models.llm.llm_response_cache import invoke_structured_output
 from utils.logger import LoggerManager
 
 logger = LoggerManager.get_logger(__name__)
@@ -19,12 +23,16 @@ logger = LoggerManager.get_logger(__name__)
 class RecommendationV2SeasonFilterExtractionAgent:
     """Agent that extracts season and month filters for recommendation_v2."""
 
+    cache_agent_name = "season_filter"
+
     def __init__(
         self,
         *,
         llm: BaseChatModel,
+        response_cache: LLMResponseCache | None = None,
     ) -> None:
         self._llm = llm
+        self._response_cache = response_cache
         self._prompt_template = prompt
         self._structured_output_llm = self._llm.with_structured_output(
             RecommendationV2SeasonFilterExtractionResult,
@@ -34,6 +42,36 @@ class RecommendationV2SeasonFilterExtractionAgent:
         self,
         inputs: RecommendationV2SeasonFilterExtractionInput,
     ) -> RecommendationV2SeasonFilterExtractionResult:
+        result = invoke_structured_output(
+            self._structured_output_llm,
+            self._build_prompt_messages(inputs),
+            output_type=RecommendationV2SeasonFilterExtractionResult,
+            agent_name=self.cache_agent_name,
+            llm=self._llm,
+            response_cache=self._response_cache,
+        )
+        logger.verbose("Season filter-extraction structured LLM result: %s", result)
+        return result
+
+    async def ainvoke(
+        self,
+        inputs: RecommendationV2SeasonFilterExtractionInput,
+    ) -> RecommendationV2SeasonFilterExtractionResult:
+        result = await ainvoke_structured_output(
+            self._structured_output_llm,
+            self._build_prompt_messages(inputs),
+            output_type=RecommendationV2SeasonFilterExtractionResult,
+            agent_name=self.cache_agent_name,
+            llm=self._llm,
+            response_cache=self._response_cache,
+        )
+        logger.verbose("Season filter-extraction structured LLM result: %s", result)
+        return result
+
+    def _build_prompt_messages(
+        self,
+        inputs: RecommendationV2SeasonFilterExtractionInput,
+    ) -> list[BaseMessage]:
         prompt_value = self._prompt_template.format_prompt(
             current_user_request=inputs.current_user_request,
             previous_season_filter=RecommendationV2SeasonFilterExtractionResult(
@@ -41,6 +79,4 @@ class RecommendationV2SeasonFilterExtractionAgent:
                 months=inputs.previous_months,
             ).model_dump_json(indent=2, exclude_none=True),
         )
-        result = self._structured_output_llm.invoke(prompt_value.to_messages())
-        logger.verbose("Raw season filter-extraction structured LLM result: %s", result)
-        return RecommendationV2SeasonFilterExtractionResult.model_validate(result)
+        return prompt_value.to_messages()
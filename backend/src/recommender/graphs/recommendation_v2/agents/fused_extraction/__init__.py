@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from recommender.graphs.recommendation_v2.agents.fused_extraction.agent import (
+    RecommendationV2FusedExtractionAgent,
+)
+from recommender.graphs.recommendation_v2.agents.fused_extraction.models import (
+    RecommendationV2FusedExtractionInput,
+    RecommendationV2FusedExtractionResult,
+)
+
+__all__ = [
+    "RecommendationV2FusedExtractionAgent",
+    "RecommendationV2FusedExtractionInput",
+    "RecommendationV2FusedExtractionResult",
+]
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+
+from recommender.graphs.recommendation_v2.agents.filter_extraction.budget.models import (
+    RecommendationV2BudgetFilterExtractionResult,
+)
+from recommender.graphs.recommendation_v2.agents.filter_extraction.season.models import (
+    RecommendationV2SeasonFilterExtractionResult,
+)
+from recommender.graphs.recommendation_v2.agents.fused_extraction.models import (
+    RecommendationV2FusedExtractionInput,
+)
+from recommender.graphs.recommendation_v2.agents.fused_extraction.models import (
+    RecommendationV2FusedExtractionResult,
+)
+from recommender.graphs.recommendation_v2.agents.fused_extraction.prompt import (
+    prompt,
+)
+from recommender.graphs.recommendation_v2.chat_history import ChatHistoryWindow
+from recommender.graphs.recommendation_v2.models import serialize_chat_history
+from recommender.models.llm.llm_response_cache import LLMResponseCache
+from recommender.models.llm.llm_response_cache import ainvoke_structured_output
+from recommender.models.llm.llm_response_cache import invoke_structured_output
+from utils.logger import LoggerManager
+
+logger = LoggerManager.get_logger(__name__)
+
+
+class RecommendationV2FusedExtractionAgent:
+    """Agent that synthesizes the user request and extracts all filters in one structured LLM call."""
+
+    cache_agent_name = "fused_extraction"
+
+    def __init__(
+        self,
+        *,
+        llm: BaseChatModel,
+        response_cache: LLMResponseCache | None = None,
+        history_window: ChatHistoryWindow | None = None,
+    ) -> None:
+        self._llm = llm
+        self._history_window = history_window
+        self._response_cache = response_cache
+        self._prompt_template = prompt
+        self._structured_output_llm = self._llm.with_structured_output(
+            RecommendationV2FusedExtractionResult,
+        )
+
+    def invoke(
+        self,
+        inputs: RecommendationV2FusedExtractionInput,
+    ) -> RecommendationV2FusedExtractionResult:
+        result = invoke_structured_output(
+            self._structured_output_llm,
+            self._build_prompt_messages(inputs),
+            output_type=RecommendationV2FusedExtractionResult,
+            agent_name=self.cache_agent_name,
+            llm=self._llm,
+            response_cache=self._response_cache,
+        )
+        logger.verbose("Fused extraction structured LLM result: %s", result)
+        return result
+
+    async def ainvoke(
+        self,
+        inputs: RecommendationV2FusedExtractionInput,
+    ) -> RecommendationV2FusedExtractionResult:
+        result = await ainvoke_structured_output(
+            self._structured_output_llm,
+            self._build_prompt_messages(inputs),
+            output_type=RecommendationV2FusedExtractionResult,
+            agent_name=self.cache_agent_name,
+            llm=self._llm,
+            response_cache=self._response_cache,
+        )
+        logger.verbose("Fused extraction structured LLM result: %s", result)
+        return result
+
+    def _build_prompt_messages(
+        self,
+        inputs: RecommendationV2FusedExtractionInput,
+    ) -> list[BaseMessage]:
+        prompt_value = self._prompt_template.format_prompt(
+            current_user_request=inputs.synthesis.current_user_request,
+            previous_synthesized_query=inputs.synthesis.previous_synthesized_query or "None",
+            chat_history=serialize_chat_history(inputs.synthesis.chat_history, window=self._history_window),
+            previous_season_filter=RecommendationV2SeasonFilterExtractionResult(
+                season=inputs.season.previous_season,
+                months=inputs.season.previous_months,
+            ).model_dump_json(indent=2, exclude_none=True),
+            previous_budget_filter=RecommendationV2BudgetFilterExtractionResult(
+                cost_term=inputs.budget.previous_cost_term,
+            ).model_dump_json(indent=2, exclude_none=True),
+        )
+        return prompt_value.to_messages()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+from pydantic import Field
+
+from recommender.graphs.recommendation_v2.agents.filter_extraction.budget.models import (
+    RecommendationV2BudgetFilterExtractionInput,
+    RecommendationV2BudgetFilterExtractionResult,
+)
+from recommender.graphs.recommendation_v2.agents.filter_extraction.parent_region.models import (
+    RecommendationV2ParentRegionFilterExtractionInput,
+    RecommendationV2ParentRegionFilterExtractionResult,
+)
+from recommender.graphs.recommendation_v2.agents.filter_extraction.season.models import (
+    RecommendationV2SeasonFilterExtractionInput,
+    RecommendationV2SeasonFilterExtractionResult,
+)
+from recommender.graphs.recommendation_v2.agents.query_synthesis.query_synthesis_agent import (
+    RecommendationV2SynthesizedUserRequestInput,
+    RecommendationV2SynthesizedUserRequestResult,
+)
+
+
+class RecommendationV2FusedExtractionInput(BaseModel):
+    """Input payload for the single-call synthesis and filter extraction of recommendation_v2."""
+
+    synthesis: RecommendationV2SynthesizedUserRequestInput = Field(
+        ...,
+        description="Input of the user request synthesis task",
+    )
+    parent_region: RecommendationV2ParentRegionFilterExtractionInput = Field(
+        ...,
+        description="Input of the parent-region filter extraction task",
+    )
+    season: RecommendationV2SeasonFilterExtractionInput = Field(
+        ...,
+        description="Input of the season filter extraction task",
+    )
+    budget: RecommendationV2BudgetFilterExtractionInput = Field(
+        ...,
+        description="Input of the budget filter extraction task",
+    )
+
+
+class RecommendationV2FusedExtractionResult(BaseModel):
+    """Structured output combining the synthesized request and all filter updates for this turn."""
+
+    synthesized_query: str = Field(
+        ...,
+        description="General context of interest synthesized for the current turn",
+    )
+    keywords: list[str] = Field(
+        default_factory=list,
+        description="Concrete direct-search keywords extracted from the synthesized query",
+    )
+    parent_region_filter: RecommendationV2ParentRegionFilterExtractionResult = Field(
+        default_factory=RecommendationV2ParentRegionFilterExtractionResult,
+        description="Parent-region filter update for the current turn",
+    )
+    season_filter: RecommendationV2SeasonFilterExtractionResult = Field(
+        default_factory=RecommendationV2SeasonFilterExtractionResult,
+        description="Season and month filter update for the current turn",
+    )
+    budget_filter: RecommendationV2BudgetFilterExtractionResult = Field(
+        default_factory=RecommendationV2BudgetFilterExtractionResult,
+        description="Budget filter update for the current turn",
+    )
+
+    def synthesis_result(self) -> RecommendationV2SynthesizedUserRequestResult:
+        return RecommendationV2SynthesizedUserRequestResult(
+            synthesized_query=self.synthesized_query,
+            keywords=self.keywords,
+        )
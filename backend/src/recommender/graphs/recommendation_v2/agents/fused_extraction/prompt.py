@@ -0,0 +1,77 @@
+from langchain_core.prompts import ChatPromptTemplate
+
+from recommender.graphs.recommendation_v2.agents.filter_extraction.budget.prompt import (
+    prompt as budget_filter_prompt,
+)
+from recommender.graphs.recommendation_v2.agents.filter_extraction.parent_region.prompt import (
+    prompt as parent_region_filter_prompt,
+)
+from recommender.graphs.recommendation_v2.agents.filter_extraction.season.prompt import (
+    prompt as season_filter_prompt,
+)
+from recommender.graphs.recommendation_v2.agents.query_synthesis.query_synthesis_prompt import (
+    prompt as query_synthesis_prompt,
+)
+
+
+def _system_template(task_prompt: ChatPromptTemplate) -> str:
+    return task_prompt.messages[0].prompt.template
+
+
+# The task instructions are reused verbatim from the fan-out agents so both extraction modes
+# stay in sync when one of the prompts changes.
+prompt = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            """
+            You perform four independent extraction tasks for the current recommendation_v2 chat turn in one response.
+
+            Output structure:
+            - `synthesized_query` and `keywords`: result of TASK 1.
+            - `parent_region_filter`: result of TASK 2, with fields `filter_removed` and `parent_regions`.
+            - `season_filter`: result of TASK 3, with fields `filter_removed`, `season` and `months`.
+            - `budget_filter`: result of TASK 4, with fields `filter_removed` and `cost_term`.
+
+            Rules:
+            - Solve every task on its own, following only that task's instructions and inputs.
+            - Output rules inside a task, such as "return only these fields", apply to that task's part of the output.
+            - Do not let a constraint handled by one task leak into the output of another task.
+
+            ===== TASK 1: user request synthesis =====
+            """
+            + _system_template(query_synthesis_prompt)
+            + """
+            ===== TASK 2: parent-region filter extraction =====
+            """
+            + _system_template(parent_region_filter_prompt)
+            + """
+            ===== TASK 3: season filter extraction =====
+            """
+            + _system_template(season_filter_prompt)
+            + """
+            ===== TASK 4: budget filter extraction =====
+            """
+            + _system_template(budget_filter_prompt),
+        ),
+        (
+            "user",
+            """
+            previous_synthesized_query:
+            {previous_synthesized_query}
+
+            previous_season_filter:
+            {previous_season_filter}
+
+            previous_budget_filter:
+            {previous_budget_filter}
+
+            current_user_request:
+            {current_user_request}
+
+            chat_history:
+            {chat_history}
+            """,
+        ),
+    ]
+)
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
 from pydantic import BaseModel
 from pydantic import Field
 
 from recommender.graphs.recommendation_v2.agents.query_synthesis.query_synthesis_prompt import (
     prompt,
 )
+from recommender.graphs.recommendation_v2.chat_history import ChatHistoryWindow
 from recommender.graphs.recommendation_v2.models import serialize_chat_history
+from recommender.models.llm.llm_response_cache import LLMResponseCache
+from recommender.models.llm.llm_response_cache import ainvoke_structured_output
+from recommender.models.llm.llm_response_cache import invoke_structured_output
 from storage.models.chat_record import ChatRecord
 class RecommendationV2SynthesizedUserRequestInput(BaseModel):
     """Input payload for recommendation_v2 synthesized user request generation."""
@@ -42,12 +47,18 @@ class RecommendationV2SynthesizedUserRequestResult(BaseModel):
 class RecommendationV2SynthesizedUserRequestAgent:
     """Agent that synthesizes the current user request with prior session context."""
 
+    cache_agent_name = "synthesize_user_request"
+
     def __init__(
         self,
         *,
         llm: BaseChatModel,
+        response_cache: LLMResponseCache | None = None,
+        history_window: ChatHistoryWindow | None = None,
     ) -> None:
         self._llm = llm
+        self._history_window = history_window
+        self._response_cache = response_cache
         self._llm.bind(
             temperature=0.1,
         )
@@ -60,13 +71,37 @@ class RecommendationV2SynthesizedUserRequestAgent:
         self,
         inputs: RecommendationV2SynthesizedUserRequestInput,
     ) -> RecommendationV2SynthesizedUserRequestResult:
+        return invoke_structured_output(
+            self._structured_output_llm,
+            self._build_prompt_messages(inputs),
+            output_type=RecommendationV2SynthesizedUserRequestResult,
+            agent_name=self.cache_agent_name,
+            llm=self._llm,
+            response_cache=self._response_cache,
+        )
+
+    async def ainvoke(
+        self,
+        inputs: RecommendationV2SynthesizedUserRequestInput,
+    ) -> RecommendationV2SynthesizedUserRequestResult:
+        return await ainvoke_structured_output(
+            self._structured_output_llm,
+            self._build_prompt_messages(inputs),
+            output_type=RecommendationV2SynthesizedUserRequestResult,
+            agent_name=self.cache_agent_name,
+            llm=self._llm,
+            response_cache=self._response_cache,
+        )
+
+    def _build_prompt_messages(
+        self,
+        inputs: RecommendationV2SynthesizedUserRequestInput,
+    ) -> list[BaseMessage]:
         prompt_inputs = {
             "current_user_request": inputs.current_user_request,
             "previous_synthesized_query": inputs.previous_synthesized_query or "None",
-            "chat_history": serialize_chat_history(inputs.chat_history),
+            "chat_history": serialize_chat_history(inputs.chat_history, window=self._history_window),
         }
-        
+
         prompt_value = self._prompt_template.format_prompt(**prompt_inputs)
-        prompt_messages = prompt_value.to_messages()
-        result = self._structured_output_llm.invoke(prompt_messages)
-        return RecommendationV2SynthesizedUserRequestResult.model_validate(result)
+        return prompt_value.to_messages()
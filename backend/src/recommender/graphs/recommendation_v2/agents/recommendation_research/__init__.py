@@ -9,9 +9,17 @@ from recommender.graphs.recommendation_v2.agents.recommendation_research.models
 from recommender.graphs.recommendation_v2.agents.recommendation_research.models import (
     RecommendationV2RecommendationResearchResult,
 )
+from recommender.graphs.recommendation_v2.agents.recommendation_research.research_cache import (
+    RegionResearchCache,
+    RegionResearchCacheBackendProtocol,
+    RegionResearchCacheConfig,
+)
 
 __all__ = [
     "RecommendationV2RecommendationResearchAgent",
     "RecommendationV2RecommendationResearchInput",
     "RecommendationV2RecommendationResearchResult",
+    "RegionResearchCache",
+    "RegionResearchCacheBackendProtocol",
+    "RegionResearchCacheConfig",
 ]
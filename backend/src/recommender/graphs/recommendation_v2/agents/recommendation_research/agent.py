@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import time
+
 import anyio
 
 from recommender.graphs.recommendation_v2.agents.recommendation_research.models import (
@@ -8,8 +10,11 @@ from recommender.graphs.recommendation_v2.agents.recommendation_research.models
 from recommender.graphs.recommendation_v2.agents.recommendation_research.models import (
     RecommendationV2RecommendationResearchResult,
 )
+from recommender.graphs.recommendation_v2.chat_history import ChatHistoryWindow
 from recommender.graphs.recommendation_v2.models import serialize_chat_history
 from recommender.models.llm.llm_config import LLMConfig
+from recommender.models.llm.llm_gateway import LLMGateway
+from recommender.models.llm.llm_latency import record_llm_agent_latency
 from tavily_agent_toolkit import ModelConfig
 from tavily_agent_toolkit import ModelObject
 from tavily_agent_toolkit import search_and_answer
@@ -18,7 +23,10 @@ from utils.logger import LoggerManager
 logger = LoggerManager.get_logger(__name__)
 
 
-def _build_search_query(inputs: RecommendationV2RecommendationResearchInput) -> str:
+def _build_search_query(
+    inputs: RecommendationV2RecommendationResearchInput,
+    history_window: ChatHistoryWindow | None = None,
+) -> str:
     return "\n".join(
         [
             "You research one travel region and must return output that matches "
@@ -31,7 +39,7 @@ def _build_search_query(inputs: RecommendationV2RecommendationResearchInput) ->
             "Use this internal region description as grounding context:",
             inputs.region_description,
             "Use this conversation context for nuance:",
-            serialize_chat_history(inputs.conversation),
+            serialize_chat_history(inputs.conversation, window=history_window),
             "Research instructions:",
             (
                 "Prioritize web results about the activities, scenery, atmosphere, seasonality, "
@@ -82,34 +90,43 @@ def _build_tavily_model_config(llm_config: LLMConfig) -> ModelConfig:
 
 
 class RecommendationV2RecommendationResearchAgent:
-    """Agent that researches one region using Tavily search results."""
+    """Agent that researches one region using Tavily search results.
+
+    The Tavily toolkit owns its chat model client, so with `llm_gateway` each research call
+    holds a slot of the provider limiter, budgeted at `LLM_GATEWAY_RESEARCH_ESTIMATED_TOKENS`,
+    within the research sub-cap that keeps slots free for the structured agents.
+    """
 
     def __init__(
         self,
         *,
         llm_config: LLMConfig,
         tavily_api_key: str,
+        history_window: ChatHistoryWindow | None = None,
+        llm_gateway: LLMGateway | None = None,
     ) -> None:
         if not tavily_api_key.strip():
             raise ValueError("tavily_api_key must be provided for region research")
 
         self._tavily_api_key = tavily_api_key
+        self._history_window = history_window
+        self._model_name = llm_config.model
         self._model_config = _build_tavily_model_config(llm_config)
+        self._llm_limiter = llm_gateway.limiter(llm_config.provider) if llm_gateway is not None else None
+        self._estimated_tokens = (
+            llm_gateway.configuration.research_estimated_tokens if llm_gateway is not None else 0
+        )
 
     async def _run_search_and_answer(
         self,
         inputs: RecommendationV2RecommendationResearchInput,
     ) -> RecommendationV2RecommendationResearchResult:
-        search_query = _build_search_query(inputs)
-        result = await search_and_answer(
-            query=search_query,
-            api_key=self._tavily_api_key,
-            model_config=self._model_config,
-            output_schema=RecommendationV2RecommendationResearchResult,
-            max_number_of_subqueries=2,
-            max_results=2,
-            include_images=True,
-        )
+        search_query = _build_search_query(inputs, self._history_window)
+        if self._llm_limiter is None:
+            result = await self._search_and_answer(search_query)
+        else:
+            async with self._llm_limiter.acquire_research(self._estimated_tokens):
+                result = await self._search_and_answer(search_query)
 
         # logger.verbose(
         #     "\n\nRegion research result for region=%s result:\n\n%s",
@@ -149,6 +166,29 @@ class RecommendationV2RecommendationResearchAgent:
 
         return response
 
+    async def _search_and_answer(self, search_query: str) -> dict:
+        started_at = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await search_and_answer(
+                query=search_query,
+                api_key=self._tavily_api_key,
+                model_config=self._model_config,
+                output_schema=RecommendationV2RecommendationResearchResult,
+                max_number_of_subqueries=2,
+                max_results=2,
+                include_images=True,
+            )
+            outcome = "success"
+            return result
+        finally:
+            record_llm_agent_latency(
+                "recommendation_research",
+                self._model_name,
+                time.perf_counter() - started_at,
+                outcome=outcome,
+            )
+
     def invoke(
         self,
         inputs: RecommendationV2RecommendationResearchInput,
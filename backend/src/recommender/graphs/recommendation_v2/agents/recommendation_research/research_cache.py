@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any, Protocol
+
+from pydantic import Field
+from pydantic import ValidationError
+from pydantic_settings import BaseSettings
+from pydantic_settings import SettingsConfigDict
+
+from recommender.graphs.recommendation_v2.agents.recommendation_research.models import (
+    RecommendationV2RecommendationResearchResult,
+)
+from utils.logger import LoggerManager
+from utils.metrics import MetricsRegistry
+
+logger = LoggerManager.get_logger(__name__)
+metrics = MetricsRegistry()
+
+
+class RegionResearchCacheBackendProtocol(Protocol):
+    """Contract for a persistent region research cache matched by region and query similarity."""
+
+    def get_similar(
+        self,
+        region_ids: list[str],
+        synthesized_query: str,
+        min_similarity: float,
+    ) -> dict[str, dict[str, Any]]:
+        """Return cached research payloads per region for queries at least `min_similarity` similar."""
+        ...
+
+    def put_many(
+        self,
+        research_by_region_id: dict[str, dict[str, Any]],
+        synthesized_query: str,
+        ttl_s: float,
+    ) -> None:
+        """Store research payloads per region for `ttl_s` seconds."""
+        ...
+
+
+class RegionResearchCacheConfig(BaseSettings):
+    """Region research cache settings for the recommendation_v2 research node."""
+
+    model_config = SettingsConfigDict(
+        env_file=Path(__file__).resolve().parents[6] / ".env",
+        env_prefix="RESEARCH_CACHE_",
+        extra="ignore",
+    )
+
+    enabled: bool = Field(default=True)
+    min_similarity: float = Field(default=0.92, ge=0.0, le=1.0)
+    ttl_s: float = Field(default=604800.0, gt=0.0)
+
+
+class RegionResearchCache:
+    """Cache in front of `RecommendationV2RecommendationResearchAgent` keyed by region and user intent.
+
+    Backend failures are logged and treated as misses so caching never breaks a chat turn.
+    """
+
+    def __init__(
+        self,
+        configuration: RegionResearchCacheConfig,
+        *,
+        backend: RegionResearchCacheBackendProtocol,
+    ) -> None:
+        if configuration is None:
+            raise ValueError("configuration is required")
+        if backend is None:
+            raise ValueError("backend is required")
+
+        self.configuration = configuration
+        self.backend = backend
+
+    async def aget_many(
+        self,
+        region_ids: list[str],
+        synthesized_query: str,
+    ) -> dict[str, RecommendationV2RecommendationResearchResult]:
+        """Return cached research for the regions whose cached intent is close enough to the query."""
+        if not region_ids:
+            return {}
+
+        try:
+            payloads = await asyncio.to_thread(
+                self.backend.get_similar,
+                region_ids,
+                synthesized_query,
+                self.configuration.min_similarity,
+            )
+        except Exception as error:
+            logger.warning("Region research cache lookup failed: %s", error)
+            metrics.increment("region_research_cache_errors_total", operation="get")
+            payloads = {}
+
+        cached: dict[str, RecommendationV2RecommendationResearchResult] = {}
+        for region_id, payload in payloads.items():
+            try:
+                cached[region_id] = RecommendationV2RecommendationResearchResult.model_validate(payload)
+            except ValidationError:
+                logger.warning("Ignoring invalid cached research for region_id=%s", region_id)
+
+        metrics.increment("region_research_cache_requests_total", len(cached), result="hit")
+        metrics.increment("region_research_cache_requests_total", len(region_ids) - len(cached), result="miss")
+        return cached
+
+    async def aput_many(
+        self,
+        research_by_region_id: dict[str, RecommendationV2RecommendationResearchResult],
+        synthesized_query: str,
+    ) -> None:
+        """Store freshly generated research for later turns with a similar intent."""
+        if not research_by_region_id:
+            return
+
+        try:
+            await asyncio.to_thread(
+                self.backend.put_many,
+                {region_id: research.model_dump() for region_id, research in research_by_region_id.items()},
+                synthesized_query,
+                self.configuration.ttl_s,
+            )
+        except Exception as error:
+            logger.warning("Region research cache write failed: %s", error)
+            metrics.increment("region_research_cache_errors_total", operation="put")
@@ -3,13 +3,18 @@ from __future__ import annotations
 from typing import Literal
 
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
 from pydantic import BaseModel
 from pydantic import Field
 
 from recommender.graphs.recommendation_v2.agents.request_routing.request_routing_prompt import (
     prompt,
 )
+from recommender.graphs.recommendation_v2.chat_history import ChatHistoryWindow
 from recommender.graphs.recommendation_v2.models import serialize_chat_history
+from recommender.models.llm.llm_response_cache import LLMResponseCache
+from recommender.models.llm.llm_response_cache import ainvoke_structured_output
+from recommender.models.llm.llm_response_cache import invoke_structured_output
 from storage.models.chat_record import ChatRecord
 from utils.logger import LoggerManager
 
@@ -49,12 +54,18 @@ class RecommendationV2RequestRoutingResult(BaseModel):
 class RecommendationV2RequestRoutingAgent:
     """Agent that routes the current user turn for recommendation_v2."""
 
+    cache_agent_name = "request_routing"
+
     def __init__(
         self,
         *,
         llm: BaseChatModel,
+        response_cache: LLMResponseCache | None = None,
+        history_window: ChatHistoryWindow | None = None,
     ) -> None:
         self._llm = llm
+        self._history_window = history_window
+        self._response_cache = response_cache
         self._prompt_template = prompt
         self._structured_output_llm = self._llm.with_structured_output(
             RecommendationV2RequestRoutingResult,
@@ -64,15 +75,45 @@ class RecommendationV2RequestRoutingAgent:
         self,
         inputs: RecommendationV2RequestRoutingInput,
     ) -> RecommendationV2RequestRoutingResult:
-        prompt_inputs = {
-            "current_user_request": inputs.current_user_request,
-            "chat_history": serialize_chat_history(inputs.chat_history),
-        }
-        prompt_value = self._prompt_template.format_prompt(**prompt_inputs)
-        prompt_messages = prompt_value.to_messages()
-        result = self._structured_output_llm.invoke(prompt_messages)
-        logger.verbose("Raw request-routing structured LLM result: %s", result)
-        output = RecommendationV2RequestRoutingResult.model_validate(result)
+        output = invoke_structured_output(
+            self._structured_output_llm,
+            self._build_prompt_messages(inputs),
+            output_type=RecommendationV2RequestRoutingResult,
+            agent_name=self.cache_agent_name,
+            llm=self._llm,
+            response_cache=self._response_cache,
+        )
+        return self._build_result(output)
+
+    async def ainvoke(
+        self,
+        inputs: RecommendationV2RequestRoutingInput,
+    ) -> RecommendationV2RequestRoutingResult:
+        output = await ainvoke_structured_output(
+            self._structured_output_llm,
+            self._build_prompt_messages(inputs),
+            output_type=RecommendationV2RequestRoutingResult,
+            agent_name=self.cache_agent_name,
+            llm=self._llm,
+            response_cache=self._response_cache,
+        )
+        return self._build_result(output)
+
+    def _build_prompt_messages(
+        self,
+        inputs: RecommendationV2RequestRoutingInput,
+    ) -> list[BaseMessage]:
+        prompt_value = self._prompt_template.format_prompt(
+            current_user_request=inputs.current_user_request,
+            chat_history=serialize_chat_history(inputs.chat_history, window=self._history_window),
+        )
+        return prompt_value.to_messages()
+
+    def _build_result(
+        self,
+        output: RecommendationV2RequestRoutingResult,
+    ) -> RecommendationV2RequestRoutingResult:
+        logger.verbose("Request-routing structured LLM result: %s", output)
 
         reason = output.reason.strip() or "No reason provided"
         return RecommendationV2RequestRoutingResult(
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
 
 from recommender.graphs.recommendation_v2.agents.response_generation.need_more_information.models import (
     RecommendationV2NeedMoreInformationResponseGenerationInput,
@@ -11,6 +14,10 @@ from recommender.graphs.recommendation_v2.agents.response_generation.need_more_i
 from recommender.graphs.recommendation_v2.agents.response_generation.response_generation_result import (
     RecommendationV2ResponseGenerationResult,
 )
+from recommender.graphs.recommendation_v2.agents.response_generation.response_streaming import (
+    astream_response_text,
+)
+from recommender.graphs.recommendation_v2.chat_history import ChatHistoryWindow
 from recommender.graphs.recommendation_v2.models import serialize_chat_history
 from utils.logger import LoggerManager
 
@@ -24,8 +31,10 @@ class RecommendationV2NeedMoreInformationResponseGenerationAgent:
         self,
         *,
         llm: BaseChatModel,
+        history_window: ChatHistoryWindow | None = None,
     ) -> None:
         self._llm = llm
+        self._history_window = history_window
         self._prompt_template = prompt
         self._structured_output_llm = self._llm.with_structured_output(
             RecommendationV2ResponseGenerationResult,
@@ -35,12 +44,31 @@ class RecommendationV2NeedMoreInformationResponseGenerationAgent:
         self,
         inputs: RecommendationV2NeedMoreInformationResponseGenerationInput,
     ) -> RecommendationV2ResponseGenerationResult:
+        result = self._structured_output_llm.invoke(self._build_prompt_messages(inputs))
+        logger.verbose("Raw need-more-information response-generation result: %s", result)
+        return RecommendationV2ResponseGenerationResult.model_validate(result)
+
+    async def ainvoke(
+        self,
+        inputs: RecommendationV2NeedMoreInformationResponseGenerationInput,
+    ) -> RecommendationV2ResponseGenerationResult:
+        result = await self._structured_output_llm.ainvoke(self._build_prompt_messages(inputs))
+        logger.verbose("Raw need-more-information response-generation result: %s", result)
+        return RecommendationV2ResponseGenerationResult.model_validate(result)
+
+    async def astream(
+        self,
+        inputs: RecommendationV2NeedMoreInformationResponseGenerationInput,
+    ) -> AsyncIterator[str]:
+        async for delta in astream_response_text(self._llm, self._build_prompt_messages(inputs)):
+            yield delta
+
+    def _build_prompt_messages(
+        self,
+        inputs: RecommendationV2NeedMoreInformationResponseGenerationInput,
+    ) -> list[BaseMessage]:
         prompt_value = self._prompt_template.format_prompt(
             current_user_request=inputs.current_user_request,
-            chat_history=serialize_chat_history(inputs.chat_history),
+            chat_history=serialize_chat_history(inputs.chat_history, window=self._history_window),
         )
-        result = self._structured_output_llm.invoke(prompt_value.to_messages())
-        logger.verbose("Raw need-more-information response-generation result: %s", result)
-        output = RecommendationV2ResponseGenerationResult.model_validate(result)
-
-        return output
+        return prompt_value.to_messages()
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
 
 from recommender.graphs.recommendation_v2.agents.response_generation.no_results_for_recommendation.models import (
     RecommendationV2NoResultsForRecommendationResponseGenerationInput,
@@ -11,9 +14,13 @@ from recommender.graphs.recommendation_v2.agents.response_generation.no_results_
 from recommender.graphs.recommendation_v2.agents.response_generation.response_generation_result import (
     RecommendationV2ResponseGenerationResult,
 )
+from recommender.graphs.recommendation_v2.agents.response_generation.response_streaming import (
+    astream_response_text,
+)
 from recommender.graphs.recommendation_v2.filter_models import (
     serialize_travel_destination_filter,
 )
+from recommender.graphs.recommendation_v2.chat_history import ChatHistoryWindow
 from recommender.graphs.recommendation_v2.models import serialize_chat_history
 from recommender.graphs.recommendation_v2.models import serialize_recommendations
 from utils.logger import LoggerManager
@@ -28,8 +35,10 @@ class RecommendationV2NoResultsForRecommendationResponseGenerationAgent:
         self,
         *,
         llm: BaseChatModel,
+        history_window: ChatHistoryWindow | None = None,
     ) -> None:
         self._llm = llm
+        self._history_window = history_window
         self._prompt_template = prompt
         self._structured_output_llm = self._llm.with_structured_output(
             RecommendationV2ResponseGenerationResult,
@@ -39,6 +48,29 @@ class RecommendationV2NoResultsForRecommendationResponseGenerationAgent:
         self,
         inputs: RecommendationV2NoResultsForRecommendationResponseGenerationInput,
     ) -> RecommendationV2ResponseGenerationResult:
+        result = self._structured_output_llm.invoke(self._build_prompt_messages(inputs))
+        logger.verbose("Raw no-results response-generation result: %s", result)
+        return RecommendationV2ResponseGenerationResult.model_validate(result)
+
+    async def ainvoke(
+        self,
+        inputs: RecommendationV2NoResultsForRecommendationResponseGenerationInput,
+    ) -> RecommendationV2ResponseGenerationResult:
+        result = await self._structured_output_llm.ainvoke(self._build_prompt_messages(inputs))
+        logger.verbose("Raw no-results response-generation result: %s", result)
+        return RecommendationV2ResponseGenerationResult.model_validate(result)
+
+    async def astream(
+        self,
+        inputs: RecommendationV2NoResultsForRecommendationResponseGenerationInput,
+    ) -> AsyncIterator[str]:
+        async for delta in astream_response_text(self._llm, self._build_prompt_messages(inputs)):
+            yield delta
+
+    def _build_prompt_messages(
+        self,
+        inputs: RecommendationV2NoResultsForRecommendationResponseGenerationInput,
+    ) -> list[BaseMessage]:
         prompt_value = self._prompt_template.format_prompt(
             current_user_request=inputs.current_user_request,
             synthesized_user_request=inputs.synthesized_user_request or "None",
@@ -47,10 +79,6 @@ class RecommendationV2NoResultsForRecommendationResponseGenerationAgent:
             ),
             recommendations=serialize_recommendations(inputs.recommendations),
             final_recommendations=serialize_recommendations(inputs.final_recommendations),
-            chat_history=serialize_chat_history(inputs.chat_history),
+            chat_history=serialize_chat_history(inputs.chat_history, window=self._history_window),
         )
-        result = self._structured_output_llm.invoke(prompt_value.to_messages())
-        logger.verbose("Raw no-results response-generation result: %s", result)
-        output = RecommendationV2ResponseGenerationResult.model_validate(result)
-
-        return output
+        return prompt_value.to_messages()
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.messages import SystemMessage
+
+PLAIN_TEXT_RESPONSE_INSTRUCTION = """
+Output format override:
+- Reply with the response text only, as plain text.
+- Do not wrap it in JSON, quotes, or a `message` / `response` field.
+"""
+
+
+def _with_plain_text_instruction(messages: list[BaseMessage]) -> list[BaseMessage]:
+    if messages and isinstance(messages[0], SystemMessage):
+        return [
+            SystemMessage(content=f"{messages[0].content}\n{PLAIN_TEXT_RESPONSE_INSTRUCTION}"),
+            *messages[1:],
+        ]
+
+    return [SystemMessage(content=PLAIN_TEXT_RESPONSE_INSTRUCTION), *messages]
+
+
+async def astream_response_text(
+    llm: BaseChatModel,
+    messages: list[BaseMessage],
+) -> AsyncIterator[str]:
+    """Stream a response-generation prompt as plain-text deltas instead of a structured output."""
+
+    async for chunk in llm.astream(_with_plain_text_instruction(messages)):
+        if chunk.text:
+            yield chunk.text
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Self
+
+from pydantic import Field
+from pydantic import model_validator
+from pydantic_settings import BaseSettings
+from pydantic_settings import SettingsConfigDict
+
+from storage.models.chat_record import ChatRecord
+
+_CHARS_PER_TOKEN = 4
+_COMPRESSED_REQUEST_MAX_CHARS = 200
+_SUMMARY_HEADER = "Summary of earlier turns:"
+
+
+@dataclass(frozen=True, slots=True)
+class ChatHistoryWindow:
+    """How much chat history one agent puts into its prompt."""
+
+    verbatim_turns: int
+    token_budget: int
+
+
+class ChatHistoryConfig(BaseSettings):
+    """Prompt history windowing for the recommendation_v2 agents.
+
+    The latest `verbatim_turns` turns go into prompts as-is; older turns are represented by the
+    rolling `history_summary` persisted with each chat row. `token_budgets` caps the serialized
+    history per agent name and falls back to `default_token_budget`.
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=Path(__file__).resolve().parents[4] / ".env",
+        env_prefix="CHAT_HISTORY_",
+        extra="ignore",
+    )
+
+    enabled: bool = Field(default=True)
+    verbatim_turns: int = Field(default=4, ge=1)
+    load_limit: int = Field(default=8, ge=2)
+    summary_token_budget: int = Field(default=300, ge=1)
+    default_token_budget: int = Field(default=1500, ge=1)
+    token_budgets: dict[str, int] = Field(
+        default_factory=lambda: {
+            "request_routing": 800,
+            "synthesize_user_request": 1500,
+            "fused_extraction": 1500,
+            "recommendation_research": 600,
+            "response_generation": 1200,
+        }
+    )
+
+    @model_validator(mode="after")
+    def validate_load_limit(self) -> Self:
+        if self.load_limit <= self.verbatim_turns:
+            raise ValueError(
+                "CHAT_HISTORY_LOAD_LIMIT must exceed CHAT_HISTORY_VERBATIM_TURNS so the row holding the summary of older turns is loaded"
+            )
+        return self
+
+    def window_for(self, agent_name: str) -> ChatHistoryWindow | None:
+        if not self.enabled:
+            return None
+        return ChatHistoryWindow(
+            verbatim_turns=self.verbatim_turns,
+            token_budget=self.token_budgets.get(agent_name, self.default_token_budget),
+        )
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate the token count of prompt text without a provider-specific tokenizer."""
+
+    return -(-len(text) // _CHARS_PER_TOKEN)
+
+
+def serialize_chat_turn(row: ChatRecord) -> str:
+    return (
+        "User: "
+        f"{row.user_request.strip() or 'None'}\n"
+        "Assistant: "
+        f"{row.system_response.strip() or 'None'}\n"
+    )
+
+
+def compress_chat_turn(row: ChatRecord) -> str:
+    """Compress one turn into a single summary line built from its request and synthesized query."""
+
+    user_request = " ".join(row.user_request.split()) or "None"
+    if len(user_request) > _COMPRESSED_REQUEST_MAX_CHARS:
+        user_request = f"{user_request[:_COMPRESSED_REQUEST_MAX_CHARS].rstrip()}..."
+
+    synthesized_query = row.synthesized_query.strip()
+    if synthesized_query:
+        return f"- User: {user_request} (searched for: {synthesized_query})"
+    return f"- User: {user_request}"
+
+
+def _trim_summary_lines(lines: list[str], token_budget: int) -> list[str]:
+    while len(lines) > 1 and estimate_tokens("\n".join(lines)) > token_budget:
+        lines.pop(0)
+    return lines
+
+
+def roll_history_summary(
+    previous_summary: str,
+    row: ChatRecord,
+    *,
+    token_budget: int,
+) -> str:
+    """Append one turn to the rolling summary, dropping the oldest lines beyond the token budget."""
+
+    lines = [*previous_summary.splitlines(), compress_chat_turn(row)]
+    return "\n".join(_trim_summary_lines(lines, token_budget))
+
+
+def _render_windowed_history(summary_lines: list[str], verbatim_rows: list[ChatRecord]) -> str:
+    parts: list[str] = []
+    if summary_lines:
+        parts.append("\n".join([_SUMMARY_HEADER, *summary_lines]))
+    parts.extend(serialize_chat_turn(row) for row in verbatim_rows)
+    return "\n\n".join(parts)
+
+
+def serialize_windowed_chat_history(history: list[ChatRecord], window: ChatHistoryWindow) -> str:
+    """Serialize the latest turns verbatim and older turns through their rolling summary.
+
+    When the result exceeds the window's token budget, the oldest verbatim turns are compressed
+    into summary lines first, then the oldest summary lines are dropped.
+    """
+
+    verbatim_rows = list(history[-window.verbatim_turns :])
+    older_rows = history[: len(history) - len(verbatim_rows)]
+    summary_lines: list[str] = []
+    if older_rows:
+        summary_lines = (
+            older_rows[-1].history_summary.splitlines()
+            if older_rows[-1].history_summary
+            else [compress_chat_turn(row) for row in older_rows]
+        )
+
+    serialized = _render_windowed_history(summary_lines, verbatim_rows)
+    while estimate_tokens(serialized) > window.token_budget and len(verbatim_rows) > 1:
+        summary_lines.append(compress_chat_turn(verbatim_rows.pop(0)))
+        serialized = _render_windowed_history(summary_lines, verbatim_rows)
+    while estimate_tokens(serialized) > window.token_budget and summary_lines:
+        summary_lines.pop(0)
+        serialized = _render_windowed_history(summary_lines, verbatim_rows)
+
+    return serialized
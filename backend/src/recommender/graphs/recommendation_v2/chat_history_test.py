@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import unittest
+from uuid import uuid4
+
+from pydantic import ValidationError
+
+from recommender.graphs.recommendation_v2.chat_history import (
+    ChatHistoryConfig,
+    ChatHistoryWindow,
+    estimate_tokens,
+    roll_history_summary,
+    serialize_windowed_chat_history,
+)
+from recommender.graphs.recommendation_v2.models import RecommendationV2GraphState
+from recommender.graphs.recommendation_v2.models import serialize_chat_history
+from recommender.graphs.recommendation_v2.nodes.save_session_node import _build_persisted_chat_record
+from recommender.models.session.session import Session
+from storage.models.chat_record import ChatRecord
+
+
+def _rows(count: int, *, start: int = 0, summary_budget: int = 1000) -> list[ChatRecord]:
+    rows: list[ChatRecord] = []
+    summary = ""
+    for number in range(start, start + count):
+        row = ChatRecord(
+            chat_history_number=number,
+            user_request=f"request {number}",
+            system_response=f"response {number}",
+            synthesized_query=f"query {number}",
+        )
+        summary = roll_history_summary(summary, row, token_budget=summary_budget)
+        row.history_summary = summary
+        rows.append(row)
+    return rows
+
+
+class TestChatHistoryWindow(unittest.TestCase):
+    def test_without_window_serializes_every_turn_verbatim(self) -> None:
+        serialized = serialize_chat_history(_rows(3))
+
+        self.assertEqual(serialized.count("User: request"), 3)
+        self.assertNotIn("Summary of earlier turns", serialized)
+
+    def test_keeps_latest_turns_verbatim_and_summarizes_older_ones(self) -> None:
+        serialized = serialize_chat_history(
+            _rows(6),
+            window=ChatHistoryWindow(verbatim_turns=2, token_budget=10_000),
+        )
+
+        self.assertIn("Summary of earlier turns:", serialized)
+        for number in range(4):
+            self.assertIn(f"- User: request {number} (searched for: query {number})", serialized)
+            self.assertNotIn(f"Assistant: response {number}", serialized)
+        self.assertIn("User: request 4\nAssistant: response 4", serialized)
+        self.assertIn("User: request 5\nAssistant: response 5", serialized)
+
+    def test_token_budget_compresses_oldest_verbatim_turns_first(self) -> None:
+        history = _rows(4)
+        budget = estimate_tokens(serialize_windowed_chat_history(history, ChatHistoryWindow(3, 10_000))) - 1
+
+        serialized = serialize_windowed_chat_history(history, ChatHistoryWindow(3, budget))
+
+        self.assertLessEqual(estimate_tokens(serialized), budget)
+        self.assertNotIn("Assistant: response 1", serialized)
+        self.assertIn("- User: request 1 (searched for: query 1)", serialized)
+        self.assertIn("Assistant: response 3", serialized)
+
+    def test_rolling_summary_drops_oldest_lines_beyond_budget(self) -> None:
+        summary = _rows(20, summary_budget=40)[-1].history_summary
+
+        self.assertLessEqual(estimate_tokens(summary), 40)
+        self.assertTrue(summary.endswith("- User: request 19 (searched for: query 19)"))
+        self.assertNotIn("request 0 ", summary)
+
+    def test_load_limit_must_exceed_verbatim_turns(self) -> None:
+        with self.assertRaises(ValidationError):
+            ChatHistoryConfig(verbatim_turns=4, load_limit=4)
+
+
+class TestPersistedChatRecordNumbering(unittest.TestCase):
+    def test_next_row_follows_latest_loaded_row_and_rolls_summary(self) -> None:
+        state = RecommendationV2GraphState(
+            session=Session(user_id=uuid4(), session_id=uuid4()),
+            user_request="request 12",
+            system_response="response 12",
+            synthesized_user_request="query 12",
+            history=_rows(2, start=10),
+        )
+
+        row = _build_persisted_chat_record(state, history_summary_token_budget=1000)
+
+        self.assertEqual(row.chat_history_number, 12)
+        self.assertEqual(
+            row.history_summary.splitlines(),
+            [
+                "- User: request 10 (searched for: query 10)",
+                "- User: request 11 (searched for: query 11)",
+                "- User: request 12 (searched for: query 12)",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
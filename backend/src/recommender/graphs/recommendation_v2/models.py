@@ -6,6 +6,11 @@ from typing import Literal
 from pydantic import BaseModel
 from pydantic import Field
 
+from recommender.graphs.recommendation_v2.chat_history import (
+    ChatHistoryWindow,
+    serialize_chat_turn,
+    serialize_windowed_chat_history,
+)
 from recommender.graphs.recommendation_v2.filter_models import (
     RecommendationV2BudgetFilter,
     RecommendationV2RegionFilter,
@@ -73,6 +78,14 @@ class RecommendationV2GraphState(BaseModel):
 
     session: Session = Field(..., description="Conversation scope identifiers")
     user_request: str = Field(..., description="Raw user query input")
+    included_regions_ids: list[str] = Field(
+        default_factory=list,
+        description="Destination IDs the request restricts retrieval to; empty means no restriction",
+    )
+    excluded_regions_ids: list[str] = Field(
+        default_factory=list,
+        description="Destination IDs the request excludes from retrieval",
+    )
     synthesized_user_request: str | None = Field(
         None,
         description="Synthetically generated user request to be used for retrieval and recommendation",
@@ -151,21 +164,28 @@ class RecommendationV2GraphState(BaseModel):
         description="Short explanation for the routing decision",
     )
 
-def serialize_chat_history(history: list[ChatRecord] | None) -> str:
-    """Serialize chat history into a compact string format for LLM input."""
+def serialize_chat_history(
+    history: list[ChatRecord] | None,
+    *,
+    window: ChatHistoryWindow | None = None,
+) -> str:
+    """Serialize chat history into a compact string format for LLM input.
+
+    Without a window every turn is serialized verbatim.
+    """
     if not history:
         return "None"
 
-    parts: list[str] = []
-    for row in history:
-        parts.append(
-            "User: "
-            f"{row.user_request.strip() or 'None'}\n"
-            "Assistant: "
-            f"{row.system_response.strip() or 'None'}\n"
-        )
+    if window is not None:
+        return serialize_windowed_chat_history(history, window)
+
+    return "\n\n".join(serialize_chat_turn(row) for row in history)
+
+
+def next_chat_history_number(history: list[ChatRecord] | None) -> int:
+    """Return the chat history number the current turn is saved under."""
 
-    return "\n\n".join(parts)
+    return history[-1].chat_history_number + 1 if history else 0
 
 __all__ = [
     "RecommendationV2",
@@ -174,4 +194,5 @@ __all__ = [
     "RecommendationV2StatusEnum",
     "serialize_recommendations",
     "serialize_chat_history",
+    "next_chat_history_number",
 ]
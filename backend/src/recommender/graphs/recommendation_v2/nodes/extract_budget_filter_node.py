@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable
 from collections.abc import Callable
 
 from recommender.graphs.recommendation_v2.agents.filter_extraction.budget.agent import (
@@ -8,6 +9,13 @@ from recommender.graphs.recommendation_v2.agents.filter_extraction.budget.agent
 from recommender.graphs.recommendation_v2.agents.filter_extraction.budget.models import (
     RecommendationV2BudgetFilterExtractionInput,
 )
+from recommender.graphs.recommendation_v2.agents.filter_extraction.budget.models import (
+    RecommendationV2BudgetFilterExtractionResult,
+)
+from recommender.graphs.recommendation_v2.agents.filter_extraction.rule_based.extractor import (
+    extract_budget_filter,
+    try_rule_based_extraction,
+)
 from recommender.graphs.recommendation_v2.filter_models import (
     RecommendationV2BudgetFilter,
     RecommendationV2TravelDestinationFilter,
@@ -21,50 +29,95 @@ from utils.logger import LoggerManager
 logger = LoggerManager.get_logger(__name__)
 
 
+def _start_budget_filter_extraction(
+    state: RecommendationV2GraphState,
+) -> RecommendationV2BudgetFilterExtractionInput:
+    if state.history is None:
+        raise RuntimeError(
+            "Session history must be loaded before extracting recommendation_v2 budget filters"
+        )
+
+    base_filter = latest_travel_destination_filter_from_history(state.history)
+    if base_filter is None:
+        base_filter = RecommendationV2TravelDestinationFilter()
+
+    logger.verbose(
+        "Extracting recommendation_v2 budget filters for user_id=%s, session_id=%s with previous_cost_term=%s",
+        state.session.user_id,
+        state.session.session_id,
+        base_filter.cost_term,
+    )
+
+    return RecommendationV2BudgetFilterExtractionInput(
+        current_user_request=state.user_request,
+        previous_cost_term=base_filter.budget.cost_term,
+    )
+
+
+def _build_budget_filter_update(
+    state: RecommendationV2GraphState,
+    budget_result: RecommendationV2BudgetFilterExtractionResult,
+) -> dict[str, object]:
+    budget_filter = RecommendationV2BudgetFilter(
+        cost_term=budget_result.cost_term,
+    )
+
+    logger.verbose(
+        "Extracted recommendation_v2 budget filters for user_id=%s, session_id=%s: %s",
+        state.session.user_id,
+        state.session.session_id,
+        budget_filter.cost_term,
+    )
+
+    return {
+        "extracted_budget_filter": budget_filter,
+        "budget_filter_removed": budget_result.filter_removed,
+    }
+
+
 def create_extract_budget_filter_node(
     budget_filter_extraction_agent: RecommendationV2BudgetFilterExtractionAgent,
+    *,
+    rule_based_min_confidence: float | None = None,
 ) -> Callable[[RecommendationV2GraphState], dict[str, object]]:
     """Create node to extract recommendation_v2 budget filters from the current turn."""
 
     def extract_budget_filter_node(
         state: RecommendationV2GraphState,
     ) -> dict[str, object]:
-        if state.history is None:
-            raise RuntimeError(
-                "Session history must be loaded before extracting recommendation_v2 budget filters"
-            )
-
-        base_filter = latest_travel_destination_filter_from_history(state.history)
-        if base_filter is None:
-            base_filter = RecommendationV2TravelDestinationFilter()
-
-        logger.verbose(
-            "Extracting recommendation_v2 budget filters for user_id=%s, session_id=%s with previous_cost_term=%s",
-            state.session.user_id,
-            state.session.session_id,
-            base_filter.cost_term,
+        extraction_input = _start_budget_filter_extraction(state)
+        budget_result = try_rule_based_extraction(
+            extract_budget_filter,
+            extraction_input,
+            filter_name="budget",
+            min_confidence=rule_based_min_confidence,
         )
+        if budget_result is None:
+            budget_result = budget_filter_extraction_agent.invoke(extraction_input)
+        return _build_budget_filter_update(state, budget_result)
 
-        budget_result = budget_filter_extraction_agent.invoke(
-            RecommendationV2BudgetFilterExtractionInput(
-                current_user_request=state.user_request,
-                previous_cost_term=base_filter.budget.cost_term,
-            )
-        )
-        budget_filter = RecommendationV2BudgetFilter(
-            cost_term=budget_result.cost_term,
-        )
+    return extract_budget_filter_node
 
-        logger.verbose(
-            "Extracted recommendation_v2 budget filters for user_id=%s, session_id=%s: %s",
-            state.session.user_id,
-            state.session.session_id,
-            budget_filter.cost_term,
-        )
 
-        return {
-            "extracted_budget_filter": budget_filter,
-            "budget_filter_removed": budget_result.filter_removed,
-        }
+def create_async_extract_budget_filter_node(
+    budget_filter_extraction_agent: RecommendationV2BudgetFilterExtractionAgent,
+    *,
+    rule_based_min_confidence: float | None = None,
+) -> Callable[[RecommendationV2GraphState], Awaitable[dict[str, object]]]:
+    """Create node to extract budget filters by awaiting the extraction agent."""
+
+    async def extract_budget_filter_node(
+        state: RecommendationV2GraphState,
+    ) -> dict[str, object]:
+        extraction_input = _start_budget_filter_extraction(state)
+        budget_result = try_rule_based_extraction(
+            extract_budget_filter,
+            extraction_input,
+            filter_name="budget",
+            min_confidence=rule_based_min_confidence,
+        )
+        if budget_result is None:
+            budget_result = await budget_filter_extraction_agent.ainvoke(extraction_input)
+        return _build_budget_filter_update(state, budget_result)
 
     return extract_budget_filter_node
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable
 from collections.abc import Callable
 
 from pydantic import ValidationError
@@ -10,6 +11,13 @@ from recommender.graphs.recommendation_v2.agents.filter_extraction.parent_region
 from recommender.graphs.recommendation_v2.agents.filter_extraction.parent_region.models import (
     RecommendationV2ParentRegionFilterExtractionInput,
 )
+from recommender.graphs.recommendation_v2.agents.filter_extraction.parent_region.models import (
+    RecommendationV2ParentRegionFilterExtractionResult,
+)
+from recommender.graphs.recommendation_v2.agents.filter_extraction.rule_based.extractor import (
+    extract_parent_region_filter,
+    try_rule_based_extraction,
+)
 from recommender.graphs.recommendation_v2.filter_models import (
     ALLOWED_RECOMMENDATION_V2_PARENT_REGION_NAMES,
     RecommendationV2RegionFilter,
@@ -25,69 +33,113 @@ logger = LoggerManager.get_logger(__name__)
 _ALLOWED_PARENT_REGION_SET = frozenset(ALLOWED_RECOMMENDATION_V2_PARENT_REGION_NAMES)
 
 
+def _start_parent_region_filter_extraction(
+    state: RecommendationV2GraphState,
+) -> RecommendationV2ParentRegionFilterExtractionInput:
+    logger.verbose(
+        "Extracting recommendation_v2 parent-region filters for user_id=%s, session_id=%s",
+        state.session.user_id,
+        state.session.session_id,
+    )
+
+    return RecommendationV2ParentRegionFilterExtractionInput(
+        current_user_request=state.user_request,
+    )
+
+
+def _build_parent_region_filter_update(
+    state: RecommendationV2GraphState,
+    result: RecommendationV2ParentRegionFilterExtractionResult,
+) -> dict[str, object]:
+    extracted_filters: list[RecommendationV2RegionFilter] = []
+    if result.parent_regions:
+        for entry in result.parent_regions:
+            if entry.name not in _ALLOWED_PARENT_REGION_SET:
+                logger.warning(
+                    "Skipping invalid parent_region from LLM output: %s",
+                    entry.name,
+                )
+                continue
+            try:
+                extracted_filters.append(
+                    RecommendationV2RegionFilter(
+                        field_name="parent_region",
+                        region_name=entry.name,
+                        type=entry.type,
+                    )
+                )
+            except ValidationError:
+                logger.warning(
+                    "Skipping invalid parent_region filter from LLM output: %s",
+                    entry.model_dump(),
+                )
+
+    if result.filter_removed:
+        valid_filters = []
+    else:
+        existing_filters = []
+        if state.previously_extracted_travel_destination_filter is not None:
+            existing_filters = (
+                state.previously_extracted_travel_destination_filter.parent_region_filters
+            )
+        valid_filters = merge_parent_region_filters(existing_filters, extracted_filters)
+
+    logger.verbose(
+        "Extracted recommendation_v2 parent-region filters for user_id=%s, session_id=%s: %s",
+        state.session.user_id,
+        state.session.session_id,
+        valid_filters,
+    )
+
+    return {
+        "extracted_parent_region_filters": valid_filters,
+        "parent_region_filter_removed": result.filter_removed,
+    }
+
+
 def create_extract_parent_region_filter_node(
     parent_region_filter_extraction_agent: RecommendationV2ParentRegionFilterExtractionAgent,
+    *,
+    rule_based_min_confidence: float | None = None,
 ) -> Callable[[RecommendationV2GraphState], dict[str, object]]:
     """Create node to extract parent-region filters from the current turn."""
 
     def extract_parent_region_filter_node(
         state: RecommendationV2GraphState,
     ) -> dict[str, object]:
-        logger.verbose(
-            "Extracting recommendation_v2 parent-region filters for user_id=%s, session_id=%s",
-            state.session.user_id,
-            state.session.session_id,
+        extraction_input = _start_parent_region_filter_extraction(state)
+        result = try_rule_based_extraction(
+            extract_parent_region_filter,
+            extraction_input,
+            filter_name="parent_region",
+            min_confidence=rule_based_min_confidence,
         )
+        if result is None:
+            result = parent_region_filter_extraction_agent.invoke(extraction_input)
+        return _build_parent_region_filter_update(state, result)
 
-        result = parent_region_filter_extraction_agent.invoke(
-            RecommendationV2ParentRegionFilterExtractionInput(
-                current_user_request=state.user_request,
-            )
-        )
+    return extract_parent_region_filter_node
 
-        extracted_filters: list[RecommendationV2RegionFilter] = []
-        if result.parent_regions:
-            for entry in result.parent_regions:
-                if entry.name not in _ALLOWED_PARENT_REGION_SET:
-                    logger.warning(
-                        "Skipping invalid parent_region from LLM output: %s",
-                        entry.name,
-                    )
-                    continue
-                try:
-                    extracted_filters.append(
-                        RecommendationV2RegionFilter(
-                            field_name="parent_region",
-                            region_name=entry.name,
-                            type=entry.type,
-                        )
-                    )
-                except ValidationError:
-                    logger.warning(
-                        "Skipping invalid parent_region filter from LLM output: %s",
-                        entry.model_dump(),
-                    )
 
-        if result.filter_removed:
-            valid_filters = []
-        else:
-            existing_filters = []
-            if state.previously_extracted_travel_destination_filter is not None:
-                existing_filters = (
-                    state.previously_extracted_travel_destination_filter.parent_region_filters
-                )
-            valid_filters = merge_parent_region_filters(existing_filters, extracted_filters)
+def create_async_extract_parent_region_filter_node(
+    parent_region_filter_extraction_agent: RecommendationV2ParentRegionFilterExtractionAgent,
+    *,
+    rule_based_min_confidence: float | None = None,
+) -> Callable[[RecommendationV2GraphState], Awaitable[dict[str, object]]]:
+    """Create node to extract parent-region filters by awaiting the extraction agent."""
 
-        logger.verbose(
-            "Extracted recommendation_v2 parent-region filters for user_id=%s, session_id=%s: %s",
-            state.session.user_id,
-            state.session.session_id,
-            valid_filters,
+    async def extract_parent_region_filter_node(
+        state: RecommendationV2GraphState,
+    ) -> dict[str, object]:
+        extraction_input = _start_parent_region_filter_extraction(state)
+        result = try_rule_based_extraction(
+            extract_parent_region_filter,
+            extraction_input,
+            filter_name="parent_region",
+            min_confidence=rule_based_min_confidence,
         )
-
-        return {
-            "extracted_parent_region_filters": valid_filters,
-            "parent_region_filter_removed": result.filter_removed,
-        }
+        if result is None:
+            result = await parent_region_filter_extraction_agent.ainvoke(extraction_input)
+        return _build_parent_region_filter_update(state, result)
 
     return extract_parent_region_filter_node
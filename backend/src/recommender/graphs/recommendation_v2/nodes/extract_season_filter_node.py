@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable
 from collections.abc import Callable
 
+from recommender.graphs.recommendation_v2.agents.filter_extraction.rule_based.extractor import (
+    extract_season_filter,
+    try_rule_based_extraction,
+)
 from recommender.graphs.recommendation_v2.agents.filter_extraction.season.agent import (
     RecommendationV2SeasonFilterExtractionAgent,
 )
 from recommender.graphs.recommendation_v2.agents.filter_extraction.season.models import (
     RecommendationV2SeasonFilterExtractionInput,
 )
+from recommender.graphs.recommendation_v2.agents.filter_extraction.season.models import (
+    RecommendationV2SeasonFilterExtractionResult,
+)
 from recommender.graphs.recommendation_v2.filter_models import (
     RecommendationV2SeasonalityFilter,
     RecommendationV2TravelDestinationFilter,
@@ -21,54 +29,99 @@ from utils.logger import LoggerManager
 logger = LoggerManager.get_logger(__name__)
 
 
+def _start_season_filter_extraction(
+    state: RecommendationV2GraphState,
+) -> RecommendationV2SeasonFilterExtractionInput:
+    if state.history is None:
+        raise RuntimeError(
+            "Session history must be loaded before extracting recommendation_v2 season filters"
+        )
+
+    base_filter = latest_travel_destination_filter_from_history(state.history)
+    if base_filter is None:
+        base_filter = RecommendationV2TravelDestinationFilter()
+
+    logger.verbose(
+        "Extracting recommendation_v2 season filters for user_id=%s, session_id=%s with previous_season=%s, previous_months=%s",
+        state.session.user_id,
+        state.session.session_id,
+        base_filter.season,
+        base_filter.months,
+    )
+
+    return RecommendationV2SeasonFilterExtractionInput(
+        current_user_request=state.user_request,
+        previous_season=base_filter.seasonality.season,
+        previous_months=base_filter.seasonality.months,
+    )
+
+
+def _build_season_filter_update(
+    state: RecommendationV2GraphState,
+    season_result: RecommendationV2SeasonFilterExtractionResult,
+) -> dict[str, object]:
+    seasonality_filter = RecommendationV2SeasonalityFilter(
+        season=season_result.season,
+        months=season_result.months,
+    )
+
+    logger.verbose(
+        "Extracted recommendation_v2 season filters for user_id=%s, session_id=%s: season=%s, months=%s",
+        state.session.user_id,
+        state.session.session_id,
+        seasonality_filter.season,
+        seasonality_filter.months,
+    )
+
+    return {
+        "extracted_seasonality_filter": seasonality_filter,
+        "seasonality_filter_removed": season_result.filter_removed,
+    }
+
+
 def create_extract_season_filter_node(
     season_filter_extraction_agent: RecommendationV2SeasonFilterExtractionAgent,
+    *,
+    rule_based_min_confidence: float | None = None,
 ) -> Callable[[RecommendationV2GraphState], dict[str, object]]:
     """Create node to extract recommendation_v2 season and month filters from the current turn."""
 
     def extract_season_filter_node(
         state: RecommendationV2GraphState,
     ) -> dict[str, object]:
-        if state.history is None:
-            raise RuntimeError(
-                "Session history must be loaded before extracting recommendation_v2 season filters"
-            )
-
-        base_filter = latest_travel_destination_filter_from_history(state.history)
-        if base_filter is None:
-            base_filter = RecommendationV2TravelDestinationFilter()
-
-        logger.verbose(
-            "Extracting recommendation_v2 season filters for user_id=%s, session_id=%s with previous_season=%s, previous_months=%s",
-            state.session.user_id,
-            state.session.session_id,
-            base_filter.season,
-            base_filter.months,
+        extraction_input = _start_season_filter_extraction(state)
+        season_result = try_rule_based_extraction(
+            extract_season_filter,
+            extraction_input,
+            filter_name="season",
+            min_confidence=rule_based_min_confidence,
         )
+        if season_result is None:
+            season_result = season_filter_extraction_agent.invoke(extraction_input)
+        return _build_season_filter_update(state, season_result)
 
-        season_result = season_filter_extraction_agent.invoke(
-            RecommendationV2SeasonFilterExtractionInput(
-                current_user_request=state.user_request,
-                previous_season=base_filter.seasonality.season,
-                previous_months=base_filter.seasonality.months,
-            )
-        )
-        seasonality_filter = RecommendationV2SeasonalityFilter(
-            season=season_result.season,
-            months=season_result.months,
-        )
+    return extract_season_filter_node
 
-        logger.verbose(
-            "Extracted recommendation_v2 season filters for user_id=%s, session_id=%s: season=%s, months=%s",
-            state.session.user_id,
-            state.session.session_id,
-            seasonality_filter.season,
-            seasonality_filter.months,
-        )
 
-        return {
-            "extracted_seasonality_filter": seasonality_filter,
-            "seasonality_filter_removed": season_result.filter_removed,
-        }
+def create_async_extract_season_filter_node(
+    season_filter_extraction_agent: RecommendationV2SeasonFilterExtractionAgent,
+    *,
+    rule_based_min_confidence: float | None = None,
+) -> Callable[[RecommendationV2GraphState], Awaitable[dict[str, object]]]:
+    """Create node to extract season and month filters by awaiting the extraction agent."""
+
+    async def extract_season_filter_node(
+        state: RecommendationV2GraphState,
+    ) -> dict[str, object]:
+        extraction_input = _start_season_filter_extraction(state)
+        season_result = try_rule_based_extraction(
+            extract_season_filter,
+            extraction_input,
+            filter_name="season",
+            min_confidence=rule_based_min_confidence,
+        )
+        if season_result is None:
+            season_result = await season_filter_extraction_agent.ainvoke(extraction_input)
+        return _build_season_filter_update(state, season_result)
 
     return extract_season_filter_node
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+from recommender.graphs.recommendation_v2.agents.fused_extraction.agent import (
+    RecommendationV2FusedExtractionAgent,
+)
+from recommender.graphs.recommendation_v2.agents.fused_extraction.models import (
+    RecommendationV2FusedExtractionInput,
+)
+from recommender.graphs.recommendation_v2.agents.fused_extraction.models import (
+    RecommendationV2FusedExtractionResult,
+)
+from recommender.graphs.recommendation_v2.models import RecommendationV2GraphState
+from recommender.graphs.recommendation_v2.nodes.extract_budget_filter_node import (
+    _build_budget_filter_update,
+    _start_budget_filter_extraction,
+)
+from recommender.graphs.recommendation_v2.nodes.extract_parent_region_filter_node import (
+    _build_parent_region_filter_update,
+    _start_parent_region_filter_extraction,
+)
+from recommender.graphs.recommendation_v2.nodes.extract_season_filter_node import (
+    _build_season_filter_update,
+    _start_season_filter_extraction,
+)
+from recommender.graphs.recommendation_v2.nodes.synthesize_user_request_node import (
+    _build_user_request_synthesis_update,
+    _start_user_request_synthesis,
+)
+from utils.logger import LoggerManager
+
+logger = LoggerManager.get_logger(__name__)
+
+
+def _start_fused_extraction(
+    state: RecommendationV2GraphState,
+) -> RecommendationV2FusedExtractionInput:
+    logger.verbose(
+        "Running fused recommendation_v2 synthesis and filter extraction for user_id=%s, session_id=%s",
+        state.session.user_id,
+        state.session.session_id,
+    )
+
+    return RecommendationV2FusedExtractionInput(
+        synthesis=_start_user_request_synthesis(state),
+        parent_region=_start_parent_region_filter_extraction(state),
+        season=_start_season_filter_extraction(state),
+        budget=_start_budget_filter_extraction(state),
+    )
+
+
+def _build_fused_extraction_update(
+    state: RecommendationV2GraphState,
+    result: RecommendationV2FusedExtractionResult,
+) -> dict[str, object]:
+    return {
+        **_build_user_request_synthesis_update(state, result.synthesis_result()),
+        **_build_parent_region_filter_update(state, result.parent_region_filter),
+        **_build_season_filter_update(state, result.season_filter),
+        **_build_budget_filter_update(state, result.budget_filter),
+    }
+
+
+def create_fused_extraction_node(
+    fused_extraction_agent: RecommendationV2FusedExtractionAgent,
+) -> Callable[[RecommendationV2GraphState], dict[str, object]]:
+    """Create node to synthesize the user request and extract all filters with one LLM call."""
+
+    def fused_extraction_node(
+        state: RecommendationV2GraphState,
+    ) -> dict[str, object]:
+        extraction_input = _start_fused_extraction(state)
+        result = fused_extraction_agent.invoke(extraction_input)
+        return _build_fused_extraction_update(state, result)
+
+    return fused_extraction_node
+
+
+def create_async_fused_extraction_node(
+    fused_extraction_agent: RecommendationV2FusedExtractionAgent,
+) -> Callable[[RecommendationV2GraphState], Awaitable[dict[str, object]]]:
+    """Create node to synthesize the user request and extract all filters by awaiting one LLM call."""
+
+    async def fused_extraction_node(
+        state: RecommendationV2GraphState,
+    ) -> dict[str, object]:
+        extraction_input = _start_fused_extraction(state)
+        result = await fused_extraction_agent.ainvoke(extraction_input)
+        return _build_fused_extraction_update(state, result)
+
+    return fused_extraction_node
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from uuid import uuid4
+
+from recommender.graphs.recommendation_v2.agents.filter_extraction.budget.models import (
+    RecommendationV2BudgetFilterExtractionResult,
+)
+from recommender.graphs.recommendation_v2.agents.filter_extraction.parent_region.models import (
+    ParentRegionEntry,
+    RecommendationV2ParentRegionFilterExtractionResult,
+)
+from recommender.graphs.recommendation_v2.agents.filter_extraction.season.models import (
+    RecommendationV2SeasonFilterExtractionResult,
+)
+from recommender.graphs.recommendation_v2.agents.fused_extraction.agent import (
+    RecommendationV2FusedExtractionAgent,
+)
+from recommender.graphs.recommendation_v2.agents.fused_extraction.models import (
+    RecommendationV2FusedExtractionResult,
+)
+from recommender.graphs.recommendation_v2.models import RecommendationV2GraphState
+from recommender.graphs.recommendation_v2.nodes.fused_extraction_node import (
+    create_async_fused_extraction_node,
+    create_fused_extraction_node,
+)
+from recommender.models.session.session import Session
+
+
+class _FakeStructuredRunnable:
+    def __init__(self, response: RecommendationV2FusedExtractionResult) -> None:
+        self._response = response
+        self.calls = 0
+
+    def invoke(self, _messages: object) -> RecommendationV2FusedExtractionResult:
+        self.calls += 1
+        return self._response
+
+    async def ainvoke(self, messages: object) -> RecommendationV2FusedExtractionResult:
+        return self.invoke(messages)
+
+
+class _FakeChatModel:
+    def __init__(self, response: RecommendationV2FusedExtractionResult) -> None:
+        self.structured_runnable = _FakeStructuredRunnable(response)
+
+    def with_structured_output(self, _output_type: object) -> _FakeStructuredRunnable:
+        return self.structured_runnable
+
+
+def _state() -> RecommendationV2GraphState:
+    return RecommendationV2GraphState(
+        session=Session(user_id=uuid4(), session_id=uuid4()),
+        user_request="A cheap beach trip in Europe in July, not in Asia",
+        history=[],
+    )
+
+
+class TestFusedExtractionNode(unittest.TestCase):
+    def setUp(self) -> None:
+        self.llm = _FakeChatModel(
+            RecommendationV2FusedExtractionResult(
+                synthesized_query="beach trip",
+                keywords=["beach"],
+                parent_region_filter=RecommendationV2ParentRegionFilterExtractionResult(
+                    parent_regions=[
+                        ParentRegionEntry(name="Europe", type="include"),
+                        ParentRegionEntry(name="Atlantis", type="include"),
+                        ParentRegionEntry(name="Asia", type="exclude"),
+                    ],
+                ),
+                season_filter=RecommendationV2SeasonFilterExtractionResult(months=["jul"]),
+                budget_filter=RecommendationV2BudgetFilterExtractionResult(
+                    cost_term={"inferred_level": "low"},
+                ),
+            )
+        )
+        self.agent = RecommendationV2FusedExtractionAgent(llm=self.llm)
+
+    def test_one_llm_call_fills_synthesis_and_every_filter(self) -> None:
+        update = create_fused_extraction_node(self.agent)(_state())
+
+        self.assertEqual(self.llm.structured_runnable.calls, 1)
+        self.assertEqual(update["synthesized_user_request"], "beach trip")
+        self.assertEqual(update["synthesized_user_request_keywords"], ["beach"])
+        self.assertEqual(
+            [(entry.region_name, entry.type) for entry in update["extracted_parent_region_filters"]],
+            [("Europe", "include"), ("Asia", "exclude")],
+        )
+        self.assertEqual(update["extracted_seasonality_filter"].months, ["jul"])
+        self.assertEqual(update["extracted_budget_filter"].cost_term.inferred_level, "low")
+        self.assertFalse(update["parent_region_filter_removed"])
+        self.assertFalse(update["seasonality_filter_removed"])
+        self.assertFalse(update["budget_filter_removed"])
+
+    def test_async_node_matches_sync_node(self) -> None:
+        sync_update = create_fused_extraction_node(self.agent)(_state())
+        async_update = asyncio.run(create_async_fused_extraction_node(self.agent)(_state()))
+
+        self.assertEqual(async_update, sync_update)
+
+
+if __name__ == "__main__":
+    unittest.main()
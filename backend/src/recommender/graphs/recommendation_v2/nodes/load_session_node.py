@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable
 from typing import Callable
 
 from recommender.graphs.recommendation_v2.models import RecommendationV2GraphState
@@ -7,51 +8,90 @@ from recommender.graphs.recommendation_v2.stream_events import emit_stream_event
 from recommender.graphs.recommendation_v2.utils.travel_destination_filter_node_utils import (
     latest_travel_destination_filter_from_history,
 )
+from storage.models.chat_record import ChatRecord
+from storage.stores.async_chat_store import AsyncChatStore
 from storage.stores.chat_store import ChatStore
 from utils.logger import LoggerManager
 
 logger = LoggerManager.get_logger(__name__)
 
 
+def _log_session_memory_load(state: RecommendationV2GraphState) -> None:
+    emit_stream_event(EventType.INITIALIZING, {})
+
+    logger.verbose(
+        "Loading recommendation_v2 session memory for user_id=%s, session_id=%s",
+        state.session.user_id,
+        state.session.session_id,
+    )
+
+
+def _build_session_memory_update(
+    state: RecommendationV2GraphState,
+    persisted_rows: list[ChatRecord],
+) -> dict[str, object]:
+    logger.verbose(
+        "Loaded %d recommendation_v2 rows for user_id=%s, session_id=%s",
+        len(persisted_rows),
+        state.session.user_id,
+        state.session.session_id,
+    )
+
+    previous_synthesized_user_request = (
+        persisted_rows[-1].synthesized_query if len(persisted_rows) > 0 else None
+    )
+    previously_extracted_travel_destination_filter = (
+        latest_travel_destination_filter_from_history(persisted_rows)
+    )
+
+    return {
+        "history": persisted_rows,
+        "previous_synthesized_user_request": previous_synthesized_user_request,
+        "previously_extracted_travel_destination_filter": previously_extracted_travel_destination_filter,
+    }
+
+
 def create_session_memory_load_node(
     chat_store: ChatStore,
+    *,
+    history_limit: int | None = None,
 ) -> Callable[[RecommendationV2GraphState], dict[str, object]]:
-    """Create node to load session memory from storage."""
+    """Create node to load session memory from storage, optionally only the latest `history_limit` turns."""
 
     def session_memory_load_node(
         state: RecommendationV2GraphState,
     ) -> dict[str, object]:
-        emit_stream_event(EventType.INITIALIZING, {})
-
-        logger.verbose(
-            "Loading recommendation_v2 session memory for user_id=%s, session_id=%s",
-            state.session.user_id,
-            state.session.session_id,
-        )
+        _log_session_memory_load(state)
 
         persisted_rows = chat_store.load_session(
             user_id=state.session.user_id,
             session_id=state.session.session_id,
+            limit=history_limit,
         )
 
-        logger.verbose(
-            "Loaded %d recommendation_v2 rows for user_id=%s, session_id=%s",
-            len(persisted_rows),
-            state.session.user_id,
-            state.session.session_id,
-        )
+        return _build_session_memory_update(state, persisted_rows)
 
-        previous_synthesized_user_request = (
-            persisted_rows[-1].synthesized_query if len(persisted_rows) > 0 else None
-        )
-        previously_extracted_travel_destination_filter = (
-            latest_travel_destination_filter_from_history(persisted_rows)
+    return session_memory_load_node
+
+
+def create_async_session_memory_load_node(
+    chat_store: AsyncChatStore,
+    *,
+    history_limit: int | None = None,
+) -> Callable[[RecommendationV2GraphState], Awaitable[dict[str, object]]]:
+    """Create node to load session memory from storage without blocking the event loop."""
+
+    async def session_memory_load_node(
+        state: RecommendationV2GraphState,
+    ) -> dict[str, object]:
+        _log_session_memory_load(state)
+
+        persisted_rows = await chat_store.load_session(
+            user_id=state.session.user_id,
+            session_id=state.session.session_id,
+            limit=history_limit,
         )
 
-        return {
-            "history": persisted_rows,
-            "previous_synthesized_user_request": previous_synthesized_user_request,
-            "previously_extracted_travel_destination_filter": previously_extracted_travel_destination_filter,
-        }
+        return _build_session_memory_update(state, persisted_rows)
 
     return session_memory_load_node
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable
 from collections.abc import Callable
 
 from recommender.graphs.recommendation_v2.agents.response_generation.need_more_information.agent import (
@@ -8,6 +9,9 @@ from recommender.graphs.recommendation_v2.agents.response_generation.need_more_i
 from recommender.graphs.recommendation_v2.agents.response_generation.need_more_information.models import (
     RecommendationV2NeedMoreInformationResponseGenerationInput,
 )
+from recommender.graphs.recommendation_v2.agents.response_generation.response_generation_result import (
+    RecommendationV2ResponseGenerationResult,
+)
 from recommender.graphs.recommendation_v2.models import RecommendationV2GraphState
 from recommender.graphs.recommendation_v2.stream_events import (
     EventType,
@@ -15,11 +19,56 @@ from recommender.graphs.recommendation_v2.stream_events import (
     build_recommendation_event_payload,
 )
 from recommender.graphs.recommendation_v2.stream_events import emit_stream_event
+from recommender.graphs.recommendation_v2.utils.response_streaming_node_utils import (
+    stream_response_deltas,
+)
 from utils.logger import LoggerManager
 
 logger = LoggerManager.get_logger(__name__)
 
 
+def _start_need_more_information_response_generation(
+    state: RecommendationV2GraphState,
+) -> RecommendationV2NeedMoreInformationResponseGenerationInput:
+    if state.history is None:
+        raise RuntimeError(
+            "Session history must be loaded before generating a need-more-information recommendation_v2 response"
+        )
+
+    logger.verbose(
+        "Generating need-more-information recommendation_v2 response for user_id=%s, session_id=%s",
+        state.session.user_id,
+        state.session.session_id,
+    )
+
+    emit_stream_event(EventType.RESPONSE_GENERATION, {})
+
+    return RecommendationV2NeedMoreInformationResponseGenerationInput(
+        current_user_request=state.user_request,
+        chat_history=state.history,
+    )
+
+
+def _build_need_more_information_response_update(
+    state: RecommendationV2GraphState,
+    response_result: RecommendationV2ResponseGenerationResult,
+) -> dict[str, object]:
+    logger.verbose(
+        "Generated need-more-information recommendation_v2 response for user_id=%s, session_id=%s: %s",
+        state.session.user_id,
+        state.session.session_id,
+        response_result.response,
+    )
+
+    emit_stream_event(
+        EventType.RESPONSE, StreamEventResponseMessage(response_result.response).serialize()
+    )
+
+    return {
+        "system_response": response_result.response,
+    }
+
+
 def create_need_more_information_response_generation_node(
     response_generation_agent: RecommendationV2NeedMoreInformationResponseGenerationAgent,
 ) -> Callable[[RecommendationV2GraphState], dict[str, object]]:
@@ -28,39 +77,34 @@ def create_need_more_information_response_generation_node(
     def need_more_information_response_generation_node(
         state: RecommendationV2GraphState,
     ) -> dict[str, object]:
-        if state.history is None:
-            raise RuntimeError(
-                "Session history must be loaded before generating a need-more-information recommendation_v2 response"
-            )
-
-        logger.verbose(
-            "Generating need-more-information recommendation_v2 response for user_id=%s, session_id=%s",
-            state.session.user_id,
-            state.session.session_id,
-        )
+        response_input = _start_need_more_information_response_generation(state)
+        response_result = response_generation_agent.invoke(response_input)
+        return _build_need_more_information_response_update(state, response_result)
 
-        emit_stream_event(EventType.RESPONSE_GENERATION, {})
+    return need_more_information_response_generation_node
 
-        response_result = response_generation_agent.invoke(
-            RecommendationV2NeedMoreInformationResponseGenerationInput(
-                current_user_request=state.user_request,
-                chat_history=state.history,
-            )
-        )
 
-        logger.verbose(
-            "Generated need-more-information recommendation_v2 response for user_id=%s, session_id=%s: %s",
-            state.session.user_id,
-            state.session.session_id,
-            response_result.response,
-        )
+def create_async_need_more_information_response_generation_node(
+    response_generation_agent: RecommendationV2NeedMoreInformationResponseGenerationAgent,
+    *,
+    stream_response: bool = False,
+) -> Callable[[RecommendationV2GraphState], Awaitable[dict[str, object]]]:
+    """Create node to generate a need-more-information response by awaiting the response agent.
 
-        emit_stream_event(
-            EventType.RESPONSE, StreamEventResponseMessage(response_result.response).serialize()
-        )
+    With `stream_response`, the response is generated as plain text and forwarded as
+    `response_delta` events while it is generated, before the final `response` event.
+    """
 
-        return {
-            "system_response": response_result.response,
-        }
+    async def need_more_information_response_generation_node(
+        state: RecommendationV2GraphState,
+    ) -> dict[str, object]:
+        response_input = _start_need_more_information_response_generation(state)
+        if stream_response:
+            response_result = await stream_response_deltas(
+                response_generation_agent.astream(response_input)
+            )
+        else:
+            response_result = await response_generation_agent.ainvoke(response_input)
+        return _build_need_more_information_response_update(state, response_result)
 
     return need_more_information_response_generation_node
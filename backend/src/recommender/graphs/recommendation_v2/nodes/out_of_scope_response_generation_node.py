@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable
 from collections.abc import Callable
 
 from recommender.graphs.recommendation_v2.agents.response_generation.out_of_scope.agent import (
@@ -8,17 +9,65 @@ from recommender.graphs.recommendation_v2.agents.response_generation.out_of_scop
 from recommender.graphs.recommendation_v2.agents.response_generation.out_of_scope.models import (
     RecommendationV2OutOfScopeResponseGenerationInput,
 )
+from recommender.graphs.recommendation_v2.agents.response_generation.response_generation_result import (
+    RecommendationV2ResponseGenerationResult,
+)
 from recommender.graphs.recommendation_v2.models import RecommendationV2GraphState
 from recommender.graphs.recommendation_v2.stream_events import (
     EventType,
     StreamEventResponseMessage,
 )
 from recommender.graphs.recommendation_v2.stream_events import emit_stream_event
+from recommender.graphs.recommendation_v2.utils.response_streaming_node_utils import (
+    stream_response_deltas,
+)
 from utils.logger import LoggerManager
 
 logger = LoggerManager.get_logger(__name__)
 
 
+def _start_out_of_scope_response_generation(
+    state: RecommendationV2GraphState,
+) -> RecommendationV2OutOfScopeResponseGenerationInput:
+    if state.history is None:
+        raise RuntimeError(
+            "Session history must be loaded before generating an out-of-scope recommendation_v2 response"
+        )
+
+    logger.verbose(
+        "Generating out-of-scope recommendation_v2 response for user_id=%s, session_id=%s",
+        state.session.user_id,
+        state.session.session_id,
+    )
+
+    emit_stream_event(EventType.RESPONSE_GENERATION, {})
+
+    return RecommendationV2OutOfScopeResponseGenerationInput(
+        current_user_request=state.user_request,
+        chat_history=state.history,
+    )
+
+
+def _build_out_of_scope_response_update(
+    state: RecommendationV2GraphState,
+    response_result: RecommendationV2ResponseGenerationResult,
+) -> dict[str, object]:
+    logger.verbose(
+        "Generated out-of-scope recommendation_v2 response for user_id=%s, session_id=%s: %s",
+        state.session.user_id,
+        state.session.session_id,
+        response_result.response,
+    )
+
+    emit_stream_event(
+        EventType.RESPONSE, StreamEventResponseMessage(response_result.response).serialize()
+    )
+
+    return {
+        "system_response": response_result.response,
+    }
+
+
 def create_out_of_scope_response_generation_node(
     response_generation_agent: RecommendationV2OutOfScopeResponseGenerationAgent,
 ) -> Callable[[RecommendationV2GraphState], dict[str, object]]:
@@ -27,40 +76,34 @@ def create_out_of_scope_response_generation_node(
     def out_of_scope_response_generation_node(
         state: RecommendationV2GraphState,
     ) -> dict[str, object]:
-        if state.history is None:
-            raise RuntimeError(
-                "Session history must be loaded before generating an out-of-scope recommendation_v2 response"
-            )
+        response_input = _start_out_of_scope_response_generation(state)
+        response_result = response_generation_agent.invoke(response_input)
+        return _build_out_of_scope_response_update(state, response_result)
 
-        logger.verbose(
-            "Generating out-of-scope recommendation_v2 response for user_id=%s, session_id=%s",
-            state.session.user_id,
-            state.session.session_id,
-        )
-
-        emit_stream_event(EventType.RESPONSE_GENERATION, {})    
-
-        response_result = response_generation_agent.invoke(
-            RecommendationV2OutOfScopeResponseGenerationInput(
-                current_user_request=state.user_request,
-                chat_history=state.history,
-            )
-        )
+    return out_of_scope_response_generation_node
 
-        logger.verbose(
-            "Generated out-of-scope recommendation_v2 response for user_id=%s, session_id=%s: %s",
-            state.session.user_id,
-            state.session.session_id,
-            response_result.response,
-        )
 
-        emit_stream_event(
-            EventType.RESPONSE, StreamEventResponseMessage(response_result.response).serialize()
-        )
+def create_async_out_of_scope_response_generation_node(
+    response_generation_agent: RecommendationV2OutOfScopeResponseGenerationAgent,
+    *,
+    stream_response: bool = False,
+) -> Callable[[RecommendationV2GraphState], Awaitable[dict[str, object]]]:
+    """Create node to generate an out-of-scope response by awaiting the response agent.
 
+    With `stream_response`, the response is generated as plain text and forwarded as
+    `response_delta` events while it is generated, before the final `response` event.
+    """
 
-        return {
-            "system_response": response_result.response,
-        }
+    async def out_of_scope_response_generation_node(
+        state: RecommendationV2GraphState,
+    ) -> dict[str, object]:
+        response_input = _start_out_of_scope_response_generation(state)
+        if stream_response:
+            response_result = await stream_response_deltas(
+                response_generation_agent.astream(response_input)
+            )
+        else:
+            response_result = await response_generation_agent.ainvoke(response_input)
+        return _build_out_of_scope_response_update(state, response_result)
 
     return out_of_scope_response_generation_node
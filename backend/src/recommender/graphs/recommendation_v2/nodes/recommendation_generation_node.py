@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable
 from collections.abc import Callable
 
 from recommender.common.configuration import Configuration
@@ -11,10 +12,14 @@ from recommender.graphs.recommendation_v2.stream_events import (
     emit_stream_event,
 )
 from recommender.graphs.recommendation_v2.utils.recommendation_generation_node_utils import (
-    apply_budget_filters,
-    apply_parent_region_filters,
+    budget_filter_needs_statistics,
+    build_travel_destination_retrieval_filter,
     resolve_seasonality_months,
 )
+from storage.stores.async_travel_destination_store import AsyncTravelDestinationStore
+from storage.stores.search_models import ScoredTravelDestination
+from storage.stores.search_models import TravelCostStatistics
+from storage.stores.search_models import TravelDestinationRetrievalFilter
 from storage.stores.travel_destination_store import TravelDestinationStore
 from utils.logger import LoggerManager
 
@@ -22,6 +27,84 @@ logger = LoggerManager.get_logger(__name__)
 configuration = Configuration()
 
 
+def _start_recommendation_generation(state: RecommendationV2GraphState) -> str:
+    if state.synthesized_user_request is None:
+        raise RuntimeError(
+            "Synthesized user request must be generated before generating recommendation_v2 candidates"
+        )
+
+    logger.verbose(
+        "Generating recommendation_v2 candidates for user_id=%s, session_id=%s with query=%s and keywords=%s",
+        state.session.user_id,
+        state.session.session_id,
+        state.synthesized_user_request,
+        state.synthesized_user_request_keywords,
+    )
+
+    emit_stream_event(EventType.RECOMMENDATION_GENERATION, {})
+
+    return state.synthesized_user_request
+
+
+def _build_retrieval_filter(
+    state: RecommendationV2GraphState,
+    cost_statistics: TravelCostStatistics | None,
+) -> TravelDestinationRetrievalFilter:
+    return build_travel_destination_retrieval_filter(
+        state.gathered_travel_destination_filter,
+        cost_statistics,
+        included_destination_ids=state.included_regions_ids,
+        excluded_destination_ids=state.excluded_regions_ids,
+    )
+
+
+def _needs_unfiltered_candidates(
+    filtered_scored_destinations: list[ScoredTravelDestination],
+    retrieval_filter: TravelDestinationRetrievalFilter,
+) -> bool:
+    # Unfiltered candidates let the no-results response explain which constraints were too narrow.
+    return not filtered_scored_destinations and not retrieval_filter.is_empty()
+
+
+def _build_recommendation_generation_update(
+    state: RecommendationV2GraphState,
+    scored_destinations: list[ScoredTravelDestination],
+    filtered_scored_destinations: list[ScoredTravelDestination],
+) -> dict[str, object]:
+    recommendations = [
+        RecommendationV2(
+            region_id=scored_destination.destination.id,
+            region_name=scored_destination.destination.region,
+        )
+        for scored_destination in scored_destinations
+    ]
+    final_recommendations = [
+        RecommendationV2(
+            region_id=scored_destination.destination.id,
+            region_name=scored_destination.destination.region,
+        )
+        for scored_destination in filtered_scored_destinations
+    ]
+
+    emit_stream_event(
+        EventType.RECOMMENDATION,
+        StreamEventRecommendation(final_recommendations).serialize(),
+    )
+
+    logger.verbose(
+        "Generated %s recommendation_v2 candidates and %s final recommendations for user_id=%s, session_id=%s",
+        len(recommendations),
+        len(final_recommendations),
+        state.session.user_id,
+        state.session.session_id,
+    )
+
+    return {
+        "recommendations": recommendations,
+        "final_recommendations": final_recommendations,
+    }
+
+
 def create_recommendation_generation_node(
     travel_destination_store: TravelDestinationStore,
 ) -> Callable[[RecommendationV2GraphState], dict[str, object]]:
@@ -30,79 +113,83 @@ def create_recommendation_generation_node(
     def recommendation_generation_node(
         state: RecommendationV2GraphState,
     ) -> dict[str, object]:
-        if state.synthesized_user_request is None:
-            raise RuntimeError(
-                "Synthesized user request must be generated before generating recommendation_v2 candidates"
-            )
-
-        query = state.synthesized_user_request
+        query = _start_recommendation_generation(state)
         keywords = state.synthesized_user_request_keywords
 
-        logger.verbose(
-            "Generating recommendation_v2 candidates for user_id=%s, session_id=%s with query=%s and keywords=%s",
-            state.session.user_id,
-            state.session.session_id,
-            query,
-            keywords,
+        cost_statistics = None
+        if budget_filter_needs_statistics(state.gathered_travel_destination_filter):
+            cost_statistics = travel_destination_store.cost_per_week_statistics()
+        retrieval_filter = _build_retrieval_filter(state, cost_statistics)
+        seasonality_months = resolve_seasonality_months(
+            state.gathered_travel_destination_filter,
         )
 
-        emit_stream_event(EventType.RECOMMENDATION_GENERATION, {})
-
-        scored_destinations = travel_destination_store.keyword_boosted_search(
+        filtered_scored_destinations = travel_destination_store.keyword_boosted_search(
             query,
             keywords=keywords,
-            seasonality_months=resolve_seasonality_months(
-                state.gathered_travel_destination_filter,
-            ),
+            seasonality_months=seasonality_months,
+            limit=configuration.recommendation_limit,
+            retrieval_filter=retrieval_filter,
         )
 
-        filtered_scored_destinations = apply_parent_region_filters(
-            scored_destinations,
-            state.gathered_travel_destination_filter,
-        )
+        scored_destinations = filtered_scored_destinations
+        if _needs_unfiltered_candidates(filtered_scored_destinations, retrieval_filter):
+            scored_destinations = travel_destination_store.keyword_boosted_search(
+                query,
+                keywords=keywords,
+                seasonality_months=seasonality_months,
+                limit=configuration.recommendation_limit,
+            )
 
-        cost_statistics = travel_destination_store.cost_per_week_statistics()
-        filtered_scored_destinations = apply_budget_filters(
+        return _build_recommendation_generation_update(
+            state,
+            scored_destinations,
             filtered_scored_destinations,
-            state.gathered_travel_destination_filter,
-            cost_statistics,
         )
 
-        filtered_scored_destinations = filtered_scored_destinations[
-            : configuration.recommendation_limit
-        ]
+    return recommendation_generation_node
 
-        recommendations = [
-            RecommendationV2(
-                region_id=scored_destination.destination.id,
-                region_name=scored_destination.destination.region,
-            )
-            for scored_destination in scored_destinations
-        ]
-        final_recommendations = [
-            RecommendationV2(
-                region_id=scored_destination.destination.id,
-                region_name=scored_destination.destination.region,
-            )
-            for scored_destination in filtered_scored_destinations
-        ]
 
-        emit_stream_event(
-            EventType.RECOMMENDATION,
-            StreamEventRecommendation(final_recommendations).serialize(),
+def create_async_recommendation_generation_node(
+    travel_destination_store: AsyncTravelDestinationStore,
+) -> Callable[[RecommendationV2GraphState], Awaitable[dict[str, object]]]:
+    """Create node to generate recommendation_v2 candidates without blocking the event loop."""
+
+    async def recommendation_generation_node(
+        state: RecommendationV2GraphState,
+    ) -> dict[str, object]:
+        query = _start_recommendation_generation(state)
+        keywords = state.synthesized_user_request_keywords
+
+        cost_statistics = None
+        if budget_filter_needs_statistics(state.gathered_travel_destination_filter):
+            cost_statistics = await travel_destination_store.cost_per_week_statistics()
+        retrieval_filter = _build_retrieval_filter(state, cost_statistics)
+        seasonality_months = resolve_seasonality_months(
+            state.gathered_travel_destination_filter,
         )
 
-        logger.verbose(
-            "Generated %s recommendation_v2 candidates and %s final recommendations for user_id=%s, session_id=%s",
-            len(recommendations),
-            len(final_recommendations),
-            state.session.user_id,
-            state.session.session_id,
+        filtered_scored_destinations = await travel_destination_store.keyword_boosted_search(
+            query,
+            keywords=keywords,
+            seasonality_months=seasonality_months,
+            limit=configuration.recommendation_limit,
+            retrieval_filter=retrieval_filter,
         )
 
-        return {
-            "recommendations": recommendations,
-            "final_recommendations": final_recommendations,
-        }
+        scored_destinations = filtered_scored_destinations
+        if _needs_unfiltered_candidates(filtered_scored_destinations, retrieval_filter):
+            scored_destinations = await travel_destination_store.keyword_boosted_search(
+                query,
+                keywords=keywords,
+                seasonality_months=seasonality_months,
+                limit=configuration.recommendation_limit,
+            )
+
+        return _build_recommendation_generation_update(
+            state,
+            scored_destinations,
+            filtered_scored_destinations,
+        )
 
     return recommendation_generation_node
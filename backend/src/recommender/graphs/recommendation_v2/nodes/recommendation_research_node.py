@@ -1,127 +1,471 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
+import time
 from collections.abc import Awaitable
 from collections.abc import Callable
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
 
 from recommender.graphs.recommendation_v2.agents.recommendation_research import (
     RecommendationV2RecommendationResearchAgent,
     RecommendationV2RecommendationResearchInput,
+    RecommendationV2RecommendationResearchResult,
+    RegionResearchCache,
 )
 from recommender.graphs.recommendation_v2.models import RecommendationV2GraphState
 from recommender.graphs.recommendation_v2.models import RecommendationV2RegionResearch
+from recommender.graphs.recommendation_v2.models import next_chat_history_number
 from recommender.graphs.recommendation_v2.stream_events import EventType
 from recommender.graphs.recommendation_v2.stream_events import StreamEventDestinationResearch
 from recommender.graphs.recommendation_v2.stream_events import StreamEventDestinationResearchGeneration
 from recommender.graphs.recommendation_v2.stream_events import emit_stream_event
+from storage.stores.async_chat_store import AsyncChatStore
+from storage.stores.async_travel_destination_store import AsyncTravelDestinationStore
+from storage.stores.chat_store import ChatStore
+from storage.stores.projection_models import TravelDestinationSummary
 from storage.stores.travel_destination_store import TravelDestinationStore
 from utils.logger import LoggerManager
+from utils.metrics import MetricsRegistry
 
 logger = LoggerManager.get_logger(__name__)
+metrics = MetricsRegistry()
+
+_DEFERRED_PERSIST_RETRY_DELAY_S = 1.0
+_DEFERRED_PERSIST_MAX_ATTEMPTS = 30
+
+DeferredResearchAppender = Callable[[UUID, UUID, int, list[dict[str, Any]]], Awaitable[bool]]
+
+# Deferred research of every turn in the process, and of the graph run currently executing.
+_deferred_research_tasks: set[asyncio.Task[None]] = set()
+_run_deferred_research_tasks: ContextVar[set[asyncio.Task[None]] | None] = ContextVar(
+    "run_deferred_research_tasks",
+    default=None,
+)
+
+
+@contextlib.contextmanager
+def deferred_research_bound_to_run() -> Iterator[None]:
+    """Cancel the deferred research started by a graph run when the run is cancelled or fails.
+
+    Wrap one graph run in it. Research deferred by a turn that completes keeps running, since the
+    turn's chat row is saved; a run that stops early never saves that row.
+    """
+    run_tasks: set[asyncio.Task[None]] = set()
+    token = _run_deferred_research_tasks.set(run_tasks)
+    try:
+        yield
+    except BaseException:
+        for task in run_tasks:
+            task.cancel()
+        raise
+    finally:
+        _run_deferred_research_tasks.reset(token)
+
+
+async def cancel_deferred_research() -> None:
+    """Cancel the deferred research still running, e.g. at application shutdown, and wait for it."""
+    tasks = list(_deferred_research_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    if tasks:
+        logger.info("Cancelled deferred research of %s turns", len(tasks))
+
+
+def _track_deferred_research(task: asyncio.Task[None]) -> None:
+    _deferred_research_tasks.add(task)
+    task.add_done_callback(_deferred_research_tasks.discard)
+    run_tasks = _run_deferred_research_tasks.get()
+    if run_tasks is not None:
+        run_tasks.add(task)
+        task.add_done_callback(run_tasks.discard)
+
+
+@dataclass(frozen=True, slots=True)
+class ResearchFanOutLimits:
+    """Deadlines and concurrency cap for researching the recommended regions of a turn.
+
+    `destination_timeout_s` abandons one region's research, `turn_timeout_s` bounds how long the
+    node holds the turn open, and `max_concurrency` caps regions researched at once across turns.
+    With `defer_stragglers`, regions unfinished at the turn deadline keep running in the background
+    and are appended to the turn's saved chat row; otherwise they are cancelled. Deferred research
+    stops with the run inside `deferred_research_bound_to_run` and at `cancel_deferred_research`.
+    """
+
+    destination_timeout_s: float | None = None
+    turn_timeout_s: float | None = None
+    max_concurrency: int | None = None
+    defer_stragglers: bool = False
+
+
+def _start_recommendation_research(state: RecommendationV2GraphState) -> list[str] | None:
+    if state.synthesized_user_request is None:
+        raise RuntimeError(
+            "Synthesized user request must be generated before researching recommendation_v2 regions"
+        )
+
+    if not state.final_recommendations:
+        return None
+
+    logger.verbose(
+        "Researching %s recommendation_v2 regions for user_id=%s, session_id=%s",
+        len(state.final_recommendations),
+        state.session.user_id,
+        state.session.session_id,
+    )
+
+    return [recommendation.region_id for recommendation in state.final_recommendations]
+
+
+def _emit_destination_research(
+    region_id: str,
+    destination_research: RecommendationV2RegionResearch,
+) -> None:
+    emit_stream_event(
+        EventType.DESTINATION_RESEARCH,
+        StreamEventDestinationResearch(
+            region_id=region_id,
+            destination_research=destination_research,
+        ).serialize(),
+    )
+
+
+def _to_region_research(
+    research_result: RecommendationV2RecommendationResearchResult,
+) -> RecommendationV2RegionResearch:
+    return RecommendationV2RegionResearch(
+        description=research_result.description,
+        image_urls=research_result.image_urls,
+    )
+
+
+def _cancel_stragglers(
+    stragglers: dict[asyncio.Task[RecommendationV2RecommendationResearchResult | None], str],
+    deferred_task: asyncio.Task[None],
+) -> None:
+    # Stragglers are done unless the deferred research was cancelled before they finished.
+    for task in stragglers:
+        task.cancel()
+    if deferred_task.cancelled():
+        metrics.increment("recommendation_research_deferred_total", outcome="cancelled")
+
+
+class _RegionResearchRunner:
+    """Runs region research under the fan-out limits and completes deferred regions in the background."""
+
+    def __init__(
+        self,
+        recommendation_research_agent: RecommendationV2RecommendationResearchAgent,
+        *,
+        research_cache: RegionResearchCache | None,
+        limits: ResearchFanOutLimits,
+        append_deferred_research: DeferredResearchAppender | None,
+    ) -> None:
+        self.recommendation_research_agent = recommendation_research_agent
+        self.research_cache = research_cache
+        self.limits = limits
+        self.append_deferred_research = append_deferred_research
+        self.semaphore = (
+            asyncio.Semaphore(limits.max_concurrency) if limits.max_concurrency is not None else None
+        )
+
+    async def research_region(
+        self,
+        region_id: str,
+        research_input: RecommendationV2RecommendationResearchInput,
+    ) -> RecommendationV2RecommendationResearchResult | None:
+        async with self.semaphore or contextlib.nullcontext():
+            started_at = time.perf_counter()
+            outcome = "failed"
+            try:
+                research_result = await asyncio.wait_for(
+                    self.recommendation_research_agent.invoke_async(research_input),
+                    timeout=self.limits.destination_timeout_s,
+                )
+                outcome = "completed"
+                return research_result
+            except TimeoutError:
+                outcome = "timeout"
+                logger.warning(
+                    "Research for region_id=%s exceeded %.1fs and was abandoned",
+                    region_id,
+                    self.limits.destination_timeout_s,
+                )
+                return None
+            except asyncio.CancelledError:
+                outcome = "cancelled"
+                raise
+            except Exception as error:
+                logger.warning("Research for region_id=%s failed: %s", region_id, error)
+                return None
+            finally:
+                elapsed_s = time.perf_counter() - started_at
+                metrics.observe("recommendation_research_destination_seconds", elapsed_s, outcome=outcome)
+                logger.verbose("Research for region_id=%s took %.2fs (%s)", region_id, elapsed_s, outcome)
+
+    def handle_stragglers(
+        self,
+        state: RecommendationV2GraphState,
+        stragglers: dict[asyncio.Task[RecommendationV2RecommendationResearchResult | None], str],
+    ) -> None:
+        if not stragglers:
+            return
+
+        if not self.limits.defer_stragglers or self.append_deferred_research is None:
+            for task in stragglers:
+                task.cancel()
+            metrics.increment("recommendation_research_stragglers_total", len(stragglers), action="cancelled")
+            logger.verbose("Cancelled research for %s regions past the turn deadline", len(stragglers))
+            return
+
+        metrics.increment("recommendation_research_stragglers_total", len(stragglers), action="deferred")
+        logger.verbose("Deferred research for %s regions past the turn deadline", len(stragglers))
+        deferred_task = asyncio.create_task(
+            self._complete_deferred_research(
+                stragglers,
+                user_id=state.session.user_id,
+                session_id=state.session.session_id,
+                chat_history_number=next_chat_history_number(state.history),
+                synthesized_query=state.synthesized_user_request,
+            )
+        )
+        deferred_task.add_done_callback(functools.partial(_cancel_stragglers, stragglers))
+        _track_deferred_research(deferred_task)
+
+    async def _complete_deferred_research(
+        self,
+        stragglers: dict[asyncio.Task[RecommendationV2RecommendationResearchResult | None], str],
+        *,
+        user_id: UUID,
+        session_id: UUID,
+        chat_history_number: int,
+        synthesized_query: str,
+    ) -> None:
+        await asyncio.wait(stragglers)
+        research_by_region_id = {
+            region_id: task.result()
+            for task, region_id in stragglers.items()
+            if not task.cancelled() and task.exception() is None and task.result() is not None
+        }
+        if not research_by_region_id:
+            return
+
+        if self.research_cache is not None:
+            await self.research_cache.aput_many(research_by_region_id, synthesized_query)
+
+        evaluations = [
+            {"region_id": region_id, **_to_region_research(research_result).serialize()}
+            for region_id, research_result in research_by_region_id.items()
+        ]
+        # The turn's row may not be saved yet when research finishes quickly after the deadline.
+        for _attempt in range(_DEFERRED_PERSIST_MAX_ATTEMPTS):
+            try:
+                appended = await self.append_deferred_research(
+                    user_id,
+                    session_id,
+                    chat_history_number,
+                    evaluations,
+                )
+            except Exception as error:
+                logger.warning("Saving deferred research failed: %s", error)
+                metrics.increment("recommendation_research_deferred_total", outcome="failed")
+                return
+
+            if appended:
+                logger.verbose(
+                    "Saved deferred research for %s regions to row %d of session_id=%s",
+                    len(evaluations),
+                    chat_history_number,
+                    session_id,
+                )
+                metrics.increment("recommendation_research_deferred_total", outcome="saved")
+                return
+
+            await asyncio.sleep(_DEFERRED_PERSIST_RETRY_DELAY_S)
+
+        logger.warning(
+            "Dropped deferred research: row %d of session_id=%s was never saved",
+            chat_history_number,
+            session_id,
+        )
+        metrics.increment("recommendation_research_deferred_total", outcome="dropped")
+
+
+async def _research_recommendations(
+    runner: _RegionResearchRunner,
+    state: RecommendationV2GraphState,
+    destinations: list[TravelDestinationSummary],
+) -> dict[str, object]:
+    destinations_by_id = {destination.id: destination for destination in destinations}
+    travel_destinations_evaluations: dict[str, RecommendationV2RegionResearch] = {}
+
+    cached_results: dict[str, RecommendationV2RecommendationResearchResult] = {}
+    if runner.research_cache is not None:
+        cached_results = await runner.research_cache.aget_many(
+            [recommendation.region_id for recommendation in state.final_recommendations or []],
+            state.synthesized_user_request,
+        )
+    for region_id, research_result in cached_results.items():
+        destination_research = _to_region_research(research_result)
+        _emit_destination_research(region_id, destination_research)
+        travel_destinations_evaluations[region_id] = destination_research
+
+    research_tasks: dict[asyncio.Task[RecommendationV2RecommendationResearchResult | None], str] = {}
+    for recommendation in state.final_recommendations or []:
+        if recommendation.region_id in cached_results:
+            continue
+
+        destination = destinations_by_id.get(recommendation.region_id)
+        region_description = ""
+        if destination is not None:
+            region_description = destination.description
+
+        emit_stream_event(
+            EventType.DESTINATION_RESEARCH_GENERATION,
+            StreamEventDestinationResearchGeneration(recommendation.region_id).serialize(),
+        )
+        research_input = RecommendationV2RecommendationResearchInput(
+            region_name=recommendation.region_name,
+            region_description=region_description,
+            synthesized_user_query=state.synthesized_user_request,
+            conversation=state.history,
+        )
+        research_task = asyncio.create_task(runner.research_region(recommendation.region_id, research_input))
+        research_tasks[research_task] = recommendation.region_id
+
+    loop = asyncio.get_running_loop()
+    deadline = (
+        loop.time() + runner.limits.turn_timeout_s if runner.limits.turn_timeout_s is not None else None
+    )
+    fresh_results: dict[str, RecommendationV2RecommendationResearchResult] = {}
+    pending = set(research_tasks)
+    try:
+        while pending:
+            timeout = max(0.0, deadline - loop.time()) if deadline is not None else None
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+
+            for research_task in done:
+                research_result = research_task.result()
+                if research_result is None:
+                    continue
+
+                region_id = research_tasks[research_task]
+                destination_research = _to_region_research(research_result)
+                _emit_destination_research(region_id, destination_research)
+                travel_destinations_evaluations[region_id] = destination_research
+                fresh_results[region_id] = research_result
+    except BaseException:
+        for research_task in pending:
+            research_task.cancel()
+        raise
+
+    runner.handle_stragglers(
+        state,
+        {research_task: research_tasks[research_task] for research_task in pending},
+    )
+
+    if runner.research_cache is not None:
+        await runner.research_cache.aput_many(fresh_results, state.synthesized_user_request)
+
+    logger.verbose(
+        "Researched %s recommendation_v2 regions for user_id=%s, session_id=%s (%s from cache, %s unfinished)",
+        len(travel_destinations_evaluations),
+        state.session.user_id,
+        state.session.session_id,
+        len(cached_results),
+        len(pending),
+    )
+
+    return {
+        "travel_destinations_evaluations": travel_destinations_evaluations,
+    }
 
 
 def create_recommendation_research_node(
     recommendation_research_agent: RecommendationV2RecommendationResearchAgent,
     travel_destination_store: TravelDestinationStore,
+    *,
+    research_cache: RegionResearchCache | None = None,
+    fan_out_limits: ResearchFanOutLimits | None = None,
+    chat_store: ChatStore | None = None,
 ) -> Callable[[RecommendationV2GraphState], Awaitable[dict[str, object]]]:
-    """Create node to research final recommendations into separate state."""
+    """Create node to research final recommendations into separate state.
+
+    With a `research_cache`, regions already researched for a similar intent are served from the
+    cache and streamed right away; only the remaining regions are researched and then cached.
+    Research is streamed per region as it completes, within `fan_out_limits`; deferred regions
+    are saved through `chat_store`.
+    """
+
+    runner = _RegionResearchRunner(
+        recommendation_research_agent,
+        research_cache=research_cache,
+        limits=fan_out_limits or ResearchFanOutLimits(),
+        append_deferred_research=(
+            functools.partial(asyncio.to_thread, chat_store.append_travel_destinations_evaluations)
+            if chat_store is not None
+            else None
+        ),
+    )
 
     async def recommendation_research_node(
         state: RecommendationV2GraphState,
     ) -> dict[str, object]:
-        if state.synthesized_user_request is None:
-            raise RuntimeError(
-                "Synthesized user request must be generated before researching recommendation_v2 regions"
-            )
-
-        if not state.final_recommendations:
+        destination_ids = _start_recommendation_research(state)
+        if destination_ids is None:
             return {
                 "travel_destinations_evaluations": state.travel_destinations_evaluations,
             }
 
-        logger.verbose(
-            "Researching %s recommendation_v2 regions for user_id=%s, session_id=%s",
-            len(state.final_recommendations),
-            state.session.user_id,
-            state.session.session_id,
+        return await _research_recommendations(
+            runner,
+            state,
+            travel_destination_store.list_summaries(destination_ids),
         )
 
-        destination_ids = [
-            recommendation.region_id for recommendation in state.final_recommendations
-        ]
-        destinations_by_id = {
-            destination.id: destination
-            for destination in travel_destination_store.list_by_ids(destination_ids)
-        }
-
-        recommendation_inputs: list[
-            tuple[str, RecommendationV2RecommendationResearchInput]
-        ] = []
-        for recommendation in state.final_recommendations:
-            destination = destinations_by_id.get(recommendation.region_id)
-            region_description = ""
-            if destination is not None:
-                region_description = destination.description
-
-            recommendation_inputs.append(
-                (
-                    recommendation.region_id,
-                    RecommendationV2RecommendationResearchInput(
-                        region_name=recommendation.region_name,
-                        region_description=region_description,
-                        synthesized_user_query=state.synthesized_user_request,
-                        conversation=state.history,
-                    ),
-                )
-            )
-
-        async def research_destination(
-            region_id: str,
-            research_input: RecommendationV2RecommendationResearchInput,
-        ) -> tuple[str, RecommendationV2RegionResearch]:
-            emit_stream_event(
-                EventType.DESTINATION_RESEARCH_GENERATION,
-                StreamEventDestinationResearchGeneration(region_id).serialize(),
-            )
-
-            research_result = await recommendation_research_agent.invoke_async(
-                research_input
-            )
-            destination_research = RecommendationV2RegionResearch(
-                description=research_result.description,
-                image_urls=research_result.image_urls,
-            )
+    return recommendation_research_node
 
-            emit_stream_event(
-                EventType.DESTINATION_RESEARCH,
-                StreamEventDestinationResearch(
-                    region_id=region_id,
-                    destination_research=destination_research,
-                ).serialize(),
-            )
 
-            return region_id, destination_research
+def create_async_recommendation_research_node(
+    recommendation_research_agent: RecommendationV2RecommendationResearchAgent,
+    travel_destination_store: AsyncTravelDestinationStore,
+    *,
+    research_cache: RegionResearchCache | None = None,
+    fan_out_limits: ResearchFanOutLimits | None = None,
+    chat_store: AsyncChatStore | None = None,
+) -> Callable[[RecommendationV2GraphState], Awaitable[dict[str, object]]]:
+    """Create node to research final recommendations, loading destinations through async storage."""
 
-        research_results = await asyncio.gather(
-            *(
-                research_destination(region_id, research_input)
-                for region_id, research_input in recommendation_inputs
-            )
-        )
+    runner = _RegionResearchRunner(
+        recommendation_research_agent,
+        research_cache=research_cache,
+        limits=fan_out_limits or ResearchFanOutLimits(),
+        append_deferred_research=(
+            chat_store.append_travel_destinations_evaluations if chat_store is not None else None
+        ),
+    )
 
-        travel_destinations_evaluations: dict[str, RecommendationV2RegionResearch] = {}
-        for region_id, destination_research in research_results:
-            travel_destinations_evaluations[region_id] = destination_research
+    async def recommendation_research_node(
+        state: RecommendationV2GraphState,
+    ) -> dict[str, object]:
+        destination_ids = _start_recommendation_research(state)
+        if destination_ids is None:
+            return {
+                "travel_destinations_evaluations": state.travel_destinations_evaluations,
+            }
 
-        logger.verbose(
-            "Researched %s recommendation_v2 regions for user_id=%s, session_id=%s",
-            len(travel_destinations_evaluations),
-            state.session.user_id,
-            state.session.session_id,
+        return await _research_recommendations(
+            runner,
+            state,
+            await travel_destination_store.list_summaries(destination_ids),
         )
 
-        return {
-            "travel_destinations_evaluations": travel_destinations_evaluations,
-        }
-
     return recommendation_research_node
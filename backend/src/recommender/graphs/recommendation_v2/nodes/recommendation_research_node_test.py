@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from typing import Any
+from unittest.mock import patch
+from uuid import uuid4
+
+from recommender.graphs.recommendation_v2.agents.recommendation_research import (
+    RecommendationV2RecommendationResearchInput,
+    RecommendationV2RecommendationResearchResult,
+    RegionResearchCache,
+    RegionResearchCacheConfig,
+)
+from recommender.graphs.recommendation_v2.models import RecommendationV2
+from recommender.graphs.recommendation_v2.models import RecommendationV2GraphState
+from recommender.graphs.recommendation_v2.nodes import recommendation_research_node
+from recommender.graphs.recommendation_v2.nodes.recommendation_research_node import (
+    ResearchFanOutLimits,
+    create_recommendation_research_node,
+)
+from recommender.graphs.recommendation_v2.stream_events import EventType
+from recommender.models.session.session import Session
+from utils.metrics import MetricsRegistry
+
+
+class _FakeResearchAgent:
+    def __init__(self, delays: dict[str, float] | None = None) -> None:
+        self.delays = delays or {}
+        self.researched_regions: list[str] = []
+
+    async def invoke_async(
+        self,
+        inputs: RecommendationV2RecommendationResearchInput,
+    ) -> RecommendationV2RecommendationResearchResult:
+        self.researched_regions.append(inputs.region_name)
+        await asyncio.sleep(self.delays.get(inputs.region_name, 0))
+        return RecommendationV2RecommendationResearchResult(description=f"fresh {inputs.region_name}")
+
+
+class _FakeTravelDestinationStore:
+    def list_summaries(self, _destination_ids: list[str]) -> list[object]:
+        return []
+
+
+class _FakeResearchCacheBackend:
+    def __init__(self, entries: dict[str, dict[str, Any]], *, fail: bool = False) -> None:
+        self.entries = entries
+        self.fail = fail
+        self.stored: dict[str, dict[str, Any]] = {}
+
+    def get_similar(
+        self,
+        region_ids: list[str],
+        _synthesized_query: str,
+        _min_similarity: float,
+    ) -> dict[str, dict[str, Any]]:
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        return {region_id: self.entries[region_id] for region_id in region_ids if region_id in self.entries}
+
+    def put_many(
+        self,
+        research_by_region_id: dict[str, dict[str, Any]],
+        _synthesized_query: str,
+        _ttl_s: float,
+    ) -> None:
+        self.stored.update(research_by_region_id)
+
+
+class _FakeChatStore:
+    def __init__(self, *, saved_after_attempts: int) -> None:
+        self.saved_after_attempts = saved_after_attempts
+        self.attempts = 0
+        self.appended: list[tuple[int, list[dict[str, Any]]]] = []
+
+    def append_travel_destinations_evaluations(
+        self,
+        _user_id: object,
+        _session_id: object,
+        chat_history_number: int,
+        evaluations: list[dict[str, Any]],
+    ) -> bool:
+        self.attempts += 1
+        if self.attempts < self.saved_after_attempts:
+            return False
+        self.appended.append((chat_history_number, evaluations))
+        return True
+
+
+def _state() -> RecommendationV2GraphState:
+    return RecommendationV2GraphState(
+        session=Session(user_id=uuid4(), session_id=uuid4()),
+        user_request="A beach trip in July",
+        synthesized_user_request="beach trip in july",
+        history=[],
+        final_recommendations=[
+            RecommendationV2(region_id="algarve", region_name="Algarve"),
+            RecommendationV2(region_id="crete", region_name="Crete"),
+        ],
+    )
+
+
+def _run_node(
+    backend: _FakeResearchCacheBackend,
+) -> tuple[dict[str, object], _FakeResearchAgent, list[tuple[str, dict[str, object]]]]:
+    agent = _FakeResearchAgent()
+    node = create_recommendation_research_node(
+        agent,
+        _FakeTravelDestinationStore(),
+        research_cache=RegionResearchCache(RegionResearchCacheConfig(), backend=backend),
+    )
+    events: list[tuple[str, dict[str, object]]] = []
+    with patch(
+        "recommender.graphs.recommendation_v2.nodes.recommendation_research_node.emit_stream_event",
+        side_effect=lambda event_type, payload: events.append((event_type, payload)),
+    ):
+        update = asyncio.run(node(_state()))
+    return update, agent, events
+
+
+class TestRecommendationResearchNodeCache(unittest.TestCase):
+    def setUp(self) -> None:
+        MetricsRegistry().reset()
+
+    def test_cached_regions_are_streamed_first_and_only_misses_are_researched(self) -> None:
+        backend = _FakeResearchCacheBackend({"algarve": {"description": "cached algarve", "image_urls": []}})
+
+        update, agent, events = _run_node(backend)
+
+        self.assertEqual(agent.researched_regions, ["Crete"])
+        self.assertEqual(events[0][0], EventType.DESTINATION_RESEARCH)
+        self.assertEqual(events[0][1]["region_id"], "algarve")
+        evaluations = update["travel_destinations_evaluations"]
+        self.assertEqual(evaluations["algarve"].description, "cached algarve")
+        self.assertEqual(evaluations["crete"].description, "fresh Crete")
+        self.assertEqual(list(backend.stored), ["crete"])
+        metrics = MetricsRegistry()
+        self.assertEqual(metrics.counter("region_research_cache_requests_total", result="hit"), 1.0)
+        self.assertEqual(metrics.counter("region_research_cache_requests_total", result="miss"), 1.0)
+
+    def test_backend_failure_falls_back_to_researching_every_region(self) -> None:
+        backend = _FakeResearchCacheBackend({}, fail=True)
+
+        update, agent, _events = _run_node(backend)
+
+        self.assertEqual(sorted(agent.researched_regions), ["Algarve", "Crete"])
+        self.assertEqual(set(update["travel_destinations_evaluations"]), {"algarve", "crete"})
+        self.assertEqual(
+            MetricsRegistry().counter("region_research_cache_errors_total", operation="get"),
+            1.0,
+        )
+
+
+async def _run_node_and_background_tasks(
+    agent: _FakeResearchAgent,
+    limits: ResearchFanOutLimits,
+    chat_store: _FakeChatStore | None = None,
+) -> dict[str, object]:
+    node = create_recommendation_research_node(
+        agent,
+        _FakeTravelDestinationStore(),
+        fan_out_limits=limits,
+        chat_store=chat_store,
+    )
+    update = await node(_state())
+    await asyncio.gather(
+        *(task for task in asyncio.all_tasks() if task is not asyncio.current_task()),
+        return_exceptions=True,
+    )
+    return update
+
+
+class TestRecommendationResearchNodeDeadlines(unittest.TestCase):
+    def setUp(self) -> None:
+        MetricsRegistry().reset()
+
+    def test_stragglers_past_turn_deadline_are_saved_in_the_background(self) -> None:
+        agent = _FakeResearchAgent({"Crete": 0.2})
+        chat_store = _FakeChatStore(saved_after_attempts=2)
+
+        with patch.object(recommendation_research_node, "_DEFERRED_PERSIST_RETRY_DELAY_S", 0):
+            update = asyncio.run(
+                _run_node_and_background_tasks(
+                    agent,
+                    ResearchFanOutLimits(turn_timeout_s=0.05, defer_stragglers=True),
+                    chat_store,
+                )
+            )
+
+        self.assertEqual(set(update["travel_destinations_evaluations"]), {"algarve"})
+        self.assertEqual(
+            chat_store.appended,
+            [(0, [{"region_id": "crete", "description": "fresh Crete", "image_urls": []}])],
+        )
+        metrics = MetricsRegistry()
+        self.assertEqual(metrics.counter("recommendation_research_stragglers_total", action="deferred"), 1.0)
+        self.assertEqual(metrics.counter("recommendation_research_deferred_total", outcome="saved"), 1.0)
+        self.assertEqual(
+            metrics.histogram("recommendation_research_destination_seconds", outcome="completed").count,
+            2,
+        )
+
+    def test_deferred_research_stops_with_a_cancelled_run(self) -> None:
+        agent = _FakeResearchAgent({"Crete": 60})
+        chat_store = _FakeChatStore(saved_after_attempts=1)
+        node = create_recommendation_research_node(
+            agent,
+            _FakeTravelDestinationStore(),
+            fan_out_limits=ResearchFanOutLimits(turn_timeout_s=0.05, defer_stragglers=True),
+            chat_store=chat_store,
+        )
+
+        async def run_turn() -> None:
+            with recommendation_research_node.deferred_research_bound_to_run():
+                await node(_state())
+                await asyncio.sleep(60)
+
+        async def run() -> None:
+            run_task = asyncio.create_task(run_turn())
+            await asyncio.sleep(0.1)
+            self.assertEqual(len(recommendation_research_node._deferred_research_tasks), 1)
+            run_task.cancel()
+            await asyncio.gather(
+                *(task for task in asyncio.all_tasks() if task is not asyncio.current_task()),
+                return_exceptions=True,
+            )
+
+        asyncio.run(run())
+
+        self.assertEqual(recommendation_research_node._deferred_research_tasks, set())
+        self.assertEqual(chat_store.appended, [])
+        metrics = MetricsRegistry()
+        self.assertEqual(metrics.counter("recommendation_research_deferred_total", outcome="cancelled"), 1.0)
+        self.assertEqual(
+            metrics.histogram("recommendation_research_destination_seconds", outcome="cancelled").count,
+            1,
+        )
+
+    def test_cancel_deferred_research_stops_every_turn(self) -> None:
+        agent = _FakeResearchAgent({"Crete": 60})
+        node = create_recommendation_research_node(
+            agent,
+            _FakeTravelDestinationStore(),
+            fan_out_limits=ResearchFanOutLimits(turn_timeout_s=0.05, defer_stragglers=True),
+            chat_store=_FakeChatStore(saved_after_attempts=1),
+        )
+
+        async def run() -> None:
+            await node(_state())
+            await recommendation_research_node.cancel_deferred_research()
+
+        asyncio.run(run())
+
+        self.assertEqual(recommendation_research_node._deferred_research_tasks, set())
+        self.assertEqual(
+            MetricsRegistry().counter("recommendation_research_deferred_total", outcome="cancelled"),
+            1.0,
+        )
+
+    def test_stragglers_are_cancelled_without_background_completion(self) -> None:
+        agent = _FakeResearchAgent({"Crete": 60})
+
+        update = asyncio.run(
+            _run_node_and_background_tasks(agent, ResearchFanOutLimits(turn_timeout_s=0.05, max_concurrency=1))
+        )
+
+        self.assertEqual(set(update["travel_destinations_evaluations"]), {"algarve"})
+        metrics = MetricsRegistry()
+        self.assertEqual(metrics.counter("recommendation_research_stragglers_total", action="cancelled"), 1.0)
+        self.assertEqual(
+            metrics.histogram("recommendation_research_destination_seconds", outcome="cancelled").count,
+            1,
+        )
+
+    def test_destination_timeout_drops_only_the_slow_region(self) -> None:
+        agent = _FakeResearchAgent({"Crete": 60})
+
+        update = asyncio.run(
+            _run_node_and_background_tasks(agent, ResearchFanOutLimits(destination_timeout_s=0.05))
+        )
+
+        self.assertEqual(set(update["travel_destinations_evaluations"]), {"algarve"})
+        self.assertEqual(
+            MetricsRegistry().histogram("recommendation_research_destination_seconds", outcome="timeout").count,
+            1,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable
 from collections.abc import Callable
 
 from recommender.graphs.recommendation_v2.agents.response_generation.no_results_for_recommendation.agent import (
@@ -14,6 +15,9 @@ from recommender.graphs.recommendation_v2.agents.response_generation.recommendat
 from recommender.graphs.recommendation_v2.agents.response_generation.recommendation_generated.models import (
     RecommendationV2RecommendationGeneratedResponseGenerationInput,
 )
+from recommender.graphs.recommendation_v2.agents.response_generation.response_generation_result import (
+    RecommendationV2ResponseGenerationResult,
+)
 from recommender.graphs.recommendation_v2.models import RecommendationV2GraphState
 from recommender.graphs.recommendation_v2.stream_events import (
     EventType,
@@ -21,11 +25,79 @@ from recommender.graphs.recommendation_v2.stream_events import (
     build_recommendation_event_payload,
 )
 from recommender.graphs.recommendation_v2.stream_events import emit_stream_event
+from recommender.graphs.recommendation_v2.utils.response_streaming_node_utils import (
+    stream_response_deltas,
+)
 from utils.logger import LoggerManager
 
 logger = LoggerManager.get_logger(__name__)
 
 
+def _start_recommendation_response_generation(state: RecommendationV2GraphState) -> None:
+    if state.history is None:
+        raise RuntimeError(
+            "Session history must be loaded before generating a recommendation_v2 recommendation response"
+        )
+
+    logger.verbose(
+        "Generating recommendation_v2 recommendation response for user_id=%s, session_id=%s with final_recommendations_count=%s",
+        state.session.user_id,
+        state.session.session_id,
+        len(state.final_recommendations) if state.final_recommendations is not None else None,
+    )
+
+    emit_stream_event(EventType.RESPONSE_GENERATION, {})
+
+
+def _has_final_recommendations(state: RecommendationV2GraphState) -> bool:
+    return bool(state.final_recommendations)
+
+
+def _build_recommendation_generated_input(
+    state: RecommendationV2GraphState,
+) -> RecommendationV2RecommendationGeneratedResponseGenerationInput:
+    return RecommendationV2RecommendationGeneratedResponseGenerationInput(
+        current_user_request=state.user_request,
+        synthesized_user_request=state.synthesized_user_request,
+        travel_destination_filter=state.gathered_travel_destination_filter,
+        recommendations=state.final_recommendations,
+        chat_history=state.history,
+    )
+
+
+def _build_no_results_input(
+    state: RecommendationV2GraphState,
+) -> RecommendationV2NoResultsForRecommendationResponseGenerationInput:
+    return RecommendationV2NoResultsForRecommendationResponseGenerationInput(
+        current_user_request=state.user_request,
+        synthesized_user_request=state.synthesized_user_request,
+        travel_destination_filter=state.gathered_travel_destination_filter,
+        recommendations=state.recommendations,
+        final_recommendations=state.final_recommendations,
+        chat_history=state.history,
+    )
+
+
+def _build_recommendation_response_update(
+    state: RecommendationV2GraphState,
+    response_result: RecommendationV2ResponseGenerationResult,
+) -> dict[str, object]:
+    logger.verbose(
+        "Generated recommendation_v2 recommendation response for user_id=%s, session_id=%s: %s",
+        state.session.user_id,
+        state.session.session_id,
+        response_result.response,
+    )
+
+    emit_stream_event(
+        EventType.RESPONSE, StreamEventResponseMessage(response_result.response).serialize()
+    )
+
+    return {
+        "system_response": response_result.response,
+    }
+
+
 def create_recommendation_response_generation_node(
     recommendation_generated_agent: RecommendationV2RecommendationGeneratedResponseGenerationAgent,
     no_results_agent: RecommendationV2NoResultsForRecommendationResponseGenerationAgent,
@@ -35,57 +107,51 @@ def create_recommendation_response_generation_node(
     def recommendation_response_generation_node(
         state: RecommendationV2GraphState,
     ) -> dict[str, object]:
-        if state.history is None:
-            raise RuntimeError(
-                "Session history must be loaded before generating a recommendation_v2 recommendation response"
+        _start_recommendation_response_generation(state)
+
+        if _has_final_recommendations(state):
+            response_result = recommendation_generated_agent.invoke(
+                _build_recommendation_generated_input(state)
             )
+        else:
+            response_result = no_results_agent.invoke(_build_no_results_input(state))
 
-        logger.verbose(
-            "Generating recommendation_v2 recommendation response for user_id=%s, session_id=%s with final_recommendations_count=%s",
-            state.session.user_id,
-            state.session.session_id,
-            len(state.final_recommendations) if state.final_recommendations is not None else None,
-        )
+        return _build_recommendation_response_update(state, response_result)
 
-        emit_stream_event(EventType.RESPONSE_GENERATION, {})
+    return recommendation_response_generation_node
 
-        travel_destination_filter = state.gathered_travel_destination_filter
 
-        if state.final_recommendations and len(state.final_recommendations) > 0:
-            response_result = recommendation_generated_agent.invoke(
-                RecommendationV2RecommendationGeneratedResponseGenerationInput(
-                    current_user_request=state.user_request,
-                    synthesized_user_request=state.synthesized_user_request,
-                    travel_destination_filter=travel_destination_filter,
-                    recommendations=state.final_recommendations,
-                    chat_history=state.history,
-                )
-            )
-        else:
-            response_result = no_results_agent.invoke(
-                RecommendationV2NoResultsForRecommendationResponseGenerationInput(
-                    current_user_request=state.user_request,
-                    synthesized_user_request=state.synthesized_user_request,
-                    travel_destination_filter=travel_destination_filter,
-                    recommendations=state.recommendations,
-                    final_recommendations=state.final_recommendations,
-                    chat_history=state.history,
-                )
-            )
+def create_async_recommendation_response_generation_node(
+    recommendation_generated_agent: RecommendationV2RecommendationGeneratedResponseGenerationAgent,
+    no_results_agent: RecommendationV2NoResultsForRecommendationResponseGenerationAgent,
+    *,
+    stream_response: bool = False,
+) -> Callable[[RecommendationV2GraphState], Awaitable[dict[str, object]]]:
+    """Create node to generate a recommendation response by awaiting the response agents.
 
-        logger.verbose(
-            "Generated recommendation_v2 recommendation response for user_id=%s, session_id=%s: %s",
-            state.session.user_id,
-            state.session.session_id,
-            response_result.response,
-        )
+    With `stream_response`, the response is generated as plain text and forwarded as
+    `response_delta` events while it is generated, before the final `response` event.
+    """
 
-        emit_stream_event(
-            EventType.RESPONSE, StreamEventResponseMessage(response_result.response).serialize()
-        )
+    async def recommendation_response_generation_node(
+        state: RecommendationV2GraphState,
+    ) -> dict[str, object]:
+        _start_recommendation_response_generation(state)
+
+        if stream_response:
+            response_deltas = (
+                recommendation_generated_agent.astream(_build_recommendation_generated_input(state))
+                if _has_final_recommendations(state)
+                else no_results_agent.astream(_build_no_results_input(state))
+            )
+            response_result = await stream_response_deltas(response_deltas)
+        elif _has_final_recommendations(state):
+            response_result = await recommendation_generated_agent.ainvoke(
+                _build_recommendation_generated_input(state)
+            )
+        else:
+            response_result = await no_results_agent.ainvoke(_build_no_results_input(state))
 
-        return {
-            "system_response": response_result.response,
-        }
+        return _build_recommendation_response_update(state, response_result)
 
     return recommendation_response_generation_node
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable
 from collections.abc import Callable
 
 from recommender.graphs.recommendation_v2.agents.request_routing.request_routing_agent import (
@@ -8,6 +9,9 @@ from recommender.graphs.recommendation_v2.agents.request_routing.request_routing
 from recommender.graphs.recommendation_v2.agents.request_routing.request_routing_agent import (
     RecommendationV2RequestRoutingInput,
 )
+from recommender.graphs.recommendation_v2.agents.request_routing.request_routing_agent import (
+    RecommendationV2RequestRoutingResult,
+)
 from recommender.graphs.recommendation_v2.models import RecommendationV2GraphState
 from recommender.graphs.recommendation_v2.stream_events import emit_stream_event, EventType
 from utils.logger import LoggerManager
@@ -15,6 +19,46 @@ from utils.logger import LoggerManager
 logger = LoggerManager.get_logger(__name__)
 
 
+def _start_request_routing(state: RecommendationV2GraphState) -> RecommendationV2RequestRoutingInput:
+    if state.history is None:
+        raise RuntimeError(
+            "Session history must be loaded before routing a recommendation_v2 user request"
+        )
+
+    logger.verbose(
+        "Routing recommendation_v2 request for user_id=%s, session_id=%s",
+        state.session.user_id,
+        state.session.session_id,
+    )
+
+    emit_stream_event(EventType.VALIDATING_REQUEST, {})
+
+    return RecommendationV2RequestRoutingInput(
+        current_user_request=state.user_request,
+        chat_history=state.history,
+    )
+
+
+def _build_request_routing_update(
+    state: RecommendationV2GraphState,
+    routing_result: RecommendationV2RequestRoutingResult,
+) -> dict[str, object]:
+    if routing_result.decision == "new_recommendation_run":
+        emit_stream_event(EventType.GATHERING_FILTER, {})
+
+    logger.verbose(
+        "Routed recommendation_v2 request for user_id=%s, session_id=%s to %s",
+        state.session.user_id,
+        state.session.session_id,
+        routing_result.decision,
+    )
+
+    return {
+        "request_routing_decision": routing_result.decision,
+        "request_routing_reason": routing_result.reason,
+    }
+
+
 def create_request_routing_node(
     request_routing_agent: RecommendationV2RequestRoutingAgent,
 ) -> Callable[[RecommendationV2GraphState], dict[str, object]]:
@@ -23,39 +67,23 @@ def create_request_routing_node(
     def request_routing_node(
         state: RecommendationV2GraphState,
     ) -> dict[str, object]:
-        if state.history is None:
-            raise RuntimeError(
-                "Session history must be loaded before routing a recommendation_v2 user request"
-            )
-
-        logger.verbose(
-            "Routing recommendation_v2 request for user_id=%s, session_id=%s",
-            state.session.user_id,
-            state.session.session_id,
-        )
+        routing_input = _start_request_routing(state)
+        routing_result = request_routing_agent.invoke(routing_input)
+        return _build_request_routing_update(state, routing_result)
 
-        emit_stream_event(EventType.VALIDATING_REQUEST, {})
-
-        routing_result = request_routing_agent.invoke(
-            RecommendationV2RequestRoutingInput(
-                current_user_request=state.user_request,
-                chat_history=state.history,
-            )
-        )
+    return request_routing_node
 
-        if routing_result.decision == "new_recommendation_run":
-            emit_stream_event(EventType.GATHERING_FILTER, {})
 
-        logger.verbose(
-            "Routed recommendation_v2 request for user_id=%s, session_id=%s to %s",
-            state.session.user_id,
-            state.session.session_id,
-            routing_result.decision,
-        )
+def create_async_request_routing_node(
+    request_routing_agent: RecommendationV2RequestRoutingAgent,
+) -> Callable[[RecommendationV2GraphState], Awaitable[dict[str, object]]]:
+    """Create node to classify the current turn by awaiting the routing agent."""
 
-        return {
-            "request_routing_decision": routing_result.decision,
-            "request_routing_reason": routing_result.reason,
-        }
+    async def request_routing_node(
+        state: RecommendationV2GraphState,
+    ) -> dict[str, object]:
+        routing_input = _start_request_routing(state)
+        routing_result = await request_routing_agent.ainvoke(routing_input)
+        return _build_request_routing_update(state, routing_result)
 
     return request_routing_node
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable
 from typing import Callable
 
+from recommender.graphs.recommendation_v2.chat_history import roll_history_summary
 from recommender.graphs.recommendation_v2.models import RecommendationV2
 from recommender.graphs.recommendation_v2.models import RecommendationV2GraphState
 from recommender.graphs.recommendation_v2.models import RecommendationV2RegionResearch
+from recommender.graphs.recommendation_v2.models import next_chat_history_number
 from storage.models.chat_record import ChatRecord
+from storage.stores.async_chat_store import AsyncChatStore
 from storage.stores.chat_store import ChatStore
 from recommender.graphs.recommendation_v2.stream_events import (
     StreamEventChatRecord,
@@ -47,52 +52,100 @@ def _serialize_region_research(
     ]
 
 
+def _build_persisted_chat_record(
+    state: RecommendationV2GraphState,
+    history_summary_token_budget: int | None,
+) -> ChatRecord:
+    logger.verbose(
+        "Saving recommendation_v2 session memory for user_id=%s, session_id=%s",
+        state.session.user_id,
+        state.session.session_id,
+    )
+
+    previous_history = state.history or []
+    next_chat_number = next_chat_history_number(previous_history)
+
+    persisted_row = ChatRecord(
+        user_id=state.session.user_id,
+        session_id=state.session.session_id,
+        chat_history_number=next_chat_number,
+        user_request=state.user_request,
+        system_response=state.system_response,
+        synthesized_query=state.synthesized_user_request or state.previous_synthesized_user_request,
+        travel_destination_filter=_serialize_travel_destination_filter(state),
+        recommendations=_serialize_recommendations(
+            state.final_recommendations,
+        ),
+        travel_destinations_evaluations=_serialize_region_research(state),
+        graph_version="v2",
+    )
+    if history_summary_token_budget is not None:
+        persisted_row.history_summary = roll_history_summary(
+            previous_history[-1].history_summary if previous_history else "",
+            persisted_row,
+            token_budget=history_summary_token_budget,
+        )
+
+    return persisted_row
+
+
+def _build_session_memory_save_update(
+    state: RecommendationV2GraphState,
+    persisted_row: ChatRecord,
+) -> dict[str, object]:
+    updated_history = [*(state.history or []), persisted_row]
+
+    logger.verbose(
+        "Saved recommendation_v2 row %d for user_id=%s, session_id=%s",
+        persisted_row.chat_history_number,
+        state.session.user_id,
+        state.session.session_id,
+    )
+
+    emit_stream_event(EventType.DONE, StreamEventChatRecord(persisted_row).serialize())
+
+    return {
+        "history": updated_history,
+    }
+
+
 def create_session_memory_save_node(
     chat_store: ChatStore,
+    *,
+    history_summary_token_budget: int | None = None,
 ) -> Callable[[RecommendationV2GraphState], dict[str, object]]:
-    """Create node to save session memory to storage."""
+    """Create node to save session memory to storage.
+
+    With `history_summary_token_budget`, each saved row also carries the rolling summary of the
+    session up to and including its turn, which later prompts use in place of older turns.
+    """
 
     def session_memory_save_node(
         state: RecommendationV2GraphState,
     ) -> dict[str, object]:
-        logger.verbose(
-            "Saving recommendation_v2 session memory for user_id=%s, session_id=%s",
-            state.session.user_id,
-            state.session.session_id,
-        )
-
-        previous_history = state.history or []
-        next_chat_number = len(previous_history)
-
-        persisted_row = ChatRecord(
-            user_id=state.session.user_id,
-            session_id=state.session.session_id,
-            chat_history_number=next_chat_number,
-            user_request=state.user_request,
-            system_response=state.system_response,
-            synthesized_query=state.synthesized_user_request or state.previous_synthesized_user_request,
-            travel_destination_filter=_serialize_travel_destination_filter(state),
-            recommendations=_serialize_recommendations(
-                state.final_recommendations,
-            ),
-            travel_destinations_evaluations=_serialize_region_research(state),
-            graph_version="v2",
-        )
+        persisted_row = _build_persisted_chat_record(state, history_summary_token_budget)
         chat_store.upsert_many([persisted_row])
+        return _build_session_memory_save_update(state, persisted_row)
+
+    return session_memory_save_node
 
-        updated_history = [*previous_history, persisted_row]
 
-        logger.verbose(
-            "Saved recommendation_v2 row %d for user_id=%s, session_id=%s",
-            next_chat_number,
-            state.session.user_id,
-            state.session.session_id,
-        )
+def create_async_session_memory_save_node(
+    chat_store: AsyncChatStore,
+    *,
+    history_summary_token_budget: int | None = None,
+) -> Callable[[RecommendationV2GraphState], Awaitable[dict[str, object]]]:
+    """Create node to save session memory to storage without blocking the event loop.
 
-        emit_stream_event(EventType.DONE, StreamEventChatRecord(persisted_row).serialize())
+    Runs cancelled before this node (e.g. after a client disconnect) save nothing for the turn;
+    once the write has started it is shielded from cancellation, so a turn is never half-saved.
+    """
 
-        return {
-            "history": updated_history,
-        }
+    async def session_memory_save_node(
+        state: RecommendationV2GraphState,
+    ) -> dict[str, object]:
+        persisted_row = _build_persisted_chat_record(state, history_summary_token_budget)
+        await asyncio.shield(chat_store.upsert_many([persisted_row]))
+        return _build_session_memory_save_update(state, persisted_row)
 
     return session_memory_save_node
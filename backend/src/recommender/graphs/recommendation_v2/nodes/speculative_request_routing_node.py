@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from recommender.graphs.recommendation_v2.agents.request_routing.request_routing_agent import (
+    RecommendationV2RequestRoutingAgent,
+)
+from recommender.graphs.recommendation_v2.models import RecommendationV2GraphState
+from recommender.graphs.recommendation_v2.nodes.request_routing_node import (
+    _build_request_routing_update,
+    _start_request_routing,
+)
+from utils.logger import LoggerManager
+from utils.metrics import MetricsRegistry
+
+logger = LoggerManager.get_logger(__name__)
+
+AsyncGraphNode = Callable[[RecommendationV2GraphState], Awaitable[dict[str, object]]]
+
+
+@dataclass(slots=True)
+class _SpeculativeExtraction:
+    node_name: str
+    task: asyncio.Task[dict[str, object]]
+    started_at: float
+    finished_at: float | None = None
+
+    def elapsed_seconds(self, now: float) -> float:
+        return (self.finished_at if self.finished_at is not None else now) - self.started_at
+
+
+def _start_speculative_extractions(
+    state: RecommendationV2GraphState,
+    requirement_extraction_nodes: Sequence[AsyncGraphNode],
+) -> list[_SpeculativeExtraction]:
+    loop = asyncio.get_running_loop()
+    extractions = []
+    for requirement_extraction_node in requirement_extraction_nodes:
+        extraction = _SpeculativeExtraction(
+            node_name=requirement_extraction_node.__name__,
+            task=asyncio.create_task(requirement_extraction_node(state)),
+            started_at=loop.time(),
+        )
+
+        def _mark_finished(_task: asyncio.Task[dict[str, object]], extraction=extraction) -> None:
+            extraction.finished_at = loop.time()
+
+        extraction.task.add_done_callback(_mark_finished)
+        extractions.append(extraction)
+
+    return extractions
+
+
+def _record_discarded_extractions(
+    state: RecommendationV2GraphState,
+    extractions: list[_SpeculativeExtraction],
+) -> None:
+    metrics = MetricsRegistry()
+    now = asyncio.get_running_loop().time()
+    for extraction in extractions:
+        status = "completed" if extraction.task.done() else "cancelled"
+        metrics.increment(
+            "speculative_extraction_discarded_calls_total",
+            node=extraction.node_name,
+            status=status,
+        )
+        metrics.increment(
+            "speculative_extraction_discarded_seconds_total",
+            extraction.elapsed_seconds(now),
+            node=extraction.node_name,
+        )
+
+    logger.verbose(
+        "Discarded %s speculative recommendation_v2 extractions for user_id=%s, session_id=%s",
+        len(extractions),
+        state.session.user_id,
+        state.session.session_id,
+    )
+
+
+def create_async_speculative_request_routing_node(
+    request_routing_agent: RecommendationV2RequestRoutingAgent,
+    requirement_extraction_nodes: Sequence[AsyncGraphNode],
+) -> Callable[[RecommendationV2GraphState], Awaitable[dict[str, object]]]:
+    """Create node that routes the current turn while speculatively gathering its requirements.
+
+    The requirement extraction nodes start together with the routing agent. In-scope turns
+    return their merged updates along with the routing decision; out-of-scope turns cancel
+    the extractions still in flight and discard the rest, recording the wasted calls and
+    their runtime in `MetricsRegistry`.
+    """
+
+    async def speculative_request_routing_node(
+        state: RecommendationV2GraphState,
+    ) -> dict[str, object]:
+        routing_input = _start_request_routing(state)
+        extractions = _start_speculative_extractions(state, requirement_extraction_nodes)
+        metrics = MetricsRegistry()
+
+        try:
+            routing_result = await request_routing_agent.ainvoke(routing_input)
+            update = _build_request_routing_update(state, routing_result)
+            if routing_result.decision == "out_of_system_scope":
+                metrics.increment("speculative_extraction_total", outcome="discarded")
+                _record_discarded_extractions(state, extractions)
+                return update
+
+            extraction_updates = await asyncio.gather(*(extraction.task for extraction in extractions))
+        finally:
+            for extraction in extractions:
+                extraction.task.cancel()
+            await asyncio.gather(*(extraction.task for extraction in extractions), return_exceptions=True)
+
+        metrics.increment("speculative_extraction_total", outcome="used")
+        for extraction_update in extraction_updates:
+            update.update(extraction_update)
+
+        return update
+
+    return speculative_request_routing_node
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from uuid import uuid4
+
+from recommender.graphs.recommendation_v2.agents.request_routing.request_routing_agent import (
+    RecommendationV2RequestRoutingAgent,
+    RecommendationV2RequestRoutingResult,
+)
+from recommender.graphs.recommendation_v2.models import RecommendationV2GraphState
+from recommender.graphs.recommendation_v2.nodes.speculative_request_routing_node import (
+    create_async_speculative_request_routing_node,
+)
+from recommender.models.session.session import Session
+from utils.metrics import MetricsRegistry
+
+
+class _FakeStructuredRunnable:
+    def __init__(self, response: RecommendationV2RequestRoutingResult, started: asyncio.Event) -> None:
+        self._response = response
+        self._started = started
+
+    async def ainvoke(self, _messages: object) -> RecommendationV2RequestRoutingResult:
+        await self._started.wait()
+        return self._response
+
+
+class _FakeChatModel:
+    def __init__(self, response: RecommendationV2RequestRoutingResult, started: asyncio.Event) -> None:
+        self._runnable = _FakeStructuredRunnable(response, started)
+
+    def with_structured_output(self, _output_type: object) -> _FakeStructuredRunnable:
+        return self._runnable
+
+
+def _state() -> RecommendationV2GraphState:
+    return RecommendationV2GraphState(
+        session=Session(user_id=uuid4(), session_id=uuid4()),
+        user_request="A beach trip in July",
+        history=[],
+    )
+
+
+async def _run_node(decision: str, *, season_delay: float) -> tuple[dict[str, object], dict[str, bool]]:
+    started = asyncio.Event()
+    finished = {"synthesize_user_request_node": False, "extract_season_filter_node": False}
+
+    async def synthesize_user_request_node(_state: RecommendationV2GraphState) -> dict[str, object]:
+        started.set()
+        finished["synthesize_user_request_node"] = True
+        return {"synthesized_user_request": "beach trip"}
+
+    async def extract_season_filter_node(_state: RecommendationV2GraphState) -> dict[str, object]:
+        await asyncio.sleep(season_delay)
+        finished["extract_season_filter_node"] = True
+        return {"seasonality_filter_removed": False}
+
+    agent = RecommendationV2RequestRoutingAgent(
+        llm=_FakeChatModel(RecommendationV2RequestRoutingResult(decision=decision, reason="test"), started),
+    )
+    node = create_async_speculative_request_routing_node(
+        agent,
+        [synthesize_user_request_node, extract_season_filter_node],
+    )
+    return await node(_state()), finished
+
+
+class TestSpeculativeRequestRoutingNode(unittest.TestCase):
+    def setUp(self) -> None:
+        MetricsRegistry().reset()
+
+    def test_in_scope_turn_merges_speculative_extractions(self) -> None:
+        update, _finished = asyncio.run(_run_node("new_recommendation_run", season_delay=0))
+
+        self.assertEqual(update["request_routing_decision"], "new_recommendation_run")
+        self.assertEqual(update["synthesized_user_request"], "beach trip")
+        self.assertFalse(update["seasonality_filter_removed"])
+        self.assertEqual(MetricsRegistry().counter("speculative_extraction_total", outcome="used"), 1.0)
+
+    def test_out_of_scope_turn_cancels_and_records_wasted_extractions(self) -> None:
+        update, finished = asyncio.run(_run_node("out_of_system_scope", season_delay=3600))
+
+        self.assertEqual(
+            update,
+            {"request_routing_decision": "out_of_system_scope", "request_routing_reason": "test"},
+        )
+        self.assertFalse(finished["extract_season_filter_node"])
+        metrics = MetricsRegistry()
+        self.assertEqual(metrics.counter("speculative_extraction_total", outcome="discarded"), 1.0)
+        self.assertEqual(
+            metrics.counter(
+                "speculative_extraction_discarded_calls_total",
+                node="synthesize_user_request_node",
+                status="completed",
+            ),
+            1.0,
+        )
+        self.assertEqual(
+            metrics.counter(
+                "speculative_extraction_discarded_calls_total",
+                node="extract_season_filter_node",
+                status="cancelled",
+            ),
+            1.0,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
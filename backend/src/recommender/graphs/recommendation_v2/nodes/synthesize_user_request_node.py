@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable
 from collections.abc import Callable
 
 
@@ -9,6 +10,9 @@ from recommender.graphs.recommendation_v2.agents.query_synthesis.query_synthesis
 from recommender.graphs.recommendation_v2.agents.query_synthesis.query_synthesis_agent import (
     RecommendationV2SynthesizedUserRequestInput,
 )
+from recommender.graphs.recommendation_v2.agents.query_synthesis.query_synthesis_agent import (
+    RecommendationV2SynthesizedUserRequestResult,
+)
 
 from recommender.graphs.recommendation_v2.models import RecommendationV2GraphState
 from storage.models.chat_record import ChatRecord
@@ -25,6 +29,47 @@ def _latest_query_from_history(history: list[ChatRecord]) -> str | None:
     return None
 
 
+def _start_user_request_synthesis(
+    state: RecommendationV2GraphState,
+) -> RecommendationV2SynthesizedUserRequestInput:
+    if state.history is None:
+        raise RuntimeError(
+            "Session history must be loaded before synthesizing a recommendation_v2 user request"
+        )
+
+    previous_synthesized_query = _latest_query_from_history(state.history)
+    logger.verbose(
+        "Synthesizing recommendation_v2 user request for user_id=%s, session_id=%s with previous_synthesized_query=%s",
+        state.session.user_id,
+        state.session.session_id,
+        previous_synthesized_query,
+    )
+
+    return RecommendationV2SynthesizedUserRequestInput(
+        current_user_request=state.user_request,
+        previous_synthesized_query=previous_synthesized_query,
+        chat_history=state.history,
+    )
+
+
+def _build_user_request_synthesis_update(
+    state: RecommendationV2GraphState,
+    synthesized_user_request: RecommendationV2SynthesizedUserRequestResult,
+) -> dict[str, object]:
+    logger.verbose(
+        "Synthesized recommendation_v2 user request for user_id=%s, session_id=%s: query=%s, keywords=%s",
+        state.session.user_id,
+        state.session.session_id,
+        synthesized_user_request.synthesized_query,
+        synthesized_user_request.keywords,
+    )
+
+    return {
+        "synthesized_user_request": synthesized_user_request.synthesized_query,
+        "synthesized_user_request_keywords": synthesized_user_request.keywords,
+    }
+
+
 def create_synthesize_user_request_node(
     synthesized_user_request_agent: RecommendationV2SynthesizedUserRequestAgent,
 ) -> Callable[[RecommendationV2GraphState], dict[str, object]]:
@@ -33,38 +78,23 @@ def create_synthesize_user_request_node(
     def synthesize_user_request_node(
         state: RecommendationV2GraphState,
     ) -> dict[str, object]:
-        if state.history is None:
-            raise RuntimeError(
-                "Session history must be loaded before synthesizing a recommendation_v2 user request"
-            )
-
-        previous_synthesized_query = _latest_query_from_history(state.history)
-        logger.verbose(
-            "Synthesizing recommendation_v2 user request for user_id=%s, session_id=%s with previous_synthesized_query=%s",
-            state.session.user_id,
-            state.session.session_id,
-            previous_synthesized_query,
-        )
+        synthesis_input = _start_user_request_synthesis(state)
+        synthesized_user_request = synthesized_user_request_agent.invoke(synthesis_input)
+        return _build_user_request_synthesis_update(state, synthesized_user_request)
 
-        synthesized_user_request = synthesized_user_request_agent.invoke(
-            RecommendationV2SynthesizedUserRequestInput(
-                current_user_request=state.user_request,
-                previous_synthesized_query=previous_synthesized_query,
-                chat_history=state.history,
-            )
-        )
+    return synthesize_user_request_node
 
-        logger.verbose(
-            "Synthesized recommendation_v2 user request for user_id=%s, session_id=%s: query=%s, keywords=%s",
-            state.session.user_id,
-            state.session.session_id,
-            synthesized_user_request.synthesized_query,
-            synthesized_user_request.keywords,
-        )
 
-        return {
-            "synthesized_user_request": synthesized_user_request.synthesized_query,
-            "synthesized_user_request_keywords": synthesized_user_request.keywords,
-        }
+def create_async_synthesize_user_request_node(
+    synthesized_user_request_agent: RecommendationV2SynthesizedUserRequestAgent,
+) -> Callable[[RecommendationV2GraphState], Awaitable[dict[str, object]]]:
+    """Create node to synthesize the user request by awaiting the synthesis agent."""
+
+    async def synthesize_user_request_node(
+        state: RecommendationV2GraphState,
+    ) -> dict[str, object]:
+        synthesis_input = _start_user_request_synthesis(state)
+        synthesized_user_request = await synthesized_user_request_agent.ainvoke(synthesis_input)
+        return _build_user_request_synthesis_update(state, synthesized_user_request)
 
     return synthesize_user_request_node
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from typing import Any
+
+from langchain_core.language_models import BaseChatModel
 from langgraph.graph import END
 from langgraph.graph import START
 from langgraph.graph import StateGraph
 from recommender.common.configuration import Configuration
+from recommender.common.configuration import FilterExtractionMode
 from recommender.graphs.recommendation_v2.agents.filter_extraction.budget.agent import (
     RecommendationV2BudgetFilterExtractionAgent,
 )
@@ -13,12 +18,20 @@ from recommender.graphs.recommendation_v2.agents.filter_extraction.parent_region
 from recommender.graphs.recommendation_v2.agents.filter_extraction.season.agent import (
     RecommendationV2SeasonFilterExtractionAgent,
 )
+from recommender.graphs.recommendation_v2.agents.fused_extraction.agent import (
+    RecommendationV2FusedExtractionAgent,
+)
 from recommender.graphs.recommendation_v2.agents.query_synthesis.query_synthesis_agent import (
     RecommendationV2SynthesizedUserRequestAgent,
 )
 from recommender.graphs.recommendation_v2.agents.recommendation_research.agent import (
     RecommendationV2RecommendationResearchAgent,
 )
+from recommender.graphs.recommendation_v2.agents.recommendation_research.research_cache import (
+    RegionResearchCache,
+    RegionResearchCacheBackendProtocol,
+    RegionResearchCacheConfig,
+)
 from recommender.graphs.recommendation_v2.agents.request_routing.request_routing_agent import (
     RecommendationV2RequestRoutingAgent,
 )
@@ -34,48 +47,71 @@ from recommender.graphs.recommendation_v2.agents.response_generation.out_of_scop
 from recommender.graphs.recommendation_v2.agents.response_generation.recommendation_generated.agent import (
     RecommendationV2RecommendationGeneratedResponseGenerationAgent,
 )
+from recommender.graphs.recommendation_v2.chat_history import ChatHistoryConfig
 from recommender.graphs.recommendation_v2.models import RecommendationV2GraphState
 from recommender.graphs.recommendation_v2.nodes.extract_budget_filter_node import (
-    create_extract_budget_filter_node,
+    create_async_extract_budget_filter_node,
 )
 from recommender.graphs.recommendation_v2.nodes.extract_parent_region_filter_node import (
-    create_extract_parent_region_filter_node,
+    create_async_extract_parent_region_filter_node,
 )
 from recommender.graphs.recommendation_v2.nodes.extract_season_filter_node import (
-    create_extract_season_filter_node,
+    create_async_extract_season_filter_node,
+)
+from recommender.graphs.recommendation_v2.nodes.fused_extraction_node import (
+    create_async_fused_extraction_node,
 )
 from recommender.graphs.recommendation_v2.nodes.gather_requirements_node import (
     create_gather_requirements_node,
 )
 from recommender.graphs.recommendation_v2.nodes.load_session_node import (
+    create_async_session_memory_load_node,
     create_session_memory_load_node,
 )
 from recommender.graphs.recommendation_v2.nodes.need_more_information_response_generation_node import (
-    create_need_more_information_response_generation_node,
+    create_async_need_more_information_response_generation_node,
 )
 from recommender.graphs.recommendation_v2.nodes.out_of_scope_response_generation_node import (
-    create_out_of_scope_response_generation_node,
+    create_async_out_of_scope_response_generation_node,
 )
 from recommender.graphs.recommendation_v2.nodes.recommendation_generation_node import (
+    create_async_recommendation_generation_node,
     create_recommendation_generation_node,
 )
 from recommender.graphs.recommendation_v2.nodes.recommendation_research_node import (
+    ResearchFanOutLimits,
+    create_async_recommendation_research_node,
     create_recommendation_research_node,
 )
 from recommender.graphs.recommendation_v2.nodes.recommendation_response_generation_node import (
-    create_recommendation_response_generation_node,
+    create_async_recommendation_response_generation_node,
 )
 from recommender.graphs.recommendation_v2.nodes.request_routing_node import (
-    create_request_routing_node,
+    create_async_request_routing_node,
 )
 from recommender.graphs.recommendation_v2.nodes.save_session_node import (
+    create_async_session_memory_save_node,
     create_session_memory_save_node,
 )
+from recommender.graphs.recommendation_v2.nodes.speculative_request_routing_node import (
+    create_async_speculative_request_routing_node,
+)
 from recommender.graphs.recommendation_v2.nodes.synthesize_user_request_node import (
-    create_synthesize_user_request_node,
+    create_async_synthesize_user_request_node,
 )
+from recommender.graphs.recommendation_v2.utils.cancellation_node_utils import track_node_cancellation
 from recommender.models.llm.llm import create_llm_chat_model
+from recommender.models.llm.llm_config import LLMCacheConfig
 from recommender.models.llm.llm_config import LLMConfig
+from recommender.models.llm.llm_config import LLMGatewayConfig
+from recommender.models.llm.llm_config import LLMHedgingConfig
+from recommender.models.llm.llm_gateway import LLMGateway
+from recommender.models.llm.llm_hedging import HedgedChatModel
+from recommender.models.llm.llm_hedging import HedgingPolicy
+from recommender.models.llm.llm_response_cache import LLMResponseCache
+from recommender.models.llm.llm_response_cache import LLMResponseCacheBackendProtocol
+from storage.stores.async_chat_store import AsyncChatStore
+from storage.stores.async_travel_destination_store import AsyncTravelDestinationStore
 from storage.stores.chat_store import ChatStore
 from storage.stores.travel_destination_store import TravelDestinationStore
 from utils.logger import LoggerManager
@@ -87,78 +123,224 @@ configuration = Configuration()
 def build_recommendation_v2_graph(
     travel_destination_store: TravelDestinationStore,
     recommendation_session_store: ChatStore,
+    *,
+    async_travel_destination_store: AsyncTravelDestinationStore | None = None,
+    async_recommendation_session_store: AsyncChatStore | None = None,
+    llm_response_cache_backend: LLMResponseCacheBackendProtocol | None = None,
+    region_research_cache_backend: RegionResearchCacheBackendProtocol | None = None,
 ):
-    """Build the recommendation_v2 graph."""
+    """Build the recommendation_v2 graph.
+
+    Each turn loads the session, routes the request, gathers requirements (synthesized request
+    and parent-region, season and budget filters), then either retrieves and researches
+    destinations or asks for more information, generates the response and saves the session.
+    Out-of-scope requests are answered directly.
+
+    Storage-bound nodes await the async stores when they are provided and fall back to the
+    synchronous stores otherwise. The optional backends give the LLM response cache and the
+    region research cache their persistent tiers.
+    """
 
     logger.verbose("Building recommendation_v2 graph...")
 
     graph_builder = StateGraph(RecommendationV2GraphState)
     llm_config = LLMConfig()
-    llm = create_llm_chat_model(llm_config)
+    llm_gateway_config = LLMGatewayConfig()
+    llm_gateway = LLMGateway(llm_gateway_config) if llm_gateway_config.enabled else None
+    llm_hedging_config = LLMHedgingConfig()
 
-    session_load_node = create_session_memory_load_node(recommendation_session_store)
-    request_routing_node = create_request_routing_node(
-        RecommendationV2RequestRoutingAgent(llm=llm),
-    )
-    synthesize_user_request_node = create_synthesize_user_request_node(
-        RecommendationV2SynthesizedUserRequestAgent(llm=llm),
-    )
-    extract_parent_region_filter_node = create_extract_parent_region_filter_node(
-        RecommendationV2ParentRegionFilterExtractionAgent(llm=llm),
-    )
-    extract_season_filter_node = create_extract_season_filter_node(
-        RecommendationV2SeasonFilterExtractionAgent(llm=llm),
+    def llm_for(agent_name: str) -> BaseChatModel | HedgedChatModel:
+        llm = create_llm_chat_model(
+            llm_config.for_agent(agent_name),
+            llm_gateway,
+            agent_name=agent_name,
+        )
+        fallback_llm_config = llm_config.fallback_for_agent(agent_name)
+        if fallback_llm_config is None or not llm_hedging_config.enabled:
+            return llm
+        return HedgedChatModel(
+            llm,
+            create_llm_chat_model(fallback_llm_config, llm_gateway, agent_name=agent_name),
+            HedgingPolicy(agent_name, llm_hedging_config),
+        )
+
+    llm_cache_config = LLMCacheConfig()
+    llm_response_cache = None
+    if llm_cache_config.enabled:
+        llm_response_cache = LLMResponseCache(
+            llm_cache_config,
+            persistent_cache=llm_response_cache_backend,
+        )
+
+    chat_history_config = ChatHistoryConfig()
+    history_limit = chat_history_config.load_limit if chat_history_config.enabled else None
+    history_summary_token_budget = (
+        chat_history_config.summary_token_budget if chat_history_config.enabled else None
     )
-    extract_budget_filter_node = create_extract_budget_filter_node(
-        RecommendationV2BudgetFilterExtractionAgent(llm=llm),
+
+    if async_recommendation_session_store is not None:
+        session_load_node = create_async_session_memory_load_node(
+            async_recommendation_session_store,
+            history_limit=history_limit,
+        )
+        session_save_node = create_async_session_memory_save_node(
+            async_recommendation_session_store,
+            history_summary_token_budget=history_summary_token_budget,
+        )
+    else:
+        session_load_node = create_session_memory_load_node(
+            recommendation_session_store,
+            history_limit=history_limit,
+        )
+        session_save_node = create_session_memory_save_node(
+            recommendation_session_store,
+            history_summary_token_budget=history_summary_token_budget,
+        )
+    request_routing_agent = RecommendationV2RequestRoutingAgent(
+        llm=llm_for("request_routing"),
+        response_cache=llm_response_cache,
+        history_window=chat_history_config.window_for("request_routing"),
     )
+    if configuration.filter_extraction_mode == FilterExtractionMode.fused:
+        requirement_extraction_nodes = [
+            create_async_fused_extraction_node(
+                RecommendationV2FusedExtractionAgent(
+                    llm=llm_for("fused_extraction"),
+                    response_cache=llm_response_cache,
+                    history_window=chat_history_config.window_for("fused_extraction"),
+                ),
+            ),
+        ]
+    else:
+        rule_based_min_confidence = (
+            configuration.rule_based_filter_extraction_min_confidence
+            if configuration.rule_based_filter_extraction_enabled
+            else None
+        )
+        requirement_extraction_nodes = [
+            create_async_synthesize_user_request_node(
+                RecommendationV2SynthesizedUserRequestAgent(
+                    llm=llm_for("synthesize_user_request"),
+                    response_cache=llm_response_cache,
+                    history_window=chat_history_config.window_for("synthesize_user_request"),
+                ),
+            ),
+            create_async_extract_parent_region_filter_node(
+                RecommendationV2ParentRegionFilterExtractionAgent(
+                    llm=llm_for("parent_region_filter"),
+                    response_cache=llm_response_cache,
+                ),
+                rule_based_min_confidence=rule_based_min_confidence,
+            ),
+            create_async_extract_season_filter_node(
+                RecommendationV2SeasonFilterExtractionAgent(
+                    llm=llm_for("season_filter"),
+                    response_cache=llm_response_cache,
+                ),
+                rule_based_min_confidence=rule_based_min_confidence,
+            ),
+            create_async_extract_budget_filter_node(
+                RecommendationV2BudgetFilterExtractionAgent(
+                    llm=llm_for("budget_filter"),
+                    response_cache=llm_response_cache,
+                ),
+                rule_based_min_confidence=rule_based_min_confidence,
+            ),
+        ]
+    if configuration.speculative_filter_extraction_enabled:
+        request_routing_node = create_async_speculative_request_routing_node(
+            request_routing_agent,
+            requirement_extraction_nodes,
+        )
+        requirement_extraction_nodes = []
+    else:
+        request_routing_node = create_async_request_routing_node(request_routing_agent)
     gather_requirements_node = create_gather_requirements_node()
-    recommendation_generation_node = create_recommendation_generation_node(
-        travel_destination_store,
+    recommendation_research_agent = RecommendationV2RecommendationResearchAgent(
+        llm_config=llm_config.for_agent("recommendation_research"),
+        tavily_api_key=configuration.tavily_api_key,
+        history_window=chat_history_config.window_for("recommendation_research"),
+        llm_gateway=llm_gateway,
     )
-    recommendation_research_node = create_recommendation_research_node(
-        RecommendationV2RecommendationResearchAgent(
-            llm_config=llm_config,
-            tavily_api_key=configuration.tavily_api_key,
-        ),
-        travel_destination_store,
+    region_research_cache_config = RegionResearchCacheConfig()
+    region_research_cache = None
+    if region_research_cache_config.enabled and region_research_cache_backend is not None:
+        region_research_cache = RegionResearchCache(
+            region_research_cache_config,
+            backend=region_research_cache_backend,
+        )
+    research_fan_out_limits = ResearchFanOutLimits(
+        destination_timeout_s=configuration.research_destination_timeout_s,
+        turn_timeout_s=configuration.research_turn_timeout_s,
+        max_concurrency=configuration.research_max_concurrency,
+        defer_stragglers=configuration.research_background_completion_enabled,
     )
-    recommendation_response_generation_node = create_recommendation_response_generation_node(
-        RecommendationV2RecommendationGeneratedResponseGenerationAgent(llm=llm),
-        RecommendationV2NoResultsForRecommendationResponseGenerationAgent(llm=llm),
+    if async_travel_destination_store is not None:
+        recommendation_generation_node = create_async_recommendation_generation_node(
+            async_travel_destination_store,
+        )
+        recommendation_research_node = create_async_recommendation_research_node(
+            recommendation_research_agent,
+            async_travel_destination_store,
+            research_cache=region_research_cache,
+            fan_out_limits=research_fan_out_limits,
+            chat_store=async_recommendation_session_store,
+        )
+    else:
+        recommendation_generation_node = create_recommendation_generation_node(
+            travel_destination_store,
+        )
+        recommendation_research_node = create_recommendation_research_node(
+            recommendation_research_agent,
+            travel_destination_store,
+            research_cache=region_research_cache,
+            fan_out_limits=research_fan_out_limits,
+            chat_store=recommendation_session_store,
+        )
+    response_history_window = chat_history_config.window_for("response_generation")
+    response_generation_llm = llm_for("response_generation")
+    recommendation_response_generation_node = create_async_recommendation_response_generation_node(
+        RecommendationV2RecommendationGeneratedResponseGenerationAgent(
+            llm=response_generation_llm,
+            history_window=response_history_window,
+        ),
+        RecommendationV2NoResultsForRecommendationResponseGenerationAgent(
+            llm=response_generation_llm,
+            history_window=response_history_window,
+        ),
+        stream_response=configuration.response_streaming_enabled,
     )
     need_more_information_response_generation_node = (
-        create_need_more_information_response_generation_node(
-            RecommendationV2NeedMoreInformationResponseGenerationAgent(llm=llm),
+        create_async_need_more_information_response_generation_node(
+            RecommendationV2NeedMoreInformationResponseGenerationAgent(
+                llm=response_generation_llm,
+                history_window=response_history_window,
+            ),
+            stream_response=configuration.response_streaming_enabled,
         )
     )
-    out_of_scope_response_generation_node = create_out_of_scope_response_generation_node(
-        RecommendationV2OutOfScopeResponseGenerationAgent(llm=llm),
-    )
-    session_save_node = create_session_memory_save_node(recommendation_session_store)
-
-    graph_builder.add_node(session_load_node.__name__, session_load_node)
-    graph_builder.add_node(request_routing_node.__name__, request_routing_node)
-    graph_builder.add_node(synthesize_user_request_node.__name__, synthesize_user_request_node)
-    graph_builder.add_node(extract_parent_region_filter_node.__name__, extract_parent_region_filter_node)
-    graph_builder.add_node(extract_season_filter_node.__name__, extract_season_filter_node)
-    graph_builder.add_node(extract_budget_filter_node.__name__, extract_budget_filter_node)
-    graph_builder.add_node(gather_requirements_node.__name__, gather_requirements_node)
-    graph_builder.add_node(recommendation_generation_node.__name__, recommendation_generation_node)
-    graph_builder.add_node(recommendation_research_node.__name__, recommendation_research_node)
-    graph_builder.add_node(
-        recommendation_response_generation_node.__name__,
-        recommendation_response_generation_node,
-    )
-    graph_builder.add_node(
-        need_more_information_response_generation_node.__name__,
-        need_more_information_response_generation_node,
-    )
-    graph_builder.add_node(
-        out_of_scope_response_generation_node.__name__,
-        out_of_scope_response_generation_node,
+    out_of_scope_response_generation_node = create_async_out_of_scope_response_generation_node(
+        RecommendationV2OutOfScopeResponseGenerationAgent(
+            llm=response_generation_llm,
+            history_window=response_history_window,
+        ),
+        stream_response=configuration.response_streaming_enabled,
     )
-    graph_builder.add_node(session_save_node.__name__, session_save_node)
+
+    def add_node(node: Callable[..., Any]) -> None:
+        graph_builder.add_node(node.__name__, track_node_cancellation(node))
+
+    add_node(session_load_node)
+    add_node(request_routing_node)
+    for requirement_extraction_node in requirement_extraction_nodes:
+        add_node(requirement_extraction_node)
+    add_node(gather_requirements_node)
+    add_node(recommendation_generation_node)
+    add_node(recommendation_research_node)
+    add_node(recommendation_response_generation_node)
+    add_node(need_more_information_response_generation_node)
+    add_node(out_of_scope_response_generation_node)
+    add_node(session_save_node)
 
     # edges
     graph_builder.add_edge(START, session_load_node.__name__)
@@ -175,11 +357,12 @@ def build_recommendation_v2_graph(
             "new_recommendation_run",
             "need_more_information_from_user",
         }:
+            if not requirement_extraction_nodes:
+                return gather_requirements_node.__name__
+
             return [
-                synthesize_user_request_node.__name__,
-                extract_parent_region_filter_node.__name__,
-                extract_season_filter_node.__name__,
-                extract_budget_filter_node.__name__,
+                requirement_extraction_node.__name__
+                for requirement_extraction_node in requirement_extraction_nodes
             ]
 
         if state.request_routing_decision == "out_of_system_scope":
@@ -220,22 +403,11 @@ def build_recommendation_v2_graph(
     )
 
     # parallel execution fan out
-    graph_builder.add_edge(
-        synthesize_user_request_node.__name__,
-        gather_requirements_node.__name__,
-    )
-    graph_builder.add_edge(
-        extract_parent_region_filter_node.__name__,
-        gather_requirements_node.__name__,
-    )
-    graph_builder.add_edge(
-        extract_season_filter_node.__name__,
-        gather_requirements_node.__name__,
-    )
-    graph_builder.add_edge(
-        extract_budget_filter_node.__name__,
-        gather_requirements_node.__name__,
-    )
+    for requirement_extraction_node in requirement_extraction_nodes:
+        graph_builder.add_edge(
+            requirement_extraction_node.__name__,
+            gather_requirements_node.__name__,
+        )
 
     # requirement fan in node
     graph_builder.add_conditional_edges(
@@ -24,6 +24,7 @@ class EventType(StrEnum):
     DESTINATION_RESEARCH_GENERATION = "desination_research_generation"
     DESTINATION_RESEARCH = "destination_research"
     RESPONSE_GENERATION = "response_generation"
+    RESPONSE_DELTA = "response_delta"
     RESPONSE = "response"
     DONE = "done"
 
@@ -36,6 +37,14 @@ class StreamEventResponseMessage:
         return {"message": self.message}
 
 
+@dataclass
+class StreamEventResponseDelta:
+    delta: str
+
+    def serialize(self) -> dict[str, object]:
+        return {"delta": self.delta}
+
+
 @dataclass
 class StreamEventTravelDestinationFilter:
     travel_destination_filter: RecommendationV2TravelDestinationFilter
@@ -2,6 +2,7 @@ from recommender.graphs.recommendation_v2.utils.recommendation_generation_node_u
     apply_budget_filters,
     apply_parent_region_filters,
     budget_filter_needs_statistics,
+    build_travel_destination_retrieval_filter,
     resolve_budget_bounds,
     resolve_weekly_cost,
 )
@@ -15,6 +16,7 @@ __all__ = [
     "apply_budget_filters",
     "apply_parent_region_filters",
     "budget_filter_needs_statistics",
+    "build_travel_destination_retrieval_filter",
     "compose_travel_destination_filter",
     "latest_travel_destination_filter_from_history",
     "merge_parent_region_filters",
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+from utils.logger import LoggerManager
+from utils.metrics import MetricsRegistry
+
+logger = LoggerManager.get_logger(__name__)
+metrics = MetricsRegistry()
+
+
+def track_node_cancellation(node: Callable[..., Any]) -> Callable[..., Any]:
+    """Count runs cancelled while `node` is in flight, e.g. after the client disconnected.
+
+    Synchronous nodes run to completion in a worker thread and are returned unchanged.
+    """
+
+    if not inspect.iscoroutinefunction(node):
+        return node
+
+    @functools.wraps(node)
+    async def cancellation_tracking_node(state: Any) -> Any:
+        try:
+            return await node(state)
+        except asyncio.CancelledError:
+            metrics.increment("recommendation_v2_cancelled_nodes_total", node=node.__name__)
+            logger.verbose("Cancelled recommendation_v2 node %s while in flight", node.__name__)
+            raise
+
+    return cancellation_tracking_node
@@ -4,8 +4,11 @@ from recommender.graphs.recommendation_v2.filter_models import (
     ExplicitCostTermFilter,
     RecommendationV2TravelDestinationFilter,
 )
+from collections.abc import Sequence
+
 from storage.stores.search_models import ScoredTravelDestination
 from storage.stores.search_models import TravelCostStatistics
+from storage.stores.search_models import TravelDestinationRetrievalFilter
 
 _SEASON_MONTHS = {
     "winter": ("dec", "jan", "feb"),
@@ -137,6 +140,51 @@ def apply_budget_filters(
     return filtered_destinations
 
 
+def build_travel_destination_retrieval_filter(
+    travel_destination_filter: RecommendationV2TravelDestinationFilter | None,
+    cost_statistics: TravelCostStatistics | None,
+    *,
+    included_destination_ids: Sequence[str] = (),
+    excluded_destination_ids: Sequence[str] = (),
+) -> TravelDestinationRetrievalFilter:
+    """Translate the gathered filter and request region IDs into storage retrieval predicates.
+
+    Parent-region includes take precedence over excludes, matching `apply_parent_region_filters`.
+    """
+    included_parent_regions: tuple[str, ...] = ()
+    excluded_parent_regions: tuple[str, ...] = ()
+    if travel_destination_filter is not None:
+        included_parent_regions = tuple(
+            dict.fromkeys(
+                region_filter.region_name
+                for region_filter in travel_destination_filter.parent_region_filters
+                if region_filter.type == "include"
+            )
+        )
+        if not included_parent_regions:
+            excluded_parent_regions = tuple(
+                dict.fromkeys(
+                    region_filter.region_name
+                    for region_filter in travel_destination_filter.parent_region_filters
+                    if region_filter.type == "exclude"
+                )
+            )
+
+    min_cost_per_week, max_cost_per_week = resolve_budget_bounds(
+        travel_destination_filter,
+        cost_statistics,
+    )
+
+    return TravelDestinationRetrievalFilter(
+        included_parent_regions=included_parent_regions,
+        excluded_parent_regions=excluded_parent_regions,
+        min_cost_per_week=min_cost_per_week,
+        max_cost_per_week=max_cost_per_week,
+        included_destination_ids=tuple(dict.fromkeys(included_destination_ids)),
+        excluded_destination_ids=tuple(dict.fromkeys(excluded_destination_ids)),
+    )
+
+
 def budget_filter_needs_statistics(
     travel_destination_filter: RecommendationV2TravelDestinationFilter | None,
 ) -> bool:
@@ -151,6 +199,7 @@ __all__ = [
     "apply_budget_filters",
     "apply_parent_region_filters",
     "budget_filter_needs_statistics",
+    "build_travel_destination_retrieval_filter",
     "resolve_seasonality_months",
     "resolve_budget_bounds",
     "resolve_weekly_cost",
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import unittest
+
+from recommender.graphs.recommendation_v2.filter_models import CostTerm
+from recommender.graphs.recommendation_v2.filter_models import RecommendationV2BudgetFilter
+from recommender.graphs.recommendation_v2.filter_models import RecommendationV2RegionFilter
+from recommender.graphs.recommendation_v2.filter_models import RecommendationV2TravelDestinationFilter
+from recommender.graphs.recommendation_v2.utils.recommendation_generation_node_utils import (
+    build_travel_destination_retrieval_filter,
+)
+from storage.stores.search_models import TravelCostStatistics
+
+
+class TestBuildTravelDestinationRetrievalFilter(unittest.TestCase):
+    def test_includes_take_precedence_over_excludes(self) -> None:
+        travel_destination_filter = RecommendationV2TravelDestinationFilter(
+            parent_region_filters=[
+                RecommendationV2RegionFilter(field_name="parent_region", region_name="Europe", type="include"),
+                RecommendationV2RegionFilter(field_name="parent_region", region_name="Asia", type="exclude"),
+            ],
+        )
+
+        retrieval_filter = build_travel_destination_retrieval_filter(travel_destination_filter, None)
+
+        self.assertEqual(retrieval_filter.included_parent_regions, ("Europe",))
+        self.assertEqual(retrieval_filter.excluded_parent_regions, ())
+
+    def test_resolves_inferred_budget_level_and_request_region_ids(self) -> None:
+        travel_destination_filter = RecommendationV2TravelDestinationFilter(
+            parent_region_filters=[
+                RecommendationV2RegionFilter(field_name="parent_region", region_name="Asia", type="exclude"),
+            ],
+            budget=RecommendationV2BudgetFilter(
+                cost_term=CostTerm.model_validate({"inferred_level": "medium"}),
+            ),
+        )
+
+        retrieval_filter = build_travel_destination_retrieval_filter(
+            travel_destination_filter,
+            TravelCostStatistics(percentile_50=600.0, percentile_75=900.0),
+            included_destination_ids=["A", "B", "A"],
+            excluded_destination_ids=["C"],
+        )
+
+        self.assertEqual(retrieval_filter.excluded_parent_regions, ("Asia",))
+        self.assertEqual(retrieval_filter.min_cost_per_week, 600.0)
+        self.assertEqual(retrieval_filter.max_cost_per_week, 900.0)
+        self.assertEqual(retrieval_filter.included_destination_ids, ("A", "B"))
+        self.assertEqual(retrieval_filter.excluded_destination_ids, ("C",))
+
+    def test_missing_filter_produces_empty_retrieval_filter(self) -> None:
+        retrieval_filter = build_travel_destination_retrieval_filter(None, None)
+
+        self.assertTrue(retrieval_filter.is_empty())
+
+
+if __name__ == "__main__":
+    unittest.main()
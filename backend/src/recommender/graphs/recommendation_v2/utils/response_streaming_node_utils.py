@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+from recommender.graphs.recommendation_v2.agents.response_generation.response_generation_result import (
+    RecommendationV2ResponseGenerationResult,
+)
+from recommender.graphs.recommendation_v2.stream_events import (
+    EventType,
+    StreamEventResponseDelta,
+    emit_stream_event,
+)
+
+
+async def stream_response_deltas(
+    deltas: AsyncIterator[str],
+) -> RecommendationV2ResponseGenerationResult:
+    """Forward response deltas as `response_delta` stream events and return the full response."""
+
+    chunks: list[str] = []
+    async for delta in deltas:
+        chunks.append(delta)
+        emit_stream_event(EventType.RESPONSE_DELTA, StreamEventResponseDelta(delta).serialize())
+
+    return RecommendationV2ResponseGenerationResult(response="".join(chunks).strip())
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from unittest.mock import patch
+from uuid import uuid4
+
+from langchain_core.messages import AIMessageChunk
+from langchain_core.messages import SystemMessage
+
+from recommender.graphs.recommendation_v2.agents.response_generation.out_of_scope.agent import (
+    RecommendationV2OutOfScopeResponseGenerationAgent,
+)
+from recommender.graphs.recommendation_v2.models import RecommendationV2GraphState
+from recommender.graphs.recommendation_v2.nodes.out_of_scope_response_generation_node import (
+    create_async_out_of_scope_response_generation_node,
+)
+from recommender.graphs.recommendation_v2.stream_events import EventType
+from recommender.models.session.session import Session
+
+
+class _FakeStreamingChatModel:
+    def __init__(self, deltas: list[str]) -> None:
+        self._deltas = deltas
+        self.messages: list[object] = []
+
+    def with_structured_output(self, _output_type: object) -> object:
+        return self
+
+    async def astream(self, messages: list[object]):
+        self.messages = messages
+        for delta in self._deltas:
+            yield AIMessageChunk(content=delta)
+
+
+class TestStreamResponseDeltas(unittest.TestCase):
+    def test_streaming_node_emits_deltas_before_full_response(self) -> None:
+        llm = _FakeStreamingChatModel(["I can only ", "help with ", "travel. "])
+        node = create_async_out_of_scope_response_generation_node(
+            RecommendationV2OutOfScopeResponseGenerationAgent(llm=llm),
+            stream_response=True,
+        )
+        state = RecommendationV2GraphState(
+            session=Session(user_id=uuid4(), session_id=uuid4()),
+            user_request="What's the weather on Mars?",
+            history=[],
+        )
+        events: list[tuple[EventType, dict[str, object]]] = []
+
+        def record_event(event: EventType, data: dict[str, object]) -> None:
+            events.append((event, data))
+
+        with (
+            patch(
+                "recommender.graphs.recommendation_v2.utils.response_streaming_node_utils.emit_stream_event",
+                record_event,
+            ),
+            patch(
+                "recommender.graphs.recommendation_v2.nodes.out_of_scope_response_generation_node.emit_stream_event",
+                record_event,
+            ),
+        ):
+            update = asyncio.run(node(state))
+
+        self.assertEqual(update, {"system_response": "I can only help with travel."})
+        self.assertEqual(
+            events,
+            [
+                (EventType.RESPONSE_GENERATION, {}),
+                (EventType.RESPONSE_DELTA, {"delta": "I can only "}),
+                (EventType.RESPONSE_DELTA, {"delta": "help with "}),
+                (EventType.RESPONSE_DELTA, {"delta": "travel. "}),
+                (EventType.RESPONSE, {"message": "I can only help with travel."}),
+            ],
+        )
+        self.assertIsInstance(llm.messages[0], SystemMessage)
+        self.assertIn("plain text", llm.messages[0].content)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,11 @@
 from langchain_core.language_models.chat_models import BaseChatModel
-from typing import Any
+from typing import Any, Optional
 
 from recommender.models.llm.llm_config import LLMConfig
+from recommender.models.llm.llm_gateway import LLMGateway
+from recommender.models.llm.llm_latency import LLMAgentLatencyCallbackHandler
 
-def create_chat_gpt_chat_model(cfg: LLMConfig) -> BaseChatModel:
+def create_chat_gpt_chat_model(cfg: LLMConfig, gateway: Optional[LLMGateway] = None) -> BaseChatModel:
     from langchain_openai import ChatOpenAI
 
     params: dict[str, Any] = {
@@ -16,10 +18,19 @@ def create_chat_gpt_chat_model(cfg: LLMConfig) -> BaseChatModel:
         params["api_key"] = cfg.api_key
     if cfg.base_url is not None:
         params["base_url"] = cfg.base_url
+    if gateway is not None:
+        import httpx
+
+        sync_transport, async_transport = gateway.transports(
+            cfg.provider,
+            expected_output_tokens=cfg.max_tokens,
+        )
+        params["http_client"] = httpx.Client(transport=sync_transport)
+        params["http_async_client"] = httpx.AsyncClient(transport=async_transport)
 
     return ChatOpenAI(**params)
 
-def create_llama_chat_model(cfg: LLMConfig) -> BaseChatModel:
+def create_llama_chat_model(cfg: LLMConfig, gateway: Optional[LLMGateway] = None) -> BaseChatModel:
     from langchain_ollama import ChatOllama
 
     params: dict[str, Any] = {
@@ -31,15 +42,37 @@ def create_llama_chat_model(cfg: LLMConfig) -> BaseChatModel:
 
     if cfg.max_tokens is not None:
         params["num_predict"] = cfg.max_tokens
+    if gateway is not None:
+        sync_transport, async_transport = gateway.transports(
+            cfg.provider,
+            expected_output_tokens=cfg.max_tokens,
+        )
+        params["sync_client_kwargs"] = {"transport": sync_transport}
+        params["async_client_kwargs"] = {"transport": async_transport}
 
     return ChatOllama(**params)
 
-def create_llm_chat_model(cfg: LLMConfig) -> BaseChatModel:
+def create_llm_chat_model(
+    cfg: LLMConfig,
+    gateway: Optional[LLMGateway] = None,
+    *,
+    agent_name: Optional[str] = None,
+) -> BaseChatModel:
+    """Create the configured chat model.
+
+    With `gateway`, its HTTP traffic goes through the provider limiter and pool. With
+    `agent_name`, every call is timed in `llm_agent_latency_seconds{agent,model,outcome}`.
+    """
     if cfg.provider == "chatgpt":
-        return create_chat_gpt_chat_model(cfg)
-    if cfg.provider == "ollama":
-        return create_llama_chat_model(cfg)
-    raise ValueError(f"Unsupported LLM provider: {cfg.provider}")
+        llm = create_chat_gpt_chat_model(cfg, gateway)
+    elif cfg.provider == "ollama":
+        llm = create_llama_chat_model(cfg, gateway)
+    else:
+        raise ValueError(f"Unsupported LLM provider: {cfg.provider}")
+
+    if agent_name is not None:
+        llm.callbacks = [LLMAgentLatencyCallbackHandler(agent_name, cfg.model)]
+    return llm
 
 
 if __name__ == "__main__":
@@ -10,6 +10,16 @@ from pydantic_settings import SettingsConfigDict
 
 LLMProvider = Literal["chatgpt", "ollama"]
 
+# Agents without their own LLM_<AGENT>_* settings fall back to the profile named here, then to LLM_*.
+LLM_PROFILE_FALLBACKS: dict[str, str] = {
+    "request_routing": "classification",
+    "synthesize_user_request": "classification",
+    "parent_region_filter": "classification",
+    "season_filter": "classification",
+    "budget_filter": "classification",
+    "fused_extraction": "classification",
+}
+
 
 class LLMConfig(BaseSettings):
     model_config = SettingsConfigDict(
@@ -45,3 +55,145 @@ class LLMConfig(BaseSettings):
             "max_retries": self.max_retries,
             **(self.extra or {}),
         }
+
+    def for_agent(self, agent_name: str) -> LLMConfig:
+        """Resolve one agent's LLM profile: `LLM_<AGENT>_*` over its fallback profile over `LLM_*`.
+
+        A profile that switches provider does not inherit the base `api_key` and `base_url`.
+        """
+        config = self
+        for profile_name in (LLM_PROFILE_FALLBACKS.get(agent_name), agent_name):
+            if profile_name is None:
+                continue
+
+            overrides = LLMProfileOverrides(_env_prefix=f"LLM_{profile_name.upper()}_").model_dump(exclude_none=True)
+            if not overrides:
+                continue
+            if overrides.get("provider", config.provider) != config.provider:
+                config = config.model_copy(update={"api_key": None, "base_url": None})
+            config = config.model_copy(update=overrides)
+        return config
+
+    def fallback_for_agent(self, agent_name: str) -> Optional[LLMConfig]:
+        """Resolve the secondary model of one agent: `LLM_FALLBACK_*` over its own profile.
+
+        Returns None when no `LLM_FALLBACK_*` field is set, i.e. hedging and fallback are off.
+        """
+        overrides = LLMProfileOverrides(_env_prefix="LLM_FALLBACK_").model_dump(exclude_none=True)
+        if not overrides:
+            return None
+
+        config = self.for_agent(agent_name)
+        if overrides.get("provider", config.provider) != config.provider:
+            config = config.model_copy(update={"api_key": None, "base_url": None})
+        return config.model_copy(update=overrides)
+
+
+class LLMProfileOverrides(BaseSettings):
+    """Optional overrides of `LLMConfig` for one agent profile; unset fields keep the base values."""
+
+    model_config = SettingsConfigDict(
+        env_file=Path(__file__).resolve().parents[4] / ".env",
+        extra="ignore",
+    )
+
+    provider: Optional[LLMProvider] = Field(default=None)
+    model: Optional[str] = Field(default=None)
+    temperature: Optional[float] = Field(default=None)
+    max_tokens: Optional[int] = Field(default=None)
+    timeout_s: Optional[float] = Field(default=None)
+    max_retries: Optional[int] = Field(default=None)
+    api_key: Optional[str] = Field(default=None)
+    base_url: Optional[str] = Field(default=None)
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def parse_blank_as_unset(cls, value: Any) -> Any:
+        if isinstance(value, str) and not value.strip():
+            return None
+        return value
+
+
+class LLMCacheConfig(BaseSettings):
+    """Structured-output response cache settings for the deterministic recommendation_v2 agents."""
+
+    model_config = SettingsConfigDict(
+        env_file=Path(__file__).resolve().parents[4] / ".env",
+        env_prefix="LLM_CACHE_",
+        extra="ignore",
+    )
+
+    enabled: bool = Field(default=True)
+    max_entries: int = Field(default=512, ge=1)
+    ttl_s: float = Field(default=3600.0, gt=0.0)
+    persistent_ttl_s: float = Field(default=86400.0, gt=0.0)
+
+    request_routing_enabled: bool = Field(default=True)
+    synthesize_user_request_enabled: bool = Field(default=True)
+    parent_region_filter_enabled: bool = Field(default=True)
+    season_filter_enabled: bool = Field(default=True)
+    budget_filter_enabled: bool = Field(default=True)
+    fused_extraction_enabled: bool = Field(default=True)
+
+    def is_agent_enabled(self, agent_name: str) -> bool:
+        if not self.enabled:
+            return False
+        return bool(getattr(self, f"{agent_name}_enabled", False))
+
+
+class LLMHedgingConfig(BaseSettings):
+    """Hedging and circuit-breaker settings for agents that have a fallback model (`LLM_FALLBACK_*`).
+
+    A call still running after the agent's `hedge_percentile` latency (clamped to the min/max
+    delay, `initial_hedge_delay_s` until `min_latency_samples` are collected) is duplicated on the
+    fallback model and the first answer wins. When the primary's error rate over the last
+    `breaker_window_size` calls reaches `breaker_error_rate_threshold`, calls go straight to the
+    fallback for `breaker_open_duration_s` before one probe call tries the primary again.
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=Path(__file__).resolve().parents[4] / ".env",
+        env_prefix="LLM_HEDGING_",
+        extra="ignore",
+    )
+
+    enabled: bool = Field(default=True)
+    hedge_percentile: float = Field(default=0.95, gt=0.0, lt=1.0)
+    initial_hedge_delay_s: float = Field(default=10.0, gt=0.0)
+    min_hedge_delay_s: float = Field(default=0.5, gt=0.0)
+    max_hedge_delay_s: float = Field(default=30.0, gt=0.0)
+    latency_window_size: int = Field(default=200, ge=1)
+    min_latency_samples: int = Field(default=20, ge=1)
+
+    breaker_window_size: int = Field(default=20, ge=1)
+    breaker_min_calls: int = Field(default=10, ge=1)
+    breaker_error_rate_threshold: float = Field(default=0.5, gt=0.0, le=1.0)
+    breaker_open_duration_s: float = Field(default=30.0, gt=0.0)
+
+
+class LLMGatewayConfig(BaseSettings):
+    """Per-provider request gating and connection pooling shared by every agent's LLM calls."""
+
+    model_config = SettingsConfigDict(
+        env_file=Path(__file__).resolve().parents[4] / ".env",
+        env_prefix="LLM_GATEWAY_",
+        extra="ignore",
+    )
+
+    enabled: bool = Field(default=True)
+    max_concurrent_requests: int = Field(default=8, ge=1)
+    tokens_per_minute: Optional[int] = Field(default=None, ge=1)
+    expected_output_tokens: int = Field(default=512, ge=0)
+    research_estimated_tokens: int = Field(default=8000, ge=0)
+    research_max_concurrent_requests: int = Field(default=2, ge=1)
+
+    max_connections: int = Field(default=32, ge=1)
+    max_keepalive_connections: int = Field(default=16, ge=0)
+    keepalive_expiry_s: float = Field(default=30.0, gt=0.0)
+
+    @field_validator("tokens_per_minute", mode="before")
+    @classmethod
+    def parse_optional_tokens_per_minute(cls, value: Any) -> Any:
+        if isinstance(value, str) and not value.strip():
+            return None
+        return value
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import os
+import unittest
+from unittest.mock import patch
+
+from recommender.models.llm.llm_config import LLMConfig
+
+
+def _base_config() -> LLMConfig:
+    return LLMConfig(
+        _env_file=None,
+        provider="chatgpt",
+        model="gpt-4o",
+        temperature=0.2,
+        api_key="sk-base",
+        base_url="https://llm.example.com/v1",
+    )
+
+
+class TestLLMConfigForAgent(unittest.TestCase):
+    def test_agent_without_profile_uses_the_base_config(self) -> None:
+        with patch.dict(os.environ, {}, clear=True):
+            config = _base_config().for_agent("response_generation")
+
+        self.assertEqual(config, _base_config())
+
+    def test_agent_profile_overrides_only_the_fields_it_sets(self) -> None:
+        with patch.dict(os.environ, {"LLM_RESPONSE_GENERATION_MODEL": "gpt-4.1", "LLM_RESPONSE_GENERATION_TEMPERATURE": ""}, clear=True):
+            config = _base_config().for_agent("response_generation")
+
+        self.assertEqual(config.model, "gpt-4.1")
+        self.assertEqual(config.temperature, 0.2)
+        self.assertEqual(config.api_key, "sk-base")
+
+    def test_classification_agents_fall_back_to_the_classification_profile(self) -> None:
+        environment = {
+            "LLM_CLASSIFICATION_PROVIDER": "ollama",
+            "LLM_CLASSIFICATION_MODEL": "llama3.2:3b",
+            "LLM_SEASON_FILTER_MODEL": "qwen2.5:1.5b",
+        }
+        with patch.dict(os.environ, environment, clear=True):
+            routing_config = _base_config().for_agent("request_routing")
+            season_config = _base_config().for_agent("season_filter")
+            response_config = _base_config().for_agent("response_generation")
+
+        self.assertEqual((routing_config.provider, routing_config.model), ("ollama", "llama3.2:3b"))
+        self.assertEqual((season_config.provider, season_config.model), ("ollama", "qwen2.5:1.5b"))
+        self.assertEqual((response_config.provider, response_config.model), ("chatgpt", "gpt-4o"))
+
+    def test_switching_provider_drops_the_base_credentials(self) -> None:
+        with patch.dict(os.environ, {"LLM_REQUEST_ROUTING_PROVIDER": "ollama"}, clear=True):
+            config = _base_config().for_agent("request_routing")
+
+        self.assertEqual(config.provider, "ollama")
+        self.assertIsNone(config.api_key)
+        self.assertIsNone(config.base_url)
+
+    def test_fallback_is_resolved_over_the_agent_profile_and_off_by_default(self) -> None:
+        environment = {
+            "LLM_CLASSIFICATION_PROVIDER": "ollama",
+            "LLM_CLASSIFICATION_MODEL": "llama3.2:3b",
+            "LLM_FALLBACK_MODEL": "llama3.1:8b",
+        }
+        with patch.dict(os.environ, environment, clear=True):
+            fallback_config = _base_config().fallback_for_agent("request_routing")
+        with patch.dict(os.environ, {}, clear=True):
+            disabled_fallback_config = _base_config().fallback_for_agent("request_routing")
+
+        self.assertIsNotNone(fallback_config)
+        self.assertEqual((fallback_config.provider, fallback_config.model), ("ollama", "llama3.1:8b"))
+        self.assertIsNone(disabled_fallback_config)
+
+
+if __name__ == "__main__":
+    unittest.main()
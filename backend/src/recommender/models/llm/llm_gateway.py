@@ -0,0 +1,424 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import asynccontextmanager
+
+import httpx
+
+from recommender.models.llm.llm_config import LLMGatewayConfig
+from utils.logger import LoggerManager
+from utils.metrics import MetricsRegistry
+
+logger = LoggerManager.get_logger(__name__)
+metrics = MetricsRegistry()
+
+_APPROX_BYTES_PER_TOKEN = 4
+
+
+class TokenBucket:
+    """Thread-safe tokens-per-minute budget that hands out reservations instead of blocking.
+
+    `reserve` always takes the tokens, letting the balance go negative, and returns how long the
+    caller must wait before sending; callers are therefore delayed in arrival order.
+    """
+
+    def __init__(self, tokens_per_minute: int) -> None:
+        if tokens_per_minute < 1:
+            raise ValueError("tokens_per_minute must be at least 1")
+
+        self.capacity = float(tokens_per_minute)
+        self._refill_per_s = tokens_per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int) -> float:
+        """Take `tokens` from the budget and return the seconds to wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self._refill_per_s)
+            self._updated_at = now
+            self._tokens -= min(float(tokens), self.capacity)
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._refill_per_s
+
+
+class _AsyncWaiter:
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.future: asyncio.Future[None] = loop.create_future()
+
+
+class RequestSlots:
+    """FIFO counting semaphore shared by event loops and worker threads.
+
+    Agents run on the service loop, on `anyio.run` loops in worker threads and synchronously,
+    so a plain `asyncio.Semaphore` (bound to one loop) cannot cap the provider as a whole.
+    A released slot is handed straight to the oldest waiter.
+    """
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+
+        self.limit = limit
+        self.in_use = 0
+        self._waiters: deque[_AsyncWaiter | threading.Event] = deque()
+        self._lock = threading.Lock()
+
+    async def acquire_async(self) -> None:
+        with self._lock:
+            if self.in_use < self.limit and not self._waiters:
+                self.in_use += 1
+                return
+            waiter = _AsyncWaiter(asyncio.get_running_loop())
+            self._waiters.append(waiter)
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            # The slot was handed over before the cancellation landed.
+            if waiter.future.done() and not waiter.future.cancelled():
+                self.release()
+            raise
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self.in_use < self.limit and not self._waiters:
+                self.in_use += 1
+                return
+            event = threading.Event()
+            self._waiters.append(event)
+        event.wait()
+
+    def release(self) -> None:
+        with self._lock:
+            if not self._waiters:
+                self.in_use -= 1
+                return
+            waiter = self._waiters.popleft()
+
+        if isinstance(waiter, threading.Event):
+            waiter.set()
+            return
+        try:
+            waiter.loop.call_soon_threadsafe(self._hand_over, waiter)
+        except RuntimeError:
+            # The waiter's loop is closed; pass the slot on.
+            self.release()
+
+    def _hand_over(self, waiter: _AsyncWaiter) -> None:
+        if waiter.future.cancelled():
+            self.release()
+            return
+        waiter.future.set_result(None)
+
+
+class LLMProviderLimiter:
+    """Concurrency and tokens-per-minute limit for one LLM provider.
+
+    The token budget is reserved before a request slot is taken, so requests held back by the
+    budget do not occupy slots. Time spent waiting for both is recorded in
+    `llm_gateway_queue_wait_seconds{provider}`. Long research calls take a provider slot only
+    within the smaller `max_concurrent_research_requests` sub-cap, so they cannot fill every slot.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        *,
+        max_concurrent_requests: int,
+        tokens_per_minute: int | None = None,
+        max_concurrent_research_requests: int | None = None,
+    ) -> None:
+        self.provider = provider
+        self.slots = RequestSlots(max_concurrent_requests)
+        self.research_slots = RequestSlots(
+            min(max_concurrent_research_requests or max_concurrent_requests, max_concurrent_requests)
+        )
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute is not None else None
+
+    @asynccontextmanager
+    async def acquire(self, estimated_tokens: int = 0) -> AsyncIterator[None]:
+        """Hold one request slot, waiting for the token budget first."""
+        await self.acquire_slot(estimated_tokens)
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def acquire_research(self, estimated_tokens: int = 0) -> AsyncIterator[None]:
+        """Hold one research slot and, within it, one request slot."""
+        await self.research_slots.acquire_async()
+        try:
+            async with self.acquire(estimated_tokens):
+                yield
+        finally:
+            self.research_slots.release()
+
+    async def acquire_slot(self, estimated_tokens: int = 0) -> None:
+        """Take a slot that must later be given back with `release`, e.g. once a response is read."""
+        started_at = time.perf_counter()
+        if self.token_bucket is not None:
+            budget_wait_s = self.token_bucket.reserve(estimated_tokens)
+            if budget_wait_s > 0:
+                await asyncio.sleep(budget_wait_s)
+        await self.slots.acquire_async()
+        self._on_acquired(started_at, estimated_tokens)
+
+    def acquire_sync_slot(self, estimated_tokens: int = 0) -> None:
+        started_at = time.perf_counter()
+        if self.token_bucket is not None:
+            budget_wait_s = self.token_bucket.reserve(estimated_tokens)
+            if budget_wait_s > 0:
+                time.sleep(budget_wait_s)
+        self.slots.acquire()
+        self._on_acquired(started_at, estimated_tokens)
+
+    def release(self) -> None:
+        self.slots.release()
+        metrics.set_gauge("llm_gateway_in_flight_requests", self.slots.in_use, provider=self.provider)
+
+    def _on_acquired(self, started_at: float, estimated_tokens: int) -> None:
+        metrics.observe("llm_gateway_queue_wait_seconds", time.perf_counter() - started_at, provider=self.provider)
+        metrics.increment("llm_gateway_requests_total", provider=self.provider)
+        metrics.increment("llm_gateway_estimated_tokens_total", estimated_tokens, provider=self.provider)
+        metrics.set_gauge("llm_gateway_in_flight_requests", self.slots.in_use, provider=self.provider)
+
+
+def estimate_request_tokens(request: httpx.Request, expected_output_tokens: int) -> int:
+    """Rough token cost of one provider request: ~4 bytes per prompt token plus the expected output."""
+    try:
+        prompt_bytes = len(request.content)
+    except httpx.RequestNotRead:
+        prompt_bytes = 0
+    return prompt_bytes // _APPROX_BYTES_PER_TOKEN + expected_output_tokens
+
+
+class _ReleasingSyncStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._release()
+
+
+class _ReleasingAsyncStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+def _once(release: Callable[[], None]) -> Callable[[], None]:
+    released = False
+
+    def release_once() -> None:
+        nonlocal released
+        if not released:
+            released = True
+            release()
+
+    return release_once
+
+
+def _record_response(provider: str, response: httpx.Response) -> None:
+    if response.status_code == 429:
+        metrics.increment("llm_gateway_rate_limited_responses_total", provider=provider)
+        logger.warning("LLM provider %s answered 429 Too Many Requests", provider)
+
+
+class PerLoopAsyncTransport(httpx.AsyncBaseTransport):
+    """Async keep-alive pool kept per running event loop.
+
+    Pooled connections belong to the loop that opened them, and agents call the provider from the
+    service loop as well as from `anyio.run` loops in worker threads. Pools of closed loops are
+    dropped the next time a pool is created.
+    """
+
+    def __init__(self, limits: httpx.Limits) -> None:
+        self._limits = limits
+        self._transports: dict[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport] = {}
+        self._lock = threading.Lock()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._current_transport().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        with self._lock:
+            transport = self._transports.pop(asyncio.get_running_loop(), None)
+        if transport is not None:
+            await transport.aclose()
+
+    def _current_transport(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.get(loop)
+            if transport is None:
+                for closed_loop in [known_loop for known_loop in self._transports if known_loop.is_closed()]:
+                    del self._transports[closed_loop]
+                transport = self._transports[loop] = httpx.AsyncHTTPTransport(limits=self._limits)
+            return transport
+
+
+class GatedTransport(httpx.BaseTransport):
+    """Synchronous transport that holds a provider slot from request until the response is closed."""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        limiter: LLMProviderLimiter,
+        *,
+        expected_output_tokens: int,
+    ) -> None:
+        self._transport = transport
+        self._limiter = limiter
+        self._expected_output_tokens = expected_output_tokens
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._limiter.acquire_sync_slot(estimate_request_tokens(request, self._expected_output_tokens))
+        release = _once(self._limiter.release)
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            release()
+            raise
+
+        _record_response(self._limiter.provider, response)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingSyncStream(response.stream, release),
+            extensions=response.extensions,
+        )
+
+
+class GatedAsyncTransport(httpx.AsyncBaseTransport):
+    """Asynchronous transport that holds a provider slot from request until the response is closed."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        limiter: LLMProviderLimiter,
+        *,
+        expected_output_tokens: int,
+    ) -> None:
+        self._transport = transport
+        self._limiter = limiter
+        self._expected_output_tokens = expected_output_tokens
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self._limiter.acquire_slot(estimate_request_tokens(request, self._expected_output_tokens))
+        release = _once(self._limiter.release)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+
+        _record_response(self._limiter.provider, response)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingAsyncStream(response.stream, release),
+            extensions=response.extensions,
+        )
+
+
+class LLMGateway:
+    """Process-wide entry point for LLM traffic: one limiter and one keep-alive pool per provider.
+
+    Chat models get `transports` wired into their HTTP clients, so every call, structured or
+    streamed, sync or async, passes the provider's limiter and reuses pooled connections; the
+    async pool is kept per event loop. Calls made by libraries that own their HTTP client go
+    through `limiter` directly.
+    """
+
+    def __init__(self, configuration: LLMGatewayConfig) -> None:
+        if configuration is None:
+            raise ValueError("configuration is required")
+
+        self.configuration = configuration
+        self._limiters: dict[str, LLMProviderLimiter] = {}
+        self._pools: dict[str, tuple[httpx.HTTPTransport, PerLoopAsyncTransport]] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, provider: str) -> LLMProviderLimiter:
+        with self._lock:
+            limiter = self._limiters.get(provider)
+            if limiter is None:
+                limiter = self._limiters[provider] = LLMProviderLimiter(
+                    provider,
+                    max_concurrent_requests=self.configuration.max_concurrent_requests,
+                    tokens_per_minute=self.configuration.tokens_per_minute,
+                    max_concurrent_research_requests=self.configuration.research_max_concurrent_requests,
+                )
+                logger.verbose(
+                    "LLM gateway limiter for %s: max_concurrent_requests=%s, tokens_per_minute=%s, "
+                    "research_max_concurrent_requests=%s",
+                    provider,
+                    self.configuration.max_concurrent_requests,
+                    self.configuration.tokens_per_minute,
+                    self.configuration.research_max_concurrent_requests,
+                )
+            return limiter
+
+    def transports(
+        self,
+        provider: str,
+        *,
+        expected_output_tokens: int | None = None,
+    ) -> tuple[GatedTransport, GatedAsyncTransport]:
+        """Return (sync, async) transports gated by the provider limiter over the shared pool."""
+        if expected_output_tokens is None:
+            expected_output_tokens = self.configuration.expected_output_tokens
+
+        limiter = self.limiter(provider)
+        sync_pool, async_pool = self._pool(provider)
+        return (
+            GatedTransport(sync_pool, limiter, expected_output_tokens=expected_output_tokens),
+            GatedAsyncTransport(async_pool, limiter, expected_output_tokens=expected_output_tokens),
+        )
+
+    def _pool(self, provider: str) -> tuple[httpx.HTTPTransport, PerLoopAsyncTransport]:
+        with self._lock:
+            pool = self._pools.get(provider)
+            if pool is None:
+                limits = httpx.Limits(
+                    max_connections=self.configuration.max_connections,
+                    max_keepalive_connections=self.configuration.max_keepalive_connections,
+                    keepalive_expiry=self.configuration.keepalive_expiry_s,
+                )
+                pool = self._pools[provider] = (
+                    httpx.HTTPTransport(limits=limits),
+                    PerLoopAsyncTransport(limits),
+                )
+            return pool
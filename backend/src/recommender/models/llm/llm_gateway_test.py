@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import unittest
+
+import httpx
+
+from recommender.models.llm.llm_config import LLMGatewayConfig
+from recommender.models.llm.llm_gateway import GatedAsyncTransport
+from recommender.models.llm.llm_gateway import LLMGateway
+from recommender.models.llm.llm_gateway import LLMProviderLimiter
+from recommender.models.llm.llm_gateway import PerLoopAsyncTransport
+from recommender.models.llm.llm_gateway import TokenBucket
+from utils.metrics import MetricsRegistry
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_reservations_beyond_the_budget_wait_for_the_refill(self) -> None:
+        bucket = TokenBucket(tokens_per_minute=6000)
+
+        self.assertEqual(bucket.reserve(6000), 0.0)
+        self.assertAlmostEqual(bucket.reserve(100), 1.0, delta=0.05)
+        self.assertAlmostEqual(bucket.reserve(100), 2.0, delta=0.05)
+
+
+class TestLLMProviderLimiter(unittest.TestCase):
+    def setUp(self) -> None:
+        MetricsRegistry().reset()
+
+    def test_caps_concurrent_requests_and_records_queue_wait(self) -> None:
+        limiter = LLMProviderLimiter("ollama", max_concurrent_requests=2)
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def call() -> None:
+            nonlocal in_flight, peak_in_flight
+            async with limiter.acquire(estimated_tokens=10):
+                in_flight += 1
+                peak_in_flight = max(peak_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        async def run() -> None:
+            await asyncio.gather(*(call() for _ in range(6)))
+
+        asyncio.run(run())
+
+        metrics = MetricsRegistry()
+        self.assertEqual(peak_in_flight, 2)
+        self.assertEqual(limiter.slots.in_use, 0)
+        self.assertEqual(metrics.counter("llm_gateway_requests_total", provider="ollama"), 6)
+        self.assertEqual(metrics.counter("llm_gateway_estimated_tokens_total", provider="ollama"), 60)
+        self.assertEqual(metrics.histogram("llm_gateway_queue_wait_seconds", provider="ollama").count, 6)
+        self.assertEqual(metrics.gauge("llm_gateway_in_flight_requests", provider="ollama"), 0)
+
+    def test_slots_are_shared_across_event_loops_in_threads(self) -> None:
+        limiter = LLMProviderLimiter("ollama", max_concurrent_requests=1)
+        in_flight = 0
+        peak_in_flight = 0
+        lock = threading.Lock()
+
+        async def call() -> None:
+            nonlocal in_flight, peak_in_flight
+            async with limiter.acquire():
+                with lock:
+                    in_flight += 1
+                    peak_in_flight = max(peak_in_flight, in_flight)
+                await asyncio.sleep(0.02)
+                with lock:
+                    in_flight -= 1
+
+        threads = [threading.Thread(target=asyncio.run, args=(call(),)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(peak_in_flight, 1)
+        self.assertEqual(limiter.slots.in_use, 0)
+
+    def test_research_holds_provider_slots_only_within_its_sub_cap(self) -> None:
+        limiter = LLMProviderLimiter("ollama", max_concurrent_requests=3, max_concurrent_research_requests=1)
+        peak_slots_in_use = 0
+        structured_call_waited = False
+
+        async def research() -> None:
+            nonlocal peak_slots_in_use
+            async with limiter.acquire_research(estimated_tokens=100):
+                peak_slots_in_use = max(peak_slots_in_use, limiter.slots.in_use)
+                await asyncio.sleep(0.02)
+
+        async def structured_call() -> None:
+            nonlocal structured_call_waited
+            started_at = asyncio.get_running_loop().time()
+            async with limiter.acquire():
+                structured_call_waited = asyncio.get_running_loop().time() - started_at > 0.01
+
+        async def run() -> None:
+            research_calls = [asyncio.create_task(research()) for _ in range(4)]
+            await asyncio.sleep(0)
+            await structured_call()
+            await asyncio.gather(*research_calls)
+
+        asyncio.run(run())
+
+        self.assertEqual(peak_slots_in_use, 1)
+        self.assertFalse(structured_call_waited)
+        self.assertEqual(limiter.slots.in_use, 0)
+        self.assertEqual(limiter.research_slots.in_use, 0)
+
+    def test_cancelled_waiter_does_not_leak_a_slot(self) -> None:
+        limiter = LLMProviderLimiter("ollama", max_concurrent_requests=1)
+
+        async def run() -> None:
+            async with limiter.acquire():
+                waiter = asyncio.create_task(limiter.acquire_slot())
+                await asyncio.sleep(0)
+                waiter.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await waiter
+
+            async with limiter.acquire():
+                pass
+
+        asyncio.run(run())
+
+        self.assertEqual(limiter.slots.in_use, 0)
+
+
+class TestLLMGateway(unittest.TestCase):
+    def setUp(self) -> None:
+        MetricsRegistry().reset()
+
+    def test_limiter_and_pool_are_shared_per_provider(self) -> None:
+        gateway = LLMGateway(LLMGatewayConfig(max_concurrent_requests=3, tokens_per_minute=None))
+
+        self.assertIs(gateway.limiter("ollama"), gateway.limiter("ollama"))
+        self.assertIsNot(gateway.limiter("ollama"), gateway.limiter("chatgpt"))
+        self.assertEqual(gateway.limiter("ollama").slots.limit, 3)
+        self.assertIsNone(gateway.limiter("ollama").token_bucket)
+
+    def test_async_pool_is_kept_per_event_loop(self) -> None:
+        transport = PerLoopAsyncTransport(httpx.Limits(max_connections=2))
+
+        async def current_pool() -> httpx.AsyncHTTPTransport:
+            return transport._current_transport()
+
+        first_pool = asyncio.run(current_pool())
+        second_pool = asyncio.run(current_pool())
+
+        self.assertIsNot(first_pool, second_pool)
+        self.assertEqual(list(transport._transports.values()), [second_pool])
+
+    def test_gated_transport_holds_the_slot_until_the_response_is_closed(self) -> None:
+        limiter = LLMProviderLimiter("chatgpt", max_concurrent_requests=1)
+        slots_in_use_during_request: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            slots_in_use_during_request.append(limiter.slots.in_use)
+            return httpx.Response(429 if request.url.path == "/limited" else 200, json={"ok": True})
+
+        transport = GatedAsyncTransport(
+            httpx.MockTransport(handler),
+            limiter,
+            expected_output_tokens=100,
+        )
+
+        async def run() -> None:
+            async with httpx.AsyncClient(transport=transport, base_url="http://llm") as client:
+                async with client.stream("POST", "/chat", content=b"x" * 400) as response:
+                    self.assertEqual(limiter.slots.in_use, 1)
+                    await response.aread()
+                self.assertEqual(limiter.slots.in_use, 0)
+
+                await client.post("/limited", content=b"{}")
+
+        asyncio.run(run())
+
+        metrics = MetricsRegistry()
+        self.assertEqual(slots_in_use_during_request, [1, 1])
+        self.assertEqual(limiter.slots.in_use, 0)
+        self.assertEqual(metrics.counter("llm_gateway_estimated_tokens_total", provider="chatgpt"), 300)
+        self.assertEqual(metrics.counter("llm_gateway_rate_limited_responses_total", provider="chatgpt"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from langchain_core.runnables import Runnable
+from langchain_core.runnables import RunnableConfig
+
+from recommender.models.llm.llm_config import LLMHedgingConfig
+from utils.logger import LoggerManager
+from utils.metrics import MetricsRegistry
+
+logger = LoggerManager.get_logger(__name__)
+metrics = MetricsRegistry()
+
+ResultT = TypeVar("ResultT")
+
+TRACKED_LATENCY_QUANTILES: tuple[float, ...] = (0.5, 0.95, 0.99)
+
+
+class FallbackAnswerTracker:
+    """Records whether any hedged call made inside `track_fallback_answers` was answered by the fallback."""
+
+    def __init__(self) -> None:
+        self.answered_by_fallback = False
+
+
+_fallback_answer_tracker: ContextVar[FallbackAnswerTracker | None] = ContextVar(
+    "_fallback_answer_tracker",
+    default=None,
+)
+
+
+@contextlib.contextmanager
+def track_fallback_answers() -> Iterator[FallbackAnswerTracker]:
+    """Track the hedged calls of the block, e.g. so a fallback answer is not cached under the primary's key."""
+    tracker = FallbackAnswerTracker()
+    token = _fallback_answer_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _fallback_answer_tracker.reset(token)
+
+
+def _mark_fallback_answer() -> None:
+    tracker = _fallback_answer_tracker.get()
+    if tracker is not None:
+        tracker.answered_by_fallback = True
+
+
+class LatencyWindow:
+    """Sliding window of recent call latencies with nearest-rank percentiles."""
+
+    def __init__(self, max_samples: int) -> None:
+        if max_samples < 1:
+            raise ValueError("max_samples must be at least 1")
+        self._samples: deque[float] = deque(maxlen=max_samples)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, latency_s: float) -> None:
+        self._samples.append(latency_s)
+
+    def percentile(self, quantile: float) -> float | None:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(quantile * len(ordered)))
+        return ordered[rank - 1]
+
+
+class CircuitBreaker:
+    """Error-rate circuit breaker over the primary model's most recent calls.
+
+    `closed` lets every call through. `open` rejects calls until `open_duration_s` has passed, then
+    `half_open` lets a single probe through: its success closes the breaker, its failure reopens it.
+    """
+
+    def __init__(
+        self,
+        *,
+        window_size: int,
+        min_calls: int,
+        error_rate_threshold: float,
+        open_duration_s: float,
+    ) -> None:
+        self.state = "closed"
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._min_calls = min_calls
+        self._error_rate_threshold = error_rate_threshold
+        self._open_duration_s = open_duration_s
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def allow(self) -> bool:
+        if self.state == "closed":
+            return True
+        if self.state == "open":
+            if time.monotonic() - self._opened_at < self._open_duration_s:
+                return False
+            self.state = "half_open"
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def record(self, success: bool) -> None:
+        if self.state == "half_open":
+            self._probe_in_flight = False
+            if success:
+                self.state = "closed"
+                self._outcomes.clear()
+            else:
+                self._open()
+            return
+
+        self._outcomes.append(success)
+        failures = self._outcomes.count(False)
+        if (
+            self.state == "closed"
+            and len(self._outcomes) >= self._min_calls
+            and failures / len(self._outcomes) >= self._error_rate_threshold
+        ):
+            self._open()
+
+    def release_probe(self) -> None:
+        """Give the probe back without an outcome, e.g. after it lost a hedge race."""
+        self._probe_in_flight = False
+
+    def _open(self) -> None:
+        self.state = "open"
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+
+class HedgingPolicy:
+    """Per-agent latency percentiles, hedge delay and circuit breaker for the primary model."""
+
+    def __init__(self, agent_name: str, configuration: LLMHedgingConfig) -> None:
+        self.agent_name = agent_name
+        self.configuration = configuration
+        self._latencies = LatencyWindow(configuration.latency_window_size)
+        self._breaker = CircuitBreaker(
+            window_size=configuration.breaker_window_size,
+            min_calls=configuration.breaker_min_calls,
+            error_rate_threshold=configuration.breaker_error_rate_threshold,
+            open_duration_s=configuration.breaker_open_duration_s,
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def breaker_state(self) -> str:
+        return self._breaker.state
+
+    def percentile(self, quantile: float) -> float | None:
+        with self._lock:
+            return self._latencies.percentile(quantile)
+
+    def hedge_delay_s(self) -> float:
+        """Seconds to wait for the primary before sending the hedge request."""
+        with self._lock:
+            if len(self._latencies) < self.configuration.min_latency_samples:
+                return self.configuration.initial_hedge_delay_s
+            threshold_s = self._latencies.percentile(self.configuration.hedge_percentile) or 0.0
+        return min(self.configuration.max_hedge_delay_s, max(self.configuration.min_hedge_delay_s, threshold_s))
+
+    def allow_primary(self) -> bool:
+        with self._lock:
+            previous_state = self._breaker.state
+            allowed = self._breaker.allow()
+            self._record_breaker_transition(previous_state)
+        return allowed
+
+    def record_primary(self, latency_s: float, *, success: bool | None) -> None:
+        """Record one primary call; `success=None` marks a call abandoned after losing a hedge race.
+
+        Abandoned calls still add their elapsed time, a lower bound of their latency, so slow
+        tails keep showing in the percentiles instead of being hidden by the hedge.
+        """
+        with self._lock:
+            self._latencies.add(latency_s)
+            previous_state = self._breaker.state
+            if success is None:
+                self._breaker.release_probe()
+            else:
+                self._breaker.record(success)
+            self._record_breaker_transition(previous_state)
+            quantiles = {quantile: self._latencies.percentile(quantile) for quantile in TRACKED_LATENCY_QUANTILES}
+
+        for quantile, value in quantiles.items():
+            if value is not None:
+                metrics.set_gauge(
+                    "llm_agent_latency_quantile_seconds",
+                    value,
+                    agent=self.agent_name,
+                    quantile=quantile,
+                )
+
+    def _record_breaker_transition(self, previous_state: str) -> None:
+        state = self._breaker.state
+        if state == previous_state:
+            return
+        metrics.increment("llm_circuit_breaker_transitions_total", agent=self.agent_name, state=state)
+        metrics.set_gauge("llm_circuit_breaker_open", 1.0 if state == "open" else 0.0, agent=self.agent_name)
+        logger.warning("LLM circuit breaker for %s is now %s", self.agent_name, state)
+
+
+def _succeeded(task: asyncio.Future[Any]) -> bool:
+    return not task.cancelled() and task.exception() is None
+
+
+class HedgedRunnable(Runnable[Any, Any]):
+    """Runs a primary runnable with a hedged duplicate on a fallback once it is slower than usual.
+
+    Async calls hedge: after `HedgingPolicy.hedge_delay_s` the fallback is started too and the
+    first successful answer wins; the loser is cancelled. A failed primary falls back directly,
+    and an open circuit breaker skips the primary altogether. Streams hedge on the first chunk.
+    Synchronous calls cannot cancel a losing call, so they only fall back, without hedging.
+    """
+
+    def __init__(self, primary: Runnable, fallback: Runnable, policy: HedgingPolicy) -> None:
+        self.primary = primary
+        self.fallback = fallback
+        self.policy = policy
+
+    def invoke(self, input: Any, config: RunnableConfig | None = None, **kwargs: Any) -> Any:
+        if not self.policy.allow_primary():
+            self._count_fallback("circuit_open")
+            return self._invoke_fallback(input, config, **kwargs)
+
+        started_at = time.perf_counter()
+        try:
+            result = self.primary.invoke(input, config, **kwargs)
+        except Exception as error:
+            self.policy.record_primary(time.perf_counter() - started_at, success=False)
+            self._count_fallback("primary_error")
+            logger.warning("Primary LLM for %s failed, using fallback: %s", self.policy.agent_name, error)
+            return self._invoke_fallback(input, config, **kwargs)
+
+        self.policy.record_primary(time.perf_counter() - started_at, success=True)
+        return result
+
+    async def ainvoke(self, input: Any, config: RunnableConfig | None = None, **kwargs: Any) -> Any:
+        return await self._arace(
+            lambda: self.primary.ainvoke(input, config, **kwargs),
+            lambda: self.fallback.ainvoke(input, config, **kwargs),
+        )
+
+    async def astream(
+        self,
+        input: Any,
+        config: RunnableConfig | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        first_chunk, stream = await self._arace(
+            lambda: _open_stream(self.primary.astream(input, config, **kwargs)),
+            lambda: _open_stream(self.fallback.astream(input, config, **kwargs)),
+            discard=_close_opened_stream,
+        )
+        try:
+            if first_chunk is not _EMPTY_STREAM:
+                yield first_chunk
+            async for chunk in stream:
+                yield chunk
+        finally:
+            await stream.aclose()
+
+    async def _arace(
+        self,
+        call_primary: Callable[[], Awaitable[ResultT]],
+        call_fallback: Callable[[], Awaitable[ResultT]],
+        *,
+        discard: Callable[[ResultT], Awaitable[None]] | None = None,
+    ) -> ResultT:
+        if not self.policy.allow_primary():
+            self._count_fallback("circuit_open")
+            _mark_fallback_answer()
+            return await call_fallback()
+
+        started_at = time.perf_counter()
+        primary = asyncio.ensure_future(call_primary())
+        hedge: asyncio.Future[ResultT] | None = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self.policy.hedge_delay_s())
+            if primary in done:
+                self.policy.record_primary(time.perf_counter() - started_at, success=_succeeded(primary))
+                if _succeeded(primary):
+                    return primary.result()
+                self._count_fallback("primary_error")
+                logger.warning(
+                    "Primary LLM for %s failed, using fallback: %s",
+                    self.policy.agent_name,
+                    primary.exception(),
+                )
+                _mark_fallback_answer()
+                return await call_fallback()
+
+            metrics.increment("llm_hedged_calls_total", agent=self.policy.agent_name)
+            logger.verbose("Hedging slow LLM call for %s on the fallback model", self.policy.agent_name)
+            hedge = asyncio.ensure_future(call_fallback())
+            pending: set[asyncio.Future[ResultT]] = {primary, hedge}
+            winner: asyncio.Future[ResultT] | None = None
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if primary in done:
+                    self.policy.record_primary(time.perf_counter() - started_at, success=_succeeded(primary))
+                winner = next((task for task in (primary, hedge) if task in done and _succeeded(task)), None)
+
+            if winner is None:
+                raise hedge.exception() or primary.exception()
+
+            metrics.increment(
+                "llm_hedge_wins_total",
+                agent=self.policy.agent_name,
+                winner="primary" if winner is primary else "fallback",
+            )
+            if winner is hedge:
+                _mark_fallback_answer()
+            loser = hedge if winner is primary else primary
+            if discard is not None and loser.done() and _succeeded(loser):
+                await discard(loser.result())
+            return winner.result()
+        finally:
+            if not primary.done():
+                primary.cancel()
+                self.policy.record_primary(time.perf_counter() - started_at, success=None)
+            if hedge is not None and not hedge.done():
+                hedge.cancel()
+
+    def _invoke_fallback(self, input: Any, config: RunnableConfig | None, **kwargs: Any) -> Any:
+        _mark_fallback_answer()
+        return self.fallback.invoke(input, config, **kwargs)
+
+    def _count_fallback(self, reason: str) -> None:
+        metrics.increment("llm_fallback_calls_total", agent=self.policy.agent_name, reason=reason)
+
+
+class HedgedChatModel(HedgedRunnable):
+    """Chat-model facade over `HedgedRunnable` for the agents.
+
+    Derived runnables (`with_structured_output`, `bind`) are hedged with the same policy, and
+    other attributes, e.g. the model name used for cache keys, are read from the primary, so
+    answers of the fallback are reported through `track_fallback_answers` instead.
+    """
+
+    def with_structured_output(self, schema: Any, **kwargs: Any) -> HedgedRunnable:
+        return HedgedRunnable(
+            self.primary.with_structured_output(schema, **kwargs),
+            self.fallback.with_structured_output(schema, **kwargs),
+            self.policy,
+        )
+
+    def bind(self, **kwargs: Any) -> HedgedChatModel:
+        return HedgedChatModel(self.primary.bind(**kwargs), self.fallback.bind(**kwargs), self.policy)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in {"primary", "fallback", "policy"}:
+            raise AttributeError(name)
+        return getattr(self.primary, name)
+
+
+_EMPTY_STREAM = object()
+
+
+async def _open_stream(stream: AsyncIterator[Any]) -> tuple[Any, AsyncIterator[Any]]:
+    """Wait for the first chunk of `stream`, so a stream counts as answered once it produces output."""
+    try:
+        first_chunk = await anext(stream)
+    except StopAsyncIteration:
+        return _EMPTY_STREAM, stream
+    except BaseException:
+        await stream.aclose()
+        raise
+    return first_chunk, stream
+
+
+async def _close_opened_stream(opened: tuple[Any, AsyncIterator[Any]]) -> None:
+    await opened[1].aclose()
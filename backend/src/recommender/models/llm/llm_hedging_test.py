@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from collections.abc import AsyncIterator
+from typing import Any
+
+from recommender.models.llm.llm_config import LLMHedgingConfig
+from recommender.models.llm.llm_hedging import HedgedChatModel
+from recommender.models.llm.llm_hedging import HedgingPolicy
+from recommender.models.llm.llm_hedging import LatencyWindow
+from utils.metrics import MetricsRegistry
+
+
+class _FakeModel:
+    def __init__(self, name: str, *, delay_s: float = 0.0, fails: bool = False) -> None:
+        self.model = name
+        self.delay_s = delay_s
+        self.fails = fails
+        self.calls = 0
+        self.cancelled = 0
+
+    async def ainvoke(self, _input: Any, _config: Any = None) -> str:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay_s)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fails:
+            raise RuntimeError(f"{self.model} failed")
+        return self.model
+
+    def invoke(self, _input: Any, _config: Any = None) -> str:
+        self.calls += 1
+        if self.fails:
+            raise RuntimeError(f"{self.model} failed")
+        return self.model
+
+    async def astream(self, _input: Any, _config: Any = None) -> AsyncIterator[str]:
+        self.calls += 1
+        await asyncio.sleep(self.delay_s)
+        for chunk in (f"{self.model}-1", f"{self.model}-2"):
+            yield chunk
+
+    def with_structured_output(self, _schema: Any) -> _FakeModel:
+        return self
+
+
+def _hedging_config(**overrides: Any) -> LLMHedgingConfig:
+    values: dict[str, Any] = {
+        "initial_hedge_delay_s": 0.05,
+        "min_hedge_delay_s": 0.01,
+        "max_hedge_delay_s": 1.0,
+        "min_latency_samples": 3,
+        "breaker_window_size": 4,
+        "breaker_min_calls": 2,
+        "breaker_error_rate_threshold": 0.5,
+        "breaker_open_duration_s": 60.0,
+    }
+    values.update(overrides)
+    return LLMHedgingConfig(_env_file=None, **values)
+
+
+def _hedged(primary: _FakeModel, fallback: _FakeModel, **overrides: Any) -> HedgedChatModel:
+    return HedgedChatModel(primary, fallback, HedgingPolicy("request_routing", _hedging_config(**overrides)))
+
+
+class TestLatencyWindow(unittest.TestCase):
+    def test_percentiles_use_the_nearest_rank(self) -> None:
+        window = LatencyWindow(max_samples=100)
+        for latency_s in range(1, 101):
+            window.add(float(latency_s))
+
+        self.assertEqual(window.percentile(0.5), 50.0)
+        self.assertEqual(window.percentile(0.95), 95.0)
+        self.assertEqual(window.percentile(0.99), 99.0)
+
+
+class TestHedgedChatModel(unittest.TestCase):
+    def setUp(self) -> None:
+        MetricsRegistry().reset()
+
+    def test_fast_primary_is_not_hedged_and_tracks_quantiles(self) -> None:
+        primary = _FakeModel("primary")
+        fallback = _FakeModel("fallback")
+        llm = _hedged(primary, fallback)
+
+        result = asyncio.run(llm.with_structured_output(object).ainvoke("route"))
+
+        self.assertEqual(result, "primary")
+        self.assertEqual(fallback.calls, 0)
+        self.assertEqual(llm.model, "primary")
+        self.assertGreaterEqual(
+            MetricsRegistry().gauge("llm_agent_latency_quantile_seconds", agent="request_routing", quantile=0.99),
+            0.0,
+        )
+        self.assertEqual(MetricsRegistry().counter("llm_hedged_calls_total", agent="request_routing"), 0)
+
+    def test_slow_primary_is_hedged_and_the_loser_cancelled(self) -> None:
+        primary = _FakeModel("primary", delay_s=5.0)
+        fallback = _FakeModel("fallback")
+        llm = _hedged(primary, fallback)
+
+        result = asyncio.run(llm.ainvoke("route"))
+
+        metrics = MetricsRegistry()
+        self.assertEqual(result, "fallback")
+        self.assertEqual(primary.cancelled, 1)
+        self.assertEqual(metrics.counter("llm_hedged_calls_total", agent="request_routing"), 1)
+        self.assertEqual(
+            metrics.counter("llm_hedge_wins_total", agent="request_routing", winner="fallback"),
+            1,
+        )
+        self.assertGreaterEqual(llm.policy.percentile(0.5), 0.05)
+
+    def test_hedge_delay_follows_the_latency_percentile(self) -> None:
+        policy = HedgingPolicy("request_routing", _hedging_config(hedge_percentile=0.95))
+        self.assertEqual(policy.hedge_delay_s(), 0.05)
+
+        for latency_s in (0.2, 0.3, 0.4):
+            policy.record_primary(latency_s, success=True)
+        self.assertEqual(policy.hedge_delay_s(), 0.4)
+
+        policy.record_primary(30.0, success=True)
+        self.assertEqual(policy.hedge_delay_s(), 1.0)
+
+    def test_failed_primary_falls_back_and_opens_the_breaker(self) -> None:
+        primary = _FakeModel("primary", fails=True)
+        fallback = _FakeModel("fallback")
+        llm = _hedged(primary, fallback)
+
+        async def run() -> list[str]:
+            return [await llm.ainvoke("route") for _ in range(4)]
+
+        results = asyncio.run(run())
+
+        metrics = MetricsRegistry()
+        self.assertEqual(results, ["fallback"] * 4)
+        self.assertEqual(primary.calls, 2)
+        self.assertEqual(llm.policy.breaker_state, "open")
+        self.assertEqual(metrics.counter("llm_fallback_calls_total", agent="request_routing", reason="primary_error"), 2)
+        self.assertEqual(metrics.counter("llm_fallback_calls_total", agent="request_routing", reason="circuit_open"), 2)
+        self.assertEqual(metrics.gauge("llm_circuit_breaker_open", agent="request_routing"), 1.0)
+
+    def test_half_open_probe_success_closes_the_breaker(self) -> None:
+        primary = _FakeModel("primary", fails=True)
+        fallback = _FakeModel("fallback")
+        llm = _hedged(primary, fallback, breaker_open_duration_s=0.01)
+
+        self.assertEqual([llm.invoke("route") for _ in range(2)], ["fallback", "fallback"])
+        self.assertEqual(llm.policy.breaker_state, "open")
+
+        asyncio.run(asyncio.sleep(0.02))
+        primary.fails = False
+
+        self.assertEqual(llm.invoke("route"), "primary")
+        self.assertEqual(llm.policy.breaker_state, "closed")
+
+    def test_stream_is_hedged_on_the_first_chunk(self) -> None:
+        primary = _FakeModel("primary", delay_s=5.0)
+        fallback = _FakeModel("fallback")
+        llm = _hedged(primary, fallback)
+
+        async def run() -> list[str]:
+            return [chunk async for chunk in llm.astream("respond")]
+
+        chunks = asyncio.run(run())
+
+        self.assertEqual(chunks, ["fallback-1", "fallback-2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
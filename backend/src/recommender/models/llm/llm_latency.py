@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from utils.metrics import MetricsRegistry
+
+metrics = MetricsRegistry()
+
+
+def record_llm_agent_latency(agent_name: str, model_name: str, elapsed_s: float, *, outcome: str) -> None:
+    """Record one LLM call of an agent in `llm_agent_latency_seconds{agent,model,outcome}`."""
+    metrics.observe(
+        "llm_agent_latency_seconds",
+        elapsed_s,
+        agent=agent_name,
+        model=model_name,
+        outcome=outcome,
+    )
+
+
+class LLMAgentLatencyCallbackHandler(BaseCallbackHandler):
+    """Times every call of the chat model it is attached to, labelled with the owning agent.
+
+    Cache hits never reach the model and are therefore not recorded.
+    """
+
+    run_inline = True
+
+    def __init__(self, agent_name: str, model_name: str) -> None:
+        self.agent_name = agent_name
+        self.model_name = model_name
+        self._started_at: dict[UUID, float] = {}
+        self._lock = threading.Lock()
+
+    def on_chat_model_start(self, serialized: dict[str, Any], messages: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            self._started_at[run_id] = time.perf_counter()
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._record(run_id, outcome="success")
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._record(run_id, outcome="error")
+
+    def _record(self, run_id: UUID, *, outcome: str) -> None:
+        with self._lock:
+            started_at = self._started_at.pop(run_id, None)
+        if started_at is None:
+            return
+        record_llm_agent_latency(
+            self.agent_name,
+            self.model_name,
+            time.perf_counter() - started_at,
+            outcome=outcome,
+        )
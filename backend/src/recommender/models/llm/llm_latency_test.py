@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from langchain_core.language_models import FakeListChatModel
+
+from recommender.models.llm.llm_latency import LLMAgentLatencyCallbackHandler
+from utils.metrics import MetricsRegistry
+
+
+class TestLLMAgentLatencyCallbackHandler(unittest.TestCase):
+    def setUp(self) -> None:
+        MetricsRegistry().reset()
+
+    def test_records_sync_and_async_calls_per_agent(self) -> None:
+        llm = FakeListChatModel(responses=["a", "b", "c"])
+        llm.callbacks = [LLMAgentLatencyCallbackHandler("request_routing", "llama3.2:3b")]
+
+        llm.invoke("route this")
+        asyncio.run(llm.ainvoke("route this too"))
+
+        histogram = MetricsRegistry().histogram(
+            "llm_agent_latency_seconds",
+            agent="request_routing",
+            model="llama3.2:3b",
+            outcome="success",
+        )
+        self.assertEqual(histogram.count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
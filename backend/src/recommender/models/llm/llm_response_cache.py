@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from collections.abc import Sequence
+from typing import Any, Protocol, TypeVar
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import Runnable
+from pydantic import BaseModel
+
+from recommender.models.llm.llm_config import LLMCacheConfig
+from recommender.models.llm.llm_hedging import track_fallback_answers
+from utils.logger import LoggerManager
+from utils.metrics import MetricsRegistry
+from utils.ttl_cache import TTLCache
+
+logger = LoggerManager.get_logger(__name__)
+metrics = MetricsRegistry()
+
+OutputT = TypeVar("OutputT", bound=BaseModel)
+
+
+class LLMResponseCacheBackendProtocol(Protocol):
+    """Contract for a persistent structured-response cache keyed by the request hash."""
+
+    def get(self, cache_key: str) -> dict[str, Any] | None:
+        """Return the cached response payload if present and not expired."""
+        ...
+
+    def put(self, cache_key: str, agent_name: str, response: dict[str, Any], ttl_s: float) -> None:
+        """Store one response payload for `ttl_s` seconds."""
+        ...
+
+
+def describe_chat_model(llm: BaseChatModel) -> tuple[str, float | None]:
+    """Return the (model name, temperature) of a chat model for cache keying.
+
+    A hedged chat model is described by its primary; see `_cache_output` for fallback answers.
+    """
+    model_name = getattr(llm, "model_name", None) or getattr(llm, "model", None) or type(llm).__name__
+    temperature = getattr(llm, "temperature", None)
+    return str(model_name), float(temperature) if temperature is not None else None
+
+
+def build_llm_response_cache_key(
+    *,
+    agent_name: str,
+    model_name: str,
+    temperature: float | None,
+    messages: Sequence[BaseMessage],
+) -> str:
+    """Return the sha256 hex digest identifying one structured-output request."""
+    payload = {
+        "agent": agent_name,
+        "model": model_name,
+        "temperature": temperature,
+        "messages": [{"type": message.type, "content": message.content} for message in messages],
+    }
+    serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Two-tier cache for structured LLM responses: in-process LRU, then an optional persistent backend.
+
+    Persistent-cache failures are logged and treated as misses so caching never breaks a chat turn.
+    """
+
+    def __init__(
+        self,
+        configuration: LLMCacheConfig,
+        *,
+        persistent_cache: LLMResponseCacheBackendProtocol | None = None,
+    ) -> None:
+        if configuration is None:
+            raise ValueError("configuration is required")
+
+        self.configuration = configuration
+        self.persistent_cache = persistent_cache
+        self._entries: TTLCache[str, dict[str, Any]] = TTLCache(
+            max_entries=configuration.max_entries,
+            ttl_s=configuration.ttl_s,
+        )
+
+    def attach_persistent_cache(self, persistent_cache: LLMResponseCacheBackendProtocol | None) -> None:
+        self.persistent_cache = persistent_cache
+
+    def is_enabled_for(self, agent_name: str) -> bool:
+        return self.configuration.is_agent_enabled(agent_name)
+
+    def get(self, agent_name: str, cache_key: str) -> dict[str, Any] | None:
+        response = self._entries.get(cache_key)
+        if response is not None:
+            metrics.increment("llm_response_cache_requests_total", agent=agent_name, result="memory_hit")
+            return dict(response)
+
+        response = self._get_from_persistent_cache(cache_key)
+        if response is not None:
+            metrics.increment("llm_response_cache_requests_total", agent=agent_name, result="persistent_hit")
+            self._entries.put(cache_key, dict(response))
+            return dict(response)
+
+        metrics.increment("llm_response_cache_requests_total", agent=agent_name, result="miss")
+        return None
+
+    def put(self, agent_name: str, cache_key: str, response: dict[str, Any]) -> None:
+        self._entries.put(cache_key, dict(response))
+        if self.persistent_cache is None:
+            return
+        try:
+            self.persistent_cache.put(cache_key, agent_name, response, self.configuration.persistent_ttl_s)
+        except Exception as error:
+            logger.warning("Persistent LLM response cache write failed: %s", error)
+            metrics.increment("llm_response_cache_errors_total", operation="put")
+
+    async def aget(self, agent_name: str, cache_key: str) -> dict[str, Any] | None:
+        """Async variant of `get`; the persistent lookup runs on a worker thread."""
+        if self.persistent_cache is None or self._entries.get(cache_key) is not None:
+            return self.get(agent_name, cache_key)
+        return await asyncio.to_thread(self.get, agent_name, cache_key)
+
+    async def aput(self, agent_name: str, cache_key: str, response: dict[str, Any]) -> None:
+        """Async variant of `put`; the persistent write runs on a worker thread."""
+        if self.persistent_cache is None:
+            self.put(agent_name, cache_key, response)
+            return
+        await asyncio.to_thread(self.put, agent_name, cache_key, response)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _get_from_persistent_cache(self, cache_key: str) -> dict[str, Any] | None:
+        if self.persistent_cache is None:
+            return None
+        try:
+            return self.persistent_cache.get(cache_key)
+        except Exception as error:
+            logger.warning("Persistent LLM response cache lookup failed: %s", error)
+            metrics.increment("llm_response_cache_errors_total", operation="get")
+            return None
+
+
+def _resolve_cache_key(
+    messages: Sequence[BaseMessage],
+    *,
+    agent_name: str,
+    llm: BaseChatModel,
+) -> str:
+    model_name, temperature = describe_chat_model(llm)
+    return build_llm_response_cache_key(
+        agent_name=agent_name,
+        model_name=model_name,
+        temperature=temperature,
+        messages=messages,
+    )
+
+
+def _cache_output(agent_name: str, *, answered_by_fallback: bool) -> bool:
+    """Whether to cache a fresh answer; the key describes the primary model, so fallback answers are skipped."""
+    if not answered_by_fallback:
+        return True
+    metrics.increment("llm_response_cache_skipped_total", agent=agent_name, reason="fallback_answer")
+    return False
+
+
+def invoke_structured_output(
+    structured_output_llm: Runnable,
+    messages: Sequence[BaseMessage],
+    *,
+    output_type: type[OutputT],
+    agent_name: str,
+    llm: BaseChatModel,
+    response_cache: LLMResponseCache | None,
+) -> OutputT:
+    """Invoke a structured-output runnable, serving identical requests from the response cache."""
+    if response_cache is None or not response_cache.is_enabled_for(agent_name):
+        return output_type.model_validate(structured_output_llm.invoke(list(messages)))
+
+    cache_key = _resolve_cache_key(messages, agent_name=agent_name, llm=llm)
+    cached_response = response_cache.get(agent_name, cache_key)
+    if cached_response is not None:
+        logger.verbose("Serving %s structured LLM result from cache", agent_name)
+        return output_type.model_validate(cached_response)
+
+    with track_fallback_answers() as fallback_answers:
+        output = output_type.model_validate(structured_output_llm.invoke(list(messages)))
+    if _cache_output(agent_name, answered_by_fallback=fallback_answers.answered_by_fallback):
+        response_cache.put(agent_name, cache_key, output.model_dump(mode="json"))
+    return output
+
+
+async def ainvoke_structured_output(
+    structured_output_llm: Runnable,
+    messages: Sequence[BaseMessage],
+    *,
+    output_type: type[OutputT],
+    agent_name: str,
+    llm: BaseChatModel,
+    response_cache: LLMResponseCache | None,
+) -> OutputT:
+    """Async variant of `invoke_structured_output`."""
+    if response_cache is None or not response_cache.is_enabled_for(agent_name):
+        return output_type.model_validate(await structured_output_llm.ainvoke(list(messages)))
+
+    cache_key = _resolve_cache_key(messages, agent_name=agent_name, llm=llm)
+    cached_response = await response_cache.aget(agent_name, cache_key)
+    if cached_response is not None:
+        logger.verbose("Serving %s structured LLM result from cache", agent_name)
+        return output_type.model_validate(cached_response)
+
+    with track_fallback_answers() as fallback_answers:
+        output = output_type.model_validate(await structured_output_llm.ainvoke(list(messages)))
+    if _cache_output(agent_name, answered_by_fallback=fallback_answers.answered_by_fallback):
+        await response_cache.aput(agent_name, cache_key, output.model_dump(mode="json"))
+    return output
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from typing import Any
+
+from langchain_core.messages import HumanMessage
+from langchain_core.messages import SystemMessage
+from pydantic import BaseModel
+
+from recommender.models.llm.llm_config import LLMCacheConfig
+from recommender.models.llm.llm_config import LLMHedgingConfig
+from recommender.models.llm.llm_hedging import HedgedChatModel
+from recommender.models.llm.llm_hedging import HedgingPolicy
+from recommender.models.llm.llm_response_cache import LLMResponseCache
+from recommender.models.llm.llm_response_cache import ainvoke_structured_output
+from recommender.models.llm.llm_response_cache import build_llm_response_cache_key
+from recommender.models.llm.llm_response_cache import invoke_structured_output
+from utils.metrics import MetricsRegistry
+
+
+class _Decision(BaseModel):
+    decision: str
+
+
+class _CountingStructuredRunnable:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def invoke(self, _messages: object) -> _Decision:
+        self.calls += 1
+        return _Decision(decision=f"call-{self.calls}")
+
+    async def ainvoke(self, messages: object) -> _Decision:
+        return self.invoke(messages)
+
+
+class _SlowOrFailingStructuredRunnable:
+    def __init__(self, name: str, *, delay_s: float = 0.0, fails: bool = False) -> None:
+        self.model = name
+        self.delay_s = delay_s
+        self.fails = fails
+        self.calls = 0
+
+    def invoke(self, _messages: object, _config: object = None) -> _Decision:
+        self.calls += 1
+        if self.fails:
+            raise RuntimeError(f"{self.model} failed")
+        return _Decision(decision=self.model)
+
+    async def ainvoke(self, messages: object, _config: object = None) -> _Decision:
+        await asyncio.sleep(self.delay_s)
+        return self.invoke(messages)
+
+    def with_structured_output(self, _schema: object) -> _SlowOrFailingStructuredRunnable:
+        return self
+
+
+class _FakeChatModel:
+    model = "llama3.1"
+    temperature = 0.2
+
+
+class _InMemoryResponseCacheBackend:
+    def __init__(self) -> None:
+        self.rows: dict[str, dict[str, Any]] = {}
+
+    def get(self, cache_key: str) -> dict[str, Any] | None:
+        return self.rows.get(cache_key)
+
+    def put(self, cache_key: str, agent_name: str, response: dict[str, Any], ttl_s: float) -> None:
+        self.rows[cache_key] = dict(response)
+
+
+def _messages(user_request: str) -> list:
+    return [SystemMessage(content="Route the request."), HumanMessage(content=user_request)]
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    def setUp(self) -> None:
+        MetricsRegistry().reset()
+        self.runnable = _CountingStructuredRunnable()
+
+    def _invoke(self, response_cache: LLMResponseCache | None, user_request: str, agent_name: str = "request_routing"):
+        return invoke_structured_output(
+            self.runnable,
+            _messages(user_request),
+            output_type=_Decision,
+            agent_name=agent_name,
+            llm=_FakeChatModel(),
+            response_cache=response_cache,
+        )
+
+    def test_identical_requests_skip_the_llm(self) -> None:
+        response_cache = LLMResponseCache(LLMCacheConfig())
+
+        first = self._invoke(response_cache, "Beach in May")
+        second = self._invoke(response_cache, "Beach in May")
+        third = self._invoke(response_cache, "Skiing in January")
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, third)
+        self.assertEqual(self.runnable.calls, 2)
+        self.assertEqual(
+            MetricsRegistry().counter("llm_response_cache_requests_total", agent="request_routing", result="memory_hit"),
+            1.0,
+        )
+
+    def test_disabled_agent_always_calls_the_llm(self) -> None:
+        response_cache = LLMResponseCache(LLMCacheConfig(request_routing_enabled=False))
+
+        self._invoke(response_cache, "Beach in May")
+        self._invoke(response_cache, "Beach in May")
+
+        self.assertEqual(self.runnable.calls, 2)
+
+    def test_persistent_cache_is_shared_between_instances(self) -> None:
+        backend = _InMemoryResponseCacheBackend()
+
+        first = self._invoke(LLMResponseCache(LLMCacheConfig(), persistent_cache=backend), "Beach in May")
+        second = self._invoke(LLMResponseCache(LLMCacheConfig(), persistent_cache=backend), "Beach in May")
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.runnable.calls, 1)
+
+    def test_async_invocation_shares_the_cache_with_sync_invocation(self) -> None:
+        response_cache = LLMResponseCache(LLMCacheConfig(), persistent_cache=_InMemoryResponseCacheBackend())
+
+        first = self._invoke(response_cache, "Beach in May")
+        second = asyncio.run(
+            ainvoke_structured_output(
+                self.runnable,
+                _messages("Beach in May"),
+                output_type=_Decision,
+                agent_name="request_routing",
+                llm=_FakeChatModel(),
+                response_cache=response_cache,
+            )
+        )
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.runnable.calls, 1)
+
+    def test_answers_of_the_fallback_model_are_not_cached_under_the_primary_key(self) -> None:
+        response_cache = LLMResponseCache(LLMCacheConfig())
+        primary = _SlowOrFailingStructuredRunnable("llama3.1", delay_s=1.0)
+        fallback = _SlowOrFailingStructuredRunnable("gpt-4o-mini")
+        hedged_llm = HedgedChatModel(
+            primary,
+            fallback,
+            HedgingPolicy("request_routing", LLMHedgingConfig(_env_file=None, initial_hedge_delay_s=0.01)),
+        )
+
+        async def ainvoke() -> _Decision:
+            return await ainvoke_structured_output(
+                hedged_llm.with_structured_output(_Decision),
+                _messages("Beach in May"),
+                output_type=_Decision,
+                agent_name="request_routing",
+                llm=hedged_llm,
+                response_cache=response_cache,
+            )
+
+        hedge_won = asyncio.run(ainvoke())
+        primary.fails = True
+        fell_back = invoke_structured_output(
+            hedged_llm.with_structured_output(_Decision),
+            _messages("Beach in May"),
+            output_type=_Decision,
+            agent_name="request_routing",
+            llm=hedged_llm,
+            response_cache=response_cache,
+        )
+        primary.fails = False
+        primary.delay_s = 0.0
+        first_primary_answer = asyncio.run(ainvoke())
+        cached_primary_answer = asyncio.run(ainvoke())
+
+        self.assertEqual(hedge_won.decision, "gpt-4o-mini")
+        self.assertEqual(fell_back.decision, "gpt-4o-mini")
+        self.assertEqual(first_primary_answer.decision, "llama3.1")
+        self.assertEqual(cached_primary_answer.decision, "llama3.1")
+        self.assertEqual(fallback.calls, 2)
+        self.assertEqual(primary.calls, 2)
+        self.assertEqual(
+            MetricsRegistry().counter(
+                "llm_response_cache_skipped_total",
+                agent="request_routing",
+                reason="fallback_answer",
+            ),
+            2.0,
+        )
+
+    def test_cache_key_depends_on_agent_model_temperature_and_messages(self) -> None:
+        base_key = build_llm_response_cache_key(
+            agent_name="request_routing",
+            model_name="llama3.1",
+            temperature=0.2,
+            messages=_messages("Beach in May"),
+        )
+        variants = [
+            build_llm_response_cache_key(
+                agent_name="budget_filter", model_name="llama3.1", temperature=0.2, messages=_messages("Beach in May")
+            ),
+            build_llm_response_cache_key(
+                agent_name="request_routing", model_name="gpt-4o", temperature=0.2, messages=_messages("Beach in May")
+            ),
+            build_llm_response_cache_key(
+                agent_name="request_routing", model_name="llama3.1", temperature=0.7, messages=_messages("Beach in May")
+            ),
+            build_llm_response_cache_key(
+                agent_name="request_routing", model_name="llama3.1", temperature=0.2, messages=_messages("Beach in June")
+            ),
+        ]
+
+        self.assertEqual(len(base_key), 64)
+        self.assertNotIn(base_key, variants)
+
+
+if __name__ == "__main__":
+    unittest.main()
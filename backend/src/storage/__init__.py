@@ -1,6 +1,9 @@
+from storage.configuration import InMemoryIndexConfiguration
 from storage.configuration import MigrationConfiguration
+from storage.configuration import StatisticsCacheConfiguration
 from storage.configuration import StorageConfiguration
 from storage.configuration import StorageEngineConfiguration
+from storage.configuration import VectorSearchConfiguration
 from storage.configuration import load_storage_configuration
 from storage.health import StorageHealthReport
 from storage.health import check_storage_health
@@ -8,11 +11,14 @@ from storage.health import validate_storage_health
 from storage.storage import Storage
 
 __all__ = [
+    "InMemoryIndexConfiguration",
     "MigrationConfiguration",
+    "StatisticsCacheConfiguration",
     "StorageConfiguration",
     "Storage",
     "StorageHealthReport",
     "StorageEngineConfiguration",
+    "VectorSearchConfiguration",
     "check_storage_health",
     "load_storage_configuration",
     "validate_storage_health",
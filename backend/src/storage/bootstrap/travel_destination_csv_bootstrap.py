@@ -50,11 +50,16 @@ def load_travel_destination_records_from_csv(
     *,
     embedding_model: TextEmbeddingModelProtocol,
 ) -> list[TravelDestinationRecord]:
-    """Load CSV rows into TravelDestinationRecord with generated embeddings."""
+    """Load CSV rows into TravelDestinationRecord with generated embeddings.
+
+    Rows are parsed and validated first, then all descriptions are embedded with one batched
+    `embed_documents` call so the provider sees a few large requests instead of one per row.
+    If the batch fails, rows are embedded one by one and the rows that fail are skipped.
+    """
     if not csv_file_path.exists():
         raise FileNotFoundError(f"Travel destination CSV file not found: {csv_file_path}")
 
-    records: list[TravelDestinationRecord] = []
+    parsed_rows: list[dict[str, Any]] = []
     with csv_file_path.open(mode="r", encoding="utf-8-sig", newline="") as csv_file:
         reader = csv.DictReader(csv_file, delimiter=";")
 
@@ -65,10 +70,7 @@ def load_travel_destination_records_from_csv(
                 continue
 
             try:
-                record = _build_travel_destination_record(
-                    row,
-                    embedding_model=embedding_model,
-                )
+                parsed_row = _parse_travel_destination_row(row)
             except ValueError as error:
                 logger.warning(
                     "Skipping invalid travel destination row %s (id=%s): %s",
@@ -78,16 +80,74 @@ def load_travel_destination_records_from_csv(
                 )
                 continue
 
-            records.append(record)
+            parsed_rows.append(parsed_row)
+
+    if not parsed_rows:
+        return []
+
+    embedding_texts = [
+        _build_embedding_text(
+            parent_region=parsed_row["parent_region"],
+            region=parsed_row["region"],
+            description=parsed_row["description"],
+        )
+        for parsed_row in parsed_rows
+    ]
+    logger.info("Embedding %s travel destination description(s)", len(embedding_texts))
+    try:
+        embeddings: list[list[float] | None] = list(embedding_model.embed_documents(embedding_texts))
+    except RuntimeError as error:
+        # Models validate every vector of a batch, so one bad row fails the whole call.
+        logger.warning("Batched embedding failed, embedding rows one by one: %s", error)
+        embeddings = _embed_one_by_one(parsed_rows, embedding_texts, embedding_model=embedding_model)
+    if len(embeddings) != len(parsed_rows):
+        raise RuntimeError(
+            "Embedding model returned a mismatched number of vectors: "
+            f"expected {len(parsed_rows)}, got {len(embeddings)}"
+        )
+
+    expected_embedding_dimension = embedding_model.get_dimentions()
+    records: list[TravelDestinationRecord] = []
+    for parsed_row, embedding in zip(parsed_rows, embeddings, strict=True):
+        if embedding is None:
+            continue
+        if len(embedding) != expected_embedding_dimension:
+            logger.warning(
+                "Skipping travel destination %s: embedding dimension mismatch, expected %s, got %s",
+                parsed_row["id"],
+                expected_embedding_dimension,
+                len(embedding),
+            )
+            continue
+
+        records.append(
+            TravelDestinationRecord(
+                **parsed_row,
+                embedding=list(embedding),
+                embedding_version=1,
+            )
+        )
 
     return records
 
 
-def _build_travel_destination_record(
-    raw_row: dict[str, str],
+def _embed_one_by_one(
+    parsed_rows: list[dict[str, Any]],
+    embedding_texts: list[str],
     *,
     embedding_model: TextEmbeddingModelProtocol,
-) -> TravelDestinationRecord:
+) -> list[list[float] | None]:
+    embeddings: list[list[float] | None] = []
+    for parsed_row, embedding_text in zip(parsed_rows, embedding_texts, strict=True):
+        try:
+            embeddings.append(embedding_model.embed_query(embedding_text))
+        except RuntimeError as error:
+            logger.warning("Skipping travel destination %s: embedding failed: %s", parsed_row["id"], error)
+            embeddings.append(None)
+    return embeddings
+
+
+def _parse_travel_destination_row(raw_row: dict[str, str]) -> dict[str, Any]:
     row = _normalize_row(raw_row)
 
     destination_id = _require_text(row, field_name="u_name")
@@ -101,51 +161,14 @@ def _build_travel_destination_record(
         for field_name in NUMERIC_SCORE_FIELDS
     }
 
-    embedding_text = _build_embedding_text(
-        parent_region=parent_region,
-        region=region,
-        description=description,
-    )
-    embedding = embedding_model.embed_query(embedding_text)
-    expected_embedding_dimension = embedding_model.get_dimentions()
-    if len(embedding) != expected_embedding_dimension:
-        raise ValueError(
-            "Embedding dimension mismatch for destination "
-            f"{destination_id}: expected {expected_embedding_dimension}, got {len(embedding)}"
-        )
-
-    return TravelDestinationRecord(
-        id=destination_id,
-        parent_region=parent_region,
-        region=region,
-        popularity=score_values["popularity"],
-        cost_per_week=cost_per_week,
-        jan=score_values["jan"],
-        feb=score_values["feb"],
-        mar=score_values["mar"],
-        apr=score_values["apr"],
-        may=score_values["may"],
-        jun=score_values["jun"],
-        jul=score_values["jul"],
-        aug=score_values["aug"],
-        sep=score_values["sep"],
-        oct=score_values["oct"],
-        nov=score_values["nov"],
-        dec=score_values["dec"],
-        nature=score_values["nature"],
-        hiking=score_values["hiking"],
-        beach=score_values["beach"],
-        watersports=score_values["watersports"],
-        entertainment=score_values["entertainment"],
-        wintersports=score_values["wintersports"],
-        culture=score_values["culture"],
-        culinary=score_values["culinary"],
-        architecture=score_values["architecture"],
-        shopping=score_values["shopping"],
-        description=description,
-        embedding=embedding,
-        embedding_version=1,
-    )
+    return {
+        "id": destination_id,
+        "parent_region": parent_region,
+        "region": region,
+        "cost_per_week": cost_per_week,
+        "description": description,
+        **score_values,
+    }
 
 
 def _build_embedding_text(*, parent_region: str, region: str, description: str) -> str:
@@ -4,7 +4,9 @@ from collections.abc import Sequence
 
 from storage.db.unit_of_work import StorageUnitOfWork
 from storage.models.travel_destination import TravelDestinationRecord
+from storage.repositories.storage_metadata_repository import StorageMetadataRepository
 from storage.repositories.travel_destination_repository import TravelDestinationRepository
+from storage.stores.search_models import TRAVEL_DESTINATION_STATISTICS_KEY_PREFIX
 
 
 def seed_travel_destinations(
@@ -34,5 +36,6 @@ def seed_travel_destinations(
                 embedding_dimension=embedding_dimension,
             )
             repository.upsert_many(batch)
+            StorageMetadataRepository(session).delete_by_prefix(TRAVEL_DESTINATION_STATISTICS_KEY_PREFIX)
 
     return total_rows
@@ -3,7 +3,8 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from embeddings.loader import load_text_embedding_model
+from embeddings.configuration import load_text_embedding_model_configuration
+from embeddings.loader import create_text_embedding_model
 from embeddings.protocols import TextEmbeddingModelProtocol
 from storage.bootstrap.travel_destination_csv_bootstrap import (
     load_travel_destination_records_from_csv,
@@ -81,6 +82,18 @@ def _parse_args() -> argparse.Namespace:
         default=200,
         help="Batch size for upsert operations.",
     )
+    parser.add_argument(
+        "--embedding-batch-size",
+        type=int,
+        default=None,
+        help="Number of descriptions per embedding request. Defaults to EMBEDDINGS_BATCH_SIZE.",
+    )
+    parser.add_argument(
+        "--embedding-concurrency",
+        type=int,
+        default=None,
+        help="Number of embedding requests in flight. Defaults to EMBEDDINGS_MAX_CONCURRENCY.",
+    )
     return parser.parse_args()
 
 
@@ -89,13 +102,25 @@ def main() -> None:
 
     if args.batch_size <= 0:
         raise ValueError("--batch-size must be greater than zero")
+    if args.embedding_batch_size is not None and args.embedding_batch_size <= 0:
+        raise ValueError("--embedding-batch-size must be greater than zero")
+    if args.embedding_concurrency is not None and args.embedding_concurrency <= 0:
+        raise ValueError("--embedding-concurrency must be greater than zero")
 
     configuration = StorageConfiguration(
         engine=StorageEngineConfiguration(db_url=args.db_url),
         migrations=MigrationConfiguration(enabled=not args.skip_migrations),
     )
 
-    embedding_model = load_text_embedding_model()
+    embedding_configuration = load_text_embedding_model_configuration()
+    embedding_overrides: dict[str, int] = {}
+    if args.embedding_batch_size is not None:
+        embedding_overrides["batch_size"] = args.embedding_batch_size
+    if args.embedding_concurrency is not None:
+        embedding_overrides["max_concurrency"] = args.embedding_concurrency
+    embedding_model = create_text_embedding_model(
+        embedding_configuration.model_copy(update=embedding_overrides),
+    )
 
     bootstrap_travel_destinations_from_csv(
         csv_file_path=args.csv_path,
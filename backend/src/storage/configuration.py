@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Literal
 
 from pydantic import BaseModel
 from pydantic import Field
 from pydantic_settings import BaseSettings
 from pydantic_settings import SettingsConfigDict
 
+KeywordBoostedRanking = Literal["sql", "python"]
+
+
 class StorageEngineConfiguration(BaseModel):
     """Database engine settings for PostgreSQL-backed storage."""
 
@@ -39,6 +43,64 @@ class MigrationConfiguration(BaseModel):
     )
 
 
+class VectorSearchConfiguration(BaseModel):
+    """Settings controlling how embedding similarity search is executed."""
+
+    mode: Literal["exact", "approximate"] = Field(
+        default="exact",
+        description="Use an exact sequential scan or HNSW approximate nearest-neighbor retrieval",
+    )
+    ef_search: int = Field(
+        default=40,
+        ge=1,
+        le=1000,
+        description="HNSW candidate list size (`hnsw.ef_search`) used for approximate retrieval",
+    )
+    iterative_scan: Literal["off", "relaxed_order", "strict_order"] | None = Field(
+        default=None,
+        description="HNSW iterative index scan mode (`hnsw.iterative_scan`, pgvector>=0.8.0); unset keeps the server default",
+    )
+    max_scan_tuples: int | None = Field(
+        default=None,
+        ge=1,
+        description="Maximum tuples visited by an iterative HNSW scan (`hnsw.max_scan_tuples`)",
+    )
+    candidate_limit: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="Number of approximate candidates fetched from the index before exact re-ranking; capped like `ef_search`",
+    )
+
+
+class InMemoryIndexConfiguration(BaseModel):
+    """Settings for the optional in-process NumPy snapshot of the destination catalog."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Serve semantic, hybrid, and keyword-boosted search from an in-memory catalog snapshot",
+    )
+    refresh_interval_s: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="Minimum seconds between catalog version checks that may trigger a snapshot rebuild",
+    )
+
+
+class StatisticsCacheConfiguration(BaseModel):
+    """Settings for cached catalog aggregate statistics such as cost percentiles."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Cache catalog percentile statistics in process and in storage_metadata",
+    )
+    ttl_s: float = Field(
+        default=300.0,
+        ge=0.0,
+        description="Seconds an in-process statistics entry is served before storage_metadata is consulted again",
+    )
+
+
 class StorageConfiguration(BaseSettings):
     """Top-level storage configuration loaded from environment variables."""
 
@@ -51,6 +113,13 @@ class StorageConfiguration(BaseSettings):
 
     engine: StorageEngineConfiguration = Field(...)
     migrations: MigrationConfiguration = Field(default_factory=MigrationConfiguration)
+    vector_search: VectorSearchConfiguration = Field(default_factory=VectorSearchConfiguration)
+    in_memory_index: InMemoryIndexConfiguration = Field(default_factory=InMemoryIndexConfiguration)
+    statistics_cache: StatisticsCacheConfiguration = Field(default_factory=StatisticsCacheConfiguration)
+    keyword_boosted_ranking: KeywordBoostedRanking = Field(
+        default="sql",
+        description="Rank keyword-boosted recommendation retrieval in one SQL statement or with the Python reference",
+    )
     schema_name: str = Field(
         default="public",
         min_length=1,
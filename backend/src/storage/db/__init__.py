@@ -1,14 +1,24 @@
+from storage.db.engine import create_async_storage_engine
 from storage.db.engine import create_storage_engine
 from storage.db.engine import ensure_pgvector_extension
 from storage.db.migration_runner import run_storage_migrations
+from storage.db.session import async_read_session_scope
+from storage.db.session import async_write_session_scope
+from storage.db.session import create_async_session_factory
 from storage.db.session import create_session_factory
 from storage.db.session import read_session_scope
 from storage.db.session import session_scope
 from storage.db.session import write_session_scope
+from storage.db.unit_of_work import AsyncStorageUnitOfWork
 from storage.db.unit_of_work import StorageUnitOfWork
 
 __all__ = [
+    "AsyncStorageUnitOfWork",
     "StorageUnitOfWork",
+    "async_read_session_scope",
+    "async_write_session_scope",
+    "create_async_session_factory",
+    "create_async_storage_engine",
     "create_session_factory",
     "create_storage_engine",
     "ensure_pgvector_extension",
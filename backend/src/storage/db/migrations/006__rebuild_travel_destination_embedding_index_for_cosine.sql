@@ -0,0 +1,5 @@
+DROP INDEX IF EXISTS ix_travel_destinations_embedding_hnsw;
+
+CREATE INDEX IF NOT EXISTS ix_travel_destinations_embedding_hnsw
+ON travel_destinations
+USING hnsw (embedding vector_cosine_ops);
@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS ix_travel_destinations_cost_per_week
+ON travel_destinations (cost_per_week);
@@ -0,0 +1,31 @@
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE travel_destinations
+    ADD COLUMN IF NOT EXISTS region_normalized TEXT
+        GENERATED ALWAYS AS (trim(regexp_replace(lower(region), '[^a-z0-9]+', ' ', 'g'))) STORED,
+    ADD COLUMN IF NOT EXISTS parent_region_normalized TEXT
+        GENERATED ALWAYS AS (trim(regexp_replace(lower(parent_region), '[^a-z0-9]+', ' ', 'g'))) STORED,
+    ADD COLUMN IF NOT EXISTS description_normalized TEXT
+        GENERATED ALWAYS AS (trim(regexp_replace(lower(description), '[^a-z0-9]+', ' ', 'g'))) STORED,
+    ADD COLUMN IF NOT EXISTS search_document TSVECTOR
+        GENERATED ALWAYS AS (
+            to_tsvector('simple'::regconfig, region || ' ' || parent_region || ' ' || description)
+        ) STORED;
+
+CREATE INDEX IF NOT EXISTS ix_travel_destinations_region_normalized_trgm
+ON travel_destinations
+USING gin (region_normalized gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_travel_destinations_parent_region_normalized_trgm
+ON travel_destinations
+USING gin (parent_region_normalized gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_travel_destinations_description_normalized_trgm
+ON travel_destinations
+USING gin (description_normalized gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_travel_destinations_search_document
+ON travel_destinations
+USING gin (search_document);
+
+DROP INDEX IF EXISTS ix_travel_destinations_search_document_gin;
@@ -0,0 +1,8 @@
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    provider TEXT NOT NULL,
+    model_name TEXT NOT NULL,
+    text_hash CHAR(64) NOT NULL,
+    embedding vector({{embedding_dimension}}) NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (provider, model_name, text_hash)
+);
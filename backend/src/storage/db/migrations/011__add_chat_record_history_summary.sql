@@ -0,0 +1,2 @@
+ALTER TABLE chat_record
+    ADD COLUMN IF NOT EXISTS history_summary TEXT NOT NULL DEFAULT '';
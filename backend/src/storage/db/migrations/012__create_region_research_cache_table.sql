@@ -0,0 +1,13 @@
+CREATE TABLE IF NOT EXISTS region_research_cache (
+    region_id TEXT NOT NULL,
+    query_hash CHAR(64) NOT NULL,
+    synthesized_query TEXT NOT NULL,
+    query_embedding vector({{embedding_dimension}}) NOT NULL,
+    research JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    expires_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (region_id, query_hash)
+);
+
+CREATE INDEX IF NOT EXISTS ix_region_research_cache_expires_at
+ON region_research_cache (expires_at);
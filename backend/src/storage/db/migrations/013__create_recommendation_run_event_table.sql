@@ -0,0 +1,14 @@
+CREATE TABLE IF NOT EXISTS recommendation_run_event (
+    run_id UUID NOT NULL,
+    event_id INTEGER NOT NULL,
+    user_id UUID NOT NULL,
+    session_id UUID NOT NULL,
+    event TEXT NOT NULL,
+    data JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    expires_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (run_id, event_id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_recommendation_run_event_expires_at
+ON recommendation_run_event (expires_at);
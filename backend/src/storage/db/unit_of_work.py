@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from collections.abc import Iterator
+from contextlib import asynccontextmanager
 from contextlib import contextmanager
 from dataclasses import dataclass
 
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from storage.db.session import async_read_session_scope
+from storage.db.session import async_write_session_scope
 from storage.db.session import read_session_scope
 from storage.db.session import write_session_scope
 
@@ -28,3 +34,22 @@ class StorageUnitOfWork:
         """Open a transactional write session scope."""
         with write_session_scope(self.session_factory) as session:
             yield session
+
+
+@dataclass(slots=True)
+class AsyncStorageUnitOfWork:
+    """Provides explicit asyncio read and write transaction scopes."""
+
+    session_factory: async_sessionmaker[AsyncSession]
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[AsyncSession]:
+        """Open a read-only async session scope."""
+        async with async_read_session_scope(self.session_factory) as session:
+            yield session
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[AsyncSession]:
+        """Open a transactional async write session scope."""
+        async with async_write_session_scope(self.session_factory) as session:
+            yield session
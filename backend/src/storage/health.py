@@ -9,6 +9,8 @@ from sqlalchemy.engine import Engine
 
 MIN_POSTGRESQL_SERVER_VERSION_NUM = 180000
 MIN_PGVECTOR_EXTENSION_VERSION = (0, 5, 0)
+VECTOR_INDEX_NAME = "ix_travel_destinations_embedding_hnsw"
+VECTOR_INDEX_OPERATOR_CLASS = "vector_cosine_ops"
 
 
 @dataclass(frozen=True, slots=True)
@@ -271,33 +273,37 @@ def _check_embedding_dimension_contract(
 
 def _check_vector_index_present(connection: Connection, *, schema_name: str) -> tuple[bool, str | None]:
     try:
-        vector_index_present = bool(
-            connection.execute(
-                text(
-                    """
-                    SELECT EXISTS (
-                        SELECT 1
-                        FROM pg_indexes
-                        WHERE schemaname = :schema_name
-                          AND tablename = 'travel_destinations'
-                          AND indexname = 'ix_travel_destinations_embedding_hnsw'
-                    )
-                    """
-                ),
-                {"schema_name": schema_name},
-            ).scalar_one()
-        )
+        vector_index_definition = connection.execute(
+            text(
+                """
+                SELECT indexdef
+                FROM pg_indexes
+                WHERE schemaname = :schema_name
+                  AND tablename = 'travel_destinations'
+                  AND indexname = :index_name
+                """
+            ),
+            {"schema_name": schema_name, "index_name": VECTOR_INDEX_NAME},
+        ).scalar_one_or_none()
     except Exception as error:
         return False, f"vector_index_present=false (failed to query index metadata: {error})"
 
-    if not vector_index_present:
+    if vector_index_definition is None:
         return (
             False,
             "vector_index_present=false "
-            "(missing index `ix_travel_destinations_embedding_hnsw` "
+            f"(missing index `{VECTOR_INDEX_NAME}` "
             f"in schema={schema_name!r})",
         )
 
+    if VECTOR_INDEX_OPERATOR_CLASS not in vector_index_definition:
+        return (
+            False,
+            "vector_index_present=false "
+            f"(index `{VECTOR_INDEX_NAME}` does not use `{VECTOR_INDEX_OPERATOR_CLASS}` "
+            "required by cosine-distance retrieval)",
+        )
+
     return True, None
 
 
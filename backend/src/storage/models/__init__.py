@@ -1,4 +1,8 @@
 from storage.models.chat_record import ChatRecord
+from storage.models.embedding_cache import EmbeddingCacheRecord
+from storage.models.llm_response_cache import LLMResponseCacheRecord
+from storage.models.recommendation_run_event import RecommendationRunEventRecord
+from storage.models.region_research_cache import RegionResearchCacheRecord
 from storage.models.storage_metadata import StorageMetadataRecord
 from storage.models.survey_question import SurveyQuestion
 from storage.models.survey_result import SurveyResult
@@ -7,6 +11,10 @@ from storage.models.travel_destination import TravelDestinationRecord
 
 __all__ = [
     "ChatRecord",
+    "EmbeddingCacheRecord",
+    "LLMResponseCacheRecord",
+    "RecommendationRunEventRecord",
+    "RegionResearchCacheRecord",
     "StorageMetadataRecord",
     "SurveyQuestion",
     "SurveyResult",
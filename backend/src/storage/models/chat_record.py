@@ -45,6 +45,7 @@ class ChatRecord(SQLModel, table=True):
     system_response: str = Field(default="")
 
     synthesized_query: str = Field(default="")
+    history_summary: str = Field(default="")
     travel_destination_filter: dict[str, Any] = Field(
         default_factory=dict,
         sa_column=Column(JSONB, nullable=False, server_default=text("'{}'::jsonb")),
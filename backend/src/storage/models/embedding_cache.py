@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from datetime import UTC
+from datetime import datetime
+
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import text
+from sqlmodel import Field
+from sqlmodel import SQLModel
+
+from storage.models.vector_type import create_vector_column
+
+
+class EmbeddingCacheRecord(SQLModel, table=True):
+    """Persisted query embedding keyed by provider, model and normalized text hash."""
+
+    __tablename__ = "embedding_cache"
+
+    provider: str = Field(primary_key=True)
+    model_name: str = Field(primary_key=True)
+    text_hash: str = Field(primary_key=True, min_length=64, max_length=64)
+    embedding: list[float] = Field(
+        sa_column=create_vector_column(nullable=False),
+    )
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column=Column(
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        ),
+    )
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import UTC
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field
+from sqlmodel import SQLModel
+
+
+class LLMResponseCacheRecord(SQLModel, table=True):
+    """Persisted structured LLM response keyed by a hash of agent, model settings and prompt."""
+
+    __tablename__ = "llm_response_cache"
+
+    cache_key: str = Field(primary_key=True, min_length=64, max_length=64)
+    agent_name: str = Field()
+    response: dict[str, Any] = Field(
+        default_factory=dict,
+        sa_column=Column(JSONB, nullable=False),
+    )
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column=Column(
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        ),
+    )
+    expires_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from datetime import UTC
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PostgreSQLUUID
+from sqlmodel import Field
+from sqlmodel import SQLModel
+
+
+class RecommendationRunEventRecord(SQLModel, table=True):
+    """One streamed event of a recommendation chat run, kept for Last-Event-ID replay."""
+
+    __tablename__ = "recommendation_run_event"
+
+    run_id: UUID = Field(
+        sa_column=Column(PostgreSQLUUID(as_uuid=True), primary_key=True, nullable=False),
+    )
+    event_id: int = Field(primary_key=True, ge=1)
+    user_id: UUID = Field(
+        sa_column=Column(PostgreSQLUUID(as_uuid=True), nullable=False),
+    )
+    session_id: UUID = Field(
+        sa_column=Column(PostgreSQLUUID(as_uuid=True), nullable=False),
+    )
+    event: str = Field()
+    data: dict[str, Any] = Field(
+        default_factory=dict,
+        sa_column=Column(JSONB, nullable=False),
+    )
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column=Column(
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        ),
+    )
+    expires_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from datetime import UTC
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field
+from sqlmodel import SQLModel
+
+from storage.models.vector_type import create_vector_column
+
+
+class RegionResearchCacheRecord(SQLModel, table=True):
+    """Persisted region research keyed by region and a hash of the normalized synthesized query."""
+
+    __tablename__ = "region_research_cache"
+
+    region_id: str = Field(primary_key=True)
+    query_hash: str = Field(primary_key=True, min_length=64, max_length=64)
+    synthesized_query: str = Field()
+    query_embedding: list[float] = Field(
+        sa_column=create_vector_column(nullable=False),
+    )
+    research: dict[str, Any] = Field(
+        default_factory=dict,
+        sa_column=Column(JSONB, nullable=False),
+    )
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC),
+        sa_column=Column(
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        ),
+    )
+    expires_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
@@ -1,5 +1,9 @@
 from storage.repositories.chat_repository import ChatRepository
 from storage.repositories.contracts import ChatRepositoryProtocol
+from storage.repositories.embedding_cache_repository import EmbeddingCacheRepository
+from storage.repositories.llm_response_cache_repository import LLMResponseCacheRepository
+from storage.repositories.recommendation_run_event_repository import RecommendationRunEventRepository
+from storage.repositories.region_research_cache_repository import RegionResearchCacheRepository
 from storage.repositories.contracts import StorageMetadataRepositoryProtocol
 from storage.repositories.contracts import TravelDestinationRepositoryProtocol
 from storage.repositories.storage_metadata_repository import StorageMetadataRepository
@@ -9,6 +13,10 @@ from storage.repositories.travel_destination_repository import TravelDestination
 __all__ = [
     "ChatRepository",
     "ChatRepositoryProtocol",
+    "EmbeddingCacheRepository",
+    "LLMResponseCacheRepository",
+    "RecommendationRunEventRepository",
+    "RegionResearchCacheRepository",
     "StorageMetadataRepository",
     "StorageMetadataRepositoryProtocol",
     "SurveyRepository",
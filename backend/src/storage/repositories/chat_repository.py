@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from typing import Any
 from uuid import UUID
 
+from sqlalchemy import literal
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import Session
 from sqlmodel import col
 from sqlmodel import delete
 from sqlmodel import select
+from sqlmodel import update
 
 from storage.models.chat_record import ChatRecord
 
@@ -22,18 +26,22 @@ class ChatRepository:
         self,
         user_id: UUID,
         session_id: UUID,
+        limit: int | None = None,
     ) -> list[ChatRecord]:
-        """Load session memory rows ordered by chat history number."""
+        """Load session memory rows ordered by chat history number.
 
-        statement = (
-            select(ChatRecord)
-            .where(
-                col(ChatRecord.user_id) == user_id,
-                col(ChatRecord.session_id) == session_id,
-            )
-            .order_by(col(ChatRecord.chat_history_number))
+        With `limit`, only the latest `limit` rows are read, still returned in ascending order.
+        """
+
+        statement = select(ChatRecord).where(
+            col(ChatRecord.user_id) == user_id,
+            col(ChatRecord.session_id) == session_id,
         )
-        return list(self.session.exec(statement).all())
+        if limit is None:
+            return list(self.session.exec(statement.order_by(col(ChatRecord.chat_history_number))).all())
+
+        statement = statement.order_by(col(ChatRecord.chat_history_number).desc()).limit(limit)
+        return list(reversed(self.session.exec(statement).all()))
 
     def upsert_many(self, rows: Sequence[ChatRecord]) -> None:
         """Insert or update memory rows by composite primary key."""
@@ -54,6 +62,34 @@ class ChatRepository:
         )
         self.session.exec(upsert_statement)
 
+    def append_travel_destinations_evaluations(
+        self,
+        user_id: UUID,
+        session_id: UUID,
+        chat_history_number: int,
+        evaluations: Sequence[dict[str, Any]],
+    ) -> bool:
+        """Append region research to one saved row and return whether the row exists.
+
+        The JSONB array is extended in place, so research saved concurrently is not overwritten.
+        """
+
+        statement = (
+            update(ChatRecord)
+            .where(
+                col(ChatRecord.user_id) == user_id,
+                col(ChatRecord.session_id) == session_id,
+                col(ChatRecord.chat_history_number) == chat_history_number,
+            )
+            .values(
+                travel_destinations_evaluations=col(ChatRecord.travel_destinations_evaluations).op("||")(
+                    literal(list(evaluations), type_=JSONB)
+                )
+            )
+        )
+        result = self.session.exec(statement)
+        return int(result.rowcount or 0) > 0
+
     def delete_by_session(
         self,
         user_id: UUID,
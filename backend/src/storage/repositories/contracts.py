@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from typing import Any
 from typing import Protocol
 from uuid import UUID
 
+from storage.configuration import VectorSearchConfiguration
 from storage.models.chat_record import ChatRecord
 from storage.models.storage_metadata import StorageMetadataRecord
 from storage.models.travel_destination import TravelDestinationRecord
+from storage.stores.projection_models import TravelDestinationSummary
 from storage.stores.query_models import QueriedTravelDestination
 from storage.stores.query_models import TravelDestinationQuery
 from storage.stores.search_models import TravelCostStatistics
+from storage.stores.search_models import TravelNumericFieldStatistics
 from storage.stores.search_models import ScoredTravelDestination
+from storage.stores.search_models import TravelDestinationRetrievalFilter
 from storage.stores.search_models import TravelSearchConstraints
 
 
@@ -19,10 +24,20 @@ class TravelDestinationRepositoryProtocol(Protocol):
 
     def count(self) -> int: ...
 
+    def catalog_version(self) -> str: ...
+
     def list_all(self) -> list[TravelDestinationRecord]: ...
 
     def cost_per_week_statistics(self) -> TravelCostStatistics: ...
 
+    def numeric_field_statistics(
+        self,
+        field_name: str,
+        percentiles: Sequence[float] = ...,
+    ) -> TravelNumericFieldStatistics: ...
+
+    def list_summaries(self, destination_ids: Sequence[str] | None = None) -> list[TravelDestinationSummary]: ...
+
     def list_by_ids(self, destination_ids: Sequence[str]) -> list[TravelDestinationRecord]: ...
 
     def upsert_many(self, rows: Sequence[TravelDestinationRecord]) -> None: ...
@@ -43,6 +58,8 @@ class TravelDestinationRepositoryProtocol(Protocol):
         query_embedding: Sequence[float],
         limit: int | None = None,
         destination_ids: Sequence[str] | None = None,
+        vector_search: VectorSearchConfiguration | None = None,
+        retrieval_filter: TravelDestinationRetrievalFilter | None = None,
     ) -> list[ScoredTravelDestination]: ...
 
     def hybrid_search(
@@ -54,6 +71,7 @@ class TravelDestinationRepositoryProtocol(Protocol):
         semantic_weight: float = 0.85,
         logistics_weight: float = 0.15,
         destination_ids: Sequence[str] | None = None,
+        vector_search: VectorSearchConfiguration | None = None,
     ) -> list[ScoredTravelDestination]: ...
 
     def exact_text_search(
@@ -64,6 +82,17 @@ class TravelDestinationRepositoryProtocol(Protocol):
 
     def keyword_matching_destination_ids(self, keywords: Sequence[str]) -> set[str]: ...
 
+    def keyword_boosted_search(
+        self,
+        query_embedding: Sequence[float],
+        keywords: Sequence[str],
+        *,
+        seasonality_months: Sequence[str] = (),
+        limit: int | None = None,
+        vector_search: VectorSearchConfiguration | None = None,
+        retrieval_filter: TravelDestinationRetrievalFilter | None = None,
+    ) -> list[ScoredTravelDestination]: ...
+
 
 class ChatRepositoryProtocol(Protocol):
     """Contract for chat session memory persistence."""
@@ -72,10 +101,19 @@ class ChatRepositoryProtocol(Protocol):
         self,
         user_id: UUID,
         session_id: UUID,
+        limit: int | None = None,
     ) -> list[ChatRecord]: ...
 
     def upsert_many(self, rows: Sequence[ChatRecord]) -> None: ...
 
+    def append_travel_destinations_evaluations(
+        self,
+        user_id: UUID,
+        session_id: UUID,
+        chat_history_number: int,
+        evaluations: Sequence[dict[str, Any]],
+    ) -> bool: ...
+
     def delete_by_session(self, user_id: UUID, session_id: UUID) -> None: ...
 
 
@@ -93,3 +131,5 @@ class StorageMetadataRepositoryProtocol(Protocol):
     def upsert(self, key: str, value: str) -> None: ...
 
     def delete(self, key: str) -> None: ...
+
+    def delete_by_prefix(self, prefix: str) -> None: ...
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session
+from sqlmodel import col
+from sqlmodel import select
+
+from storage.models.embedding_cache import EmbeddingCacheRecord
+
+
+class EmbeddingCacheRepository:
+    """Repository for persisted query embeddings."""
+
+    def __init__(self, session: Session, *, embedding_dimension: int) -> None:
+        if embedding_dimension <= 0:
+            raise ValueError("embedding_dimension must be greater than zero")
+
+        self.session = session
+        self.embedding_dimension = embedding_dimension
+
+    def get(self, provider: str, model_name: str, text_hash: str) -> EmbeddingCacheRecord | None:
+        """Return the cached embedding for one provider/model/text hash if present."""
+        statement = select(EmbeddingCacheRecord).where(
+            col(EmbeddingCacheRecord.provider) == provider,
+            col(EmbeddingCacheRecord.model_name) == model_name,
+            col(EmbeddingCacheRecord.text_hash) == text_hash,
+        )
+        return self.session.exec(statement).first()
+
+    def upsert_many(self, rows: Sequence[EmbeddingCacheRecord]) -> None:
+        """Insert or replace cached embeddings by key."""
+        if not rows:
+            return
+
+        for row in rows:
+            if len(row.embedding) != self.embedding_dimension:
+                raise ValueError(
+                    "Embedding dimension mismatch: "
+                    f"expected {self.embedding_dimension}, got {len(row.embedding)}"
+                )
+
+        payloads = [row.model_dump() for row in rows]
+        statement = insert(EmbeddingCacheRecord).values(payloads)
+        upsert_statement = statement.on_conflict_do_update(
+            index_elements=["provider", "model_name", "text_hash"],
+            set_={
+                "embedding": statement.excluded.embedding,
+                "created_at": statement.excluded.created_at,
+            },
+        )
+        self.session.exec(upsert_statement)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session
+from sqlmodel import col
+from sqlmodel import select
+
+from storage.models.llm_response_cache import LLMResponseCacheRecord
+
+
+class LLMResponseCacheRepository:
+    """Repository for persisted structured LLM responses."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get(self, cache_key: str, *, now: datetime) -> LLMResponseCacheRecord | None:
+        """Return the cached response for one key unless it has expired."""
+        statement = select(LLMResponseCacheRecord).where(
+            col(LLMResponseCacheRecord.cache_key) == cache_key,
+            col(LLMResponseCacheRecord.expires_at) > now,
+        )
+        return self.session.exec(statement).first()
+
+    def upsert_many(self, rows: Sequence[LLMResponseCacheRecord]) -> None:
+        """Insert or replace cached responses by key."""
+        if not rows:
+            return
+
+        payloads = [row.model_dump() for row in rows]
+        statement = insert(LLMResponseCacheRecord).values(payloads)
+        upsert_statement = statement.on_conflict_do_update(
+            index_elements=["cache_key"],
+            set_={
+                "agent_name": statement.excluded.agent_name,
+                "response": statement.excluded.response,
+                "created_at": statement.excluded.created_at,
+                "expires_at": statement.excluded.expires_at,
+            },
+        )
+        self.session.exec(upsert_statement)
+
+    def delete_expired(self, *, now: datetime) -> int:
+        """Delete expired responses and return the number of removed rows."""
+        statement = delete(LLMResponseCacheRecord).where(col(LLMResponseCacheRecord.expires_at) <= now)
+        result = self.session.exec(statement)
+        return int(result.rowcount or 0)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session
+from sqlmodel import col
+from sqlmodel import select
+
+from storage.models.recommendation_run_event import RecommendationRunEventRecord
+
+
+class RecommendationRunEventRepository:
+    """Repository for persisted recommendation run events."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def insert_many(self, rows: Sequence[RecommendationRunEventRecord]) -> None:
+        """Insert run events, ignoring events that are already stored."""
+        if not rows:
+            return
+
+        payloads = [row.model_dump() for row in rows]
+        statement = insert(RecommendationRunEventRecord).values(payloads)
+        self.session.exec(statement.on_conflict_do_nothing(index_elements=["run_id", "event_id"]))
+
+    def list_after(
+        self,
+        run_id: UUID,
+        *,
+        user_id: UUID,
+        session_id: UUID,
+        after_event_id: int,
+        now: datetime,
+    ) -> list[RecommendationRunEventRecord]:
+        """Return the unexpired events of one session's run after `after_event_id`, in order."""
+        statement = (
+            select(RecommendationRunEventRecord)
+            .where(
+                col(RecommendationRunEventRecord.run_id) == run_id,
+                col(RecommendationRunEventRecord.user_id) == user_id,
+                col(RecommendationRunEventRecord.session_id) == session_id,
+                col(RecommendationRunEventRecord.event_id) > after_event_id,
+                col(RecommendationRunEventRecord.expires_at) > now,
+            )
+            .order_by(col(RecommendationRunEventRecord.event_id))
+        )
+        return list(self.session.exec(statement).all())
+
+    def delete_expired(self, *, now: datetime) -> int:
+        """Delete expired events and return the number of removed rows."""
+        statement = delete(RecommendationRunEventRecord).where(
+            col(RecommendationRunEventRecord.expires_at) <= now
+        )
+        result = self.session.exec(statement)
+        return int(result.rowcount or 0)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import Float
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session
+from sqlmodel import col
+from sqlmodel import select
+
+from storage.models.region_research_cache import RegionResearchCacheRecord
+
+
+class RegionResearchCacheRepository:
+    """Repository for persisted region research results."""
+
+    def __init__(self, session: Session, *, embedding_dimension: int) -> None:
+        if embedding_dimension <= 0:
+            raise ValueError("embedding_dimension must be greater than zero")
+
+        self.session = session
+        self.embedding_dimension = embedding_dimension
+
+    def find_nearest(
+        self,
+        region_ids: Sequence[str],
+        query_embedding: Sequence[float],
+        *,
+        now: datetime,
+    ) -> list[tuple[RegionResearchCacheRecord, float]]:
+        """Return the unexpired entry closest to the query embedding for each region, with its cosine distance."""
+        if not region_ids:
+            return []
+
+        self._validate_embedding(query_embedding)
+        distance_expression = (
+            col(RegionResearchCacheRecord.query_embedding).op("<=>")(list(query_embedding)).cast(Float)
+        )
+        statement = (
+            select(RegionResearchCacheRecord, distance_expression.label("distance"))
+            .where(
+                col(RegionResearchCacheRecord.region_id).in_(list(region_ids)),
+                col(RegionResearchCacheRecord.expires_at) > now,
+            )
+            .distinct(col(RegionResearchCacheRecord.region_id))
+            .order_by(col(RegionResearchCacheRecord.region_id), distance_expression)
+        )
+        return [(record, float(distance)) for record, distance in self.session.exec(statement).all()]
+
+    def upsert_many(self, rows: Sequence[RegionResearchCacheRecord]) -> None:
+        """Insert or replace cached research by region and query hash."""
+        if not rows:
+            return
+
+        for row in rows:
+            self._validate_embedding(row.query_embedding)
+
+        payloads = [row.model_dump() for row in rows]
+        statement = insert(RegionResearchCacheRecord).values(payloads)
+        upsert_statement = statement.on_conflict_do_update(
+            index_elements=["region_id", "query_hash"],
+            set_={
+                "synthesized_query": statement.excluded.synthesized_query,
+                "query_embedding": statement.excluded.query_embedding,
+                "research": statement.excluded.research,
+                "created_at": statement.excluded.created_at,
+                "expires_at": statement.excluded.expires_at,
+            },
+        )
+        self.session.exec(upsert_statement)
+
+    def delete_expired(self, *, now: datetime) -> int:
+        """Delete expired research and return the number of removed rows."""
+        statement = delete(RegionResearchCacheRecord).where(col(RegionResearchCacheRecord.expires_at) <= now)
+        result = self.session.exec(statement)
+        return int(result.rowcount or 0)
+
+    def _validate_embedding(self, embedding: Sequence[float]) -> None:
+        if len(embedding) != self.embedding_dimension:
+            raise ValueError(
+                "Embedding dimension mismatch: "
+                f"expected {self.embedding_dimension}, got {len(embedding)}"
+            )
@@ -61,3 +61,13 @@ class StorageMetadataRepository:
         """Delete metadata key-value pair by key."""
         statement = delete(StorageMetadataRecord).where(col(StorageMetadataRecord.key) == key)
         self.session.exec(statement)
+
+    def delete_by_prefix(self, prefix: str) -> None:
+        """Delete all metadata key-value pairs whose key starts with the prefix."""
+        if not prefix:
+            raise ValueError("prefix must not be empty")
+
+        statement = delete(StorageMetadataRecord).where(
+            col(StorageMetadataRecord.key).startswith(prefix, autoescape=True)
+        )
+        self.session.exec(statement)
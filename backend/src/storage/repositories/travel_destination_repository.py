@@ -7,16 +7,24 @@ from typing import Any
 from sqlalchemy import and_
 from sqlalchemy import case
 from sqlalchemy import literal
+from sqlalchemy import literal_column
+from sqlalchemy import Text
 from sqlalchemy import Float
 from sqlalchemy import or_
+from sqlalchemy import text
+from sqlalchemy import true
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import defer
 from sqlalchemy.sql import func
 from sqlmodel import Session
 from sqlmodel import col
 from sqlmodel import select
 
+from storage.configuration import VectorSearchConfiguration
 from storage.models.travel_destination import TravelDestinationRecord
 from storage.stores.query_models import DATETIME_FIELDS
+from storage.stores.query_models import DEFAULT_TEXT_FIELDS
 from storage.stores.query_models import NUMERIC_FIELDS
 from storage.stores.query_models import TEXT_FIELDS
 from storage.stores.query_models import QueriedTravelDestination
@@ -24,8 +32,12 @@ from storage.stores.query_models import TravelDestinationQuery
 from storage.stores.query_models import TravelDestinationQueryFilter
 from storage.stores.query_models import TravelDestinationQuerySort
 from storage.stores.query_models import coerce_query_datetime
+from storage.stores.projection_models import TravelDestinationSummary
+from storage.stores.search_models import DEFAULT_STATISTICS_PERCENTILES
 from storage.stores.search_models import TravelCostStatistics
+from storage.stores.search_models import TravelNumericFieldStatistics
 from storage.stores.search_models import ScoredTravelDestination
+from storage.stores.search_models import TravelDestinationRetrievalFilter
 from storage.stores.search_models import TravelSearchConstraints
 
 VALID_MONTH_COLUMNS = {
@@ -42,6 +54,16 @@ VALID_MONTH_COLUMNS = {
     "nov",
     "dec",
 }
+MAX_HNSW_EF_SEARCH = 1000
+
+# Stored generated columns maintained by migration 008; they are not mapped on the record
+# model so that reads and upserts never transfer them.
+NORMALIZED_TEXT_COLUMNS: dict[str, Any] = {
+    "region": literal_column("travel_destinations.region_normalized", Text),
+    "parent_region": literal_column("travel_destinations.parent_region_normalized", Text),
+    "description": literal_column("travel_destinations.description_normalized", Text),
+}
+SEARCH_DOCUMENT_COLUMN = literal_column("travel_destinations.search_document", TSVECTOR)
 
 
 class TravelDestinationRepository:
@@ -65,25 +87,79 @@ class TravelDestinationRepository:
         result = self.session.exec(statement).one()
         return int(result)
 
+    def catalog_version(self) -> str:
+        """Return a token that changes whenever destinations are inserted, updated, or deleted."""
+        statement = select(func.count(), func.max(col(TravelDestinationRecord.updated_at))).select_from(
+            TravelDestinationRecord
+        )
+        count, last_updated_at = self.session.exec(statement).one()
+        last_updated = last_updated_at.isoformat() if last_updated_at is not None else "never"
+        return f"{int(count)}:{last_updated}"
+
     def list_all(self) -> list[TravelDestinationRecord]:
         """Return all travel destinations."""
         statement = select(TravelDestinationRecord)
         return list(self.session.exec(statement).all())
 
+    def list_summaries(self, destination_ids: Sequence[str] | None = None) -> list[TravelDestinationSummary]:
+        """Return embedding-free summaries, optionally restricted to the provided IDs."""
+        statement = select(
+            col(TravelDestinationRecord.id),
+            col(TravelDestinationRecord.parent_region),
+            col(TravelDestinationRecord.region),
+            col(TravelDestinationRecord.description),
+            col(TravelDestinationRecord.popularity),
+            col(TravelDestinationRecord.cost_per_week),
+        )
+        if destination_ids is not None:
+            if not destination_ids:
+                return []
+            statement = statement.where(col(TravelDestinationRecord.id).in_(list(destination_ids)))
+
+        return [
+            TravelDestinationSummary(
+                id=row[0],
+                parent_region=row[1],
+                region=row[2],
+                description=row[3],
+                popularity=float(row[4]),
+                cost_per_week=float(row[5]),
+            )
+            for row in self.session.exec(statement).all()
+        ]
+
     def cost_per_week_statistics(self) -> TravelCostStatistics:
         """Return percentile statistics for the cost_per_week field."""
+        statistics = self.numeric_field_statistics("cost_per_week", DEFAULT_STATISTICS_PERCENTILES)
+        return TravelCostStatistics(
+            percentile_50=statistics.percentile(0.5),
+            percentile_75=statistics.percentile(0.75),
+        )
+
+    def numeric_field_statistics(
+        self,
+        field_name: str,
+        percentiles: Sequence[float] = DEFAULT_STATISTICS_PERCENTILES,
+    ) -> TravelNumericFieldStatistics:
+        """Return continuous percentiles of one numeric field in a single aggregate scan."""
+        if field_name not in NUMERIC_FIELDS:
+            raise ValueError(f"unsupported statistics field: {field_name}")
+        normalized_percentiles = self._normalize_percentiles(percentiles)
+
+        column = col(getattr(TravelDestinationRecord, field_name))
         statement = select(
-            func.percentile_cont(0.5)
-            .within_group(col(TravelDestinationRecord.cost_per_week))
-            .label("percentile_50"),
-            func.percentile_cont(0.75)
-            .within_group(col(TravelDestinationRecord.cost_per_week))
-            .label("percentile_75"),
+            *(
+                func.percentile_cont(percentile).within_group(column).label(f"percentile_{index}")
+                for index, percentile in enumerate(normalized_percentiles)
+            )
         )
         result = self.session.exec(statement).one()
-        return TravelCostStatistics(
-            percentile_50=float(result[0]) if result[0] is not None else None,
-            percentile_75=float(result[1]) if result[1] is not None else None,
+        return TravelNumericFieldStatistics(
+            field_name=field_name,
+            percentiles={
+                percentile: float(value) if value is not None else None
+                for percentile, value in zip(normalized_percentiles, result, strict=True)
+            },
         )
 
     def list_by_ids(self, destination_ids: Sequence[str]) -> list[TravelDestinationRecord]:
@@ -137,7 +213,7 @@ class TravelDestinationRepository:
         )
 
         statement = (
-            select(TravelDestinationRecord)
+            self._select_records_without_embedding()
             .add_columns(distance_expression.label("embedding_distance"))
             .add_columns(semantic_score_expression.label("semantic_score"))
             .add_columns(text_score_expression.label("text_score"))
@@ -176,8 +252,14 @@ class TravelDestinationRepository:
         query_embedding: Sequence[float],
         limit: int | None = None,
         destination_ids: Sequence[str] | None = None,
+        vector_search: VectorSearchConfiguration | None = None,
+        retrieval_filter: TravelDestinationRetrievalFilter | None = None,
     ) -> list[ScoredTravelDestination]:
-        """Return nearest travel destinations with semantic-only ranking."""
+        """Return nearest travel destinations with semantic-only ranking.
+
+        In approximate mode the HNSW index selects candidates first and the exact
+        cosine distance re-ranks them, so results are limited to the candidate set.
+        """
         self._validate_embedding_dimension(query_embedding)
         self._validate_limit(limit)
 
@@ -189,11 +271,21 @@ class TravelDestinationRepository:
         semantic_score_expression = (literal(1.0) - distance_expression).cast(Float)
 
         statement = (
-            select(TravelDestinationRecord)
+            self._select_records_without_embedding()
             .add_columns(distance_expression.label("embedding_distance"))
             .add_columns(semantic_score_expression.label("semantic_score"))
         )
+        retrieval_filter_expressions = self._build_retrieval_filter_expressions(retrieval_filter)
         statement = self._apply_destination_id_filter(statement, normalized_destination_ids)
+        statement = statement.where(*retrieval_filter_expressions)
+        statement = self._apply_approximate_candidate_filter(
+            statement,
+            query_embedding=query_embedding,
+            vector_search=vector_search,
+            limit=limit,
+            destination_ids=normalized_destination_ids,
+            filter_expressions=retrieval_filter_expressions,
+        )
         statement = statement.order_by(
             semantic_score_expression.desc(),
             distance_expression,
@@ -223,8 +315,12 @@ class TravelDestinationRepository:
         semantic_weight: float = 0.85,
         logistics_weight: float = 0.15,
         destination_ids: Sequence[str] | None = None,
+        vector_search: VectorSearchConfiguration | None = None,
     ) -> list[ScoredTravelDestination]:
-        """Return destinations ranked by semantic and logistics blending."""
+        """Return destinations ranked by semantic and logistics blending.
+
+        In approximate mode only the HNSW candidates nearest to the query are blended.
+        """
         self._validate_embedding_dimension(query_embedding)
         self._validate_limit(limit)
         self._validate_weight(semantic_weight, "semantic_weight")
@@ -244,13 +340,20 @@ class TravelDestinationRepository:
         ).cast(Float)
 
         statement = (
-            select(TravelDestinationRecord)
+            self._select_records_without_embedding()
             .add_columns(distance_expression.label("embedding_distance"))
             .add_columns(semantic_score_expression.label("semantic_score"))
             .add_columns(logistics_score_expression.label("logistics_score"))
             .add_columns(ranking_score_expression.label("ranking_score"))
         )
         statement = self._apply_destination_id_filter(statement, normalized_destination_ids)
+        statement = self._apply_approximate_candidate_filter(
+            statement,
+            query_embedding=query_embedding,
+            vector_search=vector_search,
+            limit=limit,
+            destination_ids=normalized_destination_ids,
+        )
         statement = statement.order_by(ranking_score_expression.desc(), distance_expression)
         if limit is not None:
             statement = statement.limit(limit)
@@ -279,9 +382,9 @@ class TravelDestinationRepository:
 
         self._validate_limit(limit)
 
-        region_expression = self._normalize_text_expression(col(TravelDestinationRecord.region))
-        parent_region_expression = self._normalize_text_expression(col(TravelDestinationRecord.parent_region))
-        description_expression = self._normalize_text_expression(col(TravelDestinationRecord.description))
+        region_expression = NORMALIZED_TEXT_COLUMNS["region"]
+        parent_region_expression = NORMALIZED_TEXT_COLUMNS["parent_region"]
+        description_expression = NORMALIZED_TEXT_COLUMNS["description"]
         query_literal = literal(normalized_query)
         contains_pattern = f"%{normalized_query}%"
         search_document = self._build_search_document_expression()
@@ -318,7 +421,7 @@ class TravelDestinationRepository:
         ).cast(Float)
 
         statement = (
-            select(TravelDestinationRecord)
+            self._select_records_without_embedding()
             .add_columns(text_match_score_expression.label("text_match_score"))
             .where(
                 or_(
@@ -346,27 +449,123 @@ class TravelDestinationRepository:
 
     def keyword_matching_destination_ids(self, keywords: Sequence[str]) -> set[str]:
         """Return destination IDs whose text fields contain at least one keyword."""
-        normalized_keywords: list[str] = []
-        for keyword in keywords:
-            normalized_keyword = self._normalize_search_term(keyword)
-            if normalized_keyword and normalized_keyword not in normalized_keywords:
-                normalized_keywords.append(normalized_keyword)
-
-        if not normalized_keywords:
+        keyword_match_expression = self._build_keyword_match_expression(keywords)
+        if keyword_match_expression is None:
             return set()
 
-        text_expressions = (
-            self._normalize_text_expression(col(TravelDestinationRecord.region)),
-            self._normalize_text_expression(col(TravelDestinationRecord.parent_region)),
-            self._normalize_text_expression(col(TravelDestinationRecord.description)),
+        statement = select(TravelDestinationRecord.id).where(keyword_match_expression)
+        return set(self.session.exec(statement).all())
+
+    def keyword_boosted_search(
+        self,
+        query_embedding: Sequence[float],
+        keywords: Sequence[str],
+        *,
+        seasonality_months: Sequence[str] = (),
+        limit: int | None = None,
+        vector_search: VectorSearchConfiguration | None = None,
+        retrieval_filter: TravelDestinationRetrievalFilter | None = None,
+    ) -> list[ScoredTravelDestination]:
+        """Return recommendation candidates ranked in a single statement.
+
+        Semantic scores are boosted by their interquartile range for keyword matches and,
+        when months are given, blended 0.7/0.3 with min-max normalized seasonality scores.
+        `retrieval_filter` predicates restrict the candidates before any score statistics.
+        """
+        self._validate_embedding_dimension(query_embedding)
+        self._validate_limit(limit)
+
+        distance_expression = col(TravelDestinationRecord.embedding).op("<=>")(list(query_embedding)).cast(Float)
+        semantic_score_expression = (literal(1.0) - distance_expression).cast(Float)
+        keyword_match_expression = self._build_keyword_match_expression(keywords)
+        keyword_indicator_expression = literal(0.0).cast(Float)
+        if keyword_match_expression is not None:
+            keyword_indicator_expression = case(
+                (keyword_match_expression, literal(1.0)),
+                else_=literal(0.0),
+            ).cast(Float)
+        normalized_months = self._normalize_month_columns(seasonality_months)
+        seasonality_score_expression = literal(0.0)
+        for month in normalized_months:
+            seasonality_score_expression = seasonality_score_expression + col(getattr(TravelDestinationRecord, month))
+
+        scored_statement = select(
+            col(TravelDestinationRecord.id).label("id"),
+            distance_expression.label("embedding_distance"),
+            semantic_score_expression.label("semantic_score"),
+            keyword_indicator_expression.label("keyword_indicator"),
+            seasonality_score_expression.cast(Float).label("seasonality_score"),
+        )
+        retrieval_filter_expressions = self._build_retrieval_filter_expressions(retrieval_filter)
+        scored_statement = scored_statement.where(*retrieval_filter_expressions)
+        scored_statement = self._apply_approximate_candidate_filter(
+            scored_statement,
+            query_embedding=query_embedding,
+            vector_search=vector_search,
+            limit=limit,
+            destination_ids=[],
+            filter_expressions=retrieval_filter_expressions,
+        )
+        scored = scored_statement.cte("scored")
+
+        keyword_boost = select(
+            func.coalesce(
+                func.percentile_cont(0.75).within_group(scored.c.semantic_score)
+                - func.percentile_cont(0.25).within_group(scored.c.semantic_score),
+                literal(0.0),
+            ).label("iqr")
+        ).cte("keyword_boost")
+
+        boosted_score_expression = scored.c.semantic_score + (scored.c.keyword_indicator * keyword_boost.c.iqr)
+        if normalized_months:
+            ranking_score_expression = (
+                (literal(0.7) * self._build_min_max_normalized_expression(boosted_score_expression))
+                + (literal(0.3) * self._build_min_max_normalized_expression(scored.c.seasonality_score))
+            ).cast(Float)
+            logistics_score_expression = self._build_min_max_normalized_expression(scored.c.seasonality_score)
+        else:
+            ranking_score_expression = boosted_score_expression.cast(Float)
+            logistics_score_expression = literal(1.0).cast(Float)
+
+        ranked = (
+            select(
+                scored.c.id,
+                scored.c.embedding_distance,
+                scored.c.semantic_score,
+                logistics_score_expression.label("logistics_score"),
+                ranking_score_expression.label("ranking_score"),
+            )
+            .select_from(scored.join(keyword_boost, true()))
+            .cte("ranked")
         )
-        match_expressions = []
-        for keyword in normalized_keywords:
-            pattern = f"%{keyword}%"
-            match_expressions.extend(expression.like(pattern) for expression in text_expressions)
 
-        statement = select(TravelDestinationRecord.id).where(or_(*match_expressions))
-        return set(self.session.exec(statement).all())
+        statement = (
+            self._select_records_without_embedding()
+            .add_columns(ranked.c.embedding_distance)
+            .add_columns(ranked.c.semantic_score)
+            .add_columns(ranked.c.logistics_score)
+            .add_columns(ranked.c.ranking_score)
+            .join(ranked, ranked.c.id == col(TravelDestinationRecord.id))
+            .order_by(
+                ranked.c.ranking_score.desc(),
+                ranked.c.semantic_score.desc(),
+                col(TravelDestinationRecord.id).asc(),
+            )
+        )
+        if limit is not None:
+            statement = statement.limit(limit)
+
+        rows = self.session.execute(statement).all()
+        return [
+            ScoredTravelDestination(
+                destination=row[0],
+                embedding_distance=float(row[1]),
+                semantic_score=float(row[2]),
+                logistics_score=float(row[3]),
+                ranking_score=float(row[4]),
+            )
+            for row in rows
+        ]
 
     def find(
         self,
@@ -374,7 +573,7 @@ class TravelDestinationRepository:
     ) -> list[TravelDestinationRecord]:
         self._validate_limit(request.limit)
 
-        statement = select(TravelDestinationRecord)
+        statement = self._select_records_without_embedding()
 
         for filter_spec in request.filters:
             statement = statement.where(self._build_query_filter_expression(filter_spec))
@@ -398,15 +597,16 @@ class TravelDestinationRepository:
         raise ValueError(f"unsupported query field: {filter_spec.field}")
 
     def _build_text_filter_expression(self, column: Any, filter_spec: TravelDestinationQueryFilter) -> Any:
+        normalized_column = self._normalized_text_column(filter_spec.field, column)
         if filter_spec.operator == "eq":
-            return self._normalize_text_expression(column) == literal(self._normalize_query_text_value(filter_spec.value))
+            return normalized_column == literal(self._normalize_query_text_value(filter_spec.value))
         if filter_spec.operator == "ne":
-            return self._normalize_text_expression(column) != literal(self._normalize_query_text_value(filter_spec.value))
+            return normalized_column != literal(self._normalize_query_text_value(filter_spec.value))
         if filter_spec.operator == "in":
             values = [self._normalize_query_text_value(value) for value in filter_spec.values]
-            return self._normalize_text_expression(column).in_(values)
+            return normalized_column.in_(values)
         if filter_spec.operator == "starts_with":
-            return self._normalize_text_expression(column).like(f"{self._normalize_query_text_value(filter_spec.value)}%")
+            return normalized_column.like(f"{self._normalize_query_text_value(filter_spec.value)}%")
         if filter_spec.operator == "like":
             return column.like(self._require_string_query_value(filter_spec.value))
         if filter_spec.operator == "ilike":
@@ -478,7 +678,7 @@ class TravelDestinationRepository:
 
         for field_name in request.text_fields:
             field_column = col(getattr(TravelDestinationRecord, field_name))
-            normalized_expression = self._normalize_text_expression(field_column)
+            normalized_expression = self._normalized_text_column(field_name, field_column)
             document_expressions.append(field_column)
             field_score_expressions.append(
                 case(
@@ -486,7 +686,10 @@ class TravelDestinationRepository:
                     else_=literal(0.0),
                 )
             )
-        search_document = func.to_tsvector("simple", func.concat_ws(" ", *document_expressions))
+        if tuple(request.text_fields) == DEFAULT_TEXT_FIELDS:
+            search_document = self._build_search_document_expression()
+        else:
+            search_document = func.to_tsvector("simple", func.concat_ws(" ", *document_expressions))
         ts_query = func.websearch_to_tsquery("simple", normalized_query)
         fts_rank_expression = func.ts_rank_cd(search_document, ts_query).cast(Float)
         field_score_expressions.append(func.least(literal(0.8), fts_rank_expression))
@@ -567,7 +770,7 @@ class TravelDestinationRepository:
     def _build_sort_expression(self, sort_spec: TravelDestinationQuerySort) -> Any:
         expression = col(getattr(TravelDestinationRecord, sort_spec.field))
         if sort_spec.field in TEXT_FIELDS:
-            expression = self._normalize_text_expression(expression)
+            expression = self._normalized_text_column(sort_spec.field, expression)
         if sort_spec.direction == "desc":
             return expression.desc()
         return expression.asc()
@@ -605,12 +808,7 @@ class TravelDestinationRepository:
         return score_sum_expression / literal(float(len(score_expressions)))
 
     def _build_month_score_expression(self, months: Sequence[str]) -> Any | None:
-        normalized_months: list[str] = []
-        for month in months:
-            normalized = month.lower().strip()
-            if normalized in VALID_MONTH_COLUMNS and normalized not in normalized_months:
-                normalized_months.append(normalized)
-
+        normalized_months = self._normalize_month_columns(months)
         if not normalized_months:
             return None
 
@@ -620,6 +818,44 @@ class TravelDestinationRepository:
 
         return month_score_sum / literal(float(len(normalized_months)))
 
+    def _normalize_month_columns(self, months: Sequence[str]) -> list[str]:
+        normalized_months: list[str] = []
+        for month in months:
+            normalized = month.lower().strip()
+            if normalized in VALID_MONTH_COLUMNS and normalized not in normalized_months:
+                normalized_months.append(normalized)
+        return normalized_months
+
+    def _build_min_max_normalized_expression(self, expression: Any) -> Any:
+        minimum = func.min(expression).over()
+        maximum = func.max(expression).over()
+        # Mirrors the Python reference: a constant column normalizes to 1.0 for every row.
+        return func.coalesce(
+            (expression - minimum) / func.nullif(maximum - minimum, literal(0.0), type_=Float),
+            literal(1.0),
+        ).cast(Float)
+
+    def _build_keyword_match_expression(self, keywords: Sequence[str]) -> Any | None:
+        normalized_keywords: list[str] = []
+        for keyword in keywords:
+            normalized_keyword = self._normalize_search_term(keyword)
+            if normalized_keyword and normalized_keyword not in normalized_keywords:
+                normalized_keywords.append(normalized_keyword)
+
+        if not normalized_keywords:
+            return None
+
+        text_expressions = (
+            NORMALIZED_TEXT_COLUMNS["region"],
+            NORMALIZED_TEXT_COLUMNS["parent_region"],
+            NORMALIZED_TEXT_COLUMNS["description"],
+        )
+        match_expressions = []
+        for keyword in normalized_keywords:
+            pattern = f"%{keyword}%"
+            match_expressions.extend(expression.like(pattern) for expression in text_expressions)
+        return or_(*match_expressions)
+
     def _validate_query_weights(self, request: TravelDestinationQuery) -> None:
         if request.semantic_query is not None and request.text_query is not None:
             if request.semantic_weight == 0.0 and request.text_weight == 0.0:
@@ -695,11 +931,99 @@ class TravelDestinationRepository:
         if weight < 0.0:
             raise ValueError(f"{field_name} must be greater than or equal to zero")
 
+    def _build_retrieval_filter_expressions(
+        self,
+        retrieval_filter: TravelDestinationRetrievalFilter | None,
+    ) -> list[Any]:
+        if retrieval_filter is None:
+            return []
+
+        expressions: list[Any] = []
+        parent_region_column = col(TravelDestinationRecord.parent_region)
+        cost_column = col(TravelDestinationRecord.cost_per_week)
+        id_column = col(TravelDestinationRecord.id)
+
+        if retrieval_filter.included_parent_regions:
+            expressions.append(parent_region_column.in_(list(retrieval_filter.included_parent_regions)))
+        if retrieval_filter.excluded_parent_regions:
+            expressions.append(parent_region_column.not_in(list(retrieval_filter.excluded_parent_regions)))
+        if retrieval_filter.min_cost_per_week is not None:
+            expressions.append(cost_column >= literal(float(retrieval_filter.min_cost_per_week)))
+        if retrieval_filter.max_cost_per_week is not None:
+            expressions.append(cost_column <= literal(float(retrieval_filter.max_cost_per_week)))
+
+        included_destination_ids = self._normalize_destination_ids(retrieval_filter.included_destination_ids)
+        if included_destination_ids:
+            expressions.append(id_column.in_(included_destination_ids))
+        excluded_destination_ids = self._normalize_destination_ids(retrieval_filter.excluded_destination_ids)
+        if excluded_destination_ids:
+            expressions.append(id_column.not_in(excluded_destination_ids))
+        return expressions
+
     def _apply_destination_id_filter(self, statement: Any, destination_ids: Sequence[str] | None) -> Any:
         if not destination_ids:
             return statement
         return statement.where(col(TravelDestinationRecord.id).in_(list(destination_ids)))
 
+    def _apply_approximate_candidate_filter(
+        self,
+        statement: Any,
+        *,
+        query_embedding: Sequence[float],
+        vector_search: VectorSearchConfiguration | None,
+        limit: int | None,
+        destination_ids: Sequence[str],
+        filter_expressions: Sequence[Any] = (),
+    ) -> Any:
+        if vector_search is None or vector_search.mode != "approximate":
+            return statement
+
+        candidate_limit = max(vector_search.candidate_limit, limit or 0)
+        iterative_scan = vector_search.iterative_scan
+        if (destination_ids or filter_expressions) and iterative_scan in (None, "off"):
+            # Without an iterative scan, filters only see the ef_search rows the index found first.
+            iterative_scan = "relaxed_order"
+        if candidate_limit > MAX_HNSW_EF_SEARCH and iterative_scan in (None, "off"):
+            raise ValueError(
+                f"limit must not exceed {MAX_HNSW_EF_SEARCH} in approximate mode without an iterative scan"
+            )
+        self._apply_vector_search_settings(
+            vector_search,
+            candidate_limit=candidate_limit,
+            iterative_scan=iterative_scan,
+        )
+
+        # The ORDER BY must be the bare `<=>` operator so the planner can serve it from the HNSW index.
+        candidate_statement = select(col(TravelDestinationRecord.id)).order_by(
+            col(TravelDestinationRecord.embedding).op("<=>")(list(query_embedding))
+        )
+        candidate_statement = self._apply_destination_id_filter(candidate_statement, destination_ids)
+        candidate_statement = candidate_statement.where(*filter_expressions)
+        candidates = candidate_statement.limit(candidate_limit).cte("ann_candidates").prefix_with("MATERIALIZED")
+        return statement.where(col(TravelDestinationRecord.id).in_(select(candidates.c.id)))
+
+    def _apply_vector_search_settings(
+        self,
+        vector_search: VectorSearchConfiguration,
+        *,
+        candidate_limit: int,
+        iterative_scan: str | None,
+    ) -> None:
+        # HNSW returns at most ef_search rows per scan, so widen it to cover the candidate set.
+        settings: dict[str, str] = {
+            "hnsw.ef_search": str(min(MAX_HNSW_EF_SEARCH, max(vector_search.ef_search, candidate_limit))),
+        }
+        if iterative_scan is not None:
+            settings["hnsw.iterative_scan"] = iterative_scan
+        if vector_search.max_scan_tuples is not None:
+            settings["hnsw.max_scan_tuples"] = str(vector_search.max_scan_tuples)
+
+        for name, value in settings.items():
+            self.session.execute(
+                text("SELECT set_config(:name, :value, true)"),
+                {"name": name, "value": value},
+            )
+
     def _normalize_destination_ids(self, destination_ids: Sequence[str] | None) -> list[str]:
         if destination_ids is None:
             return []
@@ -711,17 +1035,29 @@ class TravelDestinationRepository:
                 normalized_destination_ids.append(normalized_destination_id)
         return normalized_destination_ids
 
-    def _build_search_document_expression(self) -> Any:
-        return func.to_tsvector(
-            "simple",
-            func.concat_ws(
-                " ",
-                col(TravelDestinationRecord.region),
-                col(TravelDestinationRecord.parent_region),
-                col(TravelDestinationRecord.description),
-            ),
+    def _select_records_without_embedding(self) -> Any:
+        # Search and find results never need the vector; accessing it raises instead of lazy loading.
+        return select(TravelDestinationRecord).options(
+            defer(col(TravelDestinationRecord.embedding), raiseload=True)
         )
 
+    def _normalize_percentiles(self, percentiles: Sequence[float]) -> tuple[float, ...]:
+        normalized_percentiles = tuple(sorted({float(percentile) for percentile in percentiles}))
+        if not normalized_percentiles:
+            raise ValueError("percentiles must not be empty")
+        if any(not 0.0 <= percentile <= 1.0 for percentile in normalized_percentiles):
+            raise ValueError("percentiles must be between 0 and 1")
+        return normalized_percentiles
+
+    def _build_search_document_expression(self) -> Any:
+        return SEARCH_DOCUMENT_COLUMN
+
+    def _normalized_text_column(self, field_name: str, column: Any) -> Any:
+        normalized_column = NORMALIZED_TEXT_COLUMNS.get(field_name)
+        if normalized_column is not None:
+            return normalized_column
+        return self._normalize_text_expression(column)
+
     def _normalize_text_expression(self, expression: Any) -> Any:
         return func.trim(func.regexp_replace(func.lower(expression), r"[^a-z0-9]+", " ", "g"))
 
@@ -3,20 +3,32 @@ from __future__ import annotations
 from types import TracebackType
 
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from embeddings.protocols import TextEmbeddingModelProtocol
 from storage.configuration import StorageConfiguration
+from storage.db.engine import create_async_storage_engine
 from storage.db.engine import create_storage_engine
 from storage.db.engine import ensure_pgvector_extension
 from storage.db.migration_runner import run_storage_migrations
 from storage.health import StorageHealthReport
 from storage.health import check_storage_health
 from storage.health import validate_storage_health
+from storage.db.session import create_async_session_factory
 from storage.db.session import create_session_factory
+from storage.db.unit_of_work import AsyncStorageUnitOfWork
 from storage.db.unit_of_work import StorageUnitOfWork
+from storage.stores.async_chat_store import AsyncChatStore
+from storage.stores.async_travel_destination_store import AsyncTravelDestinationStore
 from storage.stores.chat_store import ChatStore
+from storage.stores.embedding_cache_store import EmbeddingCacheStore
+from storage.stores.llm_response_cache_store import LLMResponseCacheStore
+from storage.stores.recommendation_run_event_store import RecommendationRunEventStore
+from storage.stores.region_research_cache_store import RegionResearchCacheStore
 from storage.stores.storage_metadata_store import StorageMetadataStore
 from storage.stores.survey_store import SurveyStore
 from storage.stores.travel_destination_store import TravelDestinationStore
@@ -61,10 +73,37 @@ class Storage:
         self.travel_destinations = TravelDestinationStore(
             unit_of_work=self.unit_of_work,
             embedding_model=embedding_model,
+            vector_search=config.vector_search,
+            keyword_boosted_ranking=config.keyword_boosted_ranking,
+            in_memory_index=config.in_memory_index,
+            statistics_cache=config.statistics_cache,
         )
         self.storage_metadata = StorageMetadataStore(unit_of_work=self.unit_of_work)
         self.chat = ChatStore(unit_of_work=self.unit_of_work)
         self.survey = SurveyStore(unit_of_work=self.unit_of_work)
+        self.embedding_cache = EmbeddingCacheStore(
+            unit_of_work=self.unit_of_work,
+            embedding_dimension=self.embedding_dimension,
+        )
+        self.llm_response_cache = LLMResponseCacheStore(unit_of_work=self.unit_of_work)
+        self.region_research_cache = RegionResearchCacheStore(
+            unit_of_work=self.unit_of_work,
+            embedding_model=embedding_model,
+            embedding_dimension=self.embedding_dimension,
+        )
+        self.recommendation_run_events = RecommendationRunEventStore(unit_of_work=self.unit_of_work)
+
+        # The async engine opens no connections until first use; its pool is owned by the event loop.
+        self.async_engine: AsyncEngine = create_async_storage_engine(config.engine)
+        self.async_session_factory: async_sessionmaker[AsyncSession] = create_async_session_factory(
+            self.async_engine
+        )
+        self.async_unit_of_work = AsyncStorageUnitOfWork(session_factory=self.async_session_factory)
+        self.async_travel_destinations = AsyncTravelDestinationStore(
+            unit_of_work=self.async_unit_of_work,
+            travel_destination_store=self.travel_destinations,
+        )
+        self.async_chat = AsyncChatStore(unit_of_work=self.async_unit_of_work)
 
     def check_health(self) -> StorageHealthReport:
         """Return current storage health report for observability and readiness checks."""
@@ -83,7 +122,17 @@ class Storage:
         )
 
     def close(self) -> None:
-        """Release database connections held by the storage engine."""
+        """Release database connections held by the storage engines.
+
+        Async connections cannot be closed outside their event loop, so their pool is only
+        dereferenced here; call `aclose` from the loop to close them gracefully.
+        """
+        self.engine.dispose()
+        self.async_engine.sync_engine.dispose(close=False)
+
+    async def aclose(self) -> None:
+        """Close async database connections, then release the synchronous engine."""
+        await self.async_engine.dispose()
         self.engine.dispose()
 
     def __enter__(self) -> Storage:
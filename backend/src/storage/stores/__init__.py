@@ -1,21 +1,47 @@
+from storage.stores.async_chat_store import AsyncChatStore
+from storage.stores.async_travel_destination_store import AsyncTravelDestinationStore
 from storage.stores.chat_store import ChatStore
+from storage.stores.contracts import AsyncChatStoreProtocol
+from storage.stores.contracts import AsyncTravelDestinationStoreProtocol
 from storage.stores.contracts import ChatStoreProtocol
 from storage.stores.contracts import StorageMetadataStoreProtocol
 from storage.stores.contracts import TravelDestinationStoreProtocol
+from storage.stores.embedding_cache_store import EmbeddingCacheStore
+from storage.stores.llm_response_cache_store import LLMResponseCacheStore
+from storage.stores.projection_models import TravelDestinationSummary
+from storage.stores.recommendation_run_event_store import RecommendationRunEventStore
+from storage.stores.region_research_cache_store import RegionResearchCacheStore
 from storage.stores.search_models import ScoredTravelDestination
+from storage.stores.search_models import TravelDestinationRetrievalFilter
+from storage.stores.search_models import TravelNumericFieldStatistics
 from storage.stores.search_models import TravelSearchConstraints
 from storage.stores.storage_metadata_store import StorageMetadataStore
 from storage.stores.survey_store import SurveyStore
+from storage.stores.travel_destination_memory_index import TravelDestinationMemoryIndex
+from storage.stores.travel_destination_statistics_cache import TravelDestinationStatisticsCache
 from storage.stores.travel_destination_store import TravelDestinationStore
 
 __all__ = [
+    "AsyncChatStore",
+    "AsyncChatStoreProtocol",
+    "AsyncTravelDestinationStore",
+    "AsyncTravelDestinationStoreProtocol",
     "ChatStore",
     "ChatStoreProtocol",
+    "EmbeddingCacheStore",
+    "LLMResponseCacheStore",
+    "RecommendationRunEventStore",
+    "RegionResearchCacheStore",
     "ScoredTravelDestination",
     "StorageMetadataStore",
     "StorageMetadataStoreProtocol",
     "SurveyStore",
     "TravelDestinationStoreProtocol",
+    "TravelDestinationRetrievalFilter",
+    "TravelDestinationSummary",
+    "TravelNumericFieldStatistics",
     "TravelSearchConstraints",
+    "TravelDestinationMemoryIndex",
+    "TravelDestinationStatisticsCache",
     "TravelDestinationStore",
 ]
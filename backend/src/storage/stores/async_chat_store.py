@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+from storage.db.unit_of_work import AsyncStorageUnitOfWork
+from storage.models.chat_record import ChatRecord
+from storage.repositories.chat_repository import ChatRepository
+
+
+class AsyncChatStore:
+    """Asyncio store facade for chat session memory.
+
+    Queries run on psycopg's async driver; the synchronous repositories are reused through
+    `AsyncSession.run_sync`, so SQL stays defined in one place.
+    """
+
+    def __init__(self, unit_of_work: AsyncStorageUnitOfWork) -> None:
+        self.unit_of_work = unit_of_work
+
+    async def load_session(
+        self,
+        user_id: UUID | str,
+        session_id: UUID | str,
+        limit: int | None = None,
+    ) -> list[ChatRecord]:
+        """Load persisted rows for one user/session pair, optionally only the latest `limit` rows."""
+        async with self.unit_of_work.read() as session:
+            return await session.run_sync(
+                lambda sync_session: ChatRepository(sync_session).list_by_session(
+                    user_id=user_id,
+                    session_id=session_id,
+                    limit=limit,
+                )
+            )
+
+    async def upsert_many(self, rows: Sequence[ChatRecord]) -> None:
+        """Insert or update many session memory rows."""
+        async with self.unit_of_work.write() as session:
+            await session.run_sync(lambda sync_session: ChatRepository(sync_session).upsert_many(rows))
+
+    async def append_travel_destinations_evaluations(
+        self,
+        user_id: UUID | str,
+        session_id: UUID | str,
+        chat_history_number: int,
+        evaluations: Sequence[dict[str, Any]],
+    ) -> bool:
+        """Append region research to one saved row; returns False when the row is not saved yet."""
+        async with self.unit_of_work.write() as session:
+            return await session.run_sync(
+                lambda sync_session: ChatRepository(sync_session).append_travel_destinations_evaluations(
+                    user_id=user_id,
+                    session_id=session_id,
+                    chat_history_number=chat_history_number,
+                    evaluations=evaluations,
+                )
+            )
+
+    async def delete_session(
+        self,
+        user_id: UUID | str,
+        session_id: UUID | str,
+    ) -> None:
+        """Delete all rows for one user/session pair."""
+        async with self.unit_of_work.write() as session:
+            await session.run_sync(
+                lambda sync_session: ChatRepository(sync_session).delete_by_session(
+                    user_id=user_id,
+                    session_id=session_id,
+                )
+            )
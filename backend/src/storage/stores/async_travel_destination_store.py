@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from collections.abc import Sequence
+from typing import TypeVar
+
+from sqlmodel import Session
+
+from storage.configuration import VectorSearchConfiguration
+from storage.db.unit_of_work import AsyncStorageUnitOfWork
+from storage.models.travel_destination import TravelDestinationRecord
+from storage.repositories.storage_metadata_repository import StorageMetadataRepository
+from storage.repositories.travel_destination_repository import TravelDestinationRepository
+from storage.stores.projection_models import TravelDestinationSummary
+from storage.stores.search_models import DEFAULT_STATISTICS_PERCENTILES
+from storage.stores.search_models import TRAVEL_DESTINATION_STATISTICS_KEY_PREFIX
+from storage.stores.search_models import ScoredTravelDestination
+from storage.stores.search_models import TravelCostStatistics
+from storage.stores.search_models import TravelDestinationRetrievalFilter
+from storage.stores.search_models import TravelNumericFieldStatistics
+from storage.stores.travel_destination_statistics_cache import normalize_requested_percentiles
+from storage.stores.travel_destination_statistics_cache import select_percentiles
+from storage.stores.travel_destination_store import TravelDestinationStore
+
+ResultT = TypeVar("ResultT")
+
+
+class AsyncTravelDestinationStore:
+    """Asyncio store facade for the travel destination operations used by the recommendation graph.
+
+    Configuration, the statistics cache and the in-memory index are shared with the wrapped
+    synchronous store. Database work runs on psycopg's async driver by reusing the synchronous
+    repositories through `AsyncSession.run_sync`. Query embedding, in-memory index refreshes and
+    the Python reference ranking stay blocking and are moved to worker threads.
+    """
+
+    def __init__(
+        self,
+        unit_of_work: AsyncStorageUnitOfWork,
+        *,
+        travel_destination_store: TravelDestinationStore,
+    ) -> None:
+        if travel_destination_store is None:
+            raise ValueError("travel_destination_store is required")
+
+        self.unit_of_work = unit_of_work
+        self.travel_destination_store = travel_destination_store
+        self.embedding_dimension = travel_destination_store.embedding_dimension
+
+    async def size(self) -> int:
+        """Return number of persisted travel destinations."""
+        return await self._read(lambda repository: repository.count())
+
+    async def list_summaries(self, destination_ids: Sequence[str] | None = None) -> list[TravelDestinationSummary]:
+        """Return embedding-free destination summaries, optionally for selected IDs only."""
+        return await self._read(lambda repository: repository.list_summaries(destination_ids))
+
+    async def list_by_ids(self, destination_ids: Sequence[str]) -> list[TravelDestinationRecord]:
+        """Return full travel destination records, including embeddings, for selected IDs."""
+        return await self._read(lambda repository: repository.list_by_ids(destination_ids))
+
+    async def upsert_many(self, rows: Sequence[TravelDestinationRecord]) -> None:
+        """Insert or update many travel destinations."""
+
+        def upsert(session: Session) -> None:
+            self._repository(session).upsert_many(rows)
+            StorageMetadataRepository(session).delete_by_prefix(TRAVEL_DESTINATION_STATISTICS_KEY_PREFIX)
+
+        async with self.unit_of_work.write() as session:
+            await session.run_sync(upsert)
+
+        self.travel_destination_store.invalidate_memory_index()
+        self.travel_destination_store.invalidate_statistics()
+
+    async def cost_per_week_statistics(self) -> TravelCostStatistics:
+        """Return percentile statistics for destination weekly costs."""
+        statistics = await self.numeric_field_statistics("cost_per_week", DEFAULT_STATISTICS_PERCENTILES)
+        return TravelCostStatistics(
+            percentile_50=statistics.percentile(0.5),
+            percentile_75=statistics.percentile(0.75),
+        )
+
+    async def numeric_field_statistics(
+        self,
+        field_name: str,
+        percentiles: Sequence[float] = DEFAULT_STATISTICS_PERCENTILES,
+    ) -> TravelNumericFieldStatistics:
+        """Return percentiles of a numeric destination field through the shared statistics cache."""
+        statistics_cache = self.travel_destination_store.statistics_cache
+        requested = normalize_requested_percentiles(percentiles)
+        if not statistics_cache.enabled:
+            return await self._read(lambda repository: repository.numeric_field_statistics(field_name, requested))
+
+        cached, generation = statistics_cache.lookup(field_name, requested)
+        if cached is not None:
+            return cached
+
+        async with self.unit_of_work.write() as session:
+            percentiles_by_fraction = await session.run_sync(
+                lambda sync_session: statistics_cache.load(sync_session, field_name, requested)
+            )
+        statistics_cache.remember(field_name, percentiles_by_fraction, generation)
+        return select_percentiles(field_name, percentiles_by_fraction, requested)
+
+    async def semantic_search(
+        self,
+        query: str,
+        limit: int | None = None,
+        destination_ids: Sequence[str] | None = None,
+        vector_search: VectorSearchConfiguration | None = None,
+    ) -> list[ScoredTravelDestination]:
+        """Run nearest-neighbor semantic search over embedding vectors."""
+        store = self.travel_destination_store
+        query_embedding = await asyncio.to_thread(store.embed_query, query)
+
+        if store.in_memory_index.enabled and vector_search is None:
+            memory_index = await asyncio.to_thread(store.current_memory_index)
+            if memory_index is not None:
+                return memory_index.semantic_search(
+                    query_embedding,
+                    limit=limit,
+                    destination_ids=destination_ids,
+                )
+
+        return await self._read(
+            lambda repository: repository.semantic_search(
+                query_embedding=query_embedding,
+                limit=limit,
+                destination_ids=destination_ids,
+                vector_search=vector_search or store.vector_search,
+            )
+        )
+
+    async def keyword_boosted_search(
+        self,
+        semantic_query: str,
+        keywords: list[str],
+        *,
+        seasonality_months: Sequence[str] = (),
+        limit: int | None = None,
+        vector_search: VectorSearchConfiguration | None = None,
+        retrieval_filter: TravelDestinationRetrievalFilter | None = None,
+    ) -> list[ScoredTravelDestination]:
+        """Run recommendation retrieval with the same ranking paths as the synchronous store."""
+        store = self.travel_destination_store
+        query_embedding = await asyncio.to_thread(store.embed_query, semantic_query)
+        resolved_vector_search = vector_search or store.vector_search
+
+        if store.in_memory_index.enabled and vector_search is None:
+            memory_index = await asyncio.to_thread(store.current_memory_index)
+            if memory_index is not None:
+                return memory_index.keyword_boosted_search(
+                    query_embedding,
+                    keywords,
+                    seasonality_months=seasonality_months,
+                    limit=limit,
+                    retrieval_filter=retrieval_filter,
+                )
+
+        if store.keyword_boosted_ranking == "python":
+            return await asyncio.to_thread(
+                store.keyword_boosted_search_in_python,
+                query_embedding,
+                keywords,
+                seasonality_months=seasonality_months,
+                limit=limit,
+                vector_search=resolved_vector_search,
+                retrieval_filter=retrieval_filter,
+            )
+
+        return await self._read(
+            lambda repository: repository.keyword_boosted_search(
+                query_embedding=query_embedding,
+                keywords=keywords,
+                seasonality_months=seasonality_months,
+                limit=limit,
+                vector_search=resolved_vector_search,
+                retrieval_filter=retrieval_filter,
+            )
+        )
+
+    async def _read(self, operation: Callable[[TravelDestinationRepository], ResultT]) -> ResultT:
+        async with self.unit_of_work.read() as session:
+            return await session.run_sync(lambda sync_session: operation(self._repository(sync_session)))
+
+    def _repository(self, session: Session) -> TravelDestinationRepository:
+        return TravelDestinationRepository(
+            session,
+            embedding_dimension=self.embedding_dimension,
+        )
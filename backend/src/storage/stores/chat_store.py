@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from typing import Any
 from uuid import UUID
 
 from storage.db.unit_of_work import StorageUnitOfWork
@@ -20,11 +21,12 @@ class ChatStore:
         self,
         user_id: UUID | str,
         session_id: UUID | str,
+        limit: int | None = None,
     ) -> list[ChatRecord]:
-        """Load persisted rows for one user/session pair."""
+        """Load persisted rows for one user/session pair, optionally only the latest `limit` rows."""
         with self.unit_of_work.read() as session:
             repository = ChatRepository(session)
-            return repository.list_by_session(user_id=user_id, session_id=session_id)
+            return repository.list_by_session(user_id=user_id, session_id=session_id, limit=limit)
 
     def upsert_many(self, rows: Sequence[ChatRecord]) -> None:
         """Insert or update many session memory rows."""
@@ -32,6 +34,23 @@ class ChatStore:
             repository = ChatRepository(session)
             repository.upsert_many(rows)
 
+    def append_travel_destinations_evaluations(
+        self,
+        user_id: UUID | str,
+        session_id: UUID | str,
+        chat_history_number: int,
+        evaluations: Sequence[dict[str, Any]],
+    ) -> bool:
+        """Append region research to one saved row; returns False when the row is not saved yet."""
+        with self.unit_of_work.write() as session:
+            repository = ChatRepository(session)
+            return repository.append_travel_destinations_evaluations(
+                user_id=user_id,
+                session_id=session_id,
+                chat_history_number=chat_history_number,
+                evaluations=evaluations,
+            )
+
     def delete_session(
         self,
         user_id: UUID | str,
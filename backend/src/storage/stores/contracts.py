@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from typing import Any
 from typing import Protocol
 from uuid import UUID
 
+from storage.configuration import VectorSearchConfiguration
 from storage.models.chat_record import ChatRecord
 from storage.models.storage_metadata import StorageMetadataRecord
 from storage.models.travel_destination import TravelDestinationRecord
+from storage.stores.projection_models import TravelDestinationSummary
 from storage.stores.query_models import QueriedTravelDestination
 from storage.stores.query_models import TravelDestinationQuery
 from storage.stores.search_models import TravelCostStatistics
+from storage.stores.search_models import TravelNumericFieldStatistics
 from storage.stores.search_models import ScoredTravelDestination
+from storage.stores.search_models import TravelDestinationRetrievalFilter
 from storage.stores.search_models import TravelSearchConstraints
 
 
@@ -23,8 +28,16 @@ class TravelDestinationStoreProtocol(Protocol):
 
     def cost_per_week_statistics(self) -> TravelCostStatistics: ...
 
+    def numeric_field_statistics(
+        self,
+        field_name: str,
+        percentiles: Sequence[float] = ...,
+    ) -> TravelNumericFieldStatistics: ...
+
     def upsert_many(self, rows: Sequence[TravelDestinationRecord]) -> None: ...
 
+    def list_summaries(self, destination_ids: Sequence[str] | None = None) -> list[TravelDestinationSummary]: ...
+
     def list_by_ids(self, destination_ids: Sequence[str]) -> list[TravelDestinationRecord]: ...
 
     def query(self, request: TravelDestinationQuery) -> list[QueriedTravelDestination]: ...
@@ -36,6 +49,7 @@ class TravelDestinationStoreProtocol(Protocol):
         query: str,
         limit: int | None = None,
         destination_ids: Sequence[str] | None = None,
+        vector_search: VectorSearchConfiguration | None = None,
     ) -> list[ScoredTravelDestination]: ...
 
     def vector_search(
@@ -53,6 +67,7 @@ class TravelDestinationStoreProtocol(Protocol):
         semantic_weight: float = 0.85,
         logistics_weight: float = 0.15,
         destination_ids: Sequence[str] | None = None,
+        vector_search: VectorSearchConfiguration | None = None,
     ) -> list[ScoredTravelDestination]: ...
 
     def exact_text_search(
@@ -68,6 +83,8 @@ class TravelDestinationStoreProtocol(Protocol):
         *,
         seasonality_months: Sequence[str] = (),
         limit: int | None = None,
+        vector_search: VectorSearchConfiguration | None = None,
+        retrieval_filter: TravelDestinationRetrievalFilter | None = None,
     ) -> list[ScoredTravelDestination]: ...
 
 
@@ -78,13 +95,84 @@ class ChatStoreProtocol(Protocol):
         self,
         user_id: UUID | str,
         session_id: UUID | str,
+        limit: int | None = None,
     ) -> list[ChatRecord]: ...
 
     def upsert_many(self, rows: Sequence[ChatRecord]) -> None: ...
 
+    def append_travel_destinations_evaluations(
+        self,
+        user_id: UUID | str,
+        session_id: UUID | str,
+        chat_history_number: int,
+        evaluations: Sequence[dict[str, Any]],
+    ) -> bool: ...
+
     def delete_session(self, user_id: UUID | str, session_id: UUID | str) -> None: ...
 
 
+class AsyncTravelDestinationStoreProtocol(Protocol):
+    """Contract for asyncio travel destination store operations used by the recommendation graph."""
+
+    async def size(self) -> int: ...
+
+    async def list_summaries(self, destination_ids: Sequence[str] | None = None) -> list[TravelDestinationSummary]: ...
+
+    async def list_by_ids(self, destination_ids: Sequence[str]) -> list[TravelDestinationRecord]: ...
+
+    async def upsert_many(self, rows: Sequence[TravelDestinationRecord]) -> None: ...
+
+    async def cost_per_week_statistics(self) -> TravelCostStatistics: ...
+
+    async def numeric_field_statistics(
+        self,
+        field_name: str,
+        percentiles: Sequence[float] = ...,
+    ) -> TravelNumericFieldStatistics: ...
+
+    async def semantic_search(
+        self,
+        query: str,
+        limit: int | None = None,
+        destination_ids: Sequence[str] | None = None,
+        vector_search: VectorSearchConfiguration | None = None,
+    ) -> list[ScoredTravelDestination]: ...
+
+    async def keyword_boosted_search(
+        self,
+        semantic_query: str,
+        keywords: list[str],
+        *,
+        seasonality_months: Sequence[str] = (),
+        limit: int | None = None,
+        vector_search: VectorSearchConfiguration | None = None,
+        retrieval_filter: TravelDestinationRetrievalFilter | None = None,
+    ) -> list[ScoredTravelDestination]: ...
+
+
+class AsyncChatStoreProtocol(Protocol):
+    """Contract for asyncio chat session memory operations."""
+
+    async def load_session(
+        self,
+        user_id: UUID | str,
+        session_id: UUID | str,
+        limit: int | None = None,
+    ) -> list[ChatRecord]: ...
+
+    async def upsert_many(self, rows: Sequence[ChatRecord]) -> None: ...
+
+    async def append_travel_destinations_evaluations(
+        self,
+        user_id: UUID | str,
+        session_id: UUID | str,
+        chat_history_number: int,
+        evaluations: Sequence[dict[str, Any]],
+    ) -> bool: ...
+
+    async def delete_session(self, user_id: UUID | str, session_id: UUID | str) -> None: ...
+
+
 class StorageMetadataStoreProtocol(Protocol):
     """Contract for storage metadata key-value store operations."""
 
@@ -99,3 +187,5 @@ class StorageMetadataStoreProtocol(Protocol):
     def upsert(self, key: str, value: str) -> None: ...
 
     def delete(self, key: str) -> None: ...
+
+    def delete_by_prefix(self, prefix: str) -> None: ...
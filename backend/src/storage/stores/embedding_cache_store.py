@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from storage.db.unit_of_work import StorageUnitOfWork
+from storage.models.embedding_cache import EmbeddingCacheRecord
+from storage.repositories.embedding_cache_repository import EmbeddingCacheRepository
+
+
+class EmbeddingCacheStore:
+    """Store facade for persisted query embeddings, usable as a persistent embedding cache backend."""
+
+    def __init__(self, unit_of_work: StorageUnitOfWork, *, embedding_dimension: int) -> None:
+        self.unit_of_work = unit_of_work
+        self.embedding_dimension = embedding_dimension
+
+    def get(self, provider: str, model_name: str, text_hash: str) -> list[float] | None:
+        """Return the cached embedding vector if present."""
+        with self.unit_of_work.read() as session:
+            repository = EmbeddingCacheRepository(session, embedding_dimension=self.embedding_dimension)
+            record = repository.get(provider, model_name, text_hash)
+            if record is None:
+                return None
+            return [float(value) for value in record.embedding]
+
+    def put(self, provider: str, model_name: str, text_hash: str, embedding: Sequence[float]) -> None:
+        """Insert or replace one cached embedding vector."""
+        with self.unit_of_work.write() as session:
+            repository = EmbeddingCacheRepository(session, embedding_dimension=self.embedding_dimension)
+            repository.upsert_many(
+                [
+                    EmbeddingCacheRecord(
+                        provider=provider,
+                        model_name=model_name,
+                        text_hash=text_hash,
+                        embedding=list(embedding),
+                    )
+                ]
+            )
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from typing import Any
+
+from storage.db.unit_of_work import StorageUnitOfWork
+from storage.models.llm_response_cache import LLMResponseCacheRecord
+from storage.repositories.llm_response_cache_repository import LLMResponseCacheRepository
+
+
+class LLMResponseCacheStore:
+    """Store facade for persisted structured LLM responses, usable as a persistent LLM cache backend."""
+
+    def __init__(self, unit_of_work: StorageUnitOfWork) -> None:
+        self.unit_of_work = unit_of_work
+
+    def get(self, cache_key: str) -> dict[str, Any] | None:
+        """Return the cached response payload if present and not expired."""
+        with self.unit_of_work.read() as session:
+            repository = LLMResponseCacheRepository(session)
+            record = repository.get(cache_key, now=datetime.now(UTC))
+            if record is None:
+                return None
+            return dict(record.response)
+
+    def put(self, cache_key: str, agent_name: str, response: dict[str, Any], ttl_s: float) -> None:
+        """Insert or replace one cached response that expires after `ttl_s` seconds."""
+        if ttl_s <= 0:
+            raise ValueError("ttl_s must be greater than zero")
+
+        created_at = datetime.now(UTC)
+        with self.unit_of_work.write() as session:
+            repository = LLMResponseCacheRepository(session)
+            repository.upsert_many(
+                [
+                    LLMResponseCacheRecord(
+                        cache_key=cache_key,
+                        agent_name=agent_name,
+                        response=response,
+                        created_at=created_at,
+                        expires_at=created_at + timedelta(seconds=ttl_s),
+                    )
+                ]
+            )
+
+    def delete_expired(self) -> int:
+        """Delete expired responses and return the number of removed rows."""
+        with self.unit_of_work.write() as session:
+            repository = LLMResponseCacheRepository(session)
+            return repository.delete_expired(now=datetime.now(UTC))
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class TravelDestinationSummary:
+    """Embedding-free destination view for listings and prompt context."""
+
+    id: str
+    parent_region: str
+    region: str
+    description: str
+    popularity: float
+    cost_per_week: float
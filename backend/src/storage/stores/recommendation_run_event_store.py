@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from typing import Any
+from uuid import UUID
+
+from storage.db.unit_of_work import StorageUnitOfWork
+from storage.models.recommendation_run_event import RecommendationRunEventRecord
+from storage.repositories.recommendation_run_event_repository import RecommendationRunEventRepository
+
+
+class RecommendationRunEventStore:
+    """Store facade for streamed recommendation run events, usable as a replay buffer backend."""
+
+    def __init__(self, unit_of_work: StorageUnitOfWork) -> None:
+        self.unit_of_work = unit_of_work
+
+    def append_many(
+        self,
+        run_id: str,
+        user_id: str,
+        session_id: str,
+        events: Sequence[dict[str, Any]],
+        ttl_s: float,
+    ) -> None:
+        """Store `{"event_id", "event", "data"}` events of one run that expire after `ttl_s` seconds."""
+        if ttl_s <= 0:
+            raise ValueError("ttl_s must be greater than zero")
+        if not events:
+            return
+
+        created_at = datetime.now(UTC)
+        with self.unit_of_work.write() as session:
+            repository = RecommendationRunEventRepository(session)
+            repository.insert_many(
+                [
+                    RecommendationRunEventRecord(
+                        run_id=UUID(run_id),
+                        event_id=event["event_id"],
+                        user_id=UUID(user_id),
+                        session_id=UUID(session_id),
+                        event=event["event"],
+                        data=event["data"],
+                        created_at=created_at,
+                        expires_at=created_at + timedelta(seconds=ttl_s),
+                    )
+                    for event in events
+                ]
+            )
+
+    def list_after(
+        self,
+        run_id: str,
+        user_id: str,
+        session_id: str,
+        after_event_id: int,
+    ) -> list[dict[str, Any]]:
+        """Return the stored events of one session's run after `after_event_id`, in order."""
+        with self.unit_of_work.read() as session:
+            repository = RecommendationRunEventRepository(session)
+            records = repository.list_after(
+                UUID(run_id),
+                user_id=UUID(user_id),
+                session_id=UUID(session_id),
+                after_event_id=after_event_id,
+                now=datetime.now(UTC),
+            )
+            return [
+                {"event_id": record.event_id, "event": record.event, "data": dict(record.data)}
+                for record in records
+            ]
+
+    def delete_expired(self) -> int:
+        """Delete expired events and return the number of removed rows."""
+        with self.unit_of_work.write() as session:
+            repository = RecommendationRunEventRepository(session)
+            return repository.delete_expired(now=datetime.now(UTC))
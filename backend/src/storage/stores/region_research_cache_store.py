@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Mapping
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from typing import Any
+
+from embeddings.protocols import TextEmbeddingModelProtocol
+from storage.db.unit_of_work import StorageUnitOfWork
+from storage.models.region_research_cache import RegionResearchCacheRecord
+from storage.repositories.region_research_cache_repository import RegionResearchCacheRepository
+
+
+def _normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+class RegionResearchCacheStore:
+    """Store facade for persisted region research, usable as a persistent research cache backend.
+
+    Entries are matched by region and by cosine similarity between the embeddings of the
+    synthesized queries, so near-duplicate intents reuse the same research.
+    """
+
+    def __init__(
+        self,
+        unit_of_work: StorageUnitOfWork,
+        *,
+        embedding_model: TextEmbeddingModelProtocol,
+        embedding_dimension: int,
+    ) -> None:
+        if embedding_model is None:
+            raise ValueError("embedding_model is required")
+
+        self.unit_of_work = unit_of_work
+        self.embedding_model = embedding_model
+        self.embedding_dimension = embedding_dimension
+
+    def get_similar(
+        self,
+        region_ids: list[str],
+        synthesized_query: str,
+        min_similarity: float,
+    ) -> dict[str, dict[str, Any]]:
+        """Return cached research per region whose query is at least `min_similarity` cosine-similar."""
+        if not region_ids:
+            return {}
+
+        query_embedding = self._embed_query(synthesized_query)
+        with self.unit_of_work.read() as session:
+            repository = RegionResearchCacheRepository(session, embedding_dimension=self.embedding_dimension)
+            matches = repository.find_nearest(region_ids, query_embedding, now=datetime.now(UTC))
+
+        return {
+            record.region_id: dict(record.research)
+            for record, distance in matches
+            if 1.0 - distance >= min_similarity
+        }
+
+    def put_many(
+        self,
+        research_by_region_id: Mapping[str, dict[str, Any]],
+        synthesized_query: str,
+        ttl_s: float,
+    ) -> None:
+        """Insert or replace research for several regions that expires after `ttl_s` seconds."""
+        if ttl_s <= 0:
+            raise ValueError("ttl_s must be greater than zero")
+        if not research_by_region_id:
+            return
+
+        query_embedding = self._embed_query(synthesized_query)
+        query_hash = hashlib.sha256(_normalize_query(synthesized_query).encode("utf-8")).hexdigest()
+        created_at = datetime.now(UTC)
+        with self.unit_of_work.write() as session:
+            repository = RegionResearchCacheRepository(session, embedding_dimension=self.embedding_dimension)
+            repository.upsert_many(
+                [
+                    RegionResearchCacheRecord(
+                        region_id=region_id,
+                        query_hash=query_hash,
+                        synthesized_query=synthesized_query,
+                        query_embedding=query_embedding,
+                        research=research,
+                        created_at=created_at,
+                        expires_at=created_at + timedelta(seconds=ttl_s),
+                    )
+                    for region_id, research in research_by_region_id.items()
+                ]
+            )
+
+    def delete_expired(self) -> int:
+        """Delete expired research and return the number of removed rows."""
+        with self.unit_of_work.write() as session:
+            repository = RegionResearchCacheRepository(session, embedding_dimension=self.embedding_dimension)
+            return repository.delete_expired(now=datetime.now(UTC))
+
+    def _embed_query(self, query: str) -> list[float]:
+        if not query.strip():
+            raise ValueError("synthesized_query must not be empty")
+
+        return self.embedding_model.embed_query(query)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from dataclasses import field
 
 from storage.models.travel_destination import TravelDestinationRecord
 
@@ -14,6 +15,31 @@ class TravelSearchConstraints:
     months: tuple[str, ...] = ()
 
 
+@dataclass(frozen=True, slots=True)
+class TravelDestinationRetrievalFilter:
+    """Hard predicates applied to candidate destinations before ranking and limiting.
+
+    Empty collections and `None` bounds leave the corresponding dimension unrestricted.
+    """
+
+    included_parent_regions: tuple[str, ...] = ()
+    excluded_parent_regions: tuple[str, ...] = ()
+    min_cost_per_week: float | None = None
+    max_cost_per_week: float | None = None
+    included_destination_ids: tuple[str, ...] = ()
+    excluded_destination_ids: tuple[str, ...] = ()
+
+    def is_empty(self) -> bool:
+        return not (
+            self.included_parent_regions
+            or self.excluded_parent_regions
+            or self.min_cost_per_week is not None
+            or self.max_cost_per_week is not None
+            or self.included_destination_ids
+            or self.excluded_destination_ids
+        )
+
+
 @dataclass(frozen=True, slots=True)
 class TravelCostStatistics:
     """Percentile statistics for destination weekly cost."""
@@ -22,6 +48,23 @@ class TravelCostStatistics:
     percentile_75: float | None
 
 
+TRAVEL_DESTINATION_STATISTICS_KEY_PREFIX = "travel_destinations.statistics."
+DEFAULT_STATISTICS_PERCENTILES: tuple[float, ...] = (0.5, 0.75)
+
+
+@dataclass(frozen=True, slots=True)
+class TravelNumericFieldStatistics:
+    """Continuous percentiles of one numeric destination field keyed by fraction (e.g. `0.75`)."""
+
+    field_name: str
+    percentiles: dict[float, float | None] = field(default_factory=dict)
+
+    def percentile(self, fraction: float) -> float | None:
+        if fraction not in self.percentiles:
+            raise KeyError(f"percentile {fraction} was not computed for {self.field_name}")
+        return self.percentiles[fraction]
+
+
 @dataclass(frozen=True, slots=True)
 class ScoredTravelDestination:
     """Search result with semantic and logistics scoring details."""
@@ -48,3 +48,9 @@ class StorageMetadataStore:
         with self.unit_of_work.write() as session:
             repository = StorageMetadataRepository(session)
             repository.delete(key)
+
+    def delete_by_prefix(self, prefix: str) -> None:
+        """Delete all metadata key-value pairs whose key starts with the prefix."""
+        with self.unit_of_work.write() as session:
+            repository = StorageMetadataRepository(session)
+            repository.delete_by_prefix(prefix)
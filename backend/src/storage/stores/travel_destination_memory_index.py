@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+
+import numpy as np
+
+from storage.models.travel_destination import TravelDestinationRecord
+from storage.stores.search_models import ScoredTravelDestination
+from storage.stores.search_models import TravelDestinationRetrievalFilter
+from storage.stores.search_models import TravelSearchConstraints
+
+MONTH_COLUMNS: tuple[str, ...] = (
+    "jan",
+    "feb",
+    "mar",
+    "apr",
+    "may",
+    "jun",
+    "jul",
+    "aug",
+    "sep",
+    "oct",
+    "nov",
+    "dec",
+)
+
+_NON_ALPHANUMERIC_PATTERN = re.compile(r"[^a-z0-9]+")
+
+
+class TravelDestinationMemoryIndex:
+    """Immutable in-process snapshot of the destination catalog for vectorized ranking.
+
+    Scores mirror the SQL ranking in `TravelDestinationRepository`: cosine similarity,
+    the logistics blend of `hybrid_search`, and the IQR keyword boost with min-max
+    seasonality blending of `keyword_boosted_search`.
+    """
+
+    def __init__(
+        self,
+        records: Sequence[TravelDestinationRecord],
+        *,
+        version: str,
+        embedding_dimension: int,
+    ) -> None:
+        if embedding_dimension <= 0:
+            raise ValueError("embedding_dimension must be greater than zero")
+
+        self.version = version
+        self.embedding_dimension = embedding_dimension
+        self.records: tuple[TravelDestinationRecord, ...] = tuple(records)
+        self._positions_by_id = {record.id: position for position, record in enumerate(self.records)}
+
+        embeddings = np.zeros((len(self.records), embedding_dimension), dtype=np.float32)
+        for position, record in enumerate(self.records):
+            if len(record.embedding) != embedding_dimension:
+                raise ValueError(
+                    "Embedding dimension mismatch: "
+                    f"expected {embedding_dimension}, got {len(record.embedding)} for destination {record.id!r}"
+                )
+            embeddings[position] = np.asarray(record.embedding, dtype=np.float32)
+        self._embeddings = np.ascontiguousarray(_normalize_rows(embeddings))
+
+        self._cost_per_week = np.array([record.cost_per_week for record in self.records], dtype=np.float64)
+        self._popularity = np.array([record.popularity for record in self.records], dtype=np.float64)
+        self._months = _build_column_matrix(self.records, MONTH_COLUMNS)
+        # Ascending id rank used as the final tie-breaker, matching `ORDER BY id ASC`.
+        self._id_ranks = np.empty(len(self.records), dtype=np.int64)
+        self._id_ranks[np.argsort(np.array([record.id for record in self.records], dtype=object))] = np.arange(
+            len(self.records)
+        )
+        self._search_texts = tuple(
+            (
+                _normalize_text(record.region),
+                _normalize_text(record.parent_region),
+                _normalize_text(record.description),
+            )
+            for record in self.records
+        )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def semantic_search(
+        self,
+        query_embedding: Sequence[float],
+        limit: int | None = None,
+        destination_ids: Sequence[str] | None = None,
+        retrieval_filter: TravelDestinationRetrievalFilter | None = None,
+    ) -> list[ScoredTravelDestination]:
+        """Return nearest destinations by cosine similarity."""
+        semantic_scores = self._semantic_scores(query_embedding)
+        positions = self._candidate_positions(destination_ids, retrieval_filter)
+        ranked_positions = self._top_positions(
+            positions,
+            primary_scores=semantic_scores,
+            secondary_scores=semantic_scores,
+            limit=limit,
+        )
+        return [
+            self._build_result(
+                position,
+                semantic_score=float(semantic_scores[position]),
+                logistics_score=1.0,
+                ranking_score=float(semantic_scores[position]),
+            )
+            for position in ranked_positions
+        ]
+
+    def hybrid_search(
+        self,
+        query_embedding: Sequence[float],
+        *,
+        constraints: TravelSearchConstraints,
+        limit: int | None = None,
+        semantic_weight: float = 0.85,
+        logistics_weight: float = 0.15,
+        destination_ids: Sequence[str] | None = None,
+    ) -> list[ScoredTravelDestination]:
+        """Return destinations ranked by semantic and logistics blending."""
+        semantic_scores = self._semantic_scores(query_embedding)
+        logistics_scores = self._logistics_scores(constraints)
+        ranking_scores = (semantic_weight * semantic_scores) + (logistics_weight * logistics_scores)
+        positions = self._candidate_positions(destination_ids)
+        ranked_positions = self._top_positions(
+            positions,
+            primary_scores=ranking_scores,
+            secondary_scores=semantic_scores,
+            limit=limit,
+        )
+        return [
+            self._build_result(
+                position,
+                semantic_score=float(semantic_scores[position]),
+                logistics_score=float(logistics_scores[position]),
+                ranking_score=float(ranking_scores[position]),
+            )
+            for position in ranked_positions
+        ]
+
+    def keyword_boosted_search(
+        self,
+        query_embedding: Sequence[float],
+        keywords: Sequence[str],
+        *,
+        seasonality_months: Sequence[str] = (),
+        limit: int | None = None,
+        retrieval_filter: TravelDestinationRetrievalFilter | None = None,
+    ) -> list[ScoredTravelDestination]:
+        """Return destinations ranked by IQR keyword boost and seasonality re-ranking."""
+        positions = self._candidate_positions(None, retrieval_filter)
+        if positions.size == 0:
+            return []
+
+        semantic_scores = self._semantic_scores(query_embedding)
+        candidate_semantic_scores = semantic_scores[positions]
+        q1, q3 = np.percentile(candidate_semantic_scores, [25.0, 75.0])
+        keyword_indicators = self._keyword_indicators(keywords)[positions]
+        boosted_scores = candidate_semantic_scores + (keyword_indicators * float(q3 - q1))
+
+        month_indexes = [MONTH_COLUMNS.index(month) for month in _normalize_months(seasonality_months)]
+        if month_indexes:
+            seasonality_scores = _min_max_normalize(self._months[positions][:, month_indexes].sum(axis=1))
+            ranking_scores = (0.7 * _min_max_normalize(boosted_scores)) + (0.3 * seasonality_scores)
+            logistics_scores = seasonality_scores
+        else:
+            ranking_scores = boosted_scores
+            logistics_scores = np.ones(positions.size, dtype=np.float64)
+
+        ranked_offsets = self._top_positions(
+            np.arange(positions.size),
+            primary_scores=ranking_scores,
+            secondary_scores=candidate_semantic_scores,
+            id_ranks=self._id_ranks[positions],
+            limit=limit,
+        )
+        return [
+            self._build_result(
+                int(positions[offset]),
+                semantic_score=float(candidate_semantic_scores[offset]),
+                logistics_score=float(logistics_scores[offset]),
+                ranking_score=float(ranking_scores[offset]),
+            )
+            for offset in ranked_offsets
+        ]
+
+    def _semantic_scores(self, query_embedding: Sequence[float]) -> np.ndarray:
+        if len(query_embedding) != self.embedding_dimension:
+            raise ValueError(
+                "Embedding dimension mismatch: "
+                f"expected {self.embedding_dimension}, got {len(query_embedding)}"
+            )
+
+        query_vector = _normalize_rows(np.asarray(query_embedding, dtype=np.float32).reshape(1, -1))[0]
+        return (self._embeddings @ query_vector).astype(np.float64)
+
+    def _logistics_scores(self, constraints: TravelSearchConstraints) -> np.ndarray:
+        score_components: list[np.ndarray] = []
+
+        if constraints.max_cost_per_week is not None:
+            max_cost = float(constraints.max_cost_per_week)
+            denominator = max(max_cost, 1.0)
+            over_budget_scores = np.maximum(0.0, 1.0 - ((self._cost_per_week - max_cost) / denominator))
+            score_components.append(np.where(self._cost_per_week <= max_cost, 1.0, over_budget_scores))
+
+        if constraints.min_popularity is not None:
+            min_popularity = max(float(constraints.min_popularity), 0.01)
+            score_components.append(np.minimum(1.0, self._popularity / min_popularity))
+
+        month_indexes = [MONTH_COLUMNS.index(month) for month in _normalize_months(constraints.months)]
+        if month_indexes:
+            score_components.append(self._months[:, month_indexes].mean(axis=1))
+
+        if not score_components:
+            return np.ones(len(self.records), dtype=np.float64)
+        return np.mean(np.vstack(score_components), axis=0)
+
+    def _keyword_indicators(self, keywords: Sequence[str]) -> np.ndarray:
+        normalized_keywords: list[str] = []
+        for keyword in keywords:
+            normalized_keyword = _normalize_text(keyword)
+            if normalized_keyword and normalized_keyword not in normalized_keywords:
+                normalized_keywords.append(normalized_keyword)
+
+        indicators = np.zeros(len(self.records), dtype=np.float64)
+        if not normalized_keywords:
+            return indicators
+
+        for position, texts in enumerate(self._search_texts):
+            if any(keyword in text for keyword in normalized_keywords for text in texts):
+                indicators[position] = 1.0
+        return indicators
+
+    def _candidate_positions(
+        self,
+        destination_ids: Sequence[str] | None,
+        retrieval_filter: TravelDestinationRetrievalFilter | None = None,
+    ) -> np.ndarray:
+        if destination_ids is None:
+            positions = np.arange(len(self.records))
+        else:
+            selected_positions: list[int] = []
+            for destination_id in destination_ids:
+                position = self._positions_by_id.get(destination_id.strip())
+                if position is not None and position not in selected_positions:
+                    selected_positions.append(position)
+            positions = np.array(selected_positions, dtype=np.int64)
+
+        if retrieval_filter is None or retrieval_filter.is_empty():
+            return positions
+        return positions[self._retrieval_filter_mask(retrieval_filter)[positions]]
+
+    def _retrieval_filter_mask(self, retrieval_filter: TravelDestinationRetrievalFilter) -> np.ndarray:
+        mask = np.ones(len(self.records), dtype=bool)
+
+        if retrieval_filter.included_parent_regions or retrieval_filter.excluded_parent_regions:
+            included_parent_regions = set(retrieval_filter.included_parent_regions)
+            excluded_parent_regions = set(retrieval_filter.excluded_parent_regions)
+            mask &= np.array(
+                [
+                    (not included_parent_regions or record.parent_region in included_parent_regions)
+                    and record.parent_region not in excluded_parent_regions
+                    for record in self.records
+                ],
+                dtype=bool,
+            )
+        if retrieval_filter.min_cost_per_week is not None:
+            mask &= self._cost_per_week >= float(retrieval_filter.min_cost_per_week)
+        if retrieval_filter.max_cost_per_week is not None:
+            mask &= self._cost_per_week <= float(retrieval_filter.max_cost_per_week)
+
+        included_destination_ids = {
+            destination_id.strip() for destination_id in retrieval_filter.included_destination_ids if destination_id.strip()
+        }
+        excluded_destination_ids = {
+            destination_id.strip() for destination_id in retrieval_filter.excluded_destination_ids if destination_id.strip()
+        }
+        if included_destination_ids or excluded_destination_ids:
+            mask &= np.array(
+                [
+                    (not included_destination_ids or record.id in included_destination_ids)
+                    and record.id not in excluded_destination_ids
+                    for record in self.records
+                ],
+                dtype=bool,
+            )
+        return mask
+
+    def _top_positions(
+        self,
+        positions: np.ndarray,
+        *,
+        primary_scores: np.ndarray,
+        secondary_scores: np.ndarray,
+        limit: int | None,
+        id_ranks: np.ndarray | None = None,
+    ) -> list[int]:
+        if limit is not None and limit <= 0:
+            raise ValueError("limit must be greater than zero")
+        if positions.size == 0:
+            return []
+
+        ranks = self._id_ranks if id_ranks is None else id_ranks
+        candidate_positions = positions
+        if limit is not None and limit < positions.size:
+            # Keep every row tied with the k-th score so the exact ordering below stays deterministic.
+            candidate_scores = primary_scores[positions]
+            kth_score = candidate_scores[np.argpartition(-candidate_scores, limit - 1)[limit - 1]]
+            candidate_positions = positions[candidate_scores >= kth_score]
+
+        order = np.lexsort(
+            (
+                ranks[candidate_positions],
+                -secondary_scores[candidate_positions],
+                -primary_scores[candidate_positions],
+            )
+        )
+        ordered_positions = candidate_positions[order]
+        if limit is not None:
+            ordered_positions = ordered_positions[:limit]
+        return [int(position) for position in ordered_positions]
+
+    def _build_result(
+        self,
+        position: int,
+        *,
+        semantic_score: float,
+        logistics_score: float,
+        ranking_score: float,
+    ) -> ScoredTravelDestination:
+        return ScoredTravelDestination(
+            destination=self.records[position],
+            embedding_distance=1.0 - semantic_score,
+            semantic_score=semantic_score,
+            logistics_score=logistics_score,
+            ranking_score=ranking_score,
+        )
+
+
+def _build_column_matrix(records: Sequence[TravelDestinationRecord], columns: Sequence[str]) -> np.ndarray:
+    matrix = np.zeros((len(records), len(columns)), dtype=np.float64)
+    for position, record in enumerate(records):
+        matrix[position] = [float(getattr(record, column)) for column in columns]
+    return matrix
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0.0, 1.0, norms)
+
+
+def _min_max_normalize(values: np.ndarray) -> np.ndarray:
+    minimum = float(values.min())
+    maximum = float(values.max())
+    if maximum == minimum:
+        return np.ones(values.size, dtype=np.float64)
+    return (values - minimum) / (maximum - minimum)
+
+
+def _normalize_months(months: Sequence[str]) -> list[str]:
+    normalized_months: list[str] = []
+    for month in months:
+        normalized_month = month.lower().strip()
+        if normalized_month in MONTH_COLUMNS and normalized_month not in normalized_months:
+            normalized_months.append(normalized_month)
+    return normalized_months
+
+
+def _normalize_text(value: str) -> str:
+    return _NON_ALPHANUMERIC_PATTERN.sub(" ", value.lower()).strip()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Sequence
+
+from sqlmodel import Session
+
+from storage.configuration import StatisticsCacheConfiguration
+from storage.models.storage_metadata import StorageMetadataRecord
+from storage.repositories.storage_metadata_repository import StorageMetadataRepository
+from storage.repositories.travel_destination_repository import TravelDestinationRepository
+from storage.stores.search_models import TRAVEL_DESTINATION_STATISTICS_KEY_PREFIX
+from storage.stores.search_models import TravelNumericFieldStatistics
+
+
+class TravelDestinationStatisticsCache:
+    """Catalog percentile cache shared by the sync and async travel destination stores.
+
+    Entries are kept in process for `ttl_s` and persisted in `storage_metadata` so other
+    workers start warm. Persisted entries are stamped with the catalog version, and a load
+    that overlaps `invalidate` is not kept in process, so percentiles computed before an
+    upsert never outlive it. The lock guards the in-process entries only and is never held
+    across a database round trip.
+    """
+
+    def __init__(self, configuration: StatisticsCacheConfiguration, *, embedding_dimension: int) -> None:
+        self.configuration = configuration
+        self.embedding_dimension = embedding_dimension
+        self._entries: dict[str, tuple[float, dict[float, float | None]]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.configuration.enabled
+
+    def lookup(
+        self,
+        field_name: str,
+        requested: tuple[float, ...],
+    ) -> tuple[TravelNumericFieldStatistics | None, int]:
+        """Return the cached statistics, if fresh and complete, and the generation to `remember` with."""
+        with self._lock:
+            entry = self._entries.get(field_name)
+            if entry is None or entry[0] <= time.monotonic() or not set(requested) <= entry[1].keys():
+                return None, self._generation
+            return select_percentiles(field_name, entry[1], requested), self._generation
+
+    def load(
+        self,
+        session: Session,
+        field_name: str,
+        requested: tuple[float, ...],
+    ) -> dict[float, float | None]:
+        """Read persisted percentiles, recomputing and persisting them when some are missing or outdated."""
+        metadata_key = f"{TRAVEL_DESTINATION_STATISTICS_KEY_PREFIX}{field_name}"
+        metadata_repository = StorageMetadataRepository(session)
+        repository = TravelDestinationRepository(
+            session,
+            embedding_dimension=self.embedding_dimension,
+        )
+        catalog_version = repository.catalog_version()
+        persisted = _parse_persisted_percentiles(metadata_repository.get_value(metadata_key), catalog_version)
+        if set(requested) <= persisted.keys():
+            return persisted
+
+        statistics = repository.numeric_field_statistics(
+            field_name,
+            tuple(persisted.keys() | set(requested)),
+        )
+        metadata_repository.upsert_many(
+            [
+                StorageMetadataRecord(
+                    key=metadata_key,
+                    value=json.dumps(
+                        {
+                            "catalog_version": catalog_version,
+                            "percentiles": {
+                                str(percentile): value for percentile, value in statistics.percentiles.items()
+                            },
+                        }
+                    ),
+                )
+            ]
+        )
+        return statistics.percentiles
+
+    def remember(self, field_name: str, percentiles: dict[float, float | None], generation: int) -> None:
+        with self._lock:
+            # An invalidation during the load means the percentiles may predate the upsert.
+            if generation == self._generation:
+                self._entries[field_name] = (time.monotonic() + self.configuration.ttl_s, percentiles)
+
+    def invalidate(self) -> None:
+        """Drop in-process entries so the next read consults storage_metadata again."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+
+def normalize_requested_percentiles(percentiles: Sequence[float]) -> tuple[float, ...]:
+    requested = tuple(sorted({float(percentile) for percentile in percentiles}))
+    if not requested:
+        raise ValueError("percentiles must not be empty")
+    return requested
+
+
+def select_percentiles(
+    field_name: str,
+    percentiles: dict[float, float | None],
+    requested: Sequence[float],
+) -> TravelNumericFieldStatistics:
+    return TravelNumericFieldStatistics(
+        field_name=field_name,
+        percentiles={percentile: percentiles[percentile] for percentile in requested},
+    )
+
+
+def _parse_persisted_percentiles(value: str | None, catalog_version: str) -> dict[float, float | None]:
+    if value is None:
+        return {}
+    try:
+        payload = json.loads(value)
+        if payload["catalog_version"] != catalog_version:
+            return {}
+        return {
+            float(percentile): float(statistic) if statistic is not None else None
+            for percentile, statistic in payload["percentiles"].items()
+        }
+    except (AttributeError, KeyError, TypeError, ValueError):
+        # Unreadable and outdated entries are treated as missing and overwritten on recompute.
+        return {}
@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+import threading
+import time
 from collections.abc import Sequence
 
 from embeddings.protocols import TextEmbeddingModelProtocol
+from storage.configuration import InMemoryIndexConfiguration
+from storage.configuration import KeywordBoostedRanking
+from storage.configuration import StatisticsCacheConfiguration
+from storage.configuration import VectorSearchConfiguration
 from storage.db.unit_of_work import StorageUnitOfWork
 from storage.models.travel_destination import TravelDestinationRecord
+from storage.repositories.storage_metadata_repository import StorageMetadataRepository
 from storage.repositories.travel_destination_repository import TravelDestinationRepository
+from storage.stores.projection_models import TravelDestinationSummary
 from storage.stores.query_models import QueriedTravelDestination
 from storage.stores.query_models import TravelDestinationQuery
+from storage.stores.search_models import DEFAULT_STATISTICS_PERCENTILES
+from storage.stores.search_models import TRAVEL_DESTINATION_STATISTICS_KEY_PREFIX
 from storage.stores.search_models import TravelCostStatistics
+from storage.stores.search_models import TravelNumericFieldStatistics
 from storage.stores.search_models import ScoredTravelDestination
+from storage.stores.search_models import TravelDestinationRetrievalFilter
 from storage.stores.search_models import TravelSearchConstraints
+from storage.stores.travel_destination_memory_index import TravelDestinationMemoryIndex
+from storage.stores.travel_destination_statistics_cache import TravelDestinationStatisticsCache
+from storage.stores.travel_destination_statistics_cache import normalize_requested_percentiles
+from storage.stores.travel_destination_statistics_cache import select_percentiles
 
 
 class TravelDestinationStore:
@@ -21,13 +37,29 @@ class TravelDestinationStore:
         unit_of_work: StorageUnitOfWork,
         *,
         embedding_model: TextEmbeddingModelProtocol,
+        vector_search: VectorSearchConfiguration | None = None,
+        keyword_boosted_ranking: KeywordBoostedRanking = "sql",
+        in_memory_index: InMemoryIndexConfiguration | None = None,
+        statistics_cache: StatisticsCacheConfiguration | None = None,
     ) -> None:
         if embedding_model is None:
             raise ValueError("embedding_model is required")
+        if keyword_boosted_ranking not in {"sql", "python"}:
+            raise ValueError("keyword_boosted_ranking must be 'sql' or 'python'")
 
         self.unit_of_work = unit_of_work
         self.embedding_model = embedding_model
+        self.vector_search = vector_search or VectorSearchConfiguration()
+        self.keyword_boosted_ranking = keyword_boosted_ranking
+        self.in_memory_index = in_memory_index or InMemoryIndexConfiguration()
+        self._memory_index: TravelDestinationMemoryIndex | None = None
+        self._memory_index_checked_at = 0.0
+        self._memory_index_lock = threading.Lock()
         self.embedding_dimension = embedding_model.get_dimentions()
+        self.statistics_cache = TravelDestinationStatisticsCache(
+            statistics_cache or StatisticsCacheConfiguration(),
+            embedding_dimension=self.embedding_dimension,
+        )
 
     def size(self) -> int:
         """Return number of persisted travel destinations."""
@@ -39,7 +71,7 @@ class TravelDestinationStore:
             return repository.count()
 
     def all(self) -> list[TravelDestinationRecord]:
-        """Return all persisted travel destinations."""
+        """Return all persisted travel destinations as full records, including embeddings."""
         with self.unit_of_work.read() as session:
             repository = TravelDestinationRepository(
                 session,
@@ -49,12 +81,44 @@ class TravelDestinationStore:
 
     def cost_per_week_statistics(self) -> TravelCostStatistics:
         """Return percentile statistics for destination weekly costs."""
-        with self.unit_of_work.read() as session:
-            repository = TravelDestinationRepository(
-                session,
-                embedding_dimension=self.embedding_dimension,
-            )
-            return repository.cost_per_week_statistics()
+        statistics = self.numeric_field_statistics("cost_per_week", DEFAULT_STATISTICS_PERCENTILES)
+        return TravelCostStatistics(
+            percentile_50=statistics.percentile(0.5),
+            percentile_75=statistics.percentile(0.75),
+        )
+
+    def numeric_field_statistics(
+        self,
+        field_name: str,
+        percentiles: Sequence[float] = DEFAULT_STATISTICS_PERCENTILES,
+    ) -> TravelNumericFieldStatistics:
+        """Return percentiles of a numeric destination field, served from cache when possible.
+
+        Entries are cached by `TravelDestinationStatisticsCache`; `upsert_many` drops them. A
+        request for percentiles that are not cached yet recomputes the union of cached and
+        requested ones in one aggregate scan.
+        """
+        requested = normalize_requested_percentiles(percentiles)
+        if not self.statistics_cache.enabled:
+            with self.unit_of_work.read() as session:
+                repository = TravelDestinationRepository(
+                    session,
+                    embedding_dimension=self.embedding_dimension,
+                )
+                return repository.numeric_field_statistics(field_name, requested)
+
+        cached, generation = self.statistics_cache.lookup(field_name, requested)
+        if cached is not None:
+            return cached
+
+        with self.unit_of_work.write() as session:
+            percentiles_by_fraction = self.statistics_cache.load(session, field_name, requested)
+        self.statistics_cache.remember(field_name, percentiles_by_fraction, generation)
+        return select_percentiles(field_name, percentiles_by_fraction, requested)
+
+    def invalidate_statistics(self) -> None:
+        """Drop in-process statistics so the next read consults storage_metadata again."""
+        self.statistics_cache.invalidate()
 
     def upsert_many(self, rows: Sequence[TravelDestinationRecord]) -> None:
         """Insert or update many travel destinations."""
@@ -64,9 +128,22 @@ class TravelDestinationStore:
                 embedding_dimension=self.embedding_dimension,
             )
             repository.upsert_many(rows)
+            StorageMetadataRepository(session).delete_by_prefix(TRAVEL_DESTINATION_STATISTICS_KEY_PREFIX)
+
+        self.invalidate_memory_index()
+        self.invalidate_statistics()
+
+    def list_summaries(self, destination_ids: Sequence[str] | None = None) -> list[TravelDestinationSummary]:
+        """Return embedding-free destination summaries, optionally for selected IDs only."""
+        with self.unit_of_work.read() as session:
+            repository = TravelDestinationRepository(
+                session,
+                embedding_dimension=self.embedding_dimension,
+            )
+            return repository.list_summaries(destination_ids)
 
     def list_by_ids(self, destination_ids: Sequence[str]) -> list[TravelDestinationRecord]:
-        """Return travel destinations for selected IDs."""
+        """Return full travel destination records, including embeddings, for selected IDs."""
         with self.unit_of_work.read() as session:
             repository = TravelDestinationRepository(
                 session,
@@ -78,7 +155,7 @@ class TravelDestinationStore:
         """Run structured destination queries suitable for tool-calling interfaces."""
         query_embedding = None
         if request.semantic_query is not None:
-            query_embedding = self._embed_query(request.semantic_query)
+            query_embedding = self.embed_query(request.semantic_query)
 
         with self.unit_of_work.read() as session:
             repository = TravelDestinationRepository(
@@ -101,9 +178,22 @@ class TravelDestinationStore:
         query: str,
         limit: int | None = None,
         destination_ids: Sequence[str] | None = None,
+        vector_search: VectorSearchConfiguration | None = None,
     ) -> list[ScoredTravelDestination]:
-        """Run nearest-neighbor semantic search over embedding vectors."""
-        query_embedding = self._embed_query(query)
+        """Run nearest-neighbor semantic search over embedding vectors.
+
+        `vector_search` overrides the store-level exact/approximate retrieval settings for this query
+        and bypasses the in-memory index, which always ranks exactly.
+        """
+        query_embedding = self.embed_query(query)
+        memory_index = self.current_memory_index(vector_search)
+        if memory_index is not None:
+            return memory_index.semantic_search(
+                query_embedding,
+                limit=limit,
+                destination_ids=destination_ids,
+            )
+
         with self.unit_of_work.read() as session:
             repository = TravelDestinationRepository(
                 session,
@@ -113,6 +203,7 @@ class TravelDestinationStore:
                 query_embedding=query_embedding,
                 limit=limit,
                 destination_ids=destination_ids,
+                vector_search=vector_search or self.vector_search,
             )
 
     def hybrid_search(
@@ -124,9 +215,21 @@ class TravelDestinationStore:
         semantic_weight: float = 0.85,
         logistics_weight: float = 0.15,
         destination_ids: Sequence[str] | None = None,
+        vector_search: VectorSearchConfiguration | None = None,
     ) -> list[ScoredTravelDestination]:
         """Run blended semantic + logistics search."""
-        query_embedding = self._embed_query(query)
+        query_embedding = self.embed_query(query)
+        memory_index = self.current_memory_index(vector_search)
+        if memory_index is not None:
+            return memory_index.hybrid_search(
+                query_embedding,
+                constraints=constraints,
+                limit=limit,
+                semantic_weight=semantic_weight,
+                logistics_weight=logistics_weight,
+                destination_ids=destination_ids,
+            )
+
         with self.unit_of_work.read() as session:
             repository = TravelDestinationRepository(
                 session,
@@ -139,6 +242,7 @@ class TravelDestinationStore:
                 semantic_weight=semantic_weight,
                 logistics_weight=logistics_weight,
                 destination_ids=destination_ids,
+                vector_search=vector_search or self.vector_search,
             )
 
     def exact_text_search(
@@ -165,9 +269,68 @@ class TravelDestinationStore:
         *,
         seasonality_months: Sequence[str] = (),
         limit: int | None = None,
+        vector_search: VectorSearchConfiguration | None = None,
+        retrieval_filter: TravelDestinationRetrievalFilter | None = None,
+    ) -> list[ScoredTravelDestination]:
+        """Run recommendation retrieval: semantic search, IQR keyword boost, and seasonality re-ranking.
+
+        `retrieval_filter` predicates (parent regions, weekly cost bounds, destination
+        ID allow/deny lists) are applied before scoring, ranking, and the limit.
+
+        The default `sql` ranking returns only the top rows from Postgres; the `python`
+        ranking is the reference implementation. In approximate mode the IQR and
+        re-ranking operate on the HNSW candidate set only. An enabled in-memory
+        index takes precedence and always ranks the filtered catalog exactly, unless
+        a per-query `vector_search` override asks for the SQL retrieval settings.
+        """
+        query_embedding = self.embed_query(semantic_query)
+        resolved_vector_search = vector_search or self.vector_search
+
+        memory_index = self.current_memory_index(vector_search)
+        if memory_index is not None:
+            return memory_index.keyword_boosted_search(
+                query_embedding,
+                keywords,
+                seasonality_months=seasonality_months,
+                limit=limit,
+                retrieval_filter=retrieval_filter,
+            )
+
+        if self.keyword_boosted_ranking == "python":
+            return self.keyword_boosted_search_in_python(
+                query_embedding,
+                keywords,
+                seasonality_months=seasonality_months,
+                limit=limit,
+                vector_search=resolved_vector_search,
+                retrieval_filter=retrieval_filter,
+            )
+
+        with self.unit_of_work.read() as session:
+            repository = TravelDestinationRepository(
+                session,
+                embedding_dimension=self.embedding_dimension,
+            )
+            return repository.keyword_boosted_search(
+                query_embedding=query_embedding,
+                keywords=keywords,
+                seasonality_months=seasonality_months,
+                limit=limit,
+                vector_search=resolved_vector_search,
+                retrieval_filter=retrieval_filter,
+            )
+
+    def keyword_boosted_search_in_python(
+        self,
+        query_embedding: list[float],
+        keywords: Sequence[str],
+        *,
+        seasonality_months: Sequence[str],
+        limit: int | None,
+        vector_search: VectorSearchConfiguration,
+        retrieval_filter: TravelDestinationRetrievalFilter | None,
     ) -> list[ScoredTravelDestination]:
-        """Run recommendation retrieval: semantic search, IQR keyword boost, and seasonality re-ranking."""
-        query_embedding = self._embed_query(semantic_query)
+        """Reference keyword-boosted ranking in Python over an already embedded query."""
         normalized_months = _normalize_months(seasonality_months)
 
         with self.unit_of_work.read() as session:
@@ -175,7 +338,11 @@ class TravelDestinationStore:
                 session,
                 embedding_dimension=self.embedding_dimension,
             )
-            semantic_results = repository.semantic_search(query_embedding=query_embedding)
+            semantic_results = repository.semantic_search(
+                query_embedding=query_embedding,
+                vector_search=vector_search,
+                retrieval_filter=retrieval_filter,
+            )
             keyword_destination_ids = repository.keyword_matching_destination_ids(keywords)
 
         if not semantic_results:
@@ -205,7 +372,50 @@ class TravelDestinationStore:
         """Backward-compatible alias for semantic vector search."""
         return self.semantic_search(query=query, limit=limit)
 
-    def _embed_query(self, query: str) -> list[float]:
+    def invalidate_memory_index(self) -> None:
+        """Drop the in-memory catalog snapshot so the next search rebuilds it."""
+        with self._memory_index_lock:
+            self._memory_index = None
+            self._memory_index_checked_at = 0.0
+
+    def current_memory_index(
+        self,
+        vector_search: VectorSearchConfiguration | None = None,
+    ) -> TravelDestinationMemoryIndex | None:
+        """Return the in-memory catalog snapshot, refreshed when the catalog changed.
+
+        Returns None when the index is disabled or a per-query `vector_search` override asks for
+        the SQL retrieval settings. A refresh reads the catalog, so async callers use a thread.
+        """
+        if not self.in_memory_index.enabled or vector_search is not None:
+            return None
+
+        with self._memory_index_lock:
+            now = time.monotonic()
+            if (
+                self._memory_index is not None
+                and now - self._memory_index_checked_at < self.in_memory_index.refresh_interval_s
+            ):
+                return self._memory_index
+
+            with self.unit_of_work.read() as session:
+                repository = TravelDestinationRepository(
+                    session,
+                    embedding_dimension=self.embedding_dimension,
+                )
+                catalog_version = repository.catalog_version()
+                if self._memory_index is None or self._memory_index.version != catalog_version:
+                    self._memory_index = TravelDestinationMemoryIndex(
+                        repository.list_all(),
+                        version=catalog_version,
+                        embedding_dimension=self.embedding_dimension,
+                    )
+
+            self._memory_index_checked_at = now
+            return self._memory_index
+
+    def embed_query(self, query: str) -> list[float]:
+        """Embed a search query, validating it and the vector dimension."""
         if not query.strip():
             raise ValueError("query must not be empty")
 
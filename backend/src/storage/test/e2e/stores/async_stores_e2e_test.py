@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+from uuid import UUID
+
+sys.path.append(str(Path(__file__).resolve().parents[4]))
+
+from storage.bootstrap_travel_destinations import bootstrap_travel_destinations_from_csv
+from storage.configuration import MigrationConfiguration
+from storage.configuration import StorageConfiguration
+from storage.configuration import StorageEngineConfiguration
+from storage.models.chat_record import ChatRecord
+from storage.storage import Storage
+from storage.stores.search_models import TravelDestinationRetrievalFilter
+from storage.test.utils import KeywordTextEmbeddingModel
+from storage.test.utils import build_db_url_with_schema_search_path
+from storage.test.utils import create_schema
+from storage.test.utils import drop_schema
+from storage.test.utils import generate_schema_name
+
+DEVELOPMENT_BASE_DB_URL = (
+    "postgresql+psycopg://"
+    "hybrid_dev:change_me_dev_password@localhost:5432/recommender"
+)
+
+QUERY_MATCHING_CSV_PATH = Path(__file__).resolve().parents[1] / "data" / "travel_destinations_query_matching.csv"
+
+
+class TestAsyncStoresE2E(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        if not QUERY_MATCHING_CSV_PATH.exists():
+            raise unittest.SkipTest(f"CSV seed file not found: {QUERY_MATCHING_CSV_PATH}")
+
+        cls.base_db_url = DEVELOPMENT_BASE_DB_URL
+        cls.embedding_model = KeywordTextEmbeddingModel()
+
+    def setUp(self) -> None:
+        self.schema_name = generate_schema_name(prefix="test_storage_async_stores")
+        create_schema(self.base_db_url, self.schema_name)
+        schema_db_url = build_db_url_with_schema_search_path(self.base_db_url, self.schema_name)
+        self.storage_configuration = StorageConfiguration(
+            engine=StorageEngineConfiguration(db_url=schema_db_url),
+            migrations=MigrationConfiguration(enabled=True),
+            schema_name=self.schema_name,
+        )
+
+        bootstrap_travel_destinations_from_csv(
+            csv_file_path=QUERY_MATCHING_CSV_PATH,
+            storage_configuration=self.storage_configuration,
+            embedding_model=self.embedding_model,
+            batch_size=32,
+        )
+        self.storage = Storage(self.storage_configuration, embedding_model=self.embedding_model)
+
+    async def asyncTearDown(self) -> None:
+        await self.storage.aclose()
+
+    def tearDown(self) -> None:
+        drop_schema(self.base_db_url, self.schema_name)
+
+    async def test_async_keyword_boosted_search_matches_sync_store(self) -> None:
+        retrieval_filter = TravelDestinationRetrievalFilter(included_parent_regions=("Europe",))
+
+        sync_results = self.storage.travel_destinations.keyword_boosted_search(
+            "alpine ski snow mountain",
+            ["mountain"],
+            limit=3,
+            retrieval_filter=retrieval_filter,
+        )
+        async_results = await self.storage.async_travel_destinations.keyword_boosted_search(
+            "alpine ski snow mountain",
+            ["mountain"],
+            limit=3,
+            retrieval_filter=retrieval_filter,
+        )
+
+        self.assertEqual(
+            [result.destination.id for result in async_results],
+            [result.destination.id for result in sync_results],
+        )
+        self.assertEqual(
+            await self.storage.async_travel_destinations.cost_per_week_statistics(),
+            self.storage.travel_destinations.cost_per_week_statistics(),
+        )
+
+    async def test_async_chat_store_upsert_load_and_delete(self) -> None:
+        user_id = UUID("11111111-1111-1111-1111-111111111111")
+        session_id = UUID("22222222-2222-2222-2222-222222222222")
+
+        await self.storage.async_chat.upsert_many(
+            [
+                ChatRecord(
+                    user_id=user_id,
+                    session_id=session_id,
+                    chat_history_number=0,
+                    user_request="Suggest a beach vacation",
+                    system_response="Try Island Escape",
+                    graph_version="v2",
+                )
+            ]
+        )
+
+        rows = await self.storage.async_chat.load_session(user_id=user_id, session_id=session_id)
+        self.assertEqual([row.user_request for row in rows], ["Suggest a beach vacation"])
+
+        await self.storage.async_chat.delete_session(user_id=user_id, session_id=session_id)
+        self.assertEqual(await self.storage.async_chat.load_session(user_id=user_id, session_id=session_id), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
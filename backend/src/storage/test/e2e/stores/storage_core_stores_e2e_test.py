@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+import time
 import unittest
 from pathlib import Path
 from uuid import UUID
@@ -59,6 +60,37 @@ class TestStorageCoreStoresE2E(unittest.TestCase):
             storage.storage_metadata.delete("custom_key")
             self.assertIsNone(storage.storage_metadata.get_value("custom_key"))
 
+    def test_embedding_cache_store_round_trip(self) -> None:
+        text_hash = "a" * 64
+
+        with Storage(self.storage_configuration, embedding_model=self.embedding_model) as storage:
+            self.assertIsNone(storage.embedding_cache.get("ollama", "nomic", text_hash))
+
+            storage.embedding_cache.put("ollama", "nomic", text_hash, [0.5] * 8)
+            storage.embedding_cache.put("ollama", "nomic", text_hash, [0.25] * 8)
+
+            self.assertEqual(storage.embedding_cache.get("ollama", "nomic", text_hash), [0.25] * 8)
+            self.assertIsNone(storage.embedding_cache.get("openai", "nomic", text_hash))
+
+    def test_llm_response_cache_store_round_trip_and_expiry(self) -> None:
+        cache_key = "b" * 64
+        expired_cache_key = "c" * 64
+
+        with Storage(self.storage_configuration, embedding_model=self.embedding_model) as storage:
+            self.assertIsNone(storage.llm_response_cache.get(cache_key))
+
+            storage.llm_response_cache.put(cache_key, "request_routing", {"decision": "out_of_system_scope"}, 60.0)
+            storage.llm_response_cache.put(cache_key, "request_routing", {"decision": "new_recommendation_run"}, 60.0)
+            storage.llm_response_cache.put(expired_cache_key, "request_routing", {"decision": "x"}, 0.001)
+            time.sleep(0.01)
+
+            self.assertEqual(
+                storage.llm_response_cache.get(cache_key),
+                {"decision": "new_recommendation_run"},
+            )
+            self.assertIsNone(storage.llm_response_cache.get(expired_cache_key))
+            self.assertEqual(storage.llm_response_cache.delete_expired(), 1)
+
     def test_chat_store_upsert_load_and_delete(self) -> None:
         user_id = UUID("11111111-1111-1111-1111-111111111111")
         session_id = UUID("22222222-2222-2222-2222-222222222222")
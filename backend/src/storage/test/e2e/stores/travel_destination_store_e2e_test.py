@@ -10,9 +10,13 @@ from storage.bootstrap_travel_destinations import bootstrap_travel_destinations_
 from storage.configuration import MigrationConfiguration
 from storage.configuration import StorageConfiguration
 from storage.configuration import StorageEngineConfiguration
+from storage.configuration import VectorSearchConfiguration
 from storage.storage import Storage
 from storage.stores.query_models import TravelDestinationQuery
+from storage.stores.search_models import TRAVEL_DESTINATION_STATISTICS_KEY_PREFIX
+from storage.stores.search_models import TravelDestinationRetrievalFilter
 from storage.stores.search_models import TravelSearchConstraints
+from storage.stores.travel_destination_store import TravelDestinationStore
 from storage.test.utils import KeywordTextEmbeddingModel
 from storage.test.utils import build_db_url_with_schema_search_path
 from storage.test.utils import create_schema
@@ -132,6 +136,138 @@ class TestTravelDestinationStoreE2E(unittest.TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].destination.id, "CITY_CULT")
 
+    def test_approximate_semantic_search_matches_exact_ranking(self) -> None:
+        approximate_search = VectorSearchConfiguration(
+            mode="approximate",
+            ef_search=100,
+            candidate_limit=10,
+        )
+
+        with Storage(self.storage_configuration, embedding_model=self.embedding_model) as storage:
+            exact_results = storage.travel_destinations.semantic_search("alpine ski snow mountain", limit=3)
+            approximate_results = storage.travel_destinations.semantic_search(
+                "alpine ski snow mountain",
+                limit=3,
+                vector_search=approximate_search,
+            )
+
+        self.assertEqual(
+            [result.destination.id for result in approximate_results],
+            [result.destination.id for result in exact_results],
+        )
+        for approximate_result, exact_result in zip(approximate_results, exact_results, strict=True):
+            self.assertAlmostEqual(approximate_result.semantic_score, exact_result.semantic_score)
+
+    def test_keyword_boosted_search_sql_ranking_matches_python_reference(self) -> None:
+        search_cases = (
+            ("luxury tropical beach resort", ["beach"], ()),
+            ("alpine ski snow mountain", ["culture", "highlands"], ("jan", "feb")),
+            ("museum culture architecture", [], ("jul",)),
+        )
+
+        with Storage(self.storage_configuration, embedding_model=self.embedding_model) as storage:
+            sql_store = TravelDestinationStore(
+                storage.unit_of_work,
+                embedding_model=self.embedding_model,
+                keyword_boosted_ranking="sql",
+            )
+            python_store = TravelDestinationStore(
+                storage.unit_of_work,
+                embedding_model=self.embedding_model,
+                keyword_boosted_ranking="python",
+            )
+
+            for semantic_query, keywords, months in search_cases:
+                with self.subTest(semantic_query=semantic_query, keywords=keywords, months=months):
+                    sql_results = sql_store.keyword_boosted_search(
+                        semantic_query,
+                        keywords,
+                        seasonality_months=months,
+                        limit=4,
+                    )
+                    python_results = python_store.keyword_boosted_search(
+                        semantic_query,
+                        keywords,
+                        seasonality_months=months,
+                        limit=4,
+                    )
+
+                    self.assertEqual(
+                        [result.destination.id for result in sql_results],
+                        [result.destination.id for result in python_results],
+                    )
+                    for sql_result, python_result in zip(sql_results, python_results, strict=True):
+                        self.assertAlmostEqual(sql_result.semantic_score, python_result.semantic_score)
+                        self.assertAlmostEqual(sql_result.logistics_score, python_result.logistics_score)
+                        self.assertAlmostEqual(sql_result.ranking_score, python_result.ranking_score)
+
+    def test_keyword_boosted_search_applies_retrieval_filter(self) -> None:
+        retrieval_filter = TravelDestinationRetrievalFilter(
+            included_parent_regions=("Europe",),
+            max_cost_per_week=1000.0,
+            excluded_destination_ids=("ALP_SKI",),
+        )
+
+        with Storage(self.storage_configuration, embedding_model=self.embedding_model) as storage:
+            results = storage.travel_destinations.keyword_boosted_search(
+                "alpine ski snow mountain",
+                ["mountain"],
+                limit=3,
+                retrieval_filter=retrieval_filter,
+            )
+
+        self.assertGreaterEqual(len(results), 1)
+        for result in results:
+            self.assertEqual(result.destination.parent_region, "Europe")
+            self.assertLessEqual(result.destination.cost_per_week, 1000.0)
+            self.assertNotEqual(result.destination.id, "ALP_SKI")
+
+    def test_approximate_search_finds_destinations_outside_the_first_candidates(self) -> None:
+        approximate_search = VectorSearchConfiguration(
+            mode="approximate",
+            ef_search=1,
+            candidate_limit=1,
+        )
+        retrieval_filter = TravelDestinationRetrievalFilter(included_parent_regions=("Oceania",))
+
+        with Storage(self.storage_configuration, embedding_model=self.embedding_model) as storage:
+            results = storage.travel_destinations.keyword_boosted_search(
+                "alpine ski snow mountain",
+                ["mountain"],
+                limit=3,
+                vector_search=approximate_search,
+                retrieval_filter=retrieval_filter,
+            )
+
+        self.assertEqual([result.destination.id for result in results], ["ISL_BEACH"])
+
+    def test_statistics_are_persisted_and_invalidated_by_upsert(self) -> None:
+        metadata_key = f"{TRAVEL_DESTINATION_STATISTICS_KEY_PREFIX}cost_per_week"
+
+        with Storage(self.storage_configuration, embedding_model=self.embedding_model) as storage:
+            store = storage.travel_destinations
+            statistics = store.cost_per_week_statistics()
+            self.assertIsNotNone(storage.storage_metadata.get_value(metadata_key))
+
+            popularity = store.numeric_field_statistics("popularity", (0.25, 0.5, 0.9))
+            self.assertEqual(set(popularity.percentiles), {0.25, 0.5, 0.9})
+
+            store.upsert_many(store.list_by_ids(["ALP_SKI"]))
+            self.assertIsNone(storage.storage_metadata.get_value(metadata_key))
+            self.assertEqual(store.cost_per_week_statistics(), statistics)
+
+    def test_search_results_and_summaries_do_not_load_embeddings(self) -> None:
+        with Storage(self.storage_configuration, embedding_model=self.embedding_model) as storage:
+            results = storage.travel_destinations.semantic_search("alpine ski snow mountain", limit=2)
+            summaries = storage.travel_destinations.list_summaries(["ALP_SKI"])
+            records = storage.travel_destinations.list_by_ids(["ALP_SKI"])
+
+        self.assertGreaterEqual(len(results), 1)
+        self.assertNotIn("embedding", results[0].destination.__dict__)
+        self.assertEqual([summary.id for summary in summaries], ["ALP_SKI"])
+        self.assertEqual(summaries[0].description, records[0].description)
+        self.assertEqual(len(records[0].embedding), self.embedding_model.get_dimentions())
+
     def test_semantic_search_rejects_blank_query(self) -> None:
         with Storage(self.storage_configuration, embedding_model=self.embedding_model) as storage:
             with self.assertRaises(ValueError):
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from pydantic import ValidationError
+
+sys.path.append(str(Path(__file__).resolve().parents[4]))
+
+from storage.configuration import VectorSearchConfiguration
+from storage.repositories.travel_destination_repository import TravelDestinationRepository
+from storage.stores.search_models import TravelDestinationRetrievalFilter
+
+
+class TestTravelDestinationRepositoryApproximateSearch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.session = MagicMock()
+        self.repository = TravelDestinationRepository(self.session, embedding_dimension=3)
+
+    def test_candidate_limit_is_capped_like_ef_search(self) -> None:
+        with self.assertRaises(ValidationError):
+            VectorSearchConfiguration(mode="approximate", candidate_limit=1001)
+
+    def test_limit_beyond_ef_search_requires_an_iterative_scan(self) -> None:
+        with self.assertRaises(ValueError):
+            self.repository.semantic_search(
+                [1.0, 0.0, 0.0],
+                limit=1001,
+                vector_search=VectorSearchConfiguration(mode="approximate"),
+            )
+
+        self.session.execute.assert_not_called()
+
+    def test_filtered_queries_use_an_iterative_scan(self) -> None:
+        self.repository.semantic_search(
+            [1.0, 0.0, 0.0],
+            limit=3,
+            vector_search=VectorSearchConfiguration(mode="approximate"),
+            retrieval_filter=TravelDestinationRetrievalFilter(included_parent_regions=("Oceania",)),
+        )
+
+        settings = {
+            call.args[1]["name"]: call.args[1]["value"]
+            for call in self.session.execute.call_args_list
+            if len(call.args) > 1
+        }
+        self.assertEqual(settings["hnsw.iterative_scan"], "relaxed_order")
+
+
+if __name__ == "__main__":
+    unittest.main()
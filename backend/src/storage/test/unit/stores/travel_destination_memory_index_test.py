@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[4]))
+
+from storage.models.travel_destination import TravelDestinationRecord
+from storage.stores.search_models import TravelDestinationRetrievalFilter
+from storage.stores.search_models import TravelSearchConstraints
+from storage.stores.travel_destination_memory_index import TravelDestinationMemoryIndex
+from storage.stores.travel_destination_store import _apply_keyword_iqr_boost
+from storage.stores.travel_destination_store import _apply_seasonality_reranking
+from storage.stores.travel_destination_store import _interquartile_range
+
+
+def _build_record(
+    destination_id: str,
+    *,
+    region: str,
+    description: str,
+    embedding: list[float],
+    cost_per_week: float = 700.0,
+    popularity: float = 0.5,
+    summer: float = 0.5,
+) -> TravelDestinationRecord:
+    months = {month: 0.2 for month in ("jan", "feb", "mar", "apr", "may", "jun", "sep", "oct", "nov", "dec")}
+    interests = {
+        interest: 0.5
+        for interest in (
+            "nature",
+            "hiking",
+            "beach",
+            "watersports",
+            "entertainment",
+            "wintersports",
+            "culture",
+            "culinary",
+            "architecture",
+            "shopping",
+        )
+    }
+    return TravelDestinationRecord(
+        id=destination_id,
+        parent_region="Europe",
+        region=region,
+        popularity=popularity,
+        cost_per_week=cost_per_week,
+        jul=summer,
+        aug=summer,
+        description=description,
+        embedding=embedding,
+        **months,
+        **interests,
+    )
+
+
+class TestTravelDestinationMemoryIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.records = [
+            _build_record("BEACH", region="Sunny Coast", description="Sandy beach", embedding=[1.0, 0.0, 0.0], summer=1.0),
+            _build_record("ISLAND", region="Island", description="Beach and coral", embedding=[0.9, 0.3, 0.0]),
+            _build_record("ALPS", region="Alps", description="Ski slopes", embedding=[0.0, 1.0, 0.1], cost_per_week=1500.0),
+            _build_record("CITY", region="Old Town", description="Museums", embedding=[0.1, 0.2, 1.0], summer=0.9),
+            _build_record("LAKE", region="Lake Side", description="Quiet lake", embedding=[0.5, 0.5, 0.5]),
+        ]
+        self.index = TravelDestinationMemoryIndex(self.records, version="5:test", embedding_dimension=3)
+
+    def test_semantic_search_ranks_by_cosine_similarity(self) -> None:
+        results = self.index.semantic_search([1.0, 0.1, 0.0], limit=2)
+
+        self.assertEqual([result.destination.id for result in results], ["BEACH", "ISLAND"])
+        self.assertAlmostEqual(results[0].semantic_score + results[0].embedding_distance, 1.0)
+
+    def test_semantic_search_respects_destination_ids(self) -> None:
+        results = self.index.semantic_search([1.0, 0.1, 0.0], destination_ids=["CITY", "ALPS", "UNKNOWN"])
+
+        self.assertEqual([result.destination.id for result in results], ["CITY", "ALPS"])
+
+    def test_hybrid_search_penalizes_destinations_over_budget(self) -> None:
+        results = self.index.hybrid_search(
+            [0.0, 1.0, 0.0],
+            constraints=TravelSearchConstraints(max_cost_per_week=750.0),
+            semantic_weight=0.2,
+            logistics_weight=0.8,
+        )
+
+        alps_result = next(result for result in results if result.destination.id == "ALPS")
+        self.assertAlmostEqual(alps_result.logistics_score, 0.0)
+        self.assertNotEqual(results[0].destination.id, "ALPS")
+
+    def test_keyword_boosted_search_matches_python_reference(self) -> None:
+        query_embedding = [0.7, 0.2, 0.4]
+        keywords = ["beach", "old town"]
+        months = ("jul", "aug")
+
+        results = self.index.keyword_boosted_search(
+            query_embedding,
+            keywords,
+            seasonality_months=months,
+            limit=4,
+        )
+
+        semantic_results = self.index.semantic_search(query_embedding)
+        reference_results = _apply_seasonality_reranking(
+            _apply_keyword_iqr_boost(
+                semantic_results,
+                keyword_destination_ids={"BEACH", "ISLAND", "CITY"},
+                boost=_interquartile_range([result.semantic_score for result in semantic_results]),
+            ),
+            months=months,
+        )
+        reference_results.sort(key=lambda result: result.ranking_score, reverse=True)
+
+        self.assertEqual(
+            [result.destination.id for result in results],
+            [result.destination.id for result in reference_results[:4]],
+        )
+        for result, reference_result in zip(results, reference_results, strict=False):
+            self.assertAlmostEqual(result.ranking_score, reference_result.ranking_score, places=6)
+            self.assertAlmostEqual(result.logistics_score, reference_result.logistics_score, places=6)
+
+    def test_keyword_boosted_search_applies_retrieval_filter_before_ranking(self) -> None:
+        results = self.index.keyword_boosted_search(
+            [1.0, 0.0, 0.0],
+            ["beach"],
+            retrieval_filter=TravelDestinationRetrievalFilter(
+                max_cost_per_week=1000.0,
+                excluded_destination_ids=("BEACH",),
+            ),
+        )
+
+        result_ids = [result.destination.id for result in results]
+        self.assertEqual(result_ids[0], "ISLAND")
+        self.assertNotIn("BEACH", result_ids)
+        self.assertNotIn("ALPS", result_ids)
+
+    def test_rejects_query_with_wrong_dimension(self) -> None:
+        with self.assertRaises(ValueError):
+            self.index.semantic_search([1.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[4]))
+
+from storage.configuration import StatisticsCacheConfiguration
+from storage.stores.travel_destination_statistics_cache import TravelDestinationStatisticsCache
+
+
+class TestTravelDestinationStatisticsCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache = TravelDestinationStatisticsCache(
+            StatisticsCacheConfiguration(ttl_s=60.0),
+            embedding_dimension=3,
+        )
+
+    def test_lookup_serves_remembered_percentiles_subsets(self) -> None:
+        _, generation = self.cache.lookup("cost_per_week", (0.5, 0.75))
+        self.cache.remember("cost_per_week", {0.5: 700.0, 0.75: 900.0}, generation)
+
+        cached, _ = self.cache.lookup("cost_per_week", (0.75,))
+        missing, _ = self.cache.lookup("cost_per_week", (0.9,))
+
+        self.assertIsNotNone(cached)
+        self.assertEqual(cached.percentiles, {0.75: 900.0})
+        self.assertIsNone(missing)
+
+    def test_load_overlapping_an_invalidation_is_not_remembered(self) -> None:
+        _, generation = self.cache.lookup("cost_per_week", (0.5,))
+        self.cache.invalidate()
+        self.cache.remember("cost_per_week", {0.5: 700.0}, generation)
+
+        cached, _ = self.cache.lookup("cost_per_week", (0.5,))
+
+        self.assertIsNone(cached)
+
+
+if __name__ == "__main__":
+    unittest.main()
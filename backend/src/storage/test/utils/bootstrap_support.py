@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import csv
+from collections.abc import Sequence
 from pathlib import Path
 
 from embeddings.protocols import TextEmbeddingModelProtocol
@@ -28,6 +29,12 @@ class FakeTextEmbeddingModel(TextEmbeddingModelProtocol):
         base_value = float(sum(ord(character) for character in normalized) % 1000) / 1000.0
         return [base_value + (index * 0.001) for index in range(self._dimensions)]
 
+    def embed_documents(self, texts: Sequence[str]) -> list[list[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    async def aembed_documents(self, texts: Sequence[str]) -> list[list[float]]:
+        return self.embed_documents(texts)
+
 
 def count_seed_rows(csv_file_path: Path) -> int:
     """Count source CSV rows that represent destinations."""
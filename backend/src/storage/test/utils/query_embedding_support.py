@@ -32,5 +32,11 @@ class KeywordTextEmbeddingModel(TextEmbeddingModelProtocol):
 
         return [self._count_token_matches(normalized_text, token_group) for token_group in self._TOKEN_GROUPS]
 
+    def embed_documents(self, texts: Sequence[str]) -> list[list[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    async def aembed_documents(self, texts: Sequence[str]) -> list[list[float]]:
+        return self.embed_documents(texts)
+
     def _count_token_matches(self, text: str, token_group: Sequence[str]) -> float:
         return float(sum(text.count(token) for token in token_group))
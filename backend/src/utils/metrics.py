@@ -0,0 +1,130 @@
+import bisect
+import threading
+from dataclasses import dataclass
+
+from utils.singleton import SingletonMeta
+
+MetricKey = tuple[str, tuple[tuple[str, str], ...]]
+
+DEFAULT_LATENCY_BUCKETS_S: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    20.0,
+    30.0,
+    60.0,
+)
+
+
+def _metric_key(name: str, labels: dict[str, object]) -> MetricKey:
+    return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+
+def _format_metric_key(key: MetricKey) -> str:
+    name, labels = key
+    if not labels:
+        return name
+    formatted_labels = ",".join(f'{label}="{value}"' for label, value in labels)
+    return f"{name}{{{formatted_labels}}}"
+
+
+@dataclass(frozen=True, slots=True)
+class HistogramSnapshot:
+    """Point-in-time view of one labelled histogram; `buckets` holds cumulative counts per upper bound."""
+
+    buckets: tuple[tuple[float, int], ...]
+    count: int
+    sum: float
+
+
+class _Histogram:
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.bucket_counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        cumulative: list[tuple[float, int]] = []
+        running = 0
+        for bound, bucket_count in zip((*self.bounds, float("inf")), self.bucket_counts):
+            running += bucket_count
+            cumulative.append((bound, running))
+        return HistogramSnapshot(buckets=tuple(cumulative), count=self.count, sum=self.sum)
+
+
+class MetricsRegistry(metaclass=SingletonMeta):
+    """Process-wide, thread-safe registry of labelled counters, gauges and histograms."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[MetricKey, float] = {}
+        self._gauges: dict[MetricKey, float] = {}
+        self._histograms: dict[MetricKey, _Histogram] = {}
+
+    def increment(self, name: str, value: float = 1.0, **labels: object) -> None:
+        key = _metric_key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def counter(self, name: str, **labels: object) -> float:
+        with self._lock:
+            return self._counters.get(_metric_key(name, labels), 0.0)
+
+    def set_gauge(self, name: str, value: float, **labels: object) -> None:
+        key = _metric_key(name, labels)
+        with self._lock:
+            self._gauges[key] = value
+
+    def gauge(self, name: str, **labels: object) -> float:
+        with self._lock:
+            return self._gauges.get(_metric_key(name, labels), 0.0)
+
+    def observe(self, name: str, value: float, **labels: object) -> None:
+        """Record one observation, e.g. a latency in seconds, into `DEFAULT_LATENCY_BUCKETS_S` buckets."""
+        key = _metric_key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(DEFAULT_LATENCY_BUCKETS_S)
+            histogram.observe(value)
+
+    def histogram(self, name: str, **labels: object) -> HistogramSnapshot:
+        with self._lock:
+            histogram = self._histograms.get(_metric_key(name, labels))
+            if histogram is None:
+                return _Histogram(DEFAULT_LATENCY_BUCKETS_S).snapshot()
+            return histogram.snapshot()
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            values = {_format_metric_key(key): value for key, value in self._counters.items()}
+            values.update((_format_metric_key(key), value) for key, value in self._gauges.items())
+            for (name, labels), histogram in self._histograms.items():
+                histogram_snapshot = histogram.snapshot()
+                for bound, cumulative_count in histogram_snapshot.buckets:
+                    bucket_label = ("le", "+Inf" if bound == float("inf") else str(bound))
+                    bucket_key = (f"{name}_bucket", (*labels, bucket_label))
+                    values[_format_metric_key(bucket_key)] = float(cumulative_count)
+                values[_format_metric_key((f"{name}_count", labels))] = float(histogram_snapshot.count)
+                values[_format_metric_key((f"{name}_sum", labels))] = histogram_snapshot.sum
+            return dict(sorted(values.items()))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
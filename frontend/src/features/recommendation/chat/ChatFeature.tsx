@@ -2,7 +2,7 @@ import { useCallback, useState } from "react";
 
 import { Chat } from "@/components/chat/Chat";
 import { normalizeRegionId } from "@/components/map/model/mapSelectors";
-import { STEP_LABELS } from "@/features/recommendation/context/handlers/useRecommendationChat";
+import { getStepLabel } from "@/features/recommendation/context/handlers/useRecommendationChat";
 import { NewSessionButton } from "@/features/recommendation/chat/components/NewSessionButton";
 import { useRecommendationFeatureContext } from "@/features/recommendation/context/useRecommendationFeatureContext";
 import { createLogger } from "@/shared/lib";
@@ -17,6 +17,7 @@ export function ChatFeature() {
             chatRecords,
             onGoingChatTurn,
             step,
+            queuePosition,
             destinationResearchStarted,
             submitRecommendationMessage,
         },
@@ -52,7 +53,7 @@ export function ChatFeature() {
 
     const loadingDetail =
         isLoading && step !== "recommendation" && step !== "response"
-            ? (STEP_LABELS[step] ?? null)
+            ? getStepLabel(step, queuePosition)
             : null;
 
     const errorMessage = createSessionError ?? getSessionError;
@@ -9,6 +9,7 @@ import type {
     ProgressStage,
     RecommendationDestinationResearchGenerationEventData,
     RecommendationDestinationResearchEventData,
+    RecommendationQueuedEventData,
     TravelDestinationFilter,
 } from "@/models/recommendation.stream.models";
 import { streamRecommendations } from "@/shared/api/recommendation.api";
@@ -56,6 +57,7 @@ export interface UseRecommendationChat {
     setChatRecords: React.Dispatch<React.SetStateAction<ChatRecordDto[]>>;
 
     step: ProgressStage;
+    queuePosition: number | null;
     onGoingChatTurn: Partial<ChatRecordDto> | null;
     destinationResearchStarted: boolean;
     destinationResearchRegionIds: string[];
@@ -71,6 +73,7 @@ interface UseRecommendationChatOptions {
 }
 
 export const STEP_LABELS: Record<string, string> = {
+    queued: "Waiting for a free slot…",
     initializing: "Starting…",
     validating_request: "Validating request…",
     gathering_filter: "Analyzing travel preferences…",
@@ -80,6 +83,14 @@ export const STEP_LABELS: Record<string, string> = {
     response_generation: "Preparing response…",
 };
 
+export function getStepLabel(step: ProgressStage, queuePosition: number | null): string | null {
+    if (step === "queued" && queuePosition != null) {
+        return `Waiting for a free slot (position ${queuePosition} in queue)…`;
+    }
+
+    return STEP_LABELS[step] ?? null;
+}
+
 export function useRecommendationChat({
     applyResolvedRegionFilters,
 }: UseRecommendationChatOptions): UseRecommendationChat {
@@ -87,6 +98,7 @@ export function useRecommendationChat({
     const [chatRecords, setChatRecords] = useState<ChatRecordDto[]>(sessionChatHistory);
     const [onGoingChatTurn, setOnGoingChatTurn] = useState<Partial<ChatRecordDto> | null>(null);
     const [step, setStep] = useState<ProgressStage>("idle");
+    const [queuePosition, setQueuePosition] = useState<number | null>(null);
     const [destinationResearchStarted, setDestinationResearchStarted] =
         useState(false);
     const [destinationResearchRegionIds, setDestinationResearchRegionIds] = useState<
@@ -179,6 +191,13 @@ export function useRecommendationChat({
 
             for await (const sseEvent of stream) {
                 switch (sseEvent.event) {
+                    case "queued": {
+                        setStep("queued");
+                        const data = sseEvent.data as RecommendationQueuedEventData;
+                        setQueuePosition(data.position ?? null);
+                        break;
+                    }
+
                     case "initializing":
                     case "validating_request":
                     case "gathering_filter":
@@ -249,6 +268,17 @@ export function useRecommendationChat({
                         break;
                     }
 
+                    case "response_delta": {
+                        setStep("response");
+                        const data = sseEvent.data as { delta: string };
+                        accumulatedResponse += data.delta ?? "";
+                        setOnGoingChatTurn((prev) => ({
+                            ...prev,
+                            system_response: accumulatedResponse,
+                        }));
+                        break;
+                    }
+
                     case "response": {
                         setStep("response");
                         const data = sseEvent.data as { message: string };
@@ -303,6 +333,7 @@ export function useRecommendationChat({
         chatRecords,
         setChatRecords,
         step,
+        queuePosition,
         onGoingChatTurn,
         destinationResearchStarted,
         destinationResearchRegionIds,
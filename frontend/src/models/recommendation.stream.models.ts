@@ -35,6 +35,7 @@ export interface TravelDestinationFilter {
 
 export type ProgressStage =
     | "idle"
+    | "queued"
     | "initializing"
     | "validating_request"
     | "gathering_filter"
@@ -47,6 +48,10 @@ export type ProgressStage =
     | "done"
     | "error";
 
+export interface RecommendationQueuedEventData {
+    position: number;
+}
+
 export interface RecommendationDestinationResearchGenerationEventData {
     region_id: string;
 }